@@ -9,28 +9,21 @@ import os
 from datetime import datetime
 from collections import defaultdict
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 from improved_xg_model import ImprovedXGModel
+from play_by_play_frame import PlayByPlayFrame, SHOT_ATTEMPT_TYPES
+from player_directory import get_player_directory
 
 class AdvancedMetricsAnalyzer:
     def __init__(self, play_by_play_data: dict):
         self.plays = play_by_play_data.get('plays', [])
+        self.frame = PlayByPlayFrame.of(play_by_play_data)
         self.roster_map = self._create_roster_map(play_by_play_data)
         self.xg_model = ImprovedXGModel()  # Initialize improved xG model
         
     def _create_roster_map(self, play_by_play_data: dict) -> dict:
-        """Create a mapping of player IDs to player info"""
-        roster_map = {}
-        if 'rosterSpots' in play_by_play_data:
-            for player in play_by_play_data['rosterSpots']:
-                player_id = player['playerId']
-                roster_map[player_id] = {
-                    'firstName': player['firstName']['default'],
-                    'lastName': player['lastName']['default'],
-                    'sweaterNumber': player['sweaterNumber'],
-                    'positionCode': player['positionCode'],
-                    'teamId': player['teamId']
-                }
-        return roster_map
+        """Create a mapping of player IDs to player info (from the shared player directory)"""
+        return get_player_directory().game_roster(play_by_play_data)
     
     def get_available_metrics(self) -> dict:
         """Get all available metrics from the play-by-play data"""
@@ -165,27 +158,27 @@ class AdvancedMetricsAnalyzer:
         rush_shots_faced = 0
         
         # Track last turnover to detect counter-attacks
-        last_turnover_time = None
+        last_turnover_time = 0
         last_turnover_team = None
         
+        event_types, zones, times = self.frame.column('event_type'), self.frame.column('zone'), self.frame.column('seconds')
+        
         for i, play in enumerate(self.plays):
             details = play.get('details', {})
-            event_type = play.get('typeDescKey', '')
+            event_type = event_types[i]
             event_team = details.get('eventOwnerTeamId')
             
             # 1. Turnover Detection (for Counter-Attack Index)
             if event_type in ['giveaway', 'takeaway']:
-                last_turnover_time = play.get('timeInPeriod', '00:00')
+                last_turnover_time = times[i]
                 last_turnover_team = event_team if event_type == 'takeaway' else (details.get('awayTeamId') if event_team == details.get('homeTeamId') else details.get('homeTeamId'))
             
             # 2. Neutral Zone Transition (NZT) & Entry Success
             # We look for events in the Offensive Zone (O) following Neutral Zone (N) context
-            if event_team == team_id and details.get('zoneCode') == 'O':
+            if event_team == team_id and zones[i] == 'O':
                 # Check previous play
                 if i > 0:
-                    prev_play = self.plays[i-1]
-                    prev_details = prev_play.get('details', {})
-                    if prev_details.get('zoneCode') == 'N':
+                    if zones[i-1] == 'N':
                         total_entries += 1
                         # If the event is a shot or pass, it's a "possession entry"
                         if event_type in ['shot-on-goal', 'goal']:
@@ -193,9 +186,7 @@ class AdvancedMetricsAnalyzer:
                 
                 # Check for Counter-Attack (Shot within 8 seconds of a turnover)
                 if event_type in ['shot-on-goal', 'goal'] and last_turnover_team == team_id:
-                    curr_time = self._time_to_seconds(play.get('timeInPeriod', '00:00'))
-                    prev_time = self._time_to_seconds(last_turnover_time or '00:00')
-                    if 0 < (curr_time - prev_time) <= 8:
+                    if 0 < (times[i] - last_turnover_time) <= 8:
                         ca_shots += 1
             
             # 3. Rush Response (Goalie resistance to transitional rush shots)
@@ -203,8 +194,7 @@ class AdvancedMetricsAnalyzer:
             if event_team != team_id and event_type in ['shot-on-goal', 'goal']:
                 # Simple rush proxy: shot in O zone within 4 seconds of N zone activity
                 if i > 0:
-                    prev_play = self.plays[i-1]
-                    if prev_play.get('details', {}).get('zoneCode') == 'N':
+                    if zones[i-1] == 'N':
                         rush_shots_faced += 1
                         if event_type == 'shot-on-goal':
                             rush_saves += 1
@@ -534,18 +524,10 @@ class AdvancedMetricsAnalyzer:
         current_sequence = []
         sequence_start_time = None
         
-        for play in self.plays:
+        for play, time_seconds in zip(self.plays, self.frame.column('seconds')):
             details = play.get('details', {})
             event_type = play.get('typeDescKey', '')
             event_team = details.get('eventOwnerTeamId')
-            time_in_period = play.get('timeInPeriod', '00:00')
-            
-            # Convert time to seconds for analysis
-            try:
-                minutes, seconds = time_in_period.split(':')
-                time_seconds = int(minutes) * 60 + int(seconds)
-            except:
-                time_seconds = 0
             
             if event_team == team_id:
                 if not current_sequence:
@@ -757,31 +739,21 @@ class AdvancedMetricsAnalyzer:
             'longitudinal_movement': {'attempts': 0, 'goals': 0, 'total_delta_x': 0, 'avg_delta_x': 0}
         }
 
-        shot_attempt_types = {'shot-on-goal', 'missed-shot', 'blocked-shot', 'goal'}
-        
-        for i, play in enumerate(self.plays):
-            details = play.get('details', {})
-            event_type = play.get('typeDescKey', '')
-            event_team = details.get('eventOwnerTeamId')
-            
-            # Only analyze shots/goals for this team
-            if event_team != team_id:
-                continue
-            
-            if event_type not in shot_attempt_types:
-                continue
-            
-            x_coord = details.get('xCoord')
-            y_coord = details.get('yCoord')
-            time_in_period = play.get('timeInPeriod', '')
-            
-            if x_coord is None or y_coord is None:
-                continue
+        frame = self.frame
+        event_types, teams, zones, times = frame.column('event_type'), frame.column('team'), frame.column('zone'), frame.column('seconds')
+        xs, ys, has_x, has_y = frame.column('x'), frame.column('y'), frame.column('has_x'), frame.column('has_y')
+        
+        # Only analyze located shots/goals for this team
+        shots = frame.is_type(*SHOT_ATTEMPT_TYPES) & (frame.team == team_id) & frame.has_x & frame.has_y
+        
+        for i in np.flatnonzero(shots).tolist():
+            event_type = event_types[i]
+            x_coord = xs[i]
+            y_coord = ys[i]
+            shot_zone = zones[i]
             
             is_goal = (event_type == 'goal')
-            
-            # Convert time to seconds
-            current_time = self._time_to_seconds(time_in_period)
+            current_time = times[i]
             
             # Look back for Royal Road Proxy and lateral/longitudinal movement.
             # Hockey-logic proxy:
@@ -794,32 +766,24 @@ class AdvancedMetricsAnalyzer:
             prev_x = None
             
             for j in range(i - 1, max(-1, i - 20), -1):  # Look back up to 20 plays
-                prev_play = self.plays[j]
-                prev_details = prev_play.get('details', {})
-                prev_team = prev_details.get('eventOwnerTeamId')
-                prev_time_str = prev_play.get('timeInPeriod', '')
-                prev_time = self._time_to_seconds(prev_time_str)
-                
                 # Only look at events from the same team within time window
-                if prev_team != team_id:
+                if teams[j] != team_id:
                     continue
                 
-                time_diff = current_time - prev_time
+                time_diff = current_time - times[j]
                 if time_diff > 4:  # Beyond 4 second window
                     break
                 
-                prev_x_coord = prev_details.get('xCoord')
-                prev_y_coord = prev_details.get('yCoord')
-                
-                if prev_x_coord is None or prev_y_coord is None:
+                if not (has_x[j] and has_y[j]):
                     continue
+                prev_x_coord = xs[j]
+                prev_y_coord = ys[j]
                 
                 # Check for Royal Road Proxy.
                 # Prefer explicit passes: a pass in the OZ followed by a shot with large |Δy|.
-                prev_type = prev_play.get('typeDescKey', '')
+                prev_type = event_types[j]
                 if not royal_road_detected:
-                    prev_zone = prev_details.get('zoneCode', '')
-                    shot_zone = details.get('zoneCode', '')
+                    prev_zone = zones[j]
                     if prev_type == 'pass' and (prev_zone == 'O' or shot_zone == 'O'):
                         try:
                             dy = abs(float(y_coord) - float(prev_y_coord))
@@ -832,7 +796,7 @@ class AdvancedMetricsAnalyzer:
                     if not royal_road_detected and prev_y_coord is not None:
                         try:
                             dy = abs(float(y_coord) - float(prev_y_coord))
-                            if dy >= 22.0 and (details.get('zoneCode', '') == 'O'):
+                            if dy >= 22.0 and (shot_zone == 'O'):
                                 royal_road_detected = True
                         except Exception:
                             pass
@@ -874,15 +838,11 @@ class AdvancedMetricsAnalyzer:
             # - or opponent giveaway in OZ immediately before the shot
             oz_retrieval_detected = False
             for j in range(i - 1, max(-1, i - 40), -1):  # Look back up to 40 plays
-                prev_play = self.plays[j]
-                prev_details = prev_play.get('details', {})
-                prev_team = prev_details.get('eventOwnerTeamId')
-                prev_type = prev_play.get('typeDescKey', '')
-                prev_zone = prev_details.get('zoneCode', '')
-                prev_time_str = prev_play.get('timeInPeriod', '')
-                prev_time = self._time_to_seconds(prev_time_str)
+                prev_team = teams[j]
+                prev_type = event_types[j]
+                prev_zone = zones[j]
                 
-                time_diff = current_time - prev_time
+                time_diff = current_time - times[j]
                 if time_diff > 8:  # Beyond 8 second window
                     break
                 
@@ -922,34 +882,23 @@ class AdvancedMetricsAnalyzer:
             'rush_goals': 0
         }
         
-        for i, play in enumerate(self.plays):
-            details = play.get('details', {})
-            event_type = play.get('typeDescKey', '')
-            event_team = details.get('eventOwnerTeamId')
+        frame = self.frame
+        event_types, teams, zones, times = frame.column('event_type'), frame.column('team'), frame.column('zone'), frame.column('seconds')
+        
+        for i in np.flatnonzero(frame.is_type(*SHOT_ATTEMPT_TYPES) & (frame.team == team_id)).tolist():
+            event_type = event_types[i]
             
-            if event_team != team_id:
-                continue
-                
-            if event_type not in ['shot-on-goal', 'missed-shot', 'blocked-shot', 'goal']:
-                continue
-                
             # Check for Rush (using xG model logic: N/D zone event within 4s)
             is_rush = False
-            current_time = self._time_to_seconds(play.get('timeInPeriod', '00:00'))
+            current_time = times[i]
             
             # Look back 4 seconds
             for j in range(i - 1, max(-1, i - 10), -1):
-                prev_play = self.plays[j]
-                prev_time = self._time_to_seconds(prev_play.get('timeInPeriod', '00:00'))
-                
-                if abs(current_time - prev_time) > 4:
+                if abs(current_time - times[j]) > 4:
                     break
-                    
-                prev_zone = prev_play.get('details', {}).get('zoneCode', '')
-                prev_team = prev_play.get('details', {}).get('eventOwnerTeamId')
                 
                 # If shooting team had possession in Neutral or Defensive zone recently
-                if prev_team == team_id and prev_zone in ['N', 'D']:
+                if teams[j] == team_id and zones[j] in ['N', 'D']:
                     is_rush = True
                     break
             
@@ -967,14 +916,9 @@ class AdvancedMetricsAnalyzer:
         last_shot_time = -999
         last_period = -1
         
-        for play in self.plays:
-            event_type = play.get('typeDescKey', '')
-            details = play.get('details', {})
-            event_team = details.get('eventOwnerTeamId')
-            period = play.get('periodDescriptor', {}).get('number', 1)
-            time_str = play.get('timeInPeriod', '00:00')
-            current_time = self._time_to_seconds(time_str)
-            
+        frame = self.frame
+        for event_type, event_team, period, current_time in zip(
+                frame.column('event_type'), frame.column('team'), frame.column('period'), frame.column('seconds')):
             # Reset on stoppage/faceoff (not a rebound if play stopped)
             if event_type in ['stoppage', 'faceoff', 'period-start']:
                 last_shot_time = -999
@@ -1000,11 +944,13 @@ class AdvancedMetricsAnalyzer:
             'nztsa': 0       # NZ Turnovers leading to Shot Attempts Against
         }
         
-        for i, play in enumerate(self.plays):
-            details = play.get('details', {})
-            event_type = play.get('typeDescKey', '')
-            event_team = details.get('eventOwnerTeamId')
-            zone = details.get('zoneCode', '')
+        frame = self.frame
+        event_types, teams, zones, times = frame.column('event_type'), frame.column('team'), frame.column('zone'), frame.column('seconds')
+        
+        for i in range(len(frame)):
+            event_type = event_types[i]
+            event_team = teams[i]
+            zone = zones[i]
             
             # We are looking for Turnovers COMMITTED by team_id
             # 1. Giveaway by Team ID
@@ -1021,17 +967,14 @@ class AdvancedMetricsAnalyzer:
                 nzt_stats['nzt'] += 1
                 
                 # Check for subsequent shot attempt AGAINST team_id within 8 seconds
-                nzt_time = self._time_to_seconds(play.get('timeInPeriod', '00:00'))
+                nzt_time = times[i]
                 
                 for j in range(i + 1, min(i + 20, len(self.plays))):
-                    next_play = self.plays[j]
-                    next_time = self._time_to_seconds(next_play.get('timeInPeriod', '00:00'))
-                    
-                    if abs(next_time - nzt_time) > 8:
+                    if abs(times[j] - nzt_time) > 8:
                         break
-                        
-                    next_type = next_play.get('typeDescKey', '')
-                    next_team = next_play.get('details', {}).get('eventOwnerTeamId')
+                    
+                    next_type = event_types[j]
+                    next_team = teams[j]
                     
                     # Look for SHOT by OPPONENT (not team_id)
                     if next_team != team_id and next_type in ['shot-on-goal', 'missed-shot', 'blocked-shot', 'goal']:
@@ -1047,38 +990,33 @@ class AdvancedMetricsAnalyzer:
             'oz_wins_leading_to_shot': 0
         }
         
-        for i, play in enumerate(self.plays):
-            if play.get('typeDescKey') == 'faceoff':
-                details = play.get('details', {})
-                zone = details.get('zoneCode', '')
-                winner_id = details.get('winningPlayerId')
+        frame = self.frame
+        event_types, teams, zones, times = frame.column('event_type'), frame.column('team'), frame.column('zone'), frame.column('seconds')
+        
+        for i in np.flatnonzero(frame.is_type('faceoff')).tolist():
+            zone = zones[i]
+            winner_id = self.plays[i].get('details', {}).get('winningPlayerId')
+            
+            # We need to know which team the winner belongs to.
+            # using roster_map check
+            winner_team_id = None
+            if winner_id in self.roster_map:
+                winner_team_id = self.roster_map[winner_id]['teamId']
+            
+            if winner_team_id == team_id and zone == 'O':
+                fo_stats['oz_wins'] += 1
                 
-                # We need to know which team the winner belongs to.
-                # using roster_map check
-                winner_team_id = None
-                if winner_id in self.roster_map:
-                    winner_team_id = self.roster_map[winner_id]['teamId']
+                # Check for shot within 10 seconds
+                fo_time = times[i]
                 
-                if winner_team_id == team_id and zone == 'O':
-                    fo_stats['oz_wins'] += 1
-                    
-                    # Check for shot within 10 seconds
-                    fo_time = self._time_to_seconds(play.get('timeInPeriod', '00:00'))
+                for j in range(i + 1, min(i + 25, len(self.plays))):
+                    if abs(times[j] - fo_time) > 10:
+                        break
                     
-                    for j in range(i + 1, min(i + 25, len(self.plays))):
-                        next_play = self.plays[j]
-                        next_time = self._time_to_seconds(next_play.get('timeInPeriod', '00:00'))
-                        
-                        if abs(next_time - fo_time) > 10:
-                            break
-                            
-                        next_type = next_play.get('typeDescKey', '')
-                        next_team = next_play.get('details', {}).get('eventOwnerTeamId')
+                    if teams[j] == team_id and event_types[j] in SHOT_ATTEMPT_TYPES:
+                        fo_stats['oz_wins_leading_to_shot'] += 1
+                        break
                         
-                        if next_team == team_id and next_type in ['shot-on-goal', 'missed-shot', 'blocked-shot', 'goal']:
-                            fo_stats['oz_wins_leading_to_shot'] += 1
-                            break
-                            
         return fo_stats
     
     def _time_to_seconds(self, time_str: str) -> float:
@@ -0,0 +1,138 @@
+"""
+Per-game memo of computed analytics.
+
+One finished game is analysed by several consumers in a pipeline run: the PDF
+report, the postgame metrics event, learn_from_game, the team stats update
+and the goalie/team builders. They all need the same metric families (xG,
+HDC, game scores, period/zone tables, the AdvancedMetricsAnalyzer report,
+win probability).
+
+`GameAnalysisContext.of(game_data)` returns the context for a game, keyed by
+game_id plus a fingerprint of the data (play count, last play, score, game
+state), so a feed that has moved on gets a fresh context. `context.get(key,
+compute)` runs each computation once; every caller receives its own copy of
+the result, so one consumer cannot change what the next one reads.
+
+PostGameReportGenerator's calculators are wrapped with `@game_metric`, so
+every existing call site shares results without being rewritten.
+
+`export()` / `merge()` carry the picklable results across a process boundary
+(the runner renders reports in a process pool and learns in the parent).
+"""
+
+import copy
+import functools
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+# Contexts kept, most recently used last.
+_CACHE_SIZE = 16
+_cache: "OrderedDict[Tuple, GameAnalysisContext]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def game_key(game_data: Dict[str, Any], game_id=None) -> Tuple:
+    """(game_id, fingerprint) identifying one state of a game's data."""
+    box = game_data.get('boxscore') or {}
+    plays = (game_data.get('play_by_play') or {}).get('plays') or []
+    last = plays[-1] if plays else {}
+    if game_id is None:
+        game_id = game_data.get('game_id') or box.get('id')
+    fingerprint = (
+        len(plays),
+        last.get('sortOrder'),
+        last.get('eventId'),
+        last.get('typeDescKey'),
+        last.get('timeInPeriod'),
+        (box.get('awayTeam') or {}).get('score'),
+        (box.get('homeTeam') or {}).get('score'),
+        box.get('gameState') or game_data.get('gameState'),
+    )
+    # Without an id, only the very same payload object can share a context.
+    return (str(game_id) if game_id is not None else ('object', id(game_data)),) + fingerprint
+
+
+class GameAnalysisContext:
+    """Lazily computed, memoized metrics for one state of one game."""
+
+    def __init__(self, game_data: Dict[str, Any], key: Tuple):
+        self.game_data = game_data
+        self.key = key
+        self._memo: Dict[Hashable, Any] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def of(cls, game_data: Dict[str, Any], game_id=None) -> 'GameAnalysisContext':
+        """Context for `game_data`, shared by every caller that sees the same game state."""
+        key = game_key(game_data, game_id)
+        with _cache_lock:
+            context = _cache.get(key)
+            if context is not None and (not isinstance(key[0], tuple) or context.game_data is game_data):
+                _cache.move_to_end(key)
+                return context
+            context = _cache[key] = cls(game_data, key)
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+        return context
+
+    @property
+    def game_id(self) -> Optional[str]:
+        return None if isinstance(self.key[0], tuple) else self.key[0]
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Result of `compute()` for `key`, computed on first use."""
+        with self._lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+            return copy.deepcopy(self._memo[key])
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._memo
+
+    def advanced_report(self, away_team_id, home_team_id) -> Dict[str, Any]:
+        """AdvancedMetricsAnalyzer.generate_comprehensive_report for this game."""
+        def compute():
+            from advanced_metrics_analyzer import AdvancedMetricsAnalyzer
+            analyzer = AdvancedMetricsAnalyzer(self.game_data.get('play_by_play') or {})
+            return analyzer.generate_comprehensive_report(away_team_id, home_team_id)
+        return self.get(('advanced_report', away_team_id, home_team_id), compute)
+
+    def export(self) -> Dict[Hashable, Any]:
+        """The memoized results that can be pickled (e.g. sent back from a worker)."""
+        with self._lock:
+            entries = dict(self._memo)
+        exported = {}
+        for key, value in entries.items():
+            try:
+                pickle.dumps(value)
+            except Exception:
+                continue
+            exported[key] = value
+        return exported
+
+    def merge(self, entries: Optional[Dict[Hashable, Any]]) -> None:
+        """Adopt results computed elsewhere for the same game state (existing entries win)."""
+        with self._lock:
+            for key, value in (entries or {}).items():
+                self._memo.setdefault(key, value)
+
+
+def game_metric(method):
+    """
+    Memoize a `method(self, game_data, *args)` calculator in the game's context.
+
+    Results are keyed by method name and the extra arguments, so they are
+    shared between all instances of the calculator's class.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, game_data, *args):
+        if not isinstance(game_data, dict):
+            return method(self, game_data, *args)
+        return GameAnalysisContext.of(game_data).get((name,) + args, lambda: method(self, game_data, *args))
+
+    return wrapper
@@ -259,13 +259,13 @@ class GoalieStatsBuilder:
             return 'pk_for'      # Team on PP
         return 'ev'
     
-    def process_game(self, game_id: str):
-        """Process a single game's PBP for goalie stats."""
+    def process_game(self, game_id: str, play_by_play: Optional[Dict] = None):
+        """Process a single game's PBP for goalie stats (fetched unless `play_by_play` is given)."""
         game_id = str(game_id)
         if game_id in self.processed_games:
             return
         
-        pbp = self.api.get_play_by_play(game_id)
+        pbp = play_by_play or self.api.get_play_by_play(game_id)
         if not pbp:
             return
         
@@ -0,0 +1,260 @@
+"""
+Incremental per-game state for live polling.
+
+The live predictor re-fetches a game's play-by-play on every poll. A
+`LiveGameSession` remembers how far into the feed it has read (the number of
+plays and the sortOrder/eventId of the last one) and folds only the plays
+appended since the previous poll into running accumulators:
+
+  counts      per-side event totals: hits, blocked shots, giveaways,
+              takeaways, PIM, power-play goals/opportunities, faceoff wins
+              and shots on goal (`faceoffs` holds the faceoff total)
+  likelihood  the play-by-play win-likelihood rows, built from cumulative
+              game score / xG / HDC / Corsi / PP inputs
+  goals       the goal plays, for the scoring summary
+  shots_data  shot chart rows; the caller appends one per new shot
+
+When the feed no longer extends what was read (fewer plays, or the last
+play read has changed - the league edits and withdraws events) the session
+starts again from the first play. A change of team ids does the same, and
+so does an edit to any goal already read (scorer or assists changed after
+the goal was posted): the few goal plays are re-checked on every poll.
+"""
+
+import json
+import math
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+SIDES = ('away', 'home')
+COUNT_KEYS = ('hits', 'blocked', 'giveaways', 'takeaways', 'pim', 'pp_goals', 'pp_opps', 'faceoff_wins', 'sog')
+RUNNING_KEYS = ('gs', 'xg', 'hdc', 'shots', 'hits', 'pim', 'pp_goals', 'pp_attempts', 'corsi_for', 'corsi_against')
+
+# POSTGAME CORRELATION WEIGHTS (same as in pdf_report_generator.py)
+POSTGAME_WEIGHTS = {
+    'gs_diff': 0.6504,           # Game Score difference - STRONGEST predictor
+    'power_play_diff': 0.3933,   # Power Play % difference
+    'corsi_diff': -0.3598,       # Corsi % difference (negative: higher Corsi favors home)
+    'hits_diff': -0.2434,        # Hits difference (negative: more hits favors home)
+    'hdc_diff': 0.0747,          # High Danger Chances difference
+    'xg_diff': -0.0545,          # Expected Goals difference
+    'pim_diff': 0.0173,          # Penalty Minutes difference
+    'shots_diff': -0.0158,       # Shots on Goal difference
+}
+
+
+def _sigmoid(x: float) -> float:
+    try:
+        return 1.0 / (1.0 + math.exp(-x))
+    except OverflowError:
+        return 0.0 if x < 0 else 1.0
+
+
+def _play_key(play: Dict[str, Any]):
+    return (play.get('sortOrder'), play.get('eventId'), play.get('typeDescKey'))
+
+
+def _goal_fingerprint(play: Dict[str, Any]) -> str:
+    return json.dumps([play.get('details'), play.get('situationCode')], sort_keys=True, default=str)
+
+
+def _other(side: str) -> str:
+    return 'home' if side == 'away' else 'away'
+
+
+class LiveGameSession:
+    """Running totals for one live game, advanced by the plays each poll adds."""
+
+    def __init__(self, game_id, xg: Optional[Callable[[float, float, str], float]] = None):
+        self.game_id = game_id
+        self.away_team_id = None
+        self.home_team_id = None
+        # Shot xG for the likelihood inputs: xg(x, y, shot_type).
+        self._xg = xg
+        # Held by the caller for the whole update, so concurrent polls of one game take turns.
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.processed = 0
+        self._last_key = None
+        self.last_play: Optional[Dict[str, Any]] = None
+        self.player_to_team: Dict[Any, Any] = {}
+        self.counts = {side: dict.fromkeys(COUNT_KEYS, 0) for side in SIDES}
+        self.faceoffs = 0
+        self.goals: List[Dict[str, Any]] = []
+        # (index, play key, fingerprint) of every goal read, to notice later edits
+        self._goal_marks: List[tuple] = []
+        self.shots_data: List[Dict[str, Any]] = []
+        self.likelihood: List[Dict[str, Any]] = []
+        self._running = {side: dict.fromkeys(RUNNING_KEYS, 0) for side in SIDES}
+
+    def advance(self, plays: List[Dict[str, Any]], away_team_id, home_team_id, roster_spots=None) -> List[Dict[str, Any]]:
+        """Apply the plays not seen yet and return them (all plays after a restart)."""
+        if (away_team_id, home_team_id) != (self.away_team_id, self.home_team_id):
+            self.reset()
+            self.away_team_id, self.home_team_id = away_team_id, home_team_id
+
+        n = self.processed
+        if n and (len(plays) < n or _play_key(plays[n - 1]) != self._last_key):
+            print(f"🔄 Live session {self.game_id}: feed changed before play {n}, rebuilding", flush=True)
+            self.reset()
+            n = 0
+        elif n and self._goals_edited(plays):
+            print(f"🔄 Live session {self.game_id}: a goal was edited, rebuilding", flush=True)
+            self.reset()
+            n = 0
+
+        for spot in roster_spots or []:
+            player_id, team_id = spot.get('playerId'), spot.get('teamId')
+            if player_id and team_id:
+                self.player_to_team[player_id] = team_id
+
+        new_plays = plays[n:]
+        for index, play in enumerate(new_plays, n):
+            if play.get('typeDescKey') == 'goal':
+                self._goal_marks.append((index, _play_key(play), _goal_fingerprint(play)))
+            self._count(play)
+            self._track_likelihood(index, play)
+        if plays:
+            self.processed = len(plays)
+            self._last_key = _play_key(plays[-1])
+            self.last_play = plays[-1]
+        return new_plays
+
+    def _goals_edited(self, plays: List[Dict[str, Any]]) -> bool:
+        for index, key, fingerprint in self._goal_marks:
+            play = plays[index]
+            if _play_key(play) != key or _goal_fingerprint(play) != fingerprint:
+                return True
+        return False
+
+    def _side(self, team_id) -> Optional[str]:
+        if team_id is None:
+            return None
+        if team_id == self.away_team_id:
+            return 'away'
+        if team_id == self.home_team_id:
+            return 'home'
+        return None
+
+    def _count(self, play: Dict[str, Any]) -> None:
+        if play.get('typeDescKey') == 'goal':
+            self.goals.append(play)
+
+        event_type = play.get('typeDescKey', '') or play.get('typeDesc', '')
+        details = play.get('details', {})
+        if event_type == 'faceoff':
+            # Each faceoff has ONE winner and ONE loser; the winner's team comes from the roster
+            self.faceoffs += 1
+            winner = self._side(self.player_to_team.get(details.get('winningPlayerId')))
+            if winner:
+                self.counts[winner]['faceoff_wins'] += 1
+            return
+
+        side = self._side(details.get('eventOwnerTeamId'))
+        if side is None:
+            return
+        counts, other = self.counts[side], self.counts[_other(side)]
+        if event_type == 'hit':
+            counts['hits'] += 1
+        elif event_type == 'blocked-shot':
+            # eventOwnerTeamId is the team that shot; the block goes to the opponent
+            other['blocked'] += 1
+        elif event_type == 'giveaway':
+            counts['giveaways'] += 1
+        elif event_type == 'takeaway':
+            counts['takeaways'] += 1
+        elif event_type == 'penalty':
+            counts['pim'] += details.get('penaltyMinutes', 2) or details.get('duration', 2) or 2
+            other['pp_opps'] += 1
+        elif event_type == 'goal':
+            # Power play goal when the situation code reads 5v4 / 5v3
+            situation_code = str(play.get('situationCode', ''))
+            if '5' in situation_code and ('4' in situation_code or '3' in situation_code):
+                counts['pp_goals'] += 1
+        elif event_type == 'shot-on-goal':
+            counts['sog'] += 1
+
+    def _track_likelihood(self, index: int, play: Dict[str, Any]) -> None:
+        event_type = play.get('typeDescKey', '')
+        details = play.get('details', {})
+        owner = details.get('eventOwnerTeamId')
+        side = self._side(owner) if owner else None
+
+        if side:
+            running, other = self._running[side], self._running[_other(side)]
+            if event_type == 'goal':
+                running['gs'] += 0.75  # Goals: 0.75 points
+                situation = str(details.get('situationCode', ''))
+                if 'PP' in situation or 'powerPlay' in situation.lower():
+                    running['pp_goals'] += 1
+            elif event_type == 'shot-on-goal':
+                running['gs'] += 0.075  # Shots: 0.075 points
+                running['shots'] += 1
+                x = details.get('xCoord', 0)
+                y = details.get('yCoord', 0)
+                distance = math.sqrt(x**2 + y**2) if x and y else 100
+                if distance < 25:  # High danger zone
+                    running['hdc'] += 1
+                try:
+                    if x and y and self._xg is not None:
+                        running['xg'] += self._xg(x, y, details.get('shotType', 'wrist'))
+                except Exception:
+                    pass
+            elif event_type == 'blocked-shot':
+                running['gs'] += 0.05  # Blocked shots: 0.05 points
+            elif event_type == 'penalty':
+                running['gs'] -= 0.15  # Penalties: -0.15 points
+                running['pim'] += details.get('duration', 2)
+                situation = str(details.get('situationCode', ''))
+                if 'PP' in situation or 'powerPlay' in situation.lower():
+                    other['pp_attempts'] += 1
+            elif event_type == 'hit':
+                running['hits'] += 1
+
+            # Corsi events (shots, goals, blocked shots, missed shots)
+            if event_type in ('goal', 'shot-on-goal', 'blocked-shot', 'missed-shot'):
+                running['corsi_for'] += 1
+                other['corsi_against'] += 1
+
+        # Likelihood rows for significant events (goals, shots, penalties) and every 10th play
+        if event_type in ('goal', 'shot-on-goal', 'penalty', 'blocked-shot') or index % 10 == 0:
+            away_prob, home_prob = self._probabilities()
+            row = play.copy()
+            row['likelihood'] = {
+                'away_probability': round(away_prob, 1),
+                'home_probability': round(home_prob, 1),
+            }
+            self.likelihood.append(row)
+
+    def _probabilities(self):
+        away, home = self._running['away'], self._running['home']
+        gs_diff = away['gs'] - home['gs']
+        xg_diff = away['xg'] - home['xg']
+        hdc_diff = away['hdc'] - home['hdc']
+        shots_diff = away['shots'] - home['shots']
+        hits_diff = away['hits'] - home['hits']
+        pim_diff = away['pim'] - home['pim']
+
+        away_corsi_total = away['corsi_for'] + away['corsi_against']
+        home_corsi_total = home['corsi_for'] + home['corsi_against']
+        away_corsi_pct = (away['corsi_for'] / away_corsi_total * 100) if away_corsi_total > 0 else 50.0
+        home_corsi_pct = (home['corsi_for'] / home_corsi_total * 100) if home_corsi_total > 0 else 50.0
+        corsi_diff = away_corsi_pct - home_corsi_pct
+
+        away_pp_pct = (away['pp_goals'] / away['pp_attempts'] * 100) if away['pp_attempts'] > 0 else 0.0
+        home_pp_pct = (home['pp_goals'] / home['pp_attempts'] * 100) if home['pp_attempts'] > 0 else 0.0
+        power_play_diff = away_pp_pct - home_pp_pct
+
+        score = 0.0
+        score += POSTGAME_WEIGHTS['gs_diff'] * (gs_diff * 0.1)
+        score += POSTGAME_WEIGHTS['power_play_diff'] * (power_play_diff * 0.01)
+        score += POSTGAME_WEIGHTS['corsi_diff'] * (corsi_diff * 0.01)
+        score += POSTGAME_WEIGHTS['hits_diff'] * (hits_diff * 0.01)
+        score += POSTGAME_WEIGHTS['hdc_diff'] * (hdc_diff * 0.05)
+        score += POSTGAME_WEIGHTS['xg_diff'] * (xg_diff * 0.2)
+        score += POSTGAME_WEIGHTS['pim_diff'] * (pim_diff * 0.01)
+        score += POSTGAME_WEIGHTS['shots_diff'] * (shots_diff * 0.02)
+        return _sigmoid(score) * 100, (1.0 - _sigmoid(score)) * 100
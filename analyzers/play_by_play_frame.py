@@ -0,0 +1,305 @@
+"""
+Columnar view of an NHL play-by-play feed.
+
+The post-game report and AdvancedMetricsAnalyzer run a dozen calculators over
+the same `plays` list, per team. `PlayByPlayFrame` walks the raw play dicts
+once and keeps one NumPy array per field (event type, owner team, period,
+elapsed seconds, coordinates, zone, situation, shooter, goalie); calculators
+read those columns instead of re-parsing every dict and clock string.
+
+Field defaults follow what the calculators used when reading the dicts:
+a missing team is NO_TEAM, a missing period is 1, a missing zone is '',
+missing coordinates are 0 (with `has_x`/`has_y` telling the two apart) and
+unparseable clocks are 0 seconds.
+
+`PlayByPlayFrame.of(play_by_play)` returns the frame for a feed, building it
+on first use and handing the same instance to every later caller.
+
+`frame.shot_annotations()` tags every play with its rush / shot-origin /
+rebound context in one forward sweep (see `ShotAnnotations`).
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+SHOT_ATTEMPT_TYPES = ('shot-on-goal', 'missed-shot', 'blocked-shot', 'goal')
+# Same-team events that start a rush when no N/D zone code is recorded.
+TRANSITION_TYPES = ('takeaway', 'giveaway', 'block-shot', 'blocked-shot', 'hit', 'faceoff')
+# Events that end a rebound sequence.
+STOPPAGE_TYPES = ('stoppage', 'faceoff', 'period-start', 'period-end')
+NO_TEAM = -1
+NO_PLAYER = -1
+
+# Feeds whose frames are kept, most recently used last.
+_CACHE_SIZE = 8
+_cache: "OrderedDict[int, PlayByPlayFrame]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def time_to_seconds(time_str: Optional[str]) -> int:
+    """Convert an MM:SS clock to seconds (0 when missing or malformed)."""
+    try:
+        if ':' in time_str:
+            minutes, seconds = map(int, time_str.split(':'))
+            return minutes * 60 + seconds
+        return 0
+    except Exception:
+        return 0
+
+
+def zone_name(zone_code: Optional[str], x_coord) -> str:
+    """'offensive'/'neutral'/'defensive' from zoneCode, falling back to |x| > 25 = offensive."""
+    if zone_code == 'O' or zone_code == 'offensive':
+        return 'offensive'
+    elif zone_code == 'D' or zone_code == 'defensive':
+        return 'defensive'
+    elif zone_code == 'N' or zone_code == 'neutral':
+        return 'neutral'
+    # Without the attacking side we cannot tell O from D in an end zone.
+    return 'offensive' if abs(x_coord) > 25 else 'neutral'
+
+
+def _coord(details: Dict, key: str, alt: str):
+    value = details.get(key)
+    if value is None:
+        value = (details.get('coordinates') or {}).get(alt)
+    return value
+
+
+class PlayByPlayFrame:
+    """One array per play-by-play field, aligned with the original `plays` list."""
+
+    def __init__(self, plays: List[Dict[str, Any]]):
+        self.plays = plays
+        self._n = n = len(plays)
+
+        event_type, team, period, period_type = [], [], [], []
+        seconds, period_start, x, y, has_x, has_y = [], [], [], [], [], []
+        zone, situation, event_id, shooter, goalie, penalty_minutes = [], [], [], [], [], []
+
+        for play in plays:
+            details = play.get('details') or {}
+            descriptor = play.get('periodDescriptor') or {}
+            clock = play.get('timeInPeriod')
+            px = _coord(details, 'xCoord', 'x')
+            py = _coord(details, 'yCoord', 'y')
+            owner = details.get('eventOwnerTeamId')
+            shooting = details.get('shootingPlayerId') or details.get('scoringPlayerId')
+            in_net = details.get('goalieInNetId')
+
+            event_type.append(play.get('typeDescKey', ''))
+            team.append(NO_TEAM if owner is None else owner)
+            period.append(descriptor.get('number', 1))
+            period_type.append(descriptor.get('periodType', 'REG'))
+            seconds.append(time_to_seconds(clock if clock is not None else '00:00'))
+            period_start.append(clock == '00:00')
+            has_x.append(px is not None)
+            has_y.append(py is not None)
+            x.append(0 if px is None else px)
+            y.append(0 if py is None else py)
+            zone.append(details.get('zoneCode') or '')
+            situation.append(play.get('situationCode') or '')
+            event_id.append(play.get('eventId'))
+            shooter.append(NO_PLAYER if shooting is None else shooting)
+            goalie.append(NO_PLAYER if in_net is None else in_net)
+            penalty_minutes.append(details.get('penaltyMinutes', 2))
+
+        def objects(values):
+            arr = np.empty(n, dtype=object)
+            arr[:] = values
+            return arr
+
+        self.event_type = objects(event_type)
+        self.team = np.asarray(team, dtype=np.int64).reshape(n)
+        self.period = np.asarray(period, dtype=np.int64).reshape(n)
+        self.period_type = objects(period_type)
+        self.seconds = np.asarray(seconds, dtype=np.int64).reshape(n)
+        self.period_start = np.asarray(period_start, dtype=bool).reshape(n)
+        # Integer feeds stay integer so sums and deltas keep their types.
+        self.x = np.asarray(x).reshape(n)
+        self.y = np.asarray(y).reshape(n)
+        self.has_x = np.asarray(has_x, dtype=bool).reshape(n)
+        self.has_y = np.asarray(has_y, dtype=bool).reshape(n)
+        self.zone = objects(zone)
+        self.situation = objects(situation)
+        self.event_id = objects(event_id)
+        self.shooter = np.asarray(shooter, dtype=np.int64).reshape(n)
+        self.goalie = np.asarray(goalie, dtype=np.int64).reshape(n)
+        self.penalty_minutes = objects(penalty_minutes)
+
+        self._lists: Dict[str, list] = {}
+        self._index: Optional[Dict[int, int]] = None
+        # Per-frame results shared between calculators (e.g. per-shot xG).
+        self.memo: Dict[Any, Any] = {}
+
+    @classmethod
+    def of(cls, play_by_play: Optional[Dict[str, Any]]) -> 'PlayByPlayFrame':
+        """Frame for a play-by-play payload, built once per `plays` list."""
+        plays = (play_by_play or {}).get('plays') or []
+        key = id(plays)
+        with _cache_lock:
+            frame = _cache.get(key)
+            if frame is not None and frame.plays is plays and len(frame) == len(plays):
+                _cache.move_to_end(key)
+                return frame
+        frame = cls(plays)
+        with _cache_lock:
+            _cache[key] = frame
+            _cache.move_to_end(key)
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+        return frame
+
+    def __len__(self) -> int:
+        return self._n
+
+    def column(self, name: str) -> list:
+        """A column as a plain Python list, for calculators that walk plays in order."""
+        values = self._lists.get(name)
+        if values is None:
+            values = getattr(self, name).tolist()
+            self._lists[name] = values
+        return values
+
+    def index_of(self, play: Dict[str, Any]) -> Optional[int]:
+        """Position of `play` in the feed (None if it is not part of it)."""
+        if self._index is None:
+            self._index = {id(p): i for i, p in enumerate(self.plays)}
+        i = self._index.get(id(play))
+        if i is None:
+            try:
+                i = self.plays.index(play)
+            except ValueError:
+                return None
+        return i
+
+    def shot_annotations(self) -> 'ShotAnnotations':
+        annotations = self.memo.get('shot_annotations')
+        if annotations is None:
+            annotations = self.memo['shot_annotations'] = ShotAnnotations(self)
+        return annotations
+
+    def is_type(self, *event_types: str) -> np.ndarray:
+        return np.isin(self.event_type, event_types)
+
+    def regulation(self) -> np.ndarray:
+        return (self.period >= 1) & (self.period <= 3)
+
+    def per_period(self, mask: np.ndarray) -> List[int]:
+        """Count of events in `mask` for periods 1-3 (mask must exclude other periods)."""
+        return np.bincount(self.period[mask] - 1, minlength=3)[:3].tolist()
+
+
+class ShotAnnotations:
+    """
+    Sequence context for every play, computed in one forward sweep.
+
+    Each team keeps a sliding window of its plays from the last 59 events, so
+    a shot only looks back over its own team's recent events:
+
+      rush / since_trigger  a same-team, same-period event in the N/D zone (or
+                            a transition event: takeaway, giveaway, block, hit,
+                            faceoff) at most 8 seconds earlier, and how long
+                            before the shot it happened (NaN when not a rush)
+      origin_zone           zone of the most recent same-team N/D event within
+                            the previous 10 plays and 20 seconds; 'offensive'
+                            if a same-team shot comes first; otherwise the
+                            shot's own zone
+
+    `rebound` and `xg_rush` apply ImprovedXGModel's rules to the 10 plays
+    before the shot (shot within 3s of a previous attempt without a stoppage;
+    same-team N/D event within 4s). Like the model, they read a previous
+    event's period from its 'period' key, which feed plays usually lack.
+    """
+
+    RUSH_LOOKBACK_PLAYS = 59
+    RUSH_WINDOW_SECONDS = 8
+    ORIGIN_LOOKBACK_PLAYS = 10
+    ORIGIN_WINDOW_SECONDS = 20
+
+    def __init__(self, frame: PlayByPlayFrame):
+        n = len(frame)
+        types = frame.column('event_type')
+        teams = frame.column('team')
+        periods = frame.column('period')
+        times = frame.column('seconds')
+        zones = frame.column('zone')
+        names = [zone_name(z, x) for z, x in zip(zones, frame.column('x'))]
+        in_nd = [z in ('N', 'D') for z in zones]
+        model_periods = [p.get('period', 1) for p in frame.plays]
+
+        rush = np.zeros(n, dtype=bool)
+        since_trigger = np.full(n, np.nan)
+        origin_zone = np.empty(n, dtype=object)
+        rebound = np.zeros(n, dtype=bool)
+        xg_rush = np.zeros(n, dtype=bool)
+
+        recent: Dict[Any, deque] = {}
+        for i in range(n):
+            team, period, t = teams[i], periods[i], times[i]
+            window = recent.get(team)
+            if window is None:
+                window = recent[team] = deque()
+            while window and window[0] < i - self.RUSH_LOOKBACK_PLAYS:
+                window.popleft()
+
+            for j in reversed(window):
+                if periods[j] != period:
+                    continue
+                dt = t - times[j]
+                if dt < 0:
+                    continue
+                if dt > self.RUSH_WINDOW_SECONDS:
+                    break
+                if in_nd[j] or types[j] in TRANSITION_TYPES:
+                    rush[i] = True
+                    since_trigger[i] = dt
+                    break
+
+            origin = names[i]
+            for j in reversed(window):
+                if j < i - self.ORIGIN_LOOKBACK_PLAYS:
+                    break
+                if periods[j] != period:
+                    continue
+                if t - times[j] > self.ORIGIN_WINDOW_SECONDS:
+                    break
+                if names[j] != 'offensive':
+                    origin = names[j]
+                    break
+                if types[j] in ('shot-on-goal', 'goal', 'missed-shot'):
+                    origin = 'offensive'
+                    break
+            origin_zone[i] = origin
+
+            for j in range(i - 1, max(-1, i - 6), -1):
+                if types[j] in STOPPAGE_TYPES:
+                    break
+                dt = abs(t - times[j])
+                if types[j] in SHOT_ATTEMPT_TYPES and model_periods[j] == period and dt <= 3:
+                    rebound[i] = True
+                    break
+                if dt > 5:
+                    break
+
+            for j in range(i - 1, max(-1, i - 11), -1):
+                if model_periods[j] != period:
+                    continue
+                dt = abs(t - times[j])
+                if dt > 6:
+                    break
+                if team != NO_TEAM and teams[j] == team and in_nd[j] and dt <= 4:
+                    xg_rush[i] = True
+                    break
+
+            window.append(i)
+
+        self.rush = rush
+        self.since_trigger = since_trigger
+        self.origin_zone = origin_zone
+        self.rebound = rebound
+        self.xg_rush = xg_rush
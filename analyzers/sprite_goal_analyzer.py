@@ -5,7 +5,43 @@ Analyzes sprite data for both teams and provides comparative statistics
 
 import requests
 import math
-from typing import Dict, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from utils.nhl_api_cache import ResponseCache
+    from utils.nhl_api_client import NHLAPIClient
+except ImportError:
+    from nhl_api_cache import ResponseCache
+    from nhl_api_client import NHLAPIClient
+
+# Sprite frames for a goal never change once published, so they are cached
+# permanently, keyed by (season, game, event).
+SPRITE_CACHE_DIR = Path(os.environ.get("SPRITE_CACHE_DIR", "data/cache/sprites"))
+SPRITE_FETCH_WORKERS = 8
+
+_sprite_cache = None
+
+
+def _get_sprite_cache():
+    global _sprite_cache
+    if _sprite_cache is None:
+        _sprite_cache = ResponseCache(SPRITE_CACHE_DIR, max_memory_entries=32)
+    return _sprite_cache
+
+
+def _sprite_season(game_id):
+    try:
+        year = str(game_id)[:4]
+        return f"{year}{int(year) + 1}"
+    except:
+        return "20252026"
+
 
 class SpriteGoalAnalyzer:
     """Analyzes all goals in a game using sprite tracking data - team comparison"""
@@ -15,38 +51,65 @@ class SpriteGoalAnalyzer:
         self.GOAL_X = 2250
         self.GOAL_Y = 500
         self.BLUE_LINE_X = 700
+        self.api = NHLAPIClient()
+        self.session = self._build_sprite_session()
+    
+    @staticmethod
+    def _build_sprite_session():
+        """Keep-alive session for wsr.nhle.com with retry/backoff on throttling and 5xx"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Referer': 'https://www.nhl.com/',
+        })
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({'GET'}))
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=SPRITE_FETCH_WORKERS)
+        session.mount('https://', adapter)
+        return session
     
     def distance(self, x1, y1, x2, y2):
         """Calculate Euclidean distance"""
         return math.sqrt((x2-x1)**2 + (y2-y1)**2)
     
     def get_sprite_data(self, game_id, event_id):
-        """Fetch sprite data for a specific event"""
-        try:
-            year = str(game_id)[:4]
-            next_year = str(int(year) + 1)
-            season = f"{year}{next_year}"
-        except:
-            season = "20252026"
+        """Fetch sprite data for a specific event (disk-cached once available)"""
+        season = _sprite_season(game_id)
+        key = f"sprites/{season}/{game_id}/ev{event_id}"
+        cache = _get_sprite_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
             
-        url = f'https://wsr.nhle.com/sprites/{season}/{game_id}/ev{event_id}.json'
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Referer': 'https://www.nhl.com/',
-        }
+        url = f'https://wsr.nhle.com/{key}.json'
         try:
-            response = requests.get(url, headers=headers, timeout=5)
+            response = self.session.get(url, timeout=5)
             if response.status_code == 200:
-                return response.json()
+                data = response.json()
+                cache.put(key, data, None)
+                return data
         except:
             pass
         return None
     
+    def get_sprites_batch(self, game_id, event_ids: Iterable) -> Dict:
+        """
+        Fetch sprite data for many events concurrently.
+
+        Returns {event_id: sprite_data}; events without sprite data are omitted.
+        """
+        event_ids = [e for e in dict.fromkeys(event_ids) if e is not None]
+        if not event_ids:
+            return {}
+        workers = min(SPRITE_FETCH_WORKERS, len(event_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(lambda e: self.get_sprite_data(game_id, e), event_ids)
+            return {e: data for e, data in zip(event_ids, results) if data}
+    
     def get_game_data(self, game_id):
         """Fetch game play-by-play data"""
-        url = f'https://api-web.nhle.com/v1/gamecenter/{game_id}/play-by-play'
         try:
-            return requests.get(url, timeout=5).json()
+            return self.api.get_play_by_play(game_id)
         except:
             return None
     
@@ -131,9 +194,8 @@ class SpriteGoalAnalyzer:
     
     def get_game_landing(self, game_id):
         """Fetch game landing data for detailed period info"""
-        url = f'https://api-web.nhle.com/v1/gamecenter/{game_id}/landing'
         try:
-            return requests.get(url, timeout=5).json()
+            return self.api.get_game_landing(game_id)
         except:
             return None
             
@@ -387,10 +449,15 @@ class SpriteGoalAnalyzer:
         else:
             return "Set"
     
-    def analyze_game_goals_by_team(self, game_id) -> Optional[Dict]:
-        """Analyze all goals by team and return team comparison data"""
-        game_data = self.get_game_data(game_id)
-        landing_data = self.get_game_landing(game_id)
+    def analyze_game_goals_by_team(self, game_id, play_by_play=None, landing=None) -> Optional[Dict]:
+        """
+        Analyze all goals by team and return team comparison data.
+
+        play_by_play / landing may be passed in when the caller already has
+        them (e.g. from a game bundle) to skip refetching.
+        """
+        game_data = play_by_play or self.get_game_data(game_id)
+        landing_data = landing or self.get_game_landing(game_id)
         
         if not game_data:
             return None
@@ -455,26 +522,22 @@ class SpriteGoalAnalyzer:
             }
         }
         
-        # Fetch PBP data to calculate Net-Front Traffic %
-        pbp_url = f"https://api-web.nhle.com/v1/gamecenter/{game_id}/play-by-play"
-        pbp_response = requests.get(pbp_url)
-        if pbp_response.status_code == 200:
-            pbp_data = pbp_response.json()
-            plays = pbp_data.get('plays', [])
+        # Net-Front Traffic % from the play-by-play we already have
+        for play in goals:
+            details = play.get('details', {})
+            event_team = details.get('eventOwnerTeamId')
             
-            # Calculate traffic goals for each team
-            for play in plays:
-                if play.get('typeDescKey') != 'goal':
-                    continue
-                details = play.get('details', {})
-                event_team = details.get('eventOwnerTeamId')
-                
-                if event_team in team_stats:
-                    team_stats[event_team]['total_goals'] += 1
-                    shot_type = details.get('shotType', '').lower()
-                    # Shot types indicating net-front traffic
-                    if shot_type in ['tip-in', 'deflected', 'wrap-around', 'bat']:
-                        team_stats[event_team]['traffic_goals'] += 1
+            if event_team in team_stats:
+                team_stats[event_team]['total_goals'] += 1
+                shot_type = details.get('shotType', '').lower()
+                # Shot types indicating net-front traffic
+                if shot_type in ['tip-in', 'deflected', 'wrap-around', 'bat']:
+                    team_stats[event_team]['traffic_goals'] += 1
+        
+        sprites = self.get_sprites_batch(
+            game_id,
+            [g.get('eventId') for g in goals if g.get('details', {}).get('eventOwnerTeamId') in team_stats],
+        )
         
         for goal in goals:
             event_id = goal.get('eventId')
@@ -484,7 +547,7 @@ class SpriteGoalAnalyzer:
             if scoring_team_id not in team_stats:
                 continue
             
-            sprite_data = self.get_sprite_data(game_id, event_id)
+            sprite_data = sprites.get(event_id)
             if not sprite_data:
                 continue
             
@@ -566,7 +629,11 @@ class SpriteGoalAnalyzer:
         if not game_id:
             return {}
             
-        result = self.analyze_game_goals_by_team(game_id)
+        result = self.analyze_game_goals_by_team(
+            game_id,
+            play_by_play=self.game_data.get('play_by_play'),
+            landing=self.game_data.get('landing'),
+        )
         if not result:
             return {}
             
@@ -138,13 +138,13 @@ class TeamAdvancedMetricsBuilder:
         m, s = map(int, time_str.split(':'))
         return (period - 1) * 1200 + m * 60 + s
 
-    def process_game(self, game_id: str):
-        """Process a single game's play-by-play for advanced metrics."""
+    def process_game(self, game_id: str, play_by_play: Optional[Dict] = None):
+        """Process a single game's play-by-play for advanced metrics (fetched unless `play_by_play` is given)."""
         game_id = str(game_id)
         if game_id in self.processed_games:
             return
             
-        pbp = self.api.get_play_by_play(game_id)
+        pbp = play_by_play or self.api.get_play_by_play(game_id)
         if not pbp:
             return
             
@@ -7,7 +7,7 @@ for _d in _module_dirs:
     if _p not in sys.path:
         sys.path.insert(0, _p)
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 import json
 import os
@@ -78,6 +78,8 @@ except ImportError as e:
         def predict_live_game(self, metrics): return {}
     live_predictor = MockPredictor()
 
+from live_hub import LiveGameHub
+
 # Cache for team metrics to avoid recalculating on every request
 _team_metrics_cache = None
 _team_metrics_cache_time = None
@@ -1223,16 +1225,15 @@ def get_team_top_performers(team_abbr):
         print(f"Error fetching team top performers: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/live-game/<game_id>', methods=['GET'])
-def get_live_game_data(game_id):
-    """Get live game data and predictions"""
-    print(f"🚀🚀🚀 ENTERING get_live_game_data for game_id={game_id}", flush=True)
+def compute_live_game(game_id):
+    """One full computation of a game's live data and predictions: (payload, HTTP status)"""
+    print(f"🚀🚀🚀 ENTERING compute_live_game for game_id={game_id}", flush=True)
     try:
         # Get live metrics (works for live and completed games)
         live_metrics = live_predictor.get_live_game_data(game_id)
         
         if not live_metrics:
-            return jsonify({"error": "Game not found"}), 404
+            return {"error": "Game not found"}, 404
         
         # CRITICAL: Extract physical stats from boxscore RIGHT HERE if they're 0
         # This ensures they're set before predict_live_game
@@ -1264,7 +1265,7 @@ def get_live_game_data(game_id):
         prediction = live_predictor.predict_live_game(live_metrics)
         
         if not prediction:
-            return jsonify({"error": "Could not generate prediction"}), 500
+            return {"error": "Could not generate prediction"}, 500
             
         # CRITICAL: Preserve original live_metrics physical stats IMMEDIATELY after predict_live_game
         # predict_live_game might overwrite or not preserve these values, so we force them back
@@ -2813,14 +2814,53 @@ def get_live_game_data(game_id):
         if 'play_by_play_with_likelihood' in final_response.get('live_metrics', {}):
             pbp_len = len(final_response['live_metrics']['play_by_play_with_likelihood'])
             print(f"   play_by_play_with_likelihood length: {pbp_len}", flush=True)
-        return jsonify(final_response)
+        return final_response, 200
     except Exception as e:
         print(f"Error in live-game endpoint: {e}")
         import traceback
         traceback.print_exc()
         # Even on error, return period_stats as empty array so frontend doesn't break
         error_response = {"error": str(e), "period_stats": [], "live_metrics": {"period_stats": []}}
-        return jsonify(error_response), 500
+        return error_response, 500
+
+
+def _live_game_status(game_id, payload):
+    """poll_interval() status of a computed live game payload"""
+    live_metrics = payload.get('live_metrics') or payload
+    if hasattr(live_predictor, 'live_status'):
+        return live_predictor.live_status(game_id, live_metrics)
+    return {'game_state': live_metrics.get('game_state')}
+
+# Each watched game is computed once per tick and shared by every client (utils/live_hub.py);
+# each sweep frees the predictor's sessions for games nobody watches any more.
+live_hub = LiveGameHub(compute_live_game, _live_game_status,
+                       on_sweep=getattr(live_predictor, 'retire_live_sessions', None),
+                       requests_per_poll=2)
+
+def _snapshot_response(snapshot):
+    return Response(snapshot['data'], status=snapshot['status'], mimetype='application/json')
+
+@app.route('/api/live-game/<game_id>', methods=['GET'])
+def get_live_game_data(game_id):
+    """Get live game data and predictions (the hub's latest snapshot)"""
+    snapshot = live_hub.snapshot(game_id)
+    if snapshot is None:
+        return jsonify({"error": "Live data not ready, retry shortly", "period_stats": [], "live_metrics": {"period_stats": []}}), 503
+    return _snapshot_response(snapshot)
+
+@app.route('/api/live-game/<game_id>/stream', methods=['GET'])
+def stream_live_game_data(game_id):
+    """Server-sent events: the live game payload each time it changes, then `event: final`"""
+    def events():
+        for snapshot in live_hub.subscribe(game_id):
+            if snapshot is None:
+                yield ": keep-alive\n\n"
+                continue
+            event = 'final' if snapshot['final'] else ('update' if snapshot['status'] == 200 else 'error')
+            yield f"id: {snapshot['version']}\nevent: {event}\ndata: {snapshot['data']}\n\n"
+
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 if __name__ == '__main__':
     import sys
@@ -2861,6 +2901,8 @@ if __name__ == '__main__':
     print(f"  GET /api/predictions/game/<game_id>")
     print(f"  GET /api/historical-stats")
     print(f"  GET /api/historical-stats/<season>")
+    print(f"  GET /api/live-game/<game_id>")
+    print(f"  GET /api/live-game/<game_id>/stream")
     print(f"  POST /api/notify/discord")
     print("=" * 50)
     port = int(os.environ.get('PORT', 5000))
@@ -612,6 +612,8 @@ class DailyPredictionNotifier:
         score_model = ScorePredictionModel()
 
 
+        # Pass 1: per-game context (odds, playoff/series state) for the slate.
+        slate = []
         for game in games:
             try:
                 # Map RotoWire game to Vegas odds key
@@ -668,18 +670,50 @@ class DailyPredictionNotifier:
                     else:
                         print(f"ℹ️  No historical series games found for {key} in local schedule.")
 
-                pred = self.meta_ensemble.predict(
-                    game['away_team'],
-                    game['home_team'],
-                    away_lineup=game.get('away_lineup'),
-                    home_lineup=game.get('home_lineup'),
-                    away_goalie=game.get('away_goalie'),
-                    home_goalie=game.get('home_goalie'),
-                    vegas_odds=vegas_odds,
-                    is_playoff=is_playoff,
-                    series_status=str(series_status_obj) if series_status_obj else None
-                )
-                
+                slate.append({
+                    'game': game,
+                    'vegas_odds': vegas_odds,
+                    'is_playoff': is_playoff,
+                    'series_status_obj': series_status_obj,
+                    'away_wins': away_wins,
+                    'home_wins': home_wins,
+                    'meta_kwargs': {
+                        'away_team': game['away_team'],
+                        'home_team': game['home_team'],
+                        'away_lineup': game.get('away_lineup'),
+                        'home_lineup': game.get('home_lineup'),
+                        'away_goalie': game.get('away_goalie'),
+                        'home_goalie': game.get('home_goalie'),
+                        'vegas_odds': vegas_odds,
+                        'is_playoff': is_playoff,
+                        'series_status': str(series_status_obj) if series_status_obj else None,
+                    },
+                })
+            except Exception as e:
+                print(f"Error predicting {game['away_team']} @ {game['home_team']}: {e}")
+                continue
+
+        # Score the whole slate with one meta-ensemble call; fall back to
+        # per-game predictions if any game breaks the batch.
+        with timed("meta-ensemble slate"):
+            try:
+                meta_preds = self.meta_ensemble.predict_batch([ctx['meta_kwargs'] for ctx in slate])
+            except Exception as e:
+                print(f"⚠️ Slate prediction failed ({e}); predicting games one at a time.")
+                meta_preds = [None] * len(slate)
+
+        # Pass 2: score model, blending and output rows.
+        for ctx, pred in zip(slate, meta_preds):
+            game = ctx['game']
+            vegas_odds = ctx['vegas_odds']
+            is_playoff = ctx['is_playoff']
+            series_status_obj = ctx['series_status_obj']
+            away_wins, home_wins = ctx['away_wins'], ctx['home_wins']
+            key = f"{game['away_team']}@{game['home_team']}"
+            try:
+                if pred is None:
+                    pred = self.meta_ensemble.predict(**ctx['meta_kwargs'])
+
                 # Phase 3: Playoff Series Simulation
                 series_proj = None
                 if is_playoff:
@@ -15,9 +15,12 @@ for _d in _module_dirs:
 import time
 import subprocess
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from nhl_api_client import NHLAPIClient
+from live_poller import LivePoller, clock_seconds
 import json
 
 
@@ -26,11 +29,15 @@ class GameMonitor:
         """
         Initialize the game monitor
         Args:
-            check_interval: How often to check for completed games (in seconds)
+            check_interval: How often to re-read today's schedule (in seconds); live games
+                are also polled individually, faster as they near their end
         """
         self.client = NHLAPIClient()
         self.check_interval = check_interval
         self.processed_games = set()  # Track games we've already processed
+        self._queued_games = set()  # Handed to the report worker, processed or not yet
+        self._queue_lock = threading.Lock()
+        self._report_worker = None
         self.processed_games_file = Path('processed_games.json')
         self.load_processed_games()
         
@@ -70,11 +77,12 @@ class GameMonitor:
             print(f"❌ Error fetching schedule: {e}")
         return []
     
-    def check_for_completed_games(self):
-        """Check for newly completed games"""
+    def check_for_completed_games(self, games=None):
+        """Check for newly completed games (in `games`, or today's schedule)"""
         print(f"\n🔍 Checking for completed games... ({datetime.now().strftime('%I:%M:%S %p')})")
         
-        games = self.get_todays_games()
+        if games is None:
+            games = self.get_todays_games()
         newly_completed = []
         
         for game in games:
@@ -211,6 +219,52 @@ class GameMonitor:
         
         return True
     
+    def game_status(self, game_id, boxscore):
+        """State of a live game's boxscore, used by LivePoller to pick the next poll interval"""
+        clock = boxscore.get('clock') or {}
+        seconds_remaining = clock.get('secondsRemaining')
+        if seconds_remaining is None:
+            seconds_remaining = clock_seconds(clock.get('timeRemaining'))
+        return {
+            'game_state': boxscore.get('gameState'),
+            'period': (boxscore.get('periodDescriptor') or {}).get('number'),
+            'seconds_remaining': seconds_remaining,
+            'in_intermission': clock.get('inIntermission'),
+            'situation_code': (boxscore.get('situation') or {}).get('situationCode'),
+        }
+    
+    def queue_game(self, game_info):
+        """Hand a completed game to the report worker, once"""
+        with self._queue_lock:
+            if game_info['id'] in self.processed_games or game_info['id'] in self._queued_games:
+                return
+            self._queued_games.add(game_info['id'])
+        self._report_worker.submit(self._process_queued_game, game_info)
+    
+    def _process_queued_game(self, game_info):
+        try:
+            self.process_game(game_info)
+        except Exception as e:
+            print(f"❌ Error processing game: {e}")
+        finally:
+            with self._queue_lock:
+                self._queued_games.discard(game_info['id'])
+    
+    def live_game_ids(self):
+        """Queue newly completed games and return the ids of the games in progress"""
+        games = self.get_todays_games()
+        for game_info in self.check_for_completed_games(games):
+            self.queue_game(game_info)
+        return [str(game.get('id')) for game in games if game.get('gameState') in ['LIVE', 'CRIT']]
+    
+    def on_game_final(self, game_id, boxscore):
+        """A polled game just ended: process it without waiting for the next schedule check"""
+        away_team = boxscore.get('awayTeam', {}).get('abbrev', 'UNK')
+        home_team = boxscore.get('homeTeam', {}).get('abbrev', 'UNK')
+        print(f"✅ NEW COMPLETED GAME: {away_team} @ {home_team} (ID: {game_id})")
+        self.queue_game({'id': str(game_id), 'away': away_team, 'home': home_team,
+                         'state': boxscore.get('gameState')})
+    
     def run(self):
         """Main monitoring loop"""
         print("="*60)
@@ -223,29 +277,24 @@ class GameMonitor:
         print("\n🔄 Starting monitoring loop...")
         print("   Press Ctrl+C to stop\n")
         
+        # Reports are generated one at a time, off the polling thread
+        self._report_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-report")
+        poller = LivePoller(
+            self.client.get_game_boxscore,
+            self.game_status,
+            on_final=self.on_game_final,
+            discover=self.live_game_ids,
+            discover_interval=self.check_interval,
+        )
         try:
-            while True:
-                # Check for completed games
-                newly_completed = self.check_for_completed_games()
-                
-                # Process each newly completed game
-                for game_info in newly_completed:
-                    try:
-                        self.process_game(game_info)
-                    except Exception as e:
-                        print(f"❌ Error processing game: {e}")
-                        continue
-                
-                # Wait before next check
-                if newly_completed:
-                    print(f"\n⏳ Waiting {self.check_interval} seconds before next check...")
-                
-                time.sleep(self.check_interval)
-                
+            poller.run()
         except KeyboardInterrupt:
+            poller.stop()
             print("\n\n🛑 Monitoring stopped by user")
             print(f"📊 Total games processed this session: {len(self.processed_games)}")
             print("👋 Goodbye!")
+        finally:
+            self._report_worker.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
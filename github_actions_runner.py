@@ -25,8 +25,10 @@ from twitter_config import TEAM_HASHTAGS, TWITTER_API_KEY
 from improved_self_learning_model_v2 import ImprovedSelfLearningModelV2
 from correlation_model import CorrelationModel
 from pdf_report_generator import PostGameReportGenerator
+from game_analysis_context import GameAnalysisContext
 from goalie_stats_builder import GoalieStatsBuilder
 from team_advanced_metrics_builder import TeamAdvancedMetricsBuilder
+from report_pipeline import prepare_reports
 import json
 import subprocess
 import numpy as np
@@ -364,32 +366,44 @@ class GitHubActionsRunner:
     
     def generate_and_post_game(self, game_id, away_team, home_team):
         """Generate report and post to Twitter for a single game"""
+        game = {'id': game_id, 'away': away_team, 'home': home_team}
+        _, prepared = next(prepare_reports([game], self.client.get_game_bundle, max_workers=1))
+        return self.publish_game_report(game_id, away_team, home_team, prepared)
+
+    def publish_game_report(self, game_id, away_team, home_team, prepared):
+        """
+        Record, learn from and post one game's prepared report (see
+        report_pipeline.prepare_reports). Runs on the main thread, one game at
+        a time, so stats files, the learning model and posts stay in order.
+        Returns True when the game can be marked processed.
+        """
         print(f"\n{'='*60}")
         print(f"🏒 PROCESSING: {away_team} @ {home_team}")
         print(f"{'='*60}")
-        
-        # Generate the report
+
         print(f"\n📊 Generating report for {away_team} @ {home_team}...")
         try:
-            # Fetch comprehensive game data
-            game_data = self.client.get_comprehensive_game_data(game_id)
-            
+            game_data = prepared['game_data']
+            report = prepared['report']
+
             if not game_data:
+                if prepared['error'] is not None:
+                    raise prepared['error']
                 print(f"❌ Failed to fetch game data")
                 return False
-            
+
+            # Reuse whatever the render step already computed for this game
+            if report:
+                GameAnalysisContext.of(game_data).merge(report.get('analysis'))
+
             # Update team stats from this completed game
             print(f"📈 Updating team stats from completed game...")
             self.update_team_stats_from_game(game_data)
-            
-            # Create output filename
-            output_filename = f"/tmp/nhl_postgame_report_{away_team}_vs_{home_team}_{game_id}.pdf"
-            
-            # Import and run the PDF generator
-            from pdf_report_generator import PostGameReportGenerator
-            
-            generator = PostGameReportGenerator()
-            pdf_path = generator.generate_report(game_data, output_filename, game_id)
+
+            if prepared['error'] is not None:
+                raise prepared['error']
+            pdf_path = report['pdf_path']
+            image_path = report['image_path']
 
             # Ingest ALL postgame report metrics (append-only JSONL) for analysis
             try:
@@ -398,7 +412,9 @@ class GitHubActionsRunner:
                 except Exception:
                     from event_store import append_postgame_metrics_event
 
-                payload = generator.collect_postgame_metrics(game_data, game_id=game_id)
+                payload = report['postgame_metrics']
+                if payload is None:
+                    raise ValueError("postgame metrics were not collected")
                 append_postgame_metrics_event(
                     {
                         "game_id": str(game_id),
@@ -411,87 +427,35 @@ class GitHubActionsRunner:
                 print("✅ Appended postgame metrics event")
             except Exception as e:
                 print(f"⚠️  Could not append postgame metrics event: {e}")
-            
-            if not generator.is_high_fidelity:
+
+            if not report['is_high_fidelity']:
                 print(f"⚠️  Low-fidelity report detected for game {game_id} (Comparison failed).")
                 print(f"   Suppressed social media posts per integrity standards.")
                 # Mark as processed anyway so we don't keep trying failed archival games
                 return True
-            
-            if not pdf_path or not Path(pdf_path).exists():
+
+            if not pdf_path or not (image_path or Path(pdf_path).exists()):
                 print(f"❌ Report generation failed")
                 return False
-            
+
             print(f"✅ Report generated: {pdf_path}")
-            
+
             # Learn from this game's data
             self.learn_from_game(game_data, game_id, away_team, home_team)
-            
+
             # Update Advanced Goalie and Team Metrics
             print(f"🔄 Updating advanced goalie and team metrics for game {game_id}...")
             try:
-                self.goalie_builder.process_game(game_data)
+                play_by_play = game_data.get('play_by_play')
+                self.goalie_builder.process_game(game_id, play_by_play)
                 self.goalie_builder.save()
-                
-                self.team_metrics_builder.process_game(game_data)
+
+                self.team_metrics_builder.process_game(game_id, play_by_play)
                 self.team_metrics_builder.save()
                 print("✅ Advanced metrics updated successfully")
             except Exception as e:
                 print(f"⚠️ Failed to update advanced metrics: {e}")
-            
-            # Convert PDF to PNG using pdf2image
-            from pdf2image import convert_from_path
-            
-            output_dir = Path("/tmp/nhl_images")
-            output_dir.mkdir(exist_ok=True)
-            
-            # Convert PDF to PNG.
-            # These reports are text-dense and get downscaled in the X timeline,
-            # so we render at higher DPI to preserve small table text (especially sprite bars).
-            pages = convert_from_path(pdf_path, dpi=400)
-            
-            if not pages:
-                print(f"❌ PDF conversion failed - no pages")
-                return False
-            
-            # Stitch all pages into a single tall image (fixes truncated reports)
-            if len(pages) == 1:
-                final_image = pages[0]
-            else:
-                from PIL import Image as PILImage
-                total_width = max(p.width for p in pages)
-                total_height = sum(p.height for p in pages)
-                final_image = PILImage.new('RGB', (total_width, total_height), 'white')
-                y_offset = 0
-                for page in pages:
-                    final_image.paste(page, (0, y_offset))
-                    y_offset += page.height
-                print(f"📐 Stitched {len(pages)} pages into single image ({total_width}x{total_height})")
-                
-                # Auto-crop the stitched image to remove empty space at the bottom (useful for OT spill-over)
-                try:
-                    gray = final_image.convert('L')
-                    # Threshold: Paper.png pixels are very bright (> 220ish). Text/lines are darker.
-                    # Convert content pixels (< 230) to 255 (white) and background to 0 (black).
-                    content_mask = gray.point(lambda p: 255 if p < 230 else 0)
-                    bbox = content_mask.getbbox()
-                    
-                    if bbox:
-                        # getbbox returns (left, upper, right, lower)
-                        # Add a padding of 150 pixels below the actual content
-                        crop_bottom = min(bbox[3] + 150, final_image.height)
-                        
-                        # Only crop if there's a significant amount of empty space (e.g. > 200px)
-                        if final_image.height - crop_bottom > 200:
-                            final_image = final_image.crop((0, 0, final_image.width, crop_bottom))
-                            print(f"✂️ Cropped image height from {total_height} to {crop_bottom} to remove empty space")
-                except Exception as e:
-                    print(f"⚠️ Could not auto-crop image: {e}")
-            
-            image_filename = f"nhl_postgame_report_{away_team}_vs_{home_team}_{game_id}.png"
-            image_path = output_dir / image_filename
-            final_image.save(image_path, 'PNG')
-            
+
             if not image_path or not Path(image_path).exists():
                 print(f"❌ Image conversion failed")
                 # Clean up PDF
@@ -500,22 +464,15 @@ class GitHubActionsRunner:
                 except:
                     pass
                 return False
-            
+
             print(f"✅ Image converted: {image_path}")
-            
-            # Clean up PDF file (no longer needed)
-            try:
-                Path(pdf_path).unlink()
-                print(f"🗑️  Cleaned up PDF: {pdf_path}")
-            except Exception as e:
-                print(f"⚠️  Could not delete PDF: {e}")
-            
+
         except Exception as e:
             print(f"❌ Error generating report: {e}")
             import traceback
             traceback.print_exc()
             return False
-        
+
         # Post to X
         away_hashtag = TEAM_HASHTAGS.get(away_team, f'#{away_team}')
         home_hashtag = TEAM_HASHTAGS.get(home_team, f'#{home_team}')
@@ -663,10 +620,9 @@ class GitHubActionsRunner:
     def learn_from_game(self, game_data, game_id, away_team, home_team):
         """Learn from completed game data to improve predictions"""
         try:
-            # Get win probability prediction from the report generator
-            from pdf_report_generator import PostGameReportGenerator
-            generator = PostGameReportGenerator()
-            
+            # Metrics come from the game's analysis context, shared with the report
+            generator = self.report_generator
+
             # Calculate win probability using current model
             win_prob = generator.calculate_win_probability(game_data)
             
@@ -941,6 +897,9 @@ class GitHubActionsRunner:
         # Check for completed games
         for game in games:
             game_id = str(game.get('id'))
+            # A game listed on both schedule days is queued (and posted) once.
+            if any(queued['id'] == game_id for queued in newly_completed):
+                continue
             game_state = game.get('gameState', 'UNKNOWN')
             away_team = game.get('awayTeam', {}).get('abbrev', 'UNK')
             home_team = game.get('homeTeam', {}).get('abbrev', 'UNK')
@@ -989,21 +948,18 @@ class GitHubActionsRunner:
         
         print(f"\n🚀 Processing {len(newly_completed)} new game(s)...")
         
-        # Process each newly completed game
+        # Fetch and render every game concurrently; post, learn and record
+        # each one here in schedule order as soon as its report is ready.
         success_count = 0
-        for game_info in newly_completed:
+        for game_info, prepared in prepare_reports(newly_completed, self.client.get_game_bundle):
             try:
-                success = self.generate_and_post_game(
+                success = self.publish_game_report(
                     game_info['id'],
                     game_info['away'],
-                    game_info['home']
+                    game_info['home'],
+                    prepared
                 )
 
-                # Also post to Discord (don't fail run if this fails)
-                # Note: We need the image path for this, but generate_and_post_game cleans it up.
-                # Refactoring note: Ideally generate_and_post_game should return the image path or accept a callback.
-                # For now, let's modify generate_and_post_game to call Discord internally BEFORE cleanup.
-                
                 if success:
                     # Only mark as processed if successfully posted
                     self.processed_games.add(game_info['id'])
@@ -15,6 +15,7 @@ for _d in _module_dirs:
 
 import json
 import requests
+import threading
 import time
 from datetime import datetime, timedelta
 import pytz
@@ -23,6 +24,10 @@ from improved_self_learning_model_v2 import ImprovedSelfLearningModelV2
 from nhl_api_client import NHLAPIClient
 from pdf_report_generator import PostGameReportGenerator
 from advanced_metrics_analyzer import AdvancedMetricsAnalyzer
+from game_analysis_context import GameAnalysisContext
+from live_game_session import LiveGameSession
+from live_poller import LivePoller, clock_seconds
+from player_directory import get_player_directory, boxscore_names, player_id_of
 
 class LiveInGamePredictor:
     def __init__(self):
@@ -30,6 +35,9 @@ class LiveInGamePredictor:
         self.model = ImprovedSelfLearningModelV2()
         self.report_generator = PostGameReportGenerator()
         self.ct_tz = pytz.timezone('US/Central')
+        # Per-game live sessions: what each poll has already read from the play-by-play
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
         
     def get_live_games(self):
         """Get all currently active NHL games"""
@@ -56,11 +64,44 @@ class LiveInGamePredictor:
             print(f"❌ Error getting live games: {e}")
             return []
     
+    def live_session(self, game_id):
+        """The LiveGameSession for game_id, created on first use"""
+        with self._sessions_lock:
+            session = self._sessions.get(str(game_id))
+            if session is None:
+                session = self._sessions[str(game_id)] = LiveGameSession(
+                    game_id, xg=lambda x, y, shot_type: self.report_generator._calculate_improved_xg_live(x, y, shot_type))
+            return session
+    
+    def retire_live_sessions(self, active_game_ids):
+        """Drop the sessions of games that are no longer being polled"""
+        active = {str(game_id) for game_id in active_game_ids}
+        with self._sessions_lock:
+            for game_id in [g for g in self._sessions if g not in active]:
+                del self._sessions[game_id]
+    
+    def live_status(self, game_id, live_metrics):
+        """Game state used by LivePoller to pick the next poll interval"""
+        last_play = self.live_session(game_id).last_play or {}
+        return {
+            'game_state': live_metrics.get('game_state'),
+            'period': live_metrics.get('current_period'),
+            'seconds_remaining': clock_seconds(live_metrics.get('time_remaining')),
+            'in_intermission': last_play.get('typeDescKey') == 'period-end',
+            'situation_code': last_play.get('situationCode'),
+        }
+    
     def get_live_game_data(self, game_id):
         """Get comprehensive live game data including ALL metrics from post-game reports"""
+        session = self.live_session(game_id)
+        with session.lock:
+            return self._get_live_game_data(game_id, session)
+    
+    def _get_live_game_data(self, game_id, session):
+        """get_live_game_data for one poll; play-by-play loops only visit the plays new to `session`"""
         try:
             print(f"🔍 get_live_game_data called for game_id={game_id}", flush=True)
-            game_data = self.api.get_comprehensive_game_data(game_id)
+            game_data = self.api.get_game_bundle(game_id, include_landing=False)
             
             # DEBUG: Mock Data for BOS vs ANA (2025020318) - REMOVED
             # if str(game_id) == '2025020318': ...
@@ -221,6 +262,12 @@ class LiveInGamePredictor:
             if not game_state:
                 print(f"⚠️ WARNING: Could not determine game_state for game {game_id}")
             
+            # Fold the plays appended since the last poll into this game's session
+            pbp_for_session = game_data.get('play_by_play') or game_data.get('playByPlay') or {}
+            new_plays = session.advance(pbp_for_session.get('plays') or [], away_team_id, home_team_id,
+                                        pbp_for_session.get('rosterSpots'))
+            print(f"🔍 Live session: {len(new_plays)} new plays ({session.processed} total)", flush=True)
+            
             # Get period and time info
             period_info = boxscore.get('periodInfo', {}) or boxscore.get('periodDescriptor', {})
             current_period = period_info.get('currentPeriod', 1) or period_info.get('number', 1)
@@ -292,22 +339,10 @@ class LiveInGamePredictor:
             # If shots are still 0, count from play-by-play data
             if away_shots == 0 or home_shots == 0:
                 play_by_play = game_data.get('playByPlay', {}) or game_data.get('play_by_play', {})
-                plays = play_by_play.get('plays', []) if play_by_play else []
-                away_shots_count = 0
-                home_shots_count = 0
-                for play in plays:
-                    event_type = play.get('typeDescKey', '') or play.get('typeDesc', '')
-                    if event_type == 'shot-on-goal':
-                        details = play.get('details', {})
-                        event_team_id = details.get('eventOwnerTeamId')
-                        if event_team_id == away_team_id:
-                            away_shots_count += 1
-                        elif event_team_id == home_team_id:
-                            home_shots_count += 1
                 if away_shots == 0:
-                    away_shots = away_shots_count
+                    away_shots = session.counts['away']['sog']
                 if home_shots == 0:
-                    home_shots = home_shots_count
+                    home_shots = session.counts['home']['sog']
             
             # Initialize sums to 0
             away_hits_sum = 0
@@ -456,90 +491,17 @@ class LiveInGamePredictor:
                 plays_list = play_by_play_data.get('plays', []) if play_by_play_data else []
                 print(f"🔍 PBP Extraction: game_state={game_state}, plays_count={len(plays_list)}", flush=True)
                 
-                # Get roster to map player IDs to teams for faceoff counting
-                roster_spots = play_by_play_data.get('rosterSpots', [])
-                player_to_team = {}
-                for player in roster_spots:
-                    player_id = player.get('playerId')
-                    team_id = player.get('teamId')
-                    if player_id and team_id:
-                        player_to_team[player_id] = team_id
-                
-                # Initialize counters
-                away_hits_pbp = 0
-                home_hits_pbp = 0
-                away_pim_pbp = 0
-                home_pim_pbp = 0
-                away_blocked_pbp = 0
-                home_blocked_pbp = 0
-                away_giveaways_pbp = 0
-                home_giveaways_pbp = 0
-                away_takeaways_pbp = 0
-                home_takeaways_pbp = 0
-                away_faceoff_wins_pbp = 0
-                home_faceoff_wins_pbp = 0
-                total_faceoffs_pbp = 0
-                away_pp_goals_pbp = 0
-                home_pp_goals_pbp = 0
-                away_pp_opps_pbp = 0
-                home_pp_opps_pbp = 0
-                
-                # Count from play-by-play
-                for play in plays_list:
-                    event_type = play.get('typeDescKey', '') or play.get('typeDesc', '')
-                    details = play.get('details', {})
-                    event_team_id = details.get('eventOwnerTeamId')
-                    
-                    if event_type == 'hit':
-                        if event_team_id == away_team_id:
-                            away_hits_pbp += 1
-                        elif event_team_id == home_team_id:
-                            home_hits_pbp += 1
-                    elif event_type == 'blocked-shot':
-                        # Blocked shots: eventOwnerTeamId is the team that shot, blocking team is opposite
-                        if event_team_id == away_team_id:
-                            home_blocked_pbp += 1  # Home team blocked away team's shot
-                        elif event_team_id == home_team_id:
-                            away_blocked_pbp += 1  # Away team blocked home team's shot
-                    elif event_type == 'giveaway':
-                        if event_team_id == away_team_id:
-                            away_giveaways_pbp += 1
-                        elif event_team_id == home_team_id:
-                            home_giveaways_pbp += 1
-                    elif event_type == 'takeaway':
-                        if event_team_id == away_team_id:
-                            away_takeaways_pbp += 1
-                        elif event_team_id == home_team_id:
-                            home_takeaways_pbp += 1
-                    elif event_type == 'penalty':
-                        penalty_minutes = details.get('penaltyMinutes', 2) or details.get('duration', 2) or 2
-                        if event_team_id == away_team_id:
-                            away_pim_pbp += penalty_minutes
-                            home_pp_opps_pbp += 1  # Opposing team gets a power play opportunity
-                        elif event_team_id == home_team_id:
-                            home_pim_pbp += penalty_minutes
-                            away_pp_opps_pbp += 1
-                    elif event_type == 'goal':
-                        # Check if it's a power play goal from situation code
-                        situation_code = str(play.get('situationCode', ''))
-                        if event_team_id == away_team_id:
-                            # Check if away team scored on power play (5v4 or 5v3 situation)
-                            if '5' in situation_code and ('4' in situation_code or '3' in situation_code):
-                                away_pp_goals_pbp += 1
-                        elif event_team_id == home_team_id:
-                            if '5' in situation_code and ('4' in situation_code or '3' in situation_code):
-                                home_pp_goals_pbp += 1
-                    elif event_type == 'faceoff':
-                        # CORRECTED: Each faceoff has ONE winner and ONE loser
-                        # Count total faceoffs once, then determine winner from roster
-                        total_faceoffs_pbp += 1
-                        winning_player_id = details.get('winningPlayerId')
-                        if winning_player_id and winning_player_id in player_to_team:
-                            winning_team = player_to_team[winning_player_id]
-                            if winning_team == away_team_id:
-                                away_faceoff_wins_pbp += 1
-                            elif winning_team == home_team_id:
-                                home_faceoff_wins_pbp += 1
+                # Counted incrementally by the live session (faceoff winners mapped to teams via rosterSpots)
+                away_counts, home_counts = session.counts['away'], session.counts['home']
+                away_hits_pbp, home_hits_pbp = away_counts['hits'], home_counts['hits']
+                away_pim_pbp, home_pim_pbp = away_counts['pim'], home_counts['pim']
+                away_blocked_pbp, home_blocked_pbp = away_counts['blocked'], home_counts['blocked']
+                away_giveaways_pbp, home_giveaways_pbp = away_counts['giveaways'], home_counts['giveaways']
+                away_takeaways_pbp, home_takeaways_pbp = away_counts['takeaways'], home_counts['takeaways']
+                away_faceoff_wins_pbp, home_faceoff_wins_pbp = away_counts['faceoff_wins'], home_counts['faceoff_wins']
+                total_faceoffs_pbp = session.faceoffs
+                away_pp_goals_pbp, home_pp_goals_pbp = away_counts['pp_goals'], home_counts['pp_goals']
+                away_pp_opps_pbp, home_pp_opps_pbp = away_counts['pp_opps'], home_counts['pp_opps']
                 
                 # Update live_metrics with play-by-play counts - ALWAYS use play-by-play for completed games
                 # Play-by-play is the source of truth for these stats
@@ -619,104 +581,12 @@ class LiveInGamePredictor:
             # Extract Scoring Summary
             scoring_summary = []
             try:
-                # BUILD player_names dictionary - PRIMARY SOURCE: NHL API Roster Endpoint
-                # This is the most reliable method (same approach as user suggested)
-                player_names = {}
-                
-                # PRIMARY SOURCE: NHL API Roster Endpoint (most reliable)
-                if away_abbrev and home_abbrev:
-                    print(f"📋 Fetching rosters from NHL API for {away_abbrev} and {home_abbrev}...", flush=True)
-                    for team_abbrev in [away_abbrev, home_abbrev]:
-                        try:
-                            roster_data = self.api.get_team_roster_by_abbrev(team_abbrev, season='20252026')
-                            if roster_data:
-                                # Roster API returns: {'forwards': [...], 'defensemen': [...], 'goalies': [...]}
-                                for position_group in ['forwards', 'defensemen', 'goalies']:
-                                    players = roster_data.get(position_group, [])
-                                    for player in players:
-                                        player_id = player.get('id')
-                                        if not player_id:
-                                            continue
-                                        
-                                        # Get name from roster API structure
-                                        first_name_obj = player.get('firstName', {})
-                                        first_name = first_name_obj.get('default', '') if isinstance(first_name_obj, dict) else (first_name_obj or '')
-                                        last_name_obj = player.get('lastName', {})
-                                        last_name = last_name_obj.get('default', '') if isinstance(last_name_obj, dict) else (last_name_obj or '')
-                                        full_name = f"{first_name} {last_name}".strip()
-                                        
-                                        # CRITICAL: Only store if full_name is actually a name (not empty, not an ID)
-                                        if full_name and not full_name.isdigit() and not isinstance(full_name, int):
-                                            player_names[player_id] = full_name
-                                            player_names[str(player_id)] = full_name
-                                        
-                                print(f"✅ Loaded {len([p for p in roster_data.get('forwards', []) + roster_data.get('defensemen', []) + roster_data.get('goalies', [])])} players from {team_abbrev} roster", flush=True)
-                        except Exception as e:
-                            print(f"⚠️ Error fetching roster for {team_abbrev}: {e}", flush=True)
+                # Names come from the player directory, seeded from this game's rosterSpots and boxscore
+                player_directory = get_player_directory()
+                player_directory.add_boxscore(game_data.get('boxscore'))
+                player_directory.add_roster_spots((game_data.get('play_by_play') or {}).get('rosterSpots'))
                 
-                # FALLBACK 1: boxscore.playerByGameStats (same method as top performers endpoint)
-                if len(player_names) == 0:
-                    print(f"⚠️ No player names from roster API, trying boxscore.playerByGameStats...", flush=True)
-                    raw_boxscore_for_names = game_data.get('boxscore', {})
-                    if raw_boxscore_for_names:
-                        player_by_game_stats = raw_boxscore_for_names.get('playerByGameStats', {})
-                        if player_by_game_stats:
-                            for team_key in ['awayTeam', 'homeTeam']:
-                                team_players = player_by_game_stats.get(team_key, {})
-                                for position_group in ['forwards', 'defense', 'goalies']:
-                                    players = team_players.get(position_group, [])
-                                    for player in players:
-                                        # Try multiple possible ID fields (same as top performers)
-                                        player_id = player.get('playerId') or player.get('id') or player.get('playerID')
-                                        if not player_id:
-                                            continue
-                                        
-                                        # Get name - EXACT SAME METHOD AS TOP PERFORMERS (lines 1128-1139 in api_server.py)
-                                        name = ''
-                                        name_field = player.get('name', '')
-                                        if isinstance(name_field, dict):
-                                            name = name_field.get('default', '')
-                                        elif isinstance(name_field, str):
-                                            name = name_field
-                                        
-                                        if not name:
-                                            firstName = player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', '')
-                                            lastName = player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', '')
-                                            name = f"{firstName} {lastName}".strip()
-                                        
-                                        if name:
-                                            player_names[player_id] = name
-                                            player_names[str(player_id)] = name
-                
-                # FALLBACK 2: Get roster from play_by_play (rosterSpots) if both above failed
-                if len(player_names) == 0:
-                    print(f"⚠️ No player names from boxscore, trying rosterSpots...", flush=True)
-                    play_by_play = game_data.get('play_by_play', {})
-                if 'rosterSpots' in play_by_play:
-                    for player in play_by_play['rosterSpots']:
-                        player_id = player.get('playerId')
-                        if player_id:
-                            # Handle both dict and direct string formats
-                            first_name_obj = player.get('firstName', {})
-                            first_name = first_name_obj.get('default', '') if isinstance(first_name_obj, dict) else (first_name_obj or '')
-                            last_name_obj = player.get('lastName', {})
-                            last_name = last_name_obj.get('default', '') if isinstance(last_name_obj, dict) else (last_name_obj or '')
-                            full_name = f"{first_name} {last_name}".strip()
-                            # CRITICAL: Only store if full_name is actually a name (not empty, not an ID)
-                            if full_name and not full_name.isdigit() and not isinstance(full_name, int):
-                                player_names[player_id] = full_name
-                                # Also store with string key in case IDs are strings
-                                player_names[str(player_id)] = full_name
-                            else:
-                                print(f"⚠️ Skipping invalid player name for ID {player_id}: '{full_name}'", flush=True)
-                
-                print(f"📋 Built player_names map with {len(player_names)} entries (primary: NHL API roster)", flush=True)
-                if len(player_names) == 0:
-                    play_by_play = game_data.get('play_by_play', {})
-                    print(f"⚠️ WARNING: No player names found! Available keys in play_by_play: {list(play_by_play.keys()) if play_by_play else 'None'}", flush=True)
-                
-                plays = play_by_play.get('plays', []) or []
-                for play in plays:
+                for play in session.goals:
                     if play.get('typeDescKey') == 'goal':
                         details = play.get('details', {})
                         period_desc = play.get('periodDescriptor', {})
@@ -728,14 +598,14 @@ class LiveInGamePredictor:
                         
                         # Get scorer ID and name
                         scorer_id = details.get('scoringPlayerId')
-                        scorer_name = player_names.get(scorer_id, f"Player {scorer_id}")
+                        scorer_name = player_directory.name(scorer_id, f"Player {scorer_id}")
                         
                         # Get assists
                         assists = []
                         for i in range(1, 3):  # assist1PlayerId, assist2PlayerId
                             assist_id = details.get(f'assist{i}PlayerId')
                             if assist_id:
-                                assists.append(player_names.get(assist_id, f"Player {assist_id}"))
+                                assists.append(player_directory.name(assist_id, f"Player {assist_id}"))
                         
                         scoring_summary.append({
                             'period': period_desc.get('number', 0),
@@ -766,39 +636,16 @@ class LiveInGamePredictor:
             
             live_metrics['goals_by_period'] = goals_by_period
 
-            # Extract Shot Data for Charts
-            shots_data = []
+            # Extract Shot Data for Charts - rows for earlier plays are kept in the session
+            shots_data = session.shots_data
             try:
-                # Get play_by_play data - ensure we have the right reference
-                play_by_play_for_shots = game_data.get('play_by_play', {}) or game_data.get('playByPlay', {})
-                plays = play_by_play_for_shots.get('plays', []) or []
-                
-                # REBUILD player_names if it's empty or if we have a different play_by_play reference
-                if len(player_names) == 0 or 'rosterSpots' not in play_by_play_for_shots:
-                    print(f"⚠️ Rebuilding player_names from play_by_play_for_shots...", flush=True)
-                    player_names = {}
-                    if 'rosterSpots' in play_by_play_for_shots:
-                        for player in play_by_play_for_shots['rosterSpots']:
-                            player_id = player.get('playerId')
-                            if player_id:
-                                first_name_obj = player.get('firstName', {})
-                                first_name = first_name_obj.get('default', '') if isinstance(first_name_obj, dict) else (first_name_obj or '')
-                                last_name_obj = player.get('lastName', {})
-                                last_name = last_name_obj.get('default', '') if isinstance(last_name_obj, dict) else (last_name_obj or '')
-                                full_name = f"{first_name} {last_name}".strip()
-                                if full_name:
-                                    player_names[player_id] = full_name
-                                    player_names[str(player_id)] = full_name
-                        print(f"✅ Rebuilt player_names with {len(player_names)} entries", flush=True)
-                    else:
-                        print(f"⚠️ rosterSpots NOT FOUND in play_by_play_for_shots! Keys: {list(play_by_play_for_shots.keys())}", flush=True)
+                plays = new_plays
                 
-                print(f"📊 Processing {len(plays)} plays for shots_data, player_names has {len(player_names)} entries", flush=True)
-                if len(player_names) > 0:
-                    sample_ids = list(player_names.keys())[:3]
-                    print(f"📊 Sample player_names entries: {[(k, player_names[k]) for k in sample_ids]}", flush=True)
-                else:
-                    print(f"⚠️⚠️⚠️ WARNING: player_names is EMPTY! Cannot look up player names!", flush=True)
+                # Shooters are labelled with their boxscore name (as top performers are), else the directory name
+                player_directory = get_player_directory()
+                boxscore_for_names = game_data.get('boxscore', {}) or (game_data.get('game_center') or {}).get('boxscore', {})
+                shooter_names = boxscore_names(boxscore_for_names)
+                print(f"📊 Processing {len(plays)} new plays for shots_data, {len(shooter_names)} boxscore names", flush=True)
                 
                 for play in plays:
                     event_type = play.get('typeDescKey')
@@ -818,138 +665,9 @@ class LiveInGamePredictor:
                             # Get actual shot type (wrist, slap, snap, etc.)
                             actual_shot_type = details.get('shotType', 'wrist')
                             
-                            # Get shooter name - use same method as team heatmap endpoint
                             shooter_id = details.get('shootingPlayerId') or details.get('scoringPlayerId')
-                            shooter_name = None  # Start with None, not 'Unknown'
-                            
-                            # CRITICAL: Never allow shooter_name to be set to shooter_id
-                            # If shooter_id is used as shooter_name anywhere, that's a bug
-                            
-                            if shooter_id:
-                                # CRITICAL: Never use shooter_id as shooter_name - always look it up
-                                # Ensure shooter_id is not accidentally used as name
-                                if isinstance(shooter_id, str) and shooter_id.isdigit():
-                                    shooter_id = int(shooter_id)
-                                
-                                # Try both int and string key in player_names dict
-                                potential_name = player_names.get(shooter_id) or player_names.get(str(shooter_id))
-                                
-                                # CRITICAL VALIDATION: Ensure what we got from player_names is actually a name, not an ID
-                                if potential_name:
-                                    # Check if it's an integer (definitely wrong)
-                                    if isinstance(potential_name, int):
-                                        print(f"⚠️ WARNING: player_names dict contains INT ID for {shooter_id}: {potential_name}", flush=True)
-                                        shooter_name = None
-                                    # Check if it's a numeric string (definitely wrong)
-                                    elif isinstance(potential_name, str) and potential_name.isdigit():
-                                        print(f"⚠️ WARNING: player_names dict contains STRING ID for {shooter_id}: '{potential_name}'", flush=True)
-                                        shooter_name = None
-                                    # Check if it equals the shooter_id (definitely wrong)
-                                    elif potential_name == shooter_id or str(potential_name) == str(shooter_id):
-                                        print(f"⚠️ WARNING: player_names dict contains ID value for {shooter_id}: '{potential_name}'", flush=True)
-                                        shooter_name = None
-                                    else:
-                                        # It's a valid name
-                                        shooter_name = potential_name
-                                else:
-                                    shooter_name = None
-                                
-                                # If not found in player_names, try looking up in rosterSpots directly
-                                if not shooter_name or shooter_name == 'Unknown' or shooter_name == '':
-                                    if 'rosterSpots' in play_by_play_for_shots:
-                                        for spot in play_by_play_for_shots['rosterSpots']:
-                                            spot_id = spot.get('playerId')
-                                            if spot_id == shooter_id or str(spot_id) == str(shooter_id):
-                                                first_name_obj = spot.get('firstName', {})
-                                                first_name = first_name_obj.get('default', '') if isinstance(first_name_obj, dict) else (first_name_obj or '')
-                                                last_name_obj = spot.get('lastName', {})
-                                                last_name = last_name_obj.get('default', '') if isinstance(last_name_obj, dict) else (last_name_obj or '')
-                                                shooter_name = f"{first_name} {last_name}".strip()
-                                                if shooter_name:
-                                                    # Update player_names for future lookups
-                                                    player_names[shooter_id] = shooter_name
-                                                    player_names[str(shooter_id)] = shooter_name
-                                                    print(f"✅ Found player name: {shooter_name} for ID {shooter_id}")
-                                                    break
-                                
-                                # Fallback: Try to get from NHL API roster endpoint
-                                if (not shooter_name or shooter_name == 'Unknown' or shooter_name == '') and shooter_id:
-                                    try:
-                                        # Get roster for both teams to find the player
-                                        away_roster = self.api.get_team_roster_by_abbrev(away_team['abbrev'])
-                                        home_roster = self.api.get_team_roster_by_abbrev(home_team['abbrev'])
-                                        
-                                        for roster in [away_roster, home_roster]:
-                                            if not roster:
-                                                continue
-                                            # Roster structure: {'forwards': [...], 'defense': [...], 'goalies': [...]}
-                                            for position_group in ['forwards', 'defense', 'goalies']:
-                                                players = roster.get(position_group, [])
-                                                for player in players:
-                                                    p_id = player.get('playerId') or player.get('id')
-                                                    if p_id == shooter_id or str(p_id) == str(shooter_id):
-                                                        # Get name from roster
-                                                        first_name = player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', '')
-                                                        last_name = player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', '')
-                                                        shooter_name = f"{first_name} {last_name}".strip()
-                                                        if shooter_name:
-                                                            player_names[shooter_id] = shooter_name
-                                                            player_names[str(shooter_id)] = shooter_name
-                                                            print(f"✅ Found player name from roster API: {shooter_name} for ID {shooter_id}", flush=True)
-                                                            break
-                                                    if shooter_name and shooter_name != 'Unknown':
-                                                        break
-                                                if shooter_name and shooter_name != 'Unknown':
-                                                    break
-                                            if shooter_name and shooter_name != 'Unknown':
-                                                break
-                                    except Exception as e:
-                                        print(f"⚠️ Error looking up player in roster API: {e}", flush=True)
-                                
-                                # Fallback: Try to get from boxscore playerByGameStats (SAME METHOD AS TOP PERFORMERS)
-                                if (not shooter_name or shooter_name == 'Unknown' or shooter_name == '') and raw_boxscore_direct:
-                                    try:
-                                        player_stats = raw_boxscore_direct.get('playerByGameStats', {})
-                                        for team_key in ['awayTeam', 'homeTeam']:
-                                            team_players = player_stats.get(team_key, {})
-                                            for position_group in ['forwards', 'defense', 'goalies']:
-                                                players = team_players.get(position_group, [])
-                                                for player in players:
-                                                    # Try multiple possible ID fields (same as top performers)
-                                                    p_id = player.get('playerId') or player.get('id') or player.get('playerID')
-                                                    if p_id == shooter_id or str(p_id) == str(shooter_id):
-                                                        # Get name - EXACT SAME METHOD AS TOP PERFORMERS (lines 1128-1139 in api_server.py)
-                                                        name = ''
-                                                        name_field = player.get('name', '')
-                                                        if isinstance(name_field, dict):
-                                                            name = name_field.get('default', '')
-                                                        elif isinstance(name_field, str):
-                                                            name = name_field
-                                                        
-                                                        if not name:
-                                                            firstName = player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', '')
-                                                            lastName = player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', '')
-                                                            name = f"{firstName} {lastName}".strip()
-                                                        
-                                                        if name:
-                                                            shooter_name = name
-                                                            player_names[shooter_id] = shooter_name
-                                                            player_names[str(shooter_id)] = shooter_name
-                                                            print(f"✅ Found player name from boxscore (top performers method): {shooter_name} for ID {shooter_id}", flush=True)
-                                                            break
-                                                    if shooter_name and shooter_name != 'Unknown':
-                                                        break
-                                                if shooter_name and shooter_name != 'Unknown':
-                                                    break
-                                            if shooter_name and shooter_name != 'Unknown':
-                                                break
-                                    except Exception as e:
-                                        print(f"⚠️ Error looking up player in boxscore: {e}", flush=True)
-                                
-                                # Last resort fallback
-                                if not shooter_name or shooter_name == 'Unknown' or shooter_name == '':
-                                    shooter_name = f"Player #{shooter_id}"
-                                    print(f"⚠️ Could not find name for player_id {shooter_id}, using fallback: {shooter_name}")
+                            if isinstance(shooter_id, str) and shooter_id.isdigit():
+                                shooter_id = int(shooter_id)
                             
                             # Calculate xG for LIVE GAMES (not post-game reports)
                             xg_value = 0.0
@@ -969,156 +687,9 @@ class LiveInGamePredictor:
                                 xg_value = max(0.01, 0.15 - (distance_from_goal * 0.001))
                                 print(f"❌ xG calculation error for shot at ({x}, {y}) with type {actual_shot_type}: {e}, using fallback: {xg_value}")
                             
-                            # FINAL VALIDATION: Ensure shooter_name is actually a name, not an ID
-                            if not shooter_name or shooter_name == 'Unknown' or shooter_name == '':
-                                shooter_name = f"Player #{shooter_id}"
-                                print(f"⚠️ Using fallback name format for player_id {shooter_id}: {shooter_name}", flush=True)
-                            elif isinstance(shooter_name, int) or (isinstance(shooter_name, str) and shooter_name.isdigit()):
-                                print(f"❌ ERROR: shooter_name is an ID ({shooter_name}) for player_id {shooter_id}, forcing fallback", flush=True)
-                                shooter_name = f"Player #{shooter_id}"
-                            
-                            # ABSOLUTE FINAL CHECK: Make absolutely sure shooter is never an ID
-                            if isinstance(shooter_name, int) or (isinstance(shooter_name, str) and shooter_name.isdigit()):
-                                print(f"❌❌❌ CRITICAL ERROR: shooter_name is STILL an ID after all checks: {shooter_name} (type: {type(shooter_name).__name__})", flush=True)
-                                shooter_name = f"Player #{shooter_id}"
-                            
-                            # Log the final shooter_name for debugging
-                            if shooter_id:
-                                print(f"🔍 Final shooter_name for ID {shooter_id}: '{shooter_name}' (type: {type(shooter_name).__name__})", flush=True)
-                            
-                            # ABSOLUTE FINAL VALIDATION before adding to shots_data
-                            final_shooter_name = shooter_name
-                            
-                            # Check if final_shooter_name is an ID (int or numeric string)
-                            if isinstance(final_shooter_name, int) or (isinstance(final_shooter_name, str) and final_shooter_name.isdigit()):
-                                final_shooter_name = f"Player #{shooter_id}"
-                                print(f"❌❌❌ LAST CHANCE FIX: shooter_name was ID, changed to: {final_shooter_name}", flush=True)
-                            
-                            # Check if final_shooter_name equals shooter_id (should never happen)
-                            if final_shooter_name == shooter_id or str(final_shooter_name) == str(shooter_id):
-                                final_shooter_name = f"Player #{shooter_id}"
-                                print(f"❌❌❌ LAST CHANCE FIX: shooter_name equals shooter_id ({shooter_id}), changed to: {final_shooter_name}", flush=True)
-                            
-                            # Final sanity check - ensure it's not empty or None
-                            if not final_shooter_name or final_shooter_name == 'Unknown' or final_shooter_name == '':
-                                final_shooter_name = f"Player #{shooter_id}"
-                                print(f"❌❌❌ LAST CHANCE FIX: shooter_name was empty/None, changed to: {final_shooter_name}", flush=True)
-                            
-                            # ABSOLUTE FINAL CHECK: Ensure final_shooter_name is NEVER an ID before appending
-                            # This is the last line of defense - if it's still an ID here, something is very wrong
-                            if isinstance(final_shooter_name, int):
-                                print(f"❌❌❌ CRITICAL: final_shooter_name is INT ID {final_shooter_name} right before append! Forcing to Player # format", flush=True)
-                                final_shooter_name = f"Player #{shooter_id}"
-                            elif isinstance(final_shooter_name, str) and final_shooter_name.isdigit():
-                                print(f"❌❌❌ CRITICAL: final_shooter_name is STRING ID '{final_shooter_name}' right before append! Forcing to Player # format", flush=True)
-                                final_shooter_name = f"Player #{shooter_id}"
-                            elif final_shooter_name == shooter_id or str(final_shooter_name) == str(shooter_id):
-                                print(f"❌❌❌ CRITICAL: final_shooter_name equals shooter_id {shooter_id} right before append! Forcing to Player # format", flush=True)
-                                final_shooter_name = f"Player #{shooter_id}"
-                            
-                            # ABSOLUTE FINAL CHECK RIGHT BEFORE APPEND - if it's still an ID, force it
-                            if isinstance(final_shooter_name, int):
-                                print(f"❌❌❌ FINAL CHECK FAILED: final_shooter_name is INT {final_shooter_name} right before append!", flush=True)
-                                final_shooter_name = f"Player #{shooter_id}"
-                            elif isinstance(final_shooter_name, str) and final_shooter_name.isdigit():
-                                print(f"❌❌❌ FINAL CHECK FAILED: final_shooter_name is STRING ID '{final_shooter_name}' right before append!", flush=True)
-                                final_shooter_name = f"Player #{shooter_id}"
-                            elif final_shooter_name == shooter_id or str(final_shooter_name) == str(shooter_id):
-                                print(f"❌❌❌ FINAL CHECK FAILED: final_shooter_name equals shooter_id {shooter_id} right before append!", flush=True)
-                                final_shooter_name = f"Player #{shooter_id}"
-                            
-                            # LAST RESORT: If we still don't have a valid name, try roster API lookup on-the-fly
-                            if not final_shooter_name or final_shooter_name == 'Unknown' or final_shooter_name == '' or isinstance(final_shooter_name, int) or (isinstance(final_shooter_name, str) and final_shooter_name.isdigit()):
-                                try:
-                                    # Try to get player name from roster API on-the-fly
-                                    player_info = self.api.get_player_info(shooter_id)
-                                    if player_info:
-                                        first_name = player_info.get('firstName', {}).get('default', '') if isinstance(player_info.get('firstName'), dict) else player_info.get('firstName', '')
-                                        last_name = player_info.get('lastName', {}).get('default', '') if isinstance(player_info.get('lastName'), dict) else player_info.get('lastName', '')
-                                        on_the_fly_name = f"{first_name} {last_name}".strip()
-                                        if on_the_fly_name:
-                                            final_shooter_name = on_the_fly_name
-                                            print(f"✅ Got player name from API on-the-fly: {final_shooter_name} for ID {shooter_id}", flush=True)
-                                except Exception as e:
-                                    print(f"⚠️ On-the-fly API lookup failed: {e}", flush=True)
-                                
-                                # If still no name, use fallback
-                                if not final_shooter_name or isinstance(final_shooter_name, int) or (isinstance(final_shooter_name, str) and final_shooter_name.isdigit()):
-                                    final_shooter_name = f"Player #{shooter_id}"
-                            
-                            # ONE MORE ABSOLUTE CHECK - if it's STILL an integer, force it (this should never happen)
-                            if isinstance(final_shooter_name, int):
-                                final_shooter_name = f"Player #{shooter_id}"
-                            
-                            # Get shooter name DIRECTLY from boxscore.playerByGameStats (SAME METHOD AS TOP PERFORMERS)
-                            # This is the exact same approach that works in get_team_top_performers
-                            shooter_name_for_dict = None
-                            if shooter_id:
-                                # Get boxscore from game_data (same structure as top performers uses)
-                                boxscore_for_lookup = game_data.get('boxscore', {})
-                                # If boxscore not at top level, try game_center.boxscore (like top performers does)
-                                if not boxscore_for_lookup:
-                                    game_center = game_data.get('game_center', {})
-                                    boxscore_for_lookup = game_center.get('boxscore', {}) if game_center else {}
-                                
-                                if not boxscore_for_lookup:
-                                    print(f"⚠️ No boxscore found for shooter_id {shooter_id}", flush=True)
-                                else:
-                                    player_by_game_stats = boxscore_for_lookup.get('playerByGameStats', {})
-                                    
-                                    if not player_by_game_stats:
-                                        print(f"⚠️ No playerByGameStats found for shooter_id {shooter_id}", flush=True)
-                                    else:
-                                        # Search through both teams (same as top performers)
-                                        for team_key in ['awayTeam', 'homeTeam']:
-                                            team_players = player_by_game_stats.get(team_key, {})
-                                            for position_group in ['forwards', 'defense', 'goalies']:
-                                                players = team_players.get(position_group, [])
-                                                for player in players:
-                                                    # Try multiple possible ID fields (same as top performers)
-                                                    player_id = player.get('playerId') or player.get('id') or player.get('playerID')
-                                                    if player_id == shooter_id or str(player_id) == str(shooter_id):
-                                                        # Get name - EXACT SAME METHOD AS TOP PERFORMERS (lines 1128-1139 in api_server.py)
-                                                        name = ''
-                                                        name_field = player.get('name', '')
-                                                        if isinstance(name_field, dict):
-                                                            name = name_field.get('default', '')
-                                                        elif isinstance(name_field, str):
-                                                            name = name_field
-                                                        
-                                                        if not name:
-                                                            firstName = player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', '')
-                                                            lastName = player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', '')
-                                                            name = f"{firstName} {lastName}".strip()
-                                                        
-                                                        if name:
-                                                            shooter_name_for_dict = name
-                                                            print(f"✅ Found name for {shooter_id}: '{name}'", flush=True)
-                                                            break
-                                                if shooter_name_for_dict:
-                                                    break
-                                            if shooter_name_for_dict:
-                                                break
-                            
-                            # If still no name, use fallback
-                            if not shooter_name_for_dict:
-                                shooter_name_for_dict = f"Player #{shooter_id}"
-                                print(f"⚠️ Using fallback for {shooter_id}: '{shooter_name_for_dict}'", flush=True)
-                            
-                            # CRITICAL: Ensure it's always a string (never an integer)
-                            shooter_name_for_dict = str(shooter_name_for_dict)
-                            
-                            # Final check - if it's still just digits, force fallback
-                            if shooter_name_for_dict.isdigit() or shooter_name_for_dict == str(shooter_id):
-                                shooter_name_for_dict = f"Player #{shooter_id}"
-                                print(f"❌ Forced fallback for {shooter_id} (was: '{shooter_name_for_dict}')", flush=True)
-                            
-                            # ABSOLUTE FINAL CHECK: Make absolutely sure shooter_name_for_dict is a string, never an integer
-                            if isinstance(shooter_name_for_dict, int):
-                                shooter_name_for_dict = f"Player #{shooter_id}"
-                            shooter_name_for_dict = str(shooter_name_for_dict)
-                            if shooter_name_for_dict.isdigit():
-                                shooter_name_for_dict = f"Player #{shooter_id}"
+                            shooter_name_for_dict = (shooter_names.get(player_id_of(shooter_id))
+                                                     or player_directory.name(shooter_id)
+                                                     or f"Player #{shooter_id}")
                             
                             shot_dict = {
                                 'x': x,
@@ -1134,325 +705,29 @@ class LiveInGamePredictor:
                                 'xg': round(xg_value, 3)
                             }
                             
-                            # ONE MORE CHECK: If shooter is somehow still an integer in the dict, force it
-                            if isinstance(shot_dict.get('shooter'), int):
-                                shot_dict['shooter'] = f"Player #{shooter_id}"
-                                shot_dict['shooterName'] = f"Player #{shooter_id}"
-                                print(f"❌❌❌ EMERGENCY: shooter was INT in dict! Fixed to: {shot_dict['shooter']}", flush=True)
-                            
-                            # ABSOLUTE FINAL CHECK: Convert shooter to string if it's still an integer (should never happen)
-                            if isinstance(shot_dict['shooter'], int):
-                                shot_dict['shooter'] = str(shot_dict['shooter'])
-                                if shot_dict['shooter'].isdigit():
-                                    shot_dict['shooter'] = f"Player #{shot_dict['shooter']}"
-                                shot_dict['shooterName'] = shot_dict['shooter']
-                                print(f"❌❌❌ CRITICAL FIX: Converted shooter from INT to string: {shot_dict['shooter']}", flush=True)
-                            
                             shots_data.append(shot_dict)
-                            
-                            # Debug: log if we're still getting IDs instead of names
-                            if final_shooter_name and (str(final_shooter_name).isdigit() or (isinstance(final_shooter_name, str) and final_shooter_name.replace('Player #', '').isdigit())):
-                                print(f"⚠️ WARNING: Final shooter_name is still ID-like: {final_shooter_name} for player_id {shooter_id}", flush=True)
             except Exception as e:
                 print(f"❌ Error extracting shot data: {e}", flush=True)
                 import traceback
                 traceback.print_exc()
+                # The new plays' shots are incomplete; rebuild the session from the first play next poll
+                session.reset()
             
             print(f"✅ Created {len(shots_data)} shots in shots_data", flush=True)
             
-            # POST-PROCESSING: Convert any integer shooter IDs to names using DIRECT boxscore lookup (same as top performers)
-            # This is the absolute final safety net - convert integers to names
-            boxscore_for_post = game_data.get('boxscore', {})
-            player_by_game_stats_post = boxscore_for_post.get('playerByGameStats', {})
-            
-            for shot in shots_data:
-                if 'shooter' in shot:
-                    shooter_val = shot['shooter']
-                    player_id = shot.get('player_id')
-                    
-                    # If it's an integer, look it up directly from boxscore (same method as top performers)
-                    if isinstance(shooter_val, int):
-                        shooter_id_to_lookup = shooter_val
-                        name_found = None
-                        
-                        # Search through both teams (same as top performers)
-                        for team_key in ['awayTeam', 'homeTeam']:
-                            team_players = player_by_game_stats_post.get(team_key, {})
-                            for position_group in ['forwards', 'defense', 'goalies']:
-                                players = team_players.get(position_group, [])
-                                for player in players:
-                                    p_id = player.get('playerId') or player.get('id') or player.get('playerID')
-                                    if p_id == shooter_id_to_lookup or str(p_id) == str(shooter_id_to_lookup):
-                                        # Get name - EXACT SAME METHOD AS TOP PERFORMERS
-                                        name = ''
-                                        name_field = player.get('name', '')
-                                        if isinstance(name_field, dict):
-                                            name = name_field.get('default', '')
-                                        elif isinstance(name_field, str):
-                                            name = name_field
-                                        
-                                        if not name:
-                                            firstName = player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', '')
-                                            lastName = player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', '')
-                                            name = f"{firstName} {lastName}".strip()
-                                        
-                                        if name:
-                                            name_found = name
-                                            break
-                                if name_found:
-                                    break
-                            if name_found:
-                                break
-                        
-                        if name_found:
-                            shot['shooter'] = name_found
-                            shot['shooterName'] = name_found
-                            print(f"✅ POST-PROCESS: Converted INT {shooter_val} to name '{name_found}'", flush=True)
-                        else:
-                            shot['shooter'] = f"Player #{shooter_val}"
-                            shot['shooterName'] = shot['shooter']
-                            print(f"⚠️ POST-PROCESS: INT {shooter_val} not found in boxscore, using fallback", flush=True)
-                    # If it's a string that's just digits, convert it
-                    elif isinstance(shooter_val, str) and shooter_val.isdigit():
-                        shooter_id_int = int(shooter_val)
-                        name_found = None
-                        
-                        # Same lookup as above
-                        for team_key in ['awayTeam', 'homeTeam']:
-                            team_players = player_by_game_stats_post.get(team_key, {})
-                            for position_group in ['forwards', 'defense', 'goalies']:
-                                players = team_players.get(position_group, [])
-                                for player in players:
-                                    p_id = player.get('playerId') or player.get('id') or player.get('playerID')
-                                    if p_id == shooter_id_int or str(p_id) == str(shooter_id_int):
-                                        name = ''
-                                        name_field = player.get('name', '')
-                                        if isinstance(name_field, dict):
-                                            name = name_field.get('default', '')
-                                        elif isinstance(name_field, str):
-                                            name = name_field
-                                        
-                                        if not name:
-                                            firstName = player.get('firstName', {}).get('default', '') if isinstance(player.get('firstName'), dict) else player.get('firstName', '')
-                                            lastName = player.get('lastName', {}).get('default', '') if isinstance(player.get('lastName'), dict) else player.get('lastName', '')
-                                            name = f"{firstName} {lastName}".strip()
-                                        
-                                        if name:
-                                            name_found = name
-                                            break
-                                if name_found:
-                                    break
-                            if name_found:
-                                break
-                        
-                        if name_found:
-                            shot['shooter'] = name_found
-                            shot['shooterName'] = name_found
-                            print(f"✅ POST-PROCESS: Converted STRING ID '{shooter_val}' to name '{name_found}'", flush=True)
-                        else:
-                            shot['shooter'] = f"Player #{shooter_val}"
-                            shot['shooterName'] = shot['shooter']
-                            print(f"⚠️ POST-PROCESS: STRING ID '{shooter_val}' not found in boxscore, using fallback", flush=True)
-            
             if shots_data:
                 sample = shots_data[0]
                 print(f"📊 Sample shot after post-processing: shooter='{sample.get('shooter')}' (type: {type(sample.get('shooter')).__name__})", flush=True)
             
-            live_metrics['shots_data'] = shots_data
+            live_metrics['shots_data'] = list(shots_data)
             
             # Calculate likelihood of winning at each play in play-by-play
-            # This uses the same POSTGAME_WEIGHTS formula from auto post reports
-            play_by_play_with_likelihood = []
+            # This uses the same POSTGAME_WEIGHTS formula from auto post reports; the live
+            # session keeps the cumulative inputs and adds a row per significant new play
             if play_by_play and 'plays' in play_by_play and away_team_id and home_team_id:
-                print(f"🔍 Calculating likelihood of winning for each play in play-by-play...", flush=True)
-                try:
-                    import math
-                    import numpy as np
-                    
-                    # POSTGAME CORRELATION WEIGHTS (same as in pdf_report_generator.py)
-                    POSTGAME_WEIGHTS = {
-                        'gs_diff': 0.6504,           # Game Score difference - STRONGEST predictor
-                        'power_play_diff': 0.3933,   # Power Play % difference
-                        'corsi_diff': -0.3598,       # Corsi % difference (negative: higher Corsi favors home)
-                        'hits_diff': -0.2434,        # Hits difference (negative: more hits favors home)
-                        'hdc_diff': 0.0747,          # High Danger Chances difference
-                        'xg_diff': -0.0545,          # Expected Goals difference
-                        'pim_diff': 0.0173,          # Penalty Minutes difference
-                        'shots_diff': -0.0158,       # Shots on Goal difference
-                    }
-                    
-                    # Helper function for sigmoid
-                    def sigmoid(x: float) -> float:
-                        try:
-                            return 1.0 / (1.0 + math.exp(-x))
-                        except OverflowError:
-                            return 0.0 if x < 0 else 1.0
-                    
-                    # Process plays and calculate cumulative stats
-                    plays = play_by_play.get('plays', [])
-                    away_gs_cumulative = 0.0
-                    home_gs_cumulative = 0.0
-                    away_xg_cumulative = 0.0
-                    home_xg_cumulative = 0.0
-                    away_hdc_cumulative = 0
-                    home_hdc_cumulative = 0
-                    away_shots_cumulative = 0
-                    home_shots_cumulative = 0
-                    away_hits_cumulative = 0
-                    home_hits_cumulative = 0
-                    away_pim_cumulative = 0
-                    home_pim_cumulative = 0
-                    away_pp_goals_cumulative = 0
-                    away_pp_attempts_cumulative = 0
-                    home_pp_goals_cumulative = 0
-                    home_pp_attempts_cumulative = 0
-                    away_corsi_for_cumulative = 0
-                    away_corsi_against_cumulative = 0
-                    home_corsi_for_cumulative = 0
-                    home_corsi_against_cumulative = 0
-                    
-                    for play_index, play in enumerate(plays):
-                        event_type = play.get('typeDescKey', '')
-                        details = play.get('details', {})
-                        event_owner_team_id = details.get('eventOwnerTeamId')
-                        is_away = (event_owner_team_id == away_team_id) if event_owner_team_id else False
-                        is_home = (event_owner_team_id == home_team_id) if event_owner_team_id else False
-                        
-                        # Update cumulative stats based on event type
-                        if event_type == 'goal':
-                            if is_away:
-                                away_gs_cumulative += 0.75  # Goals: 0.75 points
-                            elif is_home:
-                                home_gs_cumulative += 0.75
-                            
-                            # Check if it's a power play goal
-                            situation = details.get('situationCode', '')
-                            if 'PP' in situation or 'powerPlay' in situation.lower():
-                                if is_away:
-                                    away_pp_goals_cumulative += 1
-                                elif is_home:
-                                    home_pp_goals_cumulative += 1
-                        
-                        elif event_type == 'shot-on-goal':
-                            if is_away:
-                                away_gs_cumulative += 0.075  # Shots: 0.075 points
-                                away_shots_cumulative += 1
-                            elif is_home:
-                                home_gs_cumulative += 0.075
-                                home_shots_cumulative += 1
-                            
-                            # Check if high danger chance
-                            x = details.get('xCoord', 0)
-                            y = details.get('yCoord', 0)
-                            distance = math.sqrt(x**2 + y**2) if x and y else 100
-                            if distance < 25:  # High danger zone
-                                if is_away:
-                                    away_hdc_cumulative += 1
-                                elif is_home:
-                                    home_hdc_cumulative += 1
-                            
-                            # Calculate xG for this shot (LIVE GAMES ONLY)
-                            try:
-                                shot_type = details.get('shotType', 'wrist')
-                                xg_value = self.report_generator._calculate_improved_xg_live(x, y, shot_type) if x and y else 0.0
-                                if is_away:
-                                    away_xg_cumulative += xg_value
-                                elif is_home:
-                                    home_xg_cumulative += xg_value
-                            except:
-                                pass
-                        
-                        elif event_type == 'blocked-shot':
-                            if is_away:
-                                away_gs_cumulative += 0.05  # Blocked shots: 0.05 points
-                            elif is_home:
-                                home_gs_cumulative += 0.05
-                        
-                        elif event_type == 'penalty':
-                            penalty_situation = details.get('situationCode', '')
-                            if is_away:
-                                away_gs_cumulative -= 0.15  # Penalties: -0.15 points
-                                away_pim_cumulative += details.get('duration', 2)
-                                if 'PP' in penalty_situation or 'powerPlay' in penalty_situation.lower():
-                                    home_pp_attempts_cumulative += 1
-                            elif is_home:
-                                home_gs_cumulative -= 0.15
-                                home_pim_cumulative += details.get('duration', 2)
-                                if 'PP' in penalty_situation or 'powerPlay' in penalty_situation.lower():
-                                    away_pp_attempts_cumulative += 1
-                        
-                        elif event_type == 'hit':
-                            if is_away:
-                                away_hits_cumulative += 1
-                            elif is_home:
-                                home_hits_cumulative += 1
-                        
-                        # Track Corsi events (shots, goals, blocked shots, missed shots)
-                        if event_type in ['goal', 'shot-on-goal', 'blocked-shot', 'missed-shot']:
-                            if is_away:
-                                away_corsi_for_cumulative += 1
-                                home_corsi_against_cumulative += 1
-                            elif is_home:
-                                home_corsi_for_cumulative += 1
-                                away_corsi_against_cumulative += 1
-                        
-                        # Calculate likelihood at this point in the game
-                        # Only calculate for significant events (goals, shots, penalties) or every 10 plays
-                        should_calculate = (
-                            event_type in ['goal', 'shot-on-goal', 'penalty', 'blocked-shot'] or
-                            play_index % 10 == 0  # Every 10 plays
-                        )
-                        
-                        if should_calculate:
-                            # Calculate differences
-                            gs_diff = away_gs_cumulative - home_gs_cumulative
-                            xg_diff = away_xg_cumulative - home_xg_cumulative
-                            hdc_diff = away_hdc_cumulative - home_hdc_cumulative
-                            shots_diff = away_shots_cumulative - home_shots_cumulative
-                            hits_diff = away_hits_cumulative - home_hits_cumulative
-                            pim_diff = away_pim_cumulative - home_pim_cumulative
-                            
-                            # Calculate Corsi %
-                            away_corsi_total = away_corsi_for_cumulative + away_corsi_against_cumulative
-                            home_corsi_total = home_corsi_for_cumulative + home_corsi_against_cumulative
-                            away_corsi_pct = (away_corsi_for_cumulative / away_corsi_total * 100) if away_corsi_total > 0 else 50.0
-                            home_corsi_pct = (home_corsi_for_cumulative / home_corsi_total * 100) if home_corsi_total > 0 else 50.0
-                            corsi_diff = away_corsi_pct - home_corsi_pct
-                            
-                            # Power Play %
-                            away_pp_pct = (away_pp_goals_cumulative / away_pp_attempts_cumulative * 100) if away_pp_attempts_cumulative > 0 else 0.0
-                            home_pp_pct = (home_pp_goals_cumulative / home_pp_attempts_cumulative * 100) if home_pp_attempts_cumulative > 0 else 0.0
-                            power_play_diff = away_pp_pct - home_pp_pct
-                            
-                            # Calculate weighted score
-                            score = 0.0
-                            score += POSTGAME_WEIGHTS['gs_diff'] * (gs_diff * 0.1)
-                            score += POSTGAME_WEIGHTS['power_play_diff'] * (power_play_diff * 0.01)
-                            score += POSTGAME_WEIGHTS['corsi_diff'] * (corsi_diff * 0.01)
-                            score += POSTGAME_WEIGHTS['hits_diff'] * (hits_diff * 0.01)
-                            score += POSTGAME_WEIGHTS['hdc_diff'] * (hdc_diff * 0.05)
-                            score += POSTGAME_WEIGHTS['xg_diff'] * (xg_diff * 0.2)
-                            score += POSTGAME_WEIGHTS['pim_diff'] * (pim_diff * 0.01)
-                            score += POSTGAME_WEIGHTS['shots_diff'] * (shots_diff * 0.02)
-                            
-                            # Convert to probabilities
-                            away_prob = sigmoid(score) * 100
-                            home_prob = (1.0 - sigmoid(score)) * 100
-                            
-                            # Add likelihood to play
-                            play_with_likelihood = play.copy()
-                            play_with_likelihood['likelihood'] = {
-                                'away_probability': round(away_prob, 1),
-                                'home_probability': round(home_prob, 1)
-                            }
-                            play_by_play_with_likelihood.append(play_with_likelihood)
-                    
-                    print(f"✅ Calculated likelihood for {len(play_by_play_with_likelihood)} plays in play-by-play", flush=True)
-                    live_metrics['play_by_play_with_likelihood'] = play_by_play_with_likelihood
-                except Exception as e:
-                    print(f"⚠️ Error calculating likelihood for play-by-play: {e}", flush=True)
-                    import traceback
-                    traceback.print_exc()
+                play_by_play_with_likelihood = list(session.likelihood)
+                print(f"✅ Calculated likelihood for {len(play_by_play_with_likelihood)} plays in play-by-play", flush=True)
+                live_metrics['play_by_play_with_likelihood'] = play_by_play_with_likelihood
 
             # Extract Goalie Stats from boxscore like PDF generator
             goalie_stats = {'away': {}, 'home': {}}
@@ -1541,9 +816,12 @@ class LiveInGamePredictor:
                     # Calculate movement metrics
                     # Use the play_by_play variable we already checked, not game_data.get again
                     pbp_for_analyzer = play_by_play or game_data.get('play_by_play', {})
-                    analyzer = AdvancedMetricsAnalyzer(pbp_for_analyzer)
-                    away_movement = analyzer.calculate_pre_shot_movement_metrics(away_team_id)
-                    home_movement = analyzer.calculate_pre_shot_movement_metrics(home_team_id)
+                    # Memoized per game state, so polls without new plays reuse the result
+                    analysis = GameAnalysisContext.of(game_data)
+                    away_movement = analysis.get(('pre_shot_movement', away_team_id),
+                                                 lambda: AdvancedMetricsAnalyzer(pbp_for_analyzer).calculate_pre_shot_movement_metrics(away_team_id))
+                    home_movement = analysis.get(('pre_shot_movement', home_team_id),
+                                                 lambda: AdvancedMetricsAnalyzer(pbp_for_analyzer).calculate_pre_shot_movement_metrics(home_team_id))
                     
                     live_metrics['away_lateral'] = away_movement['lateral_movement'].get('avg_delta_y', 0.0)
                     live_metrics['away_longitudinal'] = away_movement['longitudinal_movement'].get('avg_delta_x', 0.0)
@@ -1680,13 +958,8 @@ class LiveInGamePredictor:
                     
                     # Who scored first
                     first_goal_scorer = None
-                    pbp = game_data.get('play_by_play', {})
-                    plays = pbp.get('plays', []) or pbp.get('events', []) or []
-                    for play in plays:
-                        if play.get('typeDescKey') == 'goal':
-                            details = play.get('details', {})
-                            first_goal_scorer = details.get('eventOwnerTeamId')
-                            break
+                    if session.goals:
+                        first_goal_scorer = session.goals[0].get('details', {}).get('eventOwnerTeamId')
                     
                     live_metrics['away_scored_first'] = (first_goal_scorer == away_team_id)
                     live_metrics['home_scored_first'] = (first_goal_scorer == home_team_id)
@@ -1976,6 +1249,8 @@ class LiveInGamePredictor:
             print(f"❌ Error getting live game data for {game_id}: {e}")
             import traceback
             traceback.print_exc()
+            # The session may already have read this poll's plays without their shot rows; start over next poll
+            session.reset()
             return None
     
     def calculate_live_momentum(self, live_metrics):
@@ -2178,39 +1453,53 @@ class LiveInGamePredictor:
 🔄 Updated: {datetime.now(self.ct_tz).strftime('%H:%M:%S CT')}
 """
     
-    def run_live_predictions(self, update_interval=30):
-        """Run live in-game predictions with automatic updates"""
+    def run_live_predictions(self, update_interval=30, max_workers=None, requests_per_minute=None):
+        """Run live in-game predictions with automatic updates
+        
+        Live games are polled concurrently, each at an interval set by its game state
+        (see utils/live_poller.py); update_interval is the interval for regular play.
+        """
         print("🏒 LIVE IN-GAME NHL PREDICTIONS")
         print("=" * 60)
-        print(f"🔄 Update interval: {update_interval} seconds")
+        print(f"🔄 Update interval: {update_interval} seconds (faster late in games, slower in intermissions)")
         print("Press Ctrl+C to stop")
         print()
         
-        try:
-            while True:
-                live_games = self.get_live_games()
-                
-                if not live_games:
-                    print(f"⏰ {datetime.now(self.ct_tz).strftime('%H:%M:%S CT')} - No live games")
-                else:
-                    print(f"⏰ {datetime.now(self.ct_tz).strftime('%H:%M:%S CT')} - {len(live_games)} live games")
-                    print()
-                    
-                    for game in live_games:
-                        game_id = game.get('id')
-                        live_metrics = self.get_live_game_data(game_id)
-                        
-                        if live_metrics:
-                            prediction = self.predict_live_game(live_metrics)
-                            if prediction:
-                                print(self.format_live_prediction(prediction))
-                                print()
-                
-                print(f"⏳ Waiting {update_interval} seconds for next update...")
-                time.sleep(update_interval)
+        def live_game_ids():
+            live_games = self.get_live_games()
+            game_ids = [game.get('id') for game in live_games]
+            self.retire_live_sessions(game_ids)
+            # One batch roster refresh per team (at most every few hours), never inside a poll
+            get_player_directory().refresh_teams(
+                self.api, [(game.get(side) or {}).get('abbrev') for game in live_games for side in ('awayTeam', 'homeTeam')])
+            if not game_ids:
+                print(f"⏰ {datetime.now(self.ct_tz).strftime('%H:%M:%S CT')} - No live games")
+            else:
+                print(f"⏰ {datetime.now(self.ct_tz).strftime('%H:%M:%S CT')} - {len(game_ids)} live games")
                 print()
-                
+            return game_ids
+        
+        def show_prediction(game_id, live_metrics, status):
+            prediction = self.predict_live_game(live_metrics)
+            if prediction:
+                print(self.format_live_prediction(prediction))
+                print()
+        
+        poller = LivePoller(
+            self.get_live_game_data,
+            self.live_status,
+            on_result=show_prediction,
+            on_final=lambda game_id, live_metrics: print(f"🏁 Game {game_id} is final"),
+            discover=live_game_ids,
+            intervals={'live': update_interval},
+            max_workers=max_workers,
+            requests_per_minute=requests_per_minute,
+            requests_per_poll=2,  # boxscore + play-by-play
+        )
+        try:
+            poller.run()
         except KeyboardInterrupt:
+            poller.stop()
             print("\n🛑 Live predictions stopped")
         except Exception as e:
             print(f"\n❌ Error in live predictions: {e}")
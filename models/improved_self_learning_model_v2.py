@@ -4,11 +4,15 @@ Improved Self-Learning Win Probability Model V2
 Implements comprehensive improvements for better prediction accuracy
 """
 
+import bisect
+import copy
 import json
+import sys
+import threading
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 import logging
 try:
     from correlation_model import CorrelationModel
@@ -57,11 +61,141 @@ DEFAULT_SCORE_WEIGHTS = {
     "opponent_ga_weight": 1.0  # Usually kept as 1.0 (baseline)
 }
 
+# Top-level model_data entries each model instance gets its own copy of, so
+# per-model learning (weights, momentum, running accuracy) never leaks into the
+# other models sharing the same parsed data.
+PER_MODEL_DATA_KEYS = (
+    "model_weights",
+    "weight_momentum",
+    "score_model_weights",
+    "score_weight_momentum",
+    "model_performance",
+)
+
+# Shared state that learning appends to or updates in place. A shared instance
+# takes a private deep copy of each one the first time it writes to it
+# (copy-on-write, see `_own`), so one model's writes never show up in another
+# model's history before the file is saved and re-read.
+COPY_ON_WRITE_DATA_KEYS = ("predictions", "error_log", "goalie_stats", "team_last_game")
+COPY_ON_WRITE_ATTRS = ("team_stats", "goalie_history")
+
+# Parsed predictions history / team stats / historical stats, shared by every
+# model in the process (the ensemble builds eight of them). Keyed by
+# (kind, resolved path, mtime, size) so a rewritten file is re-parsed.
+_SHARED_DATA: Dict[Tuple, Any] = {}
+_SHARED_DATA_LOCK = threading.Lock()
+
+# This module is imported both as `improved_self_learning_model_v2` and
+# `models.improved_self_learning_model_v2` depending on sys.path; both
+# aliases must use the same registry.
+for _alias in ("improved_self_learning_model_v2", "models.improved_self_learning_model_v2"):
+    _mod = sys.modules.get(_alias)
+    if _alias != __name__ and _mod is not None and hasattr(_mod, "_SHARED_DATA"):
+        _SHARED_DATA, _SHARED_DATA_LOCK = _mod._SHARED_DATA, _mod._SHARED_DATA_LOCK
+        break
+
+
+def _file_signature(path: Path) -> Tuple:
+    p = Path(path)
+    try:
+        st = p.stat()
+        return (str(p.resolve()), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (str(p.resolve()), None, None)
+
+
+def _shared_data(kind: str, path: Path, loader: Callable[[], Any]) -> Any:
+    """Return the parsed `kind` data for `path`, loading it at most once per file version."""
+    sig = _file_signature(path)
+    key = (kind,) + sig
+    with _SHARED_DATA_LOCK:
+        if key in _SHARED_DATA:
+            return _SHARED_DATA[key]
+    value = loader()
+    with _SHARED_DATA_LOCK:
+        for stale in [k for k in _SHARED_DATA if k[:2] == key[:2] and k != key]:
+            del _SHARED_DATA[stale]
+        return _SHARED_DATA.setdefault(key, value)
+
+
+def clear_shared_model_data() -> None:
+    """Drop all shared parsed data (tests, or after out-of-band file edits)."""
+    with _SHARED_DATA_LOCK:
+        _SHARED_DATA.clear()
+
+
+class PredictionHistoryIndex:
+    """
+    Completed games per (team, venue) in date order over model_data['predictions'].
+
+    Entries are referenced by their position in the predictions list. `sync()`
+    indexes predictions appended since the last call and re-checks the few
+    pending (outcome-less) ones, so outcomes written in place are picked up;
+    a different list object or a shrunken list triggers a rebuild.
+    """
+
+    def __init__(self) -> None:
+        self._source: Optional[List[Dict]] = None
+        self._seen = 0
+        self._pending: set = set()
+        self._completed: List[int] = []
+        self._by_team_venue: Dict[Tuple[str, str], List[Tuple[str, int]]] = {}
+
+    def _reset(self, predictions: List[Dict]) -> None:
+        self._source = predictions
+        self._seen = 0
+        self._pending = set()
+        self._completed = []
+        self._by_team_venue = {}
+
+    def _index_completed(self, seq: int, pred: Dict) -> None:
+        date = str(pred.get('date') or '')
+        bisect.insort(self._completed, seq)
+        for venue, key in (('away', 'away_team'), ('home', 'home_team')):
+            team = (pred.get(key) or '').upper()
+            if team:
+                bisect.insort(self._by_team_venue.setdefault((team, venue), []), (date, seq))
+
+    def sync(self, predictions: List[Dict]) -> "PredictionHistoryIndex":
+        if predictions is not self._source or len(predictions) < self._seen:
+            self._reset(predictions)
+        for seq in [s for s in self._pending if predictions[s].get('actual_winner')]:
+            self._pending.discard(seq)
+            self._index_completed(seq, predictions[seq])
+        for seq in range(self._seen, len(predictions)):
+            if predictions[seq].get('actual_winner'):
+                self._index_completed(seq, predictions[seq])
+            else:
+                self._pending.add(seq)
+        self._seen = len(predictions)
+        return self
+
+    def team_games(self, team: str, venue: str, window: Optional[int] = None) -> List[Dict]:
+        """Completed games for team at venue, oldest first (last `window` only if given)."""
+        entries = self._by_team_venue.get((team.upper(), venue), [])
+        if window is not None:
+            entries = entries[-window:] if window > 0 else []
+        return [self._source[seq] for _, seq in entries]
+
+    def recent_completed(self, n: int) -> List[Dict]:
+        """Last n completed predictions in list (insertion) order."""
+        return [self._source[seq] for seq in self._completed[-n:]] if n > 0 else []
+
+
 class ImprovedSelfLearningModelV2:
-    def __init__(self, predictions_file: str = "win_probability_predictions_v2.json"):
-        """Initialize the improved self-learning model V2"""
+    def __init__(self, predictions_file: str = "win_probability_predictions_v2.json", shared: bool = True):
+        """
+        Initialize the improved self-learning model V2.
+
+        With shared=True (default) the parsed predictions history, team stats
+        and historical stats are shared with every other model in the process;
+        only the entries in PER_MODEL_DATA_KEYS are copied per instance, and
+        the rest is copied on this instance's first write to it.
+        """
         self.predictions_file = Path(predictions_file)
-        self.model_data = self.load_model_data()
+        self.shared = shared
+        self._history_index = PredictionHistoryIndex()
+        self._owned = set()
         # Feature flags for experiments/backtests
         self.feature_flags = {
             'use_per_goalie_gsax': False,
@@ -84,21 +218,26 @@ class ImprovedSelfLearningModelV2:
         self.predictions_file = self.script_dir.parent / "data" / "win_probability_predictions_v2.json"
         
         # Load existing model data
-        self.model_data = self.load_model_data()
+        self.model_data = self._load_model_data_view()
         
         # Build goalie start history (team -> [(date, goalie_name)])
         # Load persisted goalie history if present, else build from predictions
-        self.goalie_history = self.model_data.get('goalie_history') or self._build_goalie_history()
+        self.goalie_history = self._shared_or_load(
+            "goalie_history", self.predictions_file,
+            lambda: self.model_data.get('goalie_history') or self._build_goalie_history(),
+        )
         
         from season_utils import get_team_stats_path
         self.team_stats_file = get_team_stats_path()
         self.historical_stats_file = Path("historical_seasons_team_stats.json")
         
         # Load current season stats
-        self.team_stats = self.load_team_stats()
+        self.team_stats = self._shared_or_load("team_stats", self.team_stats_file, self.load_team_stats)
         
         # Load historical stats if available
-        self.historical_stats = self.load_historical_stats()
+        self.historical_stats = self._shared_or_load(
+            "historical_stats", self.historical_stats_file, self.load_historical_stats
+        )
         
         # Correlation model for diagnostics and weight signals
         try:
@@ -492,6 +631,42 @@ class ImprovedSelfLearningModelV2:
                         else:
                             venue_data[field] = []
         
+    def _shared_or_load(self, kind: str, path: Path, loader: Callable[[], Any]) -> Any:
+        return _shared_data(kind, path, loader) if self.shared else loader()
+
+    def _load_model_data_view(self) -> Dict:
+        """
+        Model data for this instance: the shared parse of the predictions file
+        with private copies of the per-model entries (PER_MODEL_DATA_KEYS).
+        """
+        if not self.shared:
+            return self.load_model_data()
+        data = dict(_shared_data("model_data", self.predictions_file, self.load_model_data))
+        for key in PER_MODEL_DATA_KEYS:
+            if isinstance(data.get(key), dict):
+                data[key] = dict(data[key])
+        return data
+
+    def _own(self, *names: str) -> None:
+        """
+        Copy-on-write: replace the shared model_data entries / attributes in
+        `names` with private deep copies, once, before this instance mutates them.
+        """
+        if not self.shared:
+            return
+        for name in names:
+            if name in self._owned:
+                continue
+            if name in COPY_ON_WRITE_ATTRS:
+                setattr(self, name, copy.deepcopy(getattr(self, name)))
+            elif name in self.model_data:
+                self.model_data[name] = copy.deepcopy(self.model_data[name])
+            self._owned.add(name)
+
+    def prediction_index(self) -> PredictionHistoryIndex:
+        """Per-team completed-game index, synced with model_data['predictions']."""
+        return self._history_index.sync(self.model_data.setdefault('predictions', []))
+
     def load_model_data(self) -> Dict:
         """Load existing model data and predictions"""
         if self.predictions_file.exists():
@@ -758,26 +933,32 @@ class ImprovedSelfLearningModelV2:
         """Build per-team goalie start history from stored predictions/metrics_used."""
         hist: Dict[str, List[Tuple[str, str]]] = {}
         try:
-            preds = self.model_data.get('predictions', [])
-            for p in preds:
-                date = p.get('date')
-                if not date:
-                    continue
-                m = p.get('metrics_used') or {}
-                away = (p.get('away_team') or '').upper()
-                home = (p.get('home_team') or '').upper()
-                ag = m.get('away_goalie')
-                hg = m.get('home_goalie')
-                if away and ag:
-                    hist.setdefault(away, []).append((date, ag))
-                if home and hg:
-                    hist.setdefault(home, []).append((date, hg))
-            for team in hist:
-                hist[team].sort(key=lambda t: t[0])
+            for p in self.model_data.get('predictions', []):
+                self._record_goalie_starts(p, hist)
         except Exception:
             pass
         return hist
 
+    def _record_goalie_starts(self, prediction: Dict, history: Optional[Dict] = None) -> None:
+        """Insert a game's starting goalies into the per-team start index, keeping date order."""
+        hist = self.goalie_history if history is None else history
+        date = prediction.get('date')
+        if not date:
+            return
+        m = prediction.get('metrics_used') or {}
+        for side in ('away', 'home'):
+            team = (prediction.get(f'{side}_team') or '').upper()
+            goalie = m.get(f'{side}_goalie')
+            if not team or not goalie:
+                continue
+            starts = hist.setdefault(team, [])
+            if not starts or starts[-1][0] <= date:
+                starts.append((date, goalie))
+            else:
+                # Out-of-order backfill: insert after any starts on the same date.
+                pos = bisect.bisect_right([d for d, _ in starts], date)
+                starts.insert(pos, (date, goalie))
+
     def _opponent_strength_index(self, opponent_key: str) -> float:
         """Estimate opponent strength ~ higher is tougher. Uses xg_avg + gs_avg if available."""
         try:
@@ -1223,27 +1404,12 @@ class ImprovedSelfLearningModelV2:
         Returns win rate in last N games at that venue (home/away).
         """
         team_key = team.upper()
-        predictions = self.model_data.get('predictions', [])
-        
-        # Filter for games involving this team at this venue with actual results
-        relevant_games = []
-        for pred in predictions:
-            if not pred.get('actual_winner'):
-                continue
+        # Date-sorted completed games for this team at this venue
+        recent_games = []
+        for pred in self.prediction_index().team_games(team_key, venue, window):
             away_team = (pred.get('away_team') or '').upper()
             home_team = (pred.get('home_team') or '').upper()
-            date = pred.get('date', '')
-            actual_winner = pred.get('actual_winner')
-            
-            # Check if team played at this venue
-            if venue == 'away' and team_key == away_team:
-                relevant_games.append((date, 'away', actual_winner, away_team, home_team))
-            elif venue == 'home' and team_key == home_team:
-                relevant_games.append((date, 'home', actual_winner, away_team, home_team))
-        
-        # Sort by date and take last window games
-        relevant_games.sort(key=lambda x: x[0])
-        recent_games = relevant_games[-window:] if len(relevant_games) > window else relevant_games
+            recent_games.append((pred.get('date', ''), venue, pred.get('actual_winner'), away_team, home_team))
         
         if not recent_games:
             return 0.5  # Default neutral
@@ -1270,22 +1436,12 @@ class ImprovedSelfLearningModelV2:
         Returns 0.5 if no data available (neutral).
         """
         team_key = team.upper()
-        predictions = self.model_data.get('predictions', [])
-        
-        # Filter for all games involving this team at this venue with actual results
+        # All completed games for this team at this venue
         relevant_games = []
-        for pred in predictions:
-            if not pred.get('actual_winner'):
-                continue
+        for pred in self.prediction_index().team_games(team_key, venue):
             away_team = (pred.get('away_team') or '').upper()
             home_team = (pred.get('home_team') or '').upper()
-            actual_winner = pred.get('actual_winner')
-            
-            # Check if team played at this venue
-            if venue == 'away' and team_key == away_team:
-                relevant_games.append((actual_winner, away_team, home_team))
-            elif venue == 'home' and team_key == home_team:
-                relevant_games.append((actual_winner, away_team, home_team))
+            relevant_games.append((pred.get('actual_winner'), away_team, home_team))
         
         if not relevant_games:
             return 0.5  # Default neutral if no data
@@ -1671,10 +1827,9 @@ class ImprovedSelfLearningModelV2:
     def backtest_recent(self, n: int = 60) -> Dict:
         """Backtest accuracy on last n completed games with actual results."""
         import math
-        preds = [p for p in self.model_data.get('predictions', []) if p.get('actual_winner')]
-        if not preds:
+        sample = self.prediction_index().recent_completed(n)
+        if not sample:
             return {"samples": 0, "accuracy": 0.0, "brier": None, "log_loss": None}
-        sample = preds[-n:]
         correct = 0
         brier_sum = 0.0
         log_loss_sum = 0.0
@@ -1719,10 +1874,9 @@ class ImprovedSelfLearningModelV2:
     def backtest_recent_recompute(self, n: int = 60) -> Dict:
         """Backtest by recomputing probabilities for last n completed games using current model settings."""
         import math
-        preds = [p for p in self.model_data.get('predictions', []) if p.get('actual_winner')]
-        if not preds:
+        sample = self.prediction_index().recent_completed(n)
+        if not sample:
             return {"samples": 0, "accuracy": 0.0, "brier": None, "log_loss": None}
-        sample = preds[-n:]
         correct = 0
         brier_sum = 0.0
         log_loss_sum = 0.0
@@ -2317,6 +2471,7 @@ class ImprovedSelfLearningModelV2:
                       correlation_away_prob: Optional[float] = None, correlation_home_prob: Optional[float] = None,
                       ensemble_away_prob: Optional[float] = None, ensemble_home_prob: Optional[float] = None):
         """Add a new prediction with actual game outcomes"""
+        self._own("predictions", "error_log", "goalie_history")
         
         predicted_side = "away" if predicted_away_prob > predicted_home_prob else "home"
         predicted_team = self._side_to_team(predicted_side, away_team, home_team)
@@ -2480,6 +2635,7 @@ class ImprovedSelfLearningModelV2:
         prediction["predicted_home_win_prob"] = predicted_home_prob
         
         self.model_data["predictions"].append(prediction)
+        self._record_goalie_starts(prediction)
         logger.info(
             f"Added prediction for {away_team} @ {home_team}: "
             f"{predicted_away_prob * 100:.1f}% vs {predicted_home_prob * 100:.1f}%"
@@ -2517,8 +2673,7 @@ class ImprovedSelfLearningModelV2:
         
         # Calculate recent accuracy (last 30 games with actual results)
         # Get all games with actual winners, then take the last 30
-        all_completed_games = [p for p in self.model_data["predictions"] if p.get("actual_winner")]
-        recent_games = all_completed_games[-30:] if len(all_completed_games) >= 30 else all_completed_games
+        recent_games = self.prediction_index().recent_completed(30)
         
         # Only calculate recent accuracy if we have enough completed games
         if len(recent_games) >= 5:
@@ -2550,6 +2705,7 @@ class ImprovedSelfLearningModelV2:
     
     def update_team_stats(self, prediction: Dict):
         """Update team statistics with actual game data"""
+        self._own("team_stats", "goalie_stats", "team_last_game")
         away_team = prediction["away_team"].upper()
         home_team = prediction["home_team"].upper()
         date = prediction["date"]
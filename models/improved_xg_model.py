@@ -13,9 +13,11 @@ This model uses:
 """
 
 import math
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+import numpy as np
+
 
 class ImprovedXGModel:
     """
@@ -92,6 +94,9 @@ class ImprovedXGModel:
                 - period: Period number
                 - strength_state: Game strength (5v5, 5v4, etc.)
                 - score_differential: Goal differential from shooter's perspective
+                - is_rebound / is_rush: optional precomputed context flags (e.g. from
+                  the play-by-play shot annotations); previous_events is not scanned
+                  for a flag that is given
             previous_events: List of previous events for context (rebounds, rushes)
             
         Returns:
@@ -134,6 +139,95 @@ class ImprovedXGModel:
         # Cap at 95% (no shot is 100% certain)
         return min(final_xg, 0.95)
     
+    def calculate_xg_batch(self,
+                           x_coords: Sequence[float],
+                           y_coords: Sequence[float],
+                           shot_types: Any = 'wrist',
+                           event_types: Any = 'shot-on-goal',
+                           strength_states: Any = '5v5',
+                           score_differentials: Any = 0,
+                           is_rebound: Any = False,
+                           is_rush: Any = False) -> np.ndarray:
+        """
+        Expected goals for many shots at once.
+        
+        Same model as calculate_xg, with each shot_data field given as an
+        array (or a single value shared by every shot). Rebound and rush
+        context is passed as precomputed flags instead of previous events,
+        e.g. from the play-by-play shot annotations.
+        
+        Returns:
+            Array of expected goal values (0-0.95), one per shot
+        """
+        x = np.asarray(x_coords, dtype=float).ravel()
+        n = len(x)
+        y = np.broadcast_to(np.asarray(y_coords, dtype=float), (n,))
+        
+        # 1. Baseline xG from location (distance + angle)
+        base_xg = self._baseline_xg_batch(x, y)
+        
+        # 2-5. Shot type, event type, strength and score state multipliers
+        shot_type_adj = self._multipliers(shot_types, n, lambda v: self._get_shot_type_multiplier(v.lower()))
+        event_type_adj = self._multipliers(event_types, n, self._get_event_type_multiplier)
+        strength_adj = self._multipliers(strength_states, n, self._get_strength_state_multiplier)
+        score_adj = self._multipliers(score_differentials, n, self._get_score_state_multiplier)
+        
+        # 6-7. Rebound and rush context
+        rebound_adj = np.where(np.broadcast_to(np.asarray(is_rebound, dtype=bool), (n,)), self.rebound_multiplier, 1.0)
+        rush_adj = np.where(np.broadcast_to(np.asarray(is_rush, dtype=bool), (n,)), self.rush_multiplier, 1.0)
+        
+        # 8. Combine all factors (multiplicative model), capped at 95%
+        final_xg = (base_xg * shot_type_adj * event_type_adj *
+                    strength_adj * score_adj * rebound_adj * rush_adj)
+        return np.minimum(final_xg, 0.95)
+    
+    @staticmethod
+    def _multipliers(values: Any, n: int, lookup: Callable[[Any], float]) -> np.ndarray:
+        """Apply a scalar multiplier lookup once per distinct value."""
+        if isinstance(values, (str, int, float)) or values is None:
+            return np.full(n, lookup(values))
+        arr = np.asarray(values)
+        if arr.dtype.kind in 'USbiuf':
+            distinct, inverse = np.unique(arr, return_inverse=True)
+            return np.array([lookup(v.item()) for v in distinct], dtype=float)[inverse.reshape(-1)]
+        table: Dict[Any, float] = {}
+        out = np.empty(n)
+        for i, value in enumerate(values):
+            m = table.get(value)
+            if m is None:
+                m = table[value] = lookup(value)
+            out[i] = m
+        return out
+    
+    def _baseline_xg_batch(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_baseline_xg."""
+        flip = x < 0
+        x = np.where(flip, -x, x)
+        y = np.where(flip, -y, y)
+        
+        distance = np.sqrt((89 - x) ** 2 + (0 - y) ** 2)
+        
+        # Angle subtended by the posts at (89, +/-3), law of cosines
+        dist_to_left = np.sqrt((89 - x) ** 2 + (3 - y) ** 2)
+        dist_to_right = np.sqrt((89 - x) ** 2 + (-3 - y) ** 2)
+        valid = (dist_to_left > 0) & (dist_to_right > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos_angle = ((dist_to_left ** 2 + dist_to_right ** 2 - 6 ** 2) /
+                         (2 * dist_to_left * dist_to_right))
+        angle = np.where(valid, np.degrees(np.arccos(np.clip(np.nan_to_num(cos_angle), -1.0, 1.0))), 5.0)
+        
+        distance_factor = np.select(
+            [distance < 5, distance < 15, distance < 25, distance < 35, distance < 50],
+            [0.35, 0.18, 0.10, 0.06, 0.03], default=0.01)
+        angle_factor = np.select(
+            [angle > 10, angle > 6, angle > 3, angle > 1],
+            [1.0, 0.75, 0.45, 0.25], default=0.10)
+        
+        # Behind goal line or extreme angles
+        angle_factor = np.where((x > 89) | (np.abs(y) > 30), angle_factor * 0.3, angle_factor)
+        
+        return distance_factor * angle_factor
+    
     def _calculate_baseline_xg(self, x_coord: float, y_coord: float) -> float:
         """
         Calculate baseline xG from shot location using distance and angle
@@ -283,6 +377,10 @@ class ImprovedXGModel:
         Research shows rebounds are ~2.13x more likely to score
         """
         
+        is_rebound = shot_data.get('is_rebound')
+        if is_rebound is not None:
+            return self.rebound_multiplier if is_rebound else 1.0
+        
         if not previous_events or len(previous_events) == 0:
             return 1.0  # No previous events, not a rebound
         
@@ -326,6 +424,10 @@ class ImprovedXGModel:
         Research shows rush shots are ~1.67x more likely to score
         """
         
+        is_rush = shot_data.get('is_rush')
+        if is_rush is not None:
+            return self.rush_multiplier if is_rush else 1.0
+        
         if not previous_events or len(previous_events) == 0:
             return 1.0  # No previous events
         
@@ -71,6 +71,10 @@ try:
     from nb_utils import prob_total_over
 except Exception:
     from models.nb_utils import prob_total_over
+try:
+    from rolling_stats import RollingStats
+except Exception:
+    from models.rolling_stats import RollingStats
 
 class EloTracker:
     def __init__(self, k_factor=20, home_advantage=35):
@@ -137,14 +141,14 @@ class GoalieHistory:
 
 class TeamHistory:
     def __init__(self):
-        self.history = {}  # {team_abbr: {'dates': [], 'stats': [], 'home_stats': [], 'away_stats': [], 'opponents_elo': [], 'last_city': None}}
+        self.history = {}  # {team_abbr: {'dates': [], 'stats': RollingStats, 'home_stats': RollingStats, 'away_stats': RollingStats, 'opponents_elo': [], 'last_city': None}}
         self.elo = EloTracker()
         self.goalies = GoalieHistory()
         
     def update(self, team, date, game_stats, venue=None, opponent_elo=None, city=None):
         """Update team history with a new game"""
         if team not in self.history:
-            self.history[team] = {'dates': [], 'stats': [], 'home_stats': [], 'away_stats': [], 'opponents_elo': [], 'last_city': None}
+            self.history[team] = {'dates': [], 'stats': RollingStats(), 'home_stats': RollingStats(), 'away_stats': RollingStats(), 'opponents_elo': [], 'last_city': None}
             
         self.history[team]['dates'].append(date)
         self.history[team]['stats'].append(game_stats)
@@ -187,15 +191,9 @@ class TeamHistory:
 
     def get_rolling_rate(self, team, condition_key, target_key, window=20):
         """Calculate the success rate of a target condition (e.g., win_rate when leading_after_p2)"""
-        if team not in self.history or not self.history[team]['stats']:
+        if team not in self.history or not len(self.history[team]['stats']):
             return 0.5
-        
-        relevant_games = [g for g in self.history[team]['stats'][-window:] if g.get(condition_key) == 1]
-        if not relevant_games:
-            return 0.5
-            
-        successes = [g for g in relevant_games if g.get(target_key) == 1]
-        return float(len(successes)) / float(len(relevant_games))
+        return self.history[team]['stats'].window_rate(condition_key, target_key, window)
 
     def get_game_count_in_window(self, team, current_date, window=4):
         """Phase 3: Count games in a rolling window (e.g. 3-in-4)"""
@@ -216,38 +214,18 @@ class TeamHistory:
             return {}
             
         if venue == 'home':
-            stats_list = self.history[team]['home_stats'][-window:]
+            stats = self.history[team]['home_stats']
         elif venue == 'away':
-            stats_list = self.history[team]['away_stats'][-window:]
+            stats = self.history[team]['away_stats']
         else:
-            stats_list = self.history[team]['stats'][-window:]
-            
-        aggregated = {}
-        if not stats_list:
-            return {}
-            
-        keys = stats_list[0].keys()
-        for k in keys:
-            vals = [g[k] for g in stats_list if g.get(k) is not None]
-            if vals:
-                if alpha is not None and len(vals) > 1:
-                    # Exponential Weighted Mean
-                    weights = [alpha * (1 - alpha) ** i for i in range(len(vals))]
-                    weights = weights[::-1]
-                    aggregated[k] = np.average(vals, weights=weights)
-                else:
-                    aggregated[k] = np.mean(vals)
-            else:
-                aggregated[k] = 0.0
-        return aggregated
+            stats = self.history[team]['stats']
+        return stats.window_stats(window, alpha)
 
     def get_rolling_std(self, team, window=5, key='goal_diff'):
         """Calculate rolling standard deviation for a metric"""
         if team not in self.history or len(self.history[team]['stats']) < 2:
             return 1.0
-        stats_list = self.history[team]['stats'][-window:]
-        vals = [g[key] for g in stats_list if g.get(key) is not None]
-        return np.std(vals) if len(vals) > 1 else 1.0
+        return self.history[team]['stats'].window_std(window, key)
 
     def get_sos(self, team, window=5):
         """Calculate Strength of Schedule (Avg Opponent Elo)"""
@@ -669,11 +647,32 @@ class MetaEnsemblePredictor:
             
         return stack
 
-    def _predict_xgboost(self, away_team, home_team, game_date_str=None, away_goalie=None, home_goalie=None, is_playoff=False, series_status=None) -> Optional[Dict]:
-        """Make prediction using XGBoost model with dynamic features"""
-        if not self.xgb_model or not self.feature_names:
-            return None
-            
+    def _team_rolling_features(self, team: str, cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Per-team TeamHistory inputs of the XGBoost feature vector, memoized in `cache`."""
+        if cache is not None and team in cache:
+            return cache[team]
+        tracker = self.history_tracker
+        now = datetime.now()
+        feats = {
+            'elo': tracker.get_elo(team),
+            'l5': tracker.get_rolling_stats(team, 5, alpha=0.3),
+            'l10': tracker.get_rolling_stats(team, 10, alpha=0.3),
+            'home_l5': tracker.get_rolling_stats(team, 5, venue='home', alpha=0.3),
+            'away_l5': tracker.get_rolling_stats(team, 5, venue='away', alpha=0.3),
+            'games_4d': tracker.get_game_count_in_window(team, now, 4),
+            'games_7d': tracker.get_game_count_in_window(team, now, 7),
+            'preservation_rate': tracker.get_rolling_rate(team, 'led_after_p2', 'won_game', window=20),
+            'comeback_rate': tracker.get_rolling_rate(team, 'trailed_after_p2', 'won_game', window=20),
+            'sos': tracker.get_sos(team, 5),
+            'std': tracker.get_rolling_std(team, 5),
+            'desperation': self.standings.calculate_desperation_index(team),
+        }
+        if cache is not None:
+            cache[team] = feats
+        return feats
+
+    def _xgb_feature_data(self, away_team, home_team, game_date_str=None, away_goalie=None, home_goalie=None, is_playoff=False, team_cache=None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the XGBoost feature dict for one game plus the context reused after scoring."""
         # Determine Game Date (default to today if None)
         if game_date_str:
             try:
@@ -684,22 +683,24 @@ class MetaEnsemblePredictor:
             game_date = datetime.now()
             
         tracker = self.history_tracker
+        h_team = self._team_rolling_features(home_team, team_cache)
+        a_team = self._team_rolling_features(away_team, team_cache)
         
         # Calculate Features
-        home_elo = tracker.get_elo(home_team)
-        away_elo = tracker.get_elo(away_team)
+        home_elo = h_team['elo']
+        away_elo = a_team['elo']
         
         home_rest = tracker.get_days_rest(home_team, game_date)
         away_rest = tracker.get_days_rest(away_team, game_date)
         
-        h_l5 = tracker.get_rolling_stats(home_team, 5, alpha=0.3)
-        a_l5 = tracker.get_rolling_stats(away_team, 5, alpha=0.3)
-        h_l10 = tracker.get_rolling_stats(home_team, 10, alpha=0.3)
-        a_l10 = tracker.get_rolling_stats(away_team, 10, alpha=0.3)
+        h_l5 = h_team['l5']
+        a_l5 = a_team['l5']
+        h_l10 = h_team['l10']
+        a_l10 = a_team['l10']
         
         # Venue Specific Rolling (L5)
-        h_home_l5 = tracker.get_rolling_stats(home_team, 5, venue='home', alpha=0.3)
-        a_away_l5 = tracker.get_rolling_stats(away_team, 5, venue='away', alpha=0.3)
+        h_home_l5 = h_team['home_l5']
+        a_away_l5 = a_team['away_l5']
         
         # Goalie Features (with B2B fatigue penalty)
         h_gsax_roll = tracker.goalies.get_rolling_gsax(home_goalie)
@@ -758,8 +759,8 @@ class MetaEnsemblePredictor:
             'a_discipline_target': h_l5.get('pim', 8.0),
             
             # Phase 3 Fatigue Density
-            'h_3_in_4': 1 if tracker.get_game_count_in_window(home_team, datetime.now(), 4) >= 3 else 0,
-            'a_3_in_4': 1 if tracker.get_game_count_in_window(away_team, datetime.now(), 4) >= 3 else 0,
+            'h_3_in_4': 1 if h_team['games_4d'] >= 3 else 0,
+            'a_3_in_4': 1 if a_team['games_4d'] >= 3 else 0,
             
             # Technical Metrics
             'l5_rush_diff': h_l5.get('rush', 2) - a_l5.get('rush', 2),
@@ -779,10 +780,10 @@ class MetaEnsemblePredictor:
             'p2_xg_diff': h_l5.get('p2_xg', 0.8) - a_l5.get('p2_xg', 0.8),
             'p3_xg_diff': h_l5.get('p3_xg', 0.8) - a_l5.get('p3_xg', 0.8),
             'p1_p2_dominance': (h_l10.get('p1_xg', 0.8) + h_l10.get('p2_xg', 0.8)) - (a_l10.get('p1_xg', 0.8) + a_l10.get('p2_xg', 0.8)),
-            'h_preservation_rate': tracker.get_rolling_rate(home_team, 'led_after_p2', 'won_game', window=20),
-            'a_preservation_rate': tracker.get_rolling_rate(away_team, 'led_after_p2', 'won_game', window=20),
-            'h_comeback_rate': tracker.get_rolling_rate(home_team, 'trailed_after_p2', 'won_game', window=20),
-            'a_comeback_rate': tracker.get_rolling_rate(away_team, 'trailed_after_p2', 'won_game', window=20),
+            'h_preservation_rate': h_team['preservation_rate'],
+            'a_preservation_rate': a_team['preservation_rate'],
+            'h_comeback_rate': h_team['comeback_rate'],
+            'a_comeback_rate': a_team['comeback_rate'],
 
             # Phase 18 Features
             'l5_nzt_possession_diff': h_l5.get('nzt_possession', 50) - a_l5.get('nzt_possession', 50),
@@ -794,8 +795,8 @@ class MetaEnsemblePredictor:
             # Phase 14: Season-Phase Context
             'season_month': datetime.now().month,
             'is_late_season': 1 if datetime.now().month in [3, 4] else 0,
-            'h_desperation': self.standings.calculate_desperation_index(home_team),
-            'a_desperation': self.standings.calculate_desperation_index(away_team),
+            'h_desperation': h_team['desperation'],
+            'a_desperation': a_team['desperation'],
             
             # Phase 4: Travel Jet Lag (TZ Delta)
             'tz_delta': TEAM_TIMEZONES.get(away_team, -5) - TEAM_TIMEZONES.get(home_team, -5),
@@ -803,11 +804,11 @@ class MetaEnsemblePredictor:
             # Venue Specific
             
             # Strength of Schedule (SoS)
-            'home_sos': tracker.get_sos(home_team, 5),
-            'away_sos': tracker.get_sos(away_team, 5),
+            'home_sos': h_team['sos'],
+            'away_sos': a_team['sos'],
             
             # Stability
-            'l5_std_diff': tracker.get_rolling_std(home_team, 5) - tracker.get_rolling_std(away_team, 5),
+            'l5_std_diff': h_team['std'] - a_team['std'],
             
             'l10_goal_diff': h_l10.get('goal_diff', 0) - a_l10.get('goal_diff', 0),
             
@@ -818,8 +819,8 @@ class MetaEnsemblePredictor:
             # Phase 14: Season-Phase Context
             'season_month': datetime.now().month,
             'is_late_season': 1 if datetime.now().month in [3, 4] else 0,
-            'h_desperation': self.standings.calculate_desperation_index(home_team),
-            'a_desperation': self.standings.calculate_desperation_index(away_team),
+            'h_desperation': h_team['desperation'],
+            'a_desperation': a_team['desperation'],
             
             # Raw Components for Phase 11/12 Symbolic Features
             # Phase 48: Apply momentum_scalar to reduce xG-heavy bias during playoffs
@@ -833,77 +834,179 @@ class MetaEnsemblePredictor:
             'away_win_rate': self.team_encodings.get('away_map', {}).get(away_team, self.team_encodings.get('away_prior', 0.5)),
 
             # Phase 9: Automated Interaction Discovery
-            'home_win_rate_away_sos': self.team_encodings.get('home_map', {}).get(home_team, 0.5) * self.history_tracker.get_sos(away_team, 5),
+            'home_win_rate_away_sos': self.team_encodings.get('home_map', {}).get(home_team, 0.5) * a_team['sos'],
             'away_b2b_home_strength': (1 if away_rest == 1 else 0) * h_finish,
             'l10_xg_st_inter': (h_l10.get('xg_diff', 0) - a_l10.get('xg_diff', 0)) * ((h_l5.get('pp_pct', 20) + h_l5.get('pk_pct', 80)) - (a_l5.get('pp_pct', 20) + a_l5.get('pk_pct', 80))),
             
             # Phase 11: Symbolic Feature Discovery
             'pressure_index': (h_l5.get('xg_avg', 2.5) / (a_l5.get('xg_avg', 2.5) + 0.1)) * ((home_elo + self.history_tracker.elo.ha) / (away_elo + 0.1)),
-            'xg_efficiency': (h_l5.get('xg_avg', 2.5) * (self.history_tracker.get_sos(home_team, 5) / 1500)) - (a_l5.get('xg_avg', 2.5) * (self.history_tracker.get_sos(away_team, 5) / 1500)),
+            'xg_efficiency': (h_l5.get('xg_avg', 2.5) * (h_team['sos'] / 1500)) - (a_l5.get('xg_avg', 2.5) * (a_team['sos'] / 1500)),
             'power_momentum': ((home_elo + self.history_tracker.elo.ha) - away_elo) * (h_l10.get('xg_diff', 0) - a_l10.get('xg_diff', 0))
         }
+
+        context = {
+            'away_rest': away_rest,
+            'home_rest': home_rest,
+            'away_games_7d': a_team['games_7d'],
+            'home_games_7d': h_team['games_7d'],
+        }
+        return feature_data, context
+
+    def _aligned_frame(self, model, rows: List[Dict[str, Any]], regime_feats=None) -> Optional[pd.DataFrame]:
+        """One DataFrame row per feature dict, in the column order `model` was trained on."""
+        if model is None: return None
         
-        # --- Helper for dynamic feature alignment ---
-        def _get_aligned_df(model, regime_feats=None):
-            if model is None: return None
+        # Get feature names from model if possible, fallback to regime feats
+        feats_to_use = regime_feats or self.feature_names
+        if hasattr(model, 'get_booster'):
+            feats_to_use = model.get_booster().feature_names
+        elif hasattr(model, 'feature_names_in_'):
+            feats_to_use = list(model.feature_names_in_)
+        elif hasattr(model, 'feature_names'):
+            feats_to_use = model.feature_names
             
-            # Get feature names from model if possible, fallback to regime feats
-            feats_to_use = regime_feats or self.feature_names
-            if hasattr(model, 'get_booster'):
-                feats_to_use = model.get_booster().feature_names
-            elif hasattr(model, 'feature_names_in_'):
-                feats_to_use = list(model.feature_names_in_)
-            elif hasattr(model, 'feature_names'):
-                feats_to_use = model.feature_names
+        return pd.DataFrame([[row.get(name, 0.0) for name in feats_to_use] for row in rows], columns=feats_to_use)
+
+    def _predict_xgboost(self, away_team, home_team, game_date_str=None, away_goalie=None, home_goalie=None, is_playoff=False, series_status=None) -> Optional[Dict]:
+        """Make prediction using XGBoost model with dynamic features"""
+        return self._predict_xgboost_batch([{
+            'away_team': away_team,
+            'home_team': home_team,
+            'game_date': game_date_str,
+            'away_goalie': away_goalie,
+            'home_goalie': home_goalie,
+            'is_playoff': is_playoff,
+            'series_status': series_status,
+        }])[0]
+
+    def _predict_xgboost_batch(self, games: List[Dict[str, Any]]) -> List[Optional[Dict]]:
+        """
+        XGBoost predictions for a slate of games.
+
+        Team rolling features are computed once per team, and every stacked
+        variant and sub-model runs once per regime on the stacked feature
+        matrix instead of once per game.
+        """
+        results: List[Optional[Dict]] = [None] * len(games)
+        if not self.xgb_model or not self.feature_names:
+            return results
+
+        team_cache: Dict[str, Dict[str, Any]] = {}
+        rows = []
+        contexts = []
+        for g in games:
+            feature_data, context = self._xgb_feature_data(
+                g['away_team'], g['home_team'], g.get('game_date'), g.get('away_goalie'), g.get('home_goalie'),
+                is_playoff=bool(g.get('is_playoff')), team_cache=team_cache,
+            )
+            rows.append(feature_data)
+            contexts.append(context)
+
+        for is_playoff in (False, True):
+            idx = [i for i, g in enumerate(games) if bool(g.get('is_playoff')) == is_playoff]
+            if not idx:
+                continue
+            regime_rows = [rows[i] for i in idx]
+
+            # 4. Phase 48: Stacked Prediction
+            active_stack = self.xgb_stack_ply if is_playoff else self.xgb_stack_reg
+            if not active_stack:
+                # Minimal fallback to legacy single model if stack failed to load
+                if self.calibrated_model:
+                    active_stack = [{"model": self.calibrated_model, "feats": self.feature_names, "stack_weight": 1.0, "name": "legacy"}]
+                else:
+                    continue
                 
-            vec = []
-            for name in feats_to_use:
-                vec.append(feature_data.get(name, 0.0))
-            return pd.DataFrame([vec], columns=feats_to_use)
-
-        # 4. Phase 48: Stacked Prediction
-        active_stack = self.xgb_stack_ply if is_playoff else self.xgb_stack_reg
-        if not active_stack:
-            # Minimal fallback to legacy single model if stack failed to load
-            if self.calibrated_model:
-                active_stack = [{"model": self.calibrated_model, "feats": self.feature_names, "stack_weight": 1.0, "name": "legacy"}]
-            else:
-                return None
-            
-        prob_sum = 0.0
-        weight_sum = 0.0
-        
-        for entry in active_stack:
-            v_model = entry['model']
-            v_feats = entry['feats']
-            v_weight = entry.get('stack_weight', 1.0)
+            prob_sum = np.zeros(len(idx))
+            weight_sum = 0.0
             
+            for entry in active_stack:
+                v_model = entry['model']
+                v_feats = entry['feats']
+                v_weight = entry.get('stack_weight', 1.0)
+                
+                try:
+                    # Feature Snapshot Guard (only for the primary variant in regular season)
+                    if entry['name'] == "full" and not is_playoff:
+                        if isinstance(self._feature_snapshot, dict) and self._feature_snapshot.get("sha256"):
+                            joined = "\n".join([str(x) for x in v_feats]).encode("utf-8")
+                            cur = hashlib.sha256(joined).hexdigest()
+                            exp = str(self._feature_snapshot.get("sha256"))
+                            if cur != exp:
+                                print(f"⚠️ Feature snapshot mismatch for {entry['name']} (runtime={cur} expected={exp})")
+                                continue # Skip this variant if it's drifting
+
+                    df_v = self._aligned_frame(v_model, regime_rows, regime_feats=v_feats)
+                    v_prob = v_model.predict_proba(df_v)[:, 1]
+                    prob_sum += (v_prob * v_weight)
+                    weight_sum += v_weight
+                except Exception as e:
+                    print(f"⚠️ Variant {entry['name']} prediction failed: {e}")
+                    
+            if weight_sum <= 0:
+                continue
+            probs = prob_sum / weight_sum
+                
+            # Use the first variant for downstream sub-models (margin, etc.) as primary alignment
+            active_feats = active_stack[0]['feats']
+            sub_preds = self._xgb_sub_model_predictions(regime_rows, active_feats)
+
+            for j, i in enumerate(idx):
+                g = games[i]
+                results[i] = self._finish_xgb_prediction(
+                    g['away_team'], g['home_team'], probs[j], rows[i], contexts[i],
+                    {name: (vals[j] if vals is not None else None) for name, vals in sub_preds.items()},
+                    away_goalie=g.get('away_goalie'), home_goalie=g.get('home_goalie'), is_playoff=is_playoff,
+                )
+        return results
+
+    def _xgb_sub_model_predictions(self, rows: List[Dict[str, Any]], active_feats) -> Dict[str, Optional[np.ndarray]]:
+        """Run each auxiliary model once over the stacked rows; None where a model is missing or failed."""
+        out: Dict[str, Optional[np.ndarray]] = {'margin': None, 'home_goals': None, 'away_goals': None, 'total_goals': None, 'confidence': None, 'p1': None}
+
+        # 5. Goal Margin Prediction (Phase 12)
+        # Use dynamic alignment to handle potentially different features in margin model
+        if self.margin_model is not None:
             try:
-                # Feature Snapshot Guard (only for the primary variant in regular season)
-                if entry['name'] == "full" and not is_playoff:
-                    if isinstance(self._feature_snapshot, dict) and self._feature_snapshot.get("sha256"):
-                        joined = "\n".join([str(x) for x in v_feats]).encode("utf-8")
-                        cur = hashlib.sha256(joined).hexdigest()
-                        exp = str(self._feature_snapshot.get("sha256"))
-                        if cur != exp:
-                            print(f"⚠️ Feature snapshot mismatch for {entry['name']} (runtime={cur} expected={exp})")
-                            continue # Skip this variant if it's drifting
-
-                df_v = _get_aligned_df(v_model, regime_feats=v_feats)
-                v_prob = v_model.predict_proba(df_v)[0][1]
-                prob_sum += (v_prob * v_weight)
-                weight_sum += v_weight
+                out['margin'] = np.asarray(self.margin_model.predict(self._aligned_frame(self.margin_model, rows, regime_feats=active_feats)), dtype=float)
             except Exception as e:
-                print(f"⚠️ Variant {entry['name']} prediction failed: {e}")
-                
-        if weight_sum > 0:
-            prob = prob_sum / weight_sum
-        else:
-            return None
-            
-        # Use the first variant for downstream sub-models (margin, etc.) as primary alignment
-        active_model = active_stack[0]['model']
-        active_feats = active_stack[0]['feats']
+                print(f"Margin prediction error: {e}")
+
+        # 5b. Scoreline: prefer direct home/away goals models when available.
+        try:
+            if self.home_goals_model is not None and self.away_goals_model is not None:
+                out['home_goals'] = np.asarray(self.home_goals_model.predict(self._aligned_frame(self.home_goals_model, rows, regime_feats=active_feats)), dtype=float)
+                out['away_goals'] = np.asarray(self.away_goals_model.predict(self._aligned_frame(self.away_goals_model, rows, regime_feats=active_feats)), dtype=float)
+        except Exception as e:
+            print(f"Home/away goals prediction error: {e}")
+            out['home_goals'] = out['away_goals'] = None
+
+        if self.total_goals_model is not None:
+            try:
+                out['total_goals'] = np.asarray(self.total_goals_model.predict(self._aligned_frame(self.total_goals_model, rows, regime_feats=active_feats)), dtype=float)
+            except Exception as e:
+                print(f"Total goals prediction error: {e}")
+
+        # 6. Meta-Confidence Estimation
+        if self.confidence_model is not None:
+            try:
+                out['confidence'] = np.asarray(self.confidence_model.predict(self._aligned_frame(self.confidence_model, rows, regime_feats=active_feats)))
+            except Exception as e:
+                print(f"Confidence model error: {e}")
+
+        # 7. Period 1 Outcome Model (Phase 17)
+        if self.p1_model is not None:
+            try:
+                out['p1'] = np.asarray(self.p1_model.predict_proba(self._aligned_frame(self.p1_model, rows, regime_feats=active_feats))[:, 1])
+            except Exception as e:
+                print(f"P1 prediction error: {e}")
+        return out
+
+    def _finish_xgb_prediction(self, away_team, home_team, prob, feature_data, context, sub, away_goalie=None, home_goalie=None, is_playoff=False) -> Optional[Dict]:
+        """Turn a stacked win probability and sub-model outputs into the per-game XGBoost dict."""
+        tracker = self.history_tracker
+        home_rest = context['home_rest']
+        away_rest = context['away_rest']
 
         try:
             # 5. Apply post-hoc calibration mapping if available.
@@ -947,24 +1050,17 @@ class MetaEnsemblePredictor:
             # 5. Goal Margin Prediction (Phase 12)
             # Use dynamic alignment to handle potentially different features in margin model
             predicted_margin = 0.0
-            if self.margin_model is not None:
-                try:
-                    df_margin = _get_aligned_df(self.margin_model, regime_feats=active_feats)
-                    predicted_margin = float(self.margin_model.predict(df_margin)[0])
-                except Exception as e:
-                    print(f"Margin prediction error: {e}")
+            if sub.get('margin') is not None:
+                predicted_margin = float(sub['margin'])
 
             # 5b. Scoreline: prefer direct home/away goals models when available.
             predicted_total = None
             predicted_home_goals = None
             predicted_away_goals = None
             try:
-                if self.home_goals_model is not None and self.away_goals_model is not None:
-                    df_h = _get_aligned_df(self.home_goals_model, regime_feats=active_feats)
-                    df_a = _get_aligned_df(self.away_goals_model, regime_feats=active_feats)
-                    
-                    h = float(self.home_goals_model.predict(df_h)[0])
-                    a = float(self.away_goals_model.predict(df_a)[0])
+                if sub.get('home_goals') is not None and sub.get('away_goals') is not None:
+                    h = float(sub['home_goals'])
+                    a = float(sub['away_goals'])
                     # Clamp predicted means
                     h = float(max(0.05, min(12.0, h)))
                     a = float(max(0.05, min(12.0, a)))
@@ -998,13 +1094,8 @@ class MetaEnsemblePredictor:
 
             # Fallback: total-goals model + margin split
             if predicted_total is None:
-                try:
-                    if self.total_goals_model is not None:
-                        df_tg = _get_aligned_df(self.total_goals_model, regime_feats=active_feats)
-                        predicted_total = float(self.total_goals_model.predict(df_tg)[0])
-                except Exception as e:
-                    print(f"Total goals prediction error: {e}")
-                    predicted_total = None
+                if sub.get('total_goals') is not None:
+                    predicted_total = float(sub['total_goals'])
 
                 if predicted_total is not None:
                     predicted_total = float(max(2.0, min(12.0, predicted_total)))
@@ -1050,29 +1141,21 @@ class MetaEnsemblePredictor:
             
             # 6. Meta-Confidence Estimation
             confidence_tier = "Standard"
-            if self.confidence_model is not None:
-                try:
-                    df_conf = _get_aligned_df(self.confidence_model, regime_feats=active_feats)
-                    is_correct = self.confidence_model.predict(df_conf)[0]
-                    if is_correct == 1 and max(away_prob, home_prob) > 55:
-                        confidence_tier = "🔥 High Confidence"
-                    elif is_correct == 0 or max(away_prob, home_prob) < 52:
-                        confidence_tier = "⚠️ High Risk"
-                except Exception as e:
-                    print(f"Confidence model error: {e}")
+            if sub.get('confidence') is not None:
+                is_correct = sub['confidence']
+                if is_correct == 1 and max(away_prob, home_prob) > 55:
+                    confidence_tier = "🔥 High Confidence"
+                elif is_correct == 0 or max(away_prob, home_prob) < 52:
+                    confidence_tier = "⚠️ High Risk"
             
             # 7. Period 1 Outcome Model (Phase 17)
             p1_win_prob = 0.5
-            if self.p1_model is not None:
-                try:
-                    df_p1 = _get_aligned_df(self.p1_model, regime_feats=active_feats)
-                    p1_win_prob = self.p1_model.predict_proba(df_p1)[0][1]
-                except Exception as e:
-                    print(f"P1 prediction error: {e}")
+            if sub.get('p1') is not None:
+                p1_win_prob = sub['p1']
             
             # Phase 47/48 Fatigue Metrics for Score Model
-            away_games_7d = tracker.get_game_count_in_window(away_team, datetime.now(), 7)
-            home_games_7d = tracker.get_game_count_in_window(home_team, datetime.now(), 7)
+            away_games_7d = context['away_games_7d']
+            home_games_7d = context['home_games_7d']
             away_travel = tracker.get_travel_distance(away_team, home_team)
             home_travel = tracker.get_travel_distance(home_team, home_team) # Home stays home
 
@@ -1120,11 +1203,11 @@ class MetaEnsemblePredictor:
             print(f"XGBoost prediction error: {e}")
             return None
     
-    def get_injury_impact(self, team: str) -> float:
+    def get_injury_impact(self, team: str, daily_data: Optional[Dict] = None) -> float:
         """Calculate injury impact multiplier (0.90 - 1.0) using RotoWire data"""
         try:
-            # Scrape latest data
-            data = self.rotowire.scrape_daily_data()
+            # Scrape latest data (unless the caller already has today's scrape)
+            data = daily_data if daily_data is not None else self.rotowire.scrape_daily_data()
             impact = 1.0
             
             # Find the team's injuries in the scraped data
@@ -1158,6 +1241,53 @@ class MetaEnsemblePredictor:
                 vegas_odds: Dict = None, is_playoff: bool = False,
                 series_status: str = None) -> Dict:
         """Meta-ensemble prediction combining all methods"""
+        return self.predict_batch([{
+            'away_team': away_team,
+            'home_team': home_team,
+            'game_id': game_id,
+            'game_date': game_date,
+            'away_lineup': away_lineup,
+            'home_lineup': home_lineup,
+            'away_goalie': away_goalie,
+            'home_goalie': home_goalie,
+            'away_injuries': away_injuries,
+            'home_injuries': home_injuries,
+            'vegas_odds': vegas_odds,
+            'is_playoff': is_playoff,
+            'series_status': series_status,
+        }])[0]
+
+    def predict_batch(self, games: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Meta-ensemble predictions for a whole slate.
+
+        Each game is a dict of `predict` keyword arguments (away_team and
+        home_team required). The XGBoost stack scores every game in one call
+        per model and regime, and the RotoWire injury scrape is shared by
+        the slate. Returns one `predict` result per game, in order.
+        """
+        xgb_preds = self._predict_xgboost_batch(games)
+
+        daily_data = None
+        if any(not g.get('away_injuries') or not g.get('home_injuries') for g in games):
+            try:
+                daily_data = self.rotowire.scrape_daily_data()
+            except Exception as e:
+                print(f"RotoWire injury scrape failed: {e}")
+
+        return [
+            self._blend_prediction(xgb_pred=xgb_pred, injury_data=daily_data, **g)
+            for g, xgb_pred in zip(games, xgb_preds)
+        ]
+
+    def _blend_prediction(self, away_team: str, home_team: str, xgb_pred: Optional[Dict] = None,
+                          game_id: str = None, game_date: str = None,
+                          away_lineup: Dict = None, home_lineup: Dict = None,
+                          away_goalie: str = None, home_goalie: str = None,
+                          away_injuries: list = None, home_injuries: list = None,
+                          vegas_odds: Dict = None, is_playoff: bool = False,
+                          series_status: str = None, injury_data: Optional[Dict] = None) -> Dict:
+        """Blend a precomputed XGBoost prediction with the other components for one game."""
         predictions = []
         weights = []
         xgb_p1_prob = 50.0
@@ -1177,7 +1307,6 @@ class MetaEnsemblePredictor:
                 xgb_weight = 0.35
                 spec_weight = 0.45
             
-        xgb_pred = self._predict_xgboost(away_team, home_team, game_date, away_goalie, home_goalie, is_playoff=is_playoff, series_status=series_status)
         xgb_margin = 0.0
         if xgb_pred:
             predictions.append(xgb_pred)
@@ -1267,8 +1396,8 @@ class MetaEnsemblePredictor:
         
         # Apply Contextual Factors (Phase 4 Blending)
         # 1. Injury Impact
-        h_health = self.get_injury_impact(home_team) if not home_injuries else (1.0 - self._team_injury_impact(home_injuries))
-        a_health = self.get_injury_impact(away_team) if not away_injuries else (1.0 - self._team_injury_impact(away_injuries))
+        h_health = self.get_injury_impact(home_team, injury_data) if not home_injuries else (1.0 - self._team_injury_impact(home_injuries))
+        a_health = self.get_injury_impact(away_team, injury_data) if not away_injuries else (1.0 - self._team_injury_impact(away_injuries))
         
         # 2. Travel Impact
         h_travel = self.history_tracker.get_travel_distance(home_team, home_team)
@@ -66,3 +66,110 @@ def prob_total_over(mu: float, size: float, line: float, max_k: int = 15) -> flo
         return 1.0
     return float(1.0 - float(np.sum(pmf[: k + 1])))
 
+
+
+# ---------------------------------------------------------------------------
+# Batched scoreline engine
+#
+# The helpers below take arrays of per-game means (and NB sizes) and return one
+# row per game, so win/tie probabilities for a whole history come out of a few
+# array operations instead of per-game pmf loops. PMFs are truncated at
+# `max_goals` and NOT renormalized, matching the scalar loops they replace.
+# ---------------------------------------------------------------------------
+
+
+def poisson_pmf_matrix(lam, max_goals: int = 15) -> np.ndarray:
+    """Poisson pmf for 0..max_goals, one row per mean: shape (n, max_goals+1)."""
+    lam = np.asarray(lam, dtype=float).reshape(-1, 1)
+    g = np.arange(1, int(max_goals) + 1, dtype=float)
+    steps = np.empty((lam.shape[0], int(max_goals) + 1))
+    steps[:, :1] = np.exp(-lam)
+    # pmf(n) = pmf(n-1) * lam / n
+    steps[:, 1:] = lam / g
+    return np.cumprod(steps, axis=1)
+
+
+def nb_pmf_matrix(mean, size, max_goals: int = 12) -> np.ndarray:
+    """
+    NB2 pmf (mean/size parameterization) for 0..max_goals: shape (n, max_goals+1).
+
+    `size` may be a scalar or one value per row.
+    """
+    mu = np.maximum(1e-9, np.asarray(mean, dtype=float).reshape(-1, 1))
+    r = np.maximum(1e-9, np.asarray(size, dtype=float).reshape(-1, 1))
+    p = r / (r + mu)
+    g = np.arange(0, int(max_goals), dtype=float)
+    steps = np.empty((mu.shape[0], int(max_goals) + 1))
+    steps[:, :1] = p ** r
+    # pmf(n+1) = pmf(n) * (n + r) / (n + 1) * (1 - p)
+    steps[:, 1:] = (g + r) / (g + 1.0) * (1.0 - p)
+    return np.cumprod(steps, axis=1)
+
+
+def scoreline_matrix(pmf_away: np.ndarray, pmf_home: np.ndarray) -> np.ndarray:
+    """Joint P(away=a, home=h) under independence: shape (n, G+1, G+1), indexed [i, a, h]."""
+    pmf_away = np.atleast_2d(pmf_away)
+    pmf_home = np.atleast_2d(pmf_home)
+    return pmf_away[:, :, None] * pmf_home[:, None, :]
+
+
+def outcome_probs(pmf_away: np.ndarray, pmf_home: np.ndarray):
+    """
+    (p_away_win, p_home_win, p_tie) per row from two pmf matrices.
+
+    Uses the lower/upper triangles of the scoreline matrix via CDFs:
+    P(away > home) = sum_a P(away=a) * P(home <= a-1).
+    """
+    pmf_away = np.atleast_2d(pmf_away)
+    pmf_home = np.atleast_2d(pmf_home)
+    cdf_away = np.cumsum(pmf_away, axis=1)
+    cdf_home = np.cumsum(pmf_home, axis=1)
+    p_away = np.sum(pmf_away[:, 1:] * cdf_home[:, :-1], axis=1)
+    p_home = np.sum(pmf_home[:, 1:] * cdf_away[:, :-1], axis=1)
+    p_tie = np.sum(pmf_away * pmf_home, axis=1)
+    return p_away, p_home, p_tie
+
+
+def poisson_win_probs(away_lam, home_lam, max_goals: int = 15):
+    """Batched regulation (p_away_win, p_home_win, p_tie) from two Poissons."""
+    away_lam = np.maximum(0.01, np.asarray(away_lam, dtype=float).reshape(-1))
+    home_lam = np.maximum(0.01, np.asarray(home_lam, dtype=float).reshape(-1))
+    pmf = poisson_pmf_matrix(np.concatenate([away_lam, home_lam]), max_goals)
+    return outcome_probs(pmf[:away_lam.shape[0]], pmf[away_lam.shape[0]:])
+
+
+def nb_win_probs(away_mu, home_mu, size, max_goals: int = 12):
+    """Batched regulation (p_away_win, p_home_win, p_tie) from two NB goal counts."""
+    away_mu = np.asarray(away_mu, dtype=float).reshape(-1)
+    home_mu = np.asarray(home_mu, dtype=float).reshape(-1)
+    size = np.broadcast_to(np.asarray(size, dtype=float).reshape(-1), away_mu.shape)
+    n = away_mu.shape[0]
+    # One pmf pass for both sides.
+    pmf = nb_pmf_matrix(np.concatenate([away_mu, home_mu]), np.concatenate([size, size]), max_goals)
+    return outcome_probs(pmf[:n], pmf[n:])
+
+
+def nb_away_win_with_ot(away_mu, home_mu, ot_scale: float, size, tie_gamma: float = 1.0, max_goals: int = 12) -> np.ndarray:
+    """
+    Batched away win probability: NB regulation plus the OT tie allocation
+    of `ScorePredictionModel._neg_bin_away_win_with_ot`.
+    """
+    away_mu = np.atleast_1d(np.asarray(away_mu, dtype=float))
+    home_mu = np.atleast_1d(np.asarray(home_mu, dtype=float))
+    size = np.broadcast_to(np.asarray(size, dtype=float), away_mu.shape)
+    p_away_reg, _p_home_reg, p_tie_reg = nb_win_probs(away_mu, home_mu, size, max_goals)
+
+    away_ot_mu = np.maximum(0.01, away_mu * float(ot_scale))
+    home_ot_mu = np.maximum(0.01, home_mu * float(ot_scale))
+    kk = np.maximum(1e-9, size)
+    away0 = (kk / (kk + away_ot_mu)) ** kk
+    home0 = (kk / (kk + home_ot_mu)) ** kk
+    away_scored = np.maximum(0.0, 1.0 - away0)
+    home_scored = np.maximum(0.0, 1.0 - home0)
+
+    away_share = np.clip(away_ot_mu / (away_ot_mu + home_ot_mu), 0.01, 0.99)
+    if float(tie_gamma) != 1.0:
+        away_share = np.clip(0.5 + (away_share - 0.5) * float(tie_gamma), 0.01, 0.99)
+
+    p_ot = home0 * away_scored + away_share * (away0 * home0 + away_scored * home_scored)
+    return p_away_reg + p_tie_reg * np.clip(p_ot, 0.0, 1.0)
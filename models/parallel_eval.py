@@ -0,0 +1,126 @@
+"""
+Process-pool executor for independent training/evaluation tasks.
+
+train_xgboost_model uses it to run TimeSeriesSplit folds and model variants
+side by side. Every worker gets an equal share of the machine's cores
+(`worker_threads()` is the n_jobs a model fitted inside a task should use),
+and each task is seeded from its position in the task list, so the results
+do not depend on how many workers ran them.
+
+TRAIN_WORKERS caps the pool size; TRAIN_WORKERS=1 runs everything serially
+in-process, exactly as before. Tasks started inside a worker always run
+serially, so nested evaluators never oversubscribe the machine.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing as mp
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+BASE_SEED = 42
+
+# Set by the pool initializer; None in the parent process.
+_worker_threads: Optional[int] = None
+
+# Pools are kept per size and reused, so the model libraries are imported
+# once per worker rather than once per evaluation.
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    try:
+        n = int(os.environ.get("TRAIN_WORKERS", "0"))
+    except ValueError:
+        n = 0
+    return n if n > 0 else (os.cpu_count() or 1)
+
+
+def worker_threads() -> Optional[int]:
+    """Thread budget for the current task (None outside a pool: library default)."""
+    return _worker_threads
+
+
+def _init_worker(threads: int) -> None:
+    global _worker_threads
+    _worker_threads = threads
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(threads)
+    except Exception:
+        pass
+
+
+def _run_seeded(fn: Callable[..., Any], index: int, kwargs: Dict[str, Any]) -> Any:
+    random.seed(BASE_SEED + index)
+    np.random.seed(BASE_SEED + index)
+    return fn(**kwargs)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(threads,),
+            )
+            _pools[workers] = pool
+        return pool
+
+
+def _discard_pool(workers: int) -> None:
+    with _pools_lock:
+        pool = _pools.pop(workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+def run_tasks(
+    fn: Callable[..., Any],
+    tasks: Sequence[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """
+    Return [fn(**task) for task in tasks], in task order.
+
+    `fn` must be a module-level function and the task values picklable. An
+    exception raised by a task propagates as it would serially; if the pool
+    itself cannot start or dies, the remaining work runs in-process.
+    """
+    tasks = list(tasks)
+    workers = min(len(tasks), max_workers or default_workers())
+    if workers <= 1 or _worker_threads is not None:
+        return [_run_seeded(fn, i, t) for i, t in enumerate(tasks)]
+
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(_run_seeded, fn, i, t) for i, t in enumerate(tasks)]
+        return [f.result() for f in futures]
+    except (BrokenProcessPool, OSError) as e:
+        _discard_pool(workers)
+        print(f"⚠️ Process pool unavailable ({e}); running {len(tasks)} tasks serially")
+        return [_run_seeded(fn, i, t) for i, t in enumerate(tasks)]
@@ -15,6 +15,55 @@ _ROUND_MODEL_TARGET = {
     4: "won_cup",
 }
 
+# Best-of-7 venue by game index (2-2-1-1-1): 0 = game in home's arena, 1 = in away's arena
+_SERIES_VENUE_IDX = np.array([0, 0, 1, 1, 0, 1, 0], dtype=np.intp)
+
+
+def venue_game_prob_grid(p_away_at_home: float, p_away_at_away: float) -> np.ndarray:
+    """4x4 P(away wins the next game) by series state, from fixed per-venue game probabilities."""
+    aw, hw = np.indices((4, 4))
+    return np.where(_SERIES_VENUE_IDX[aw + hw] == 0, p_away_at_home, p_away_at_away).astype(np.float64)
+
+
+def solve_series_lattice(grid: np.ndarray, away_wins: int = 0, home_wins: int = 0) -> Dict[str, Any]:
+    """
+    Exact best-of-7 outcome by dynamic programming over the 4x4 series-state lattice.
+
+    `grid[aw, hw]` is P(away wins the next game) at (aw, hw). Propagates the
+    probability of reaching each state forward from the current one; absorbing
+    states at 4 wins give the series winner and the length distribution.
+    """
+    away_wins, home_wins = min(4, int(away_wins)), min(4, int(home_wins))
+    reach = np.zeros((5, 5), dtype=np.float64)
+    reach[away_wins, home_wins] = 1.0
+    length_dist = {g: 0.0 for g in range(4, 8)}
+    p_away = 1.0 if away_wins == 4 else 0.0
+    for g in range(away_wins + home_wins, 7):
+        for aw in range(max(0, g - 3), min(3, g) + 1):
+            hw = g - aw
+            r = reach[aw, hw]
+            if r <= 0.0:
+                continue
+            p = grid[aw, hw]
+            reach[aw + 1, hw] += r * p
+            reach[aw, hw + 1] += r * (1.0 - p)
+            if aw + 1 == 4:
+                p_away += r * p
+                length_dist[g + 1] += r * p
+            if hw + 1 == 4:
+                length_dist[g + 1] += r * (1.0 - p)
+
+    played = away_wins + home_wins
+    avg_remaining = sum(prob * (games - played) for games, prob in length_dist.items())
+    return {
+        'away_series_win_prob': float(p_away),
+        'home_series_win_prob': float(1.0 - p_away),
+        'series_length_distribution': {g: float(v) for g, v in length_dist.items()},
+        'prob_series_goes_seven': float(reach[3, 3]),
+        'avg_remaining_games': float(avg_remaining),
+    }
+
+
 class PlayoffSeriesPredictor:
     """Best-of-7 series simulation based on 'DNA of Playoff Success' Audit weights."""
     
@@ -35,6 +84,8 @@ class PlayoffSeriesPredictor:
         self.round_models: Dict[str, Dict[str, Any]] = {}
         self.round_team_features: Dict[str, Dict[str, float]] = {}
         self.metric_norms = {}
+        # (away, home, playoff_round) -> [away_wins, home_wins, venue] next-game win probs (see _series_state_prob_tensor)
+        self._series_state_prob_cache: Dict[tuple, np.ndarray] = {}
         
         # City Coordinates (Lat, Lon) for fatigue/travel calculation
         self.TEAM_COORDS = {
@@ -692,7 +743,8 @@ class PlayoffSeriesPredictor:
     ) -> tuple[int, float, float, float]:
         """
         Dynamic probability simulation.
-        Probabilities are recalculated in each step based on the current series score.
+        Probabilities depend on the current series score; they come from the memoized
+        per-matchup state tensor, so each game step is pure array indexing.
         """
         rng = np.random.default_rng()
         n = int(simulations)
@@ -702,31 +754,16 @@ class PlayoffSeriesPredictor:
         total_games = np.zeros(n, dtype=np.float64)
         total_goals = np.zeros(n, dtype=np.float64)
 
-        # Map current game index to its place in full_venues (H-H-A-A-H-A-H)
-        full_venues = ['home', 'home', 'away', 'away', 'home', 'away', 'home']
+        # grid[a, h] already has the venue of game a + h baked in (H-H-A-A-H-A-H)
+        grid = self._series_game_prob_grid(away, home, playoff_round, away_wins, home_wins)
         
         for g_idx in range(away_wins + home_wins, 7):
             mask = (a_w < 4) & (h_w < 4)
             if not np.any(mask):
                 break
             
-            venue = full_venues[g_idx]
-            
-            # Recalculate probabilities for unique (a_w, h_w) states in the current batch
-            # For simplicity in batching, we group by unique scorelines
-            unique_scores = set(zip(a_w[mask], h_w[mask]))
-            p_map = {}
-            for aw, hw in unique_scores:
-                # Probability depends on who is home/away in THIS game
-                if venue == 'home':
-                    p_map[(aw, hw)] = self.calculate_game_win_prob(away, home, aw, hw, playoff_round)
-                else:
-                    # 'away' venue in the series schedule means home_team is visiting away_team's arena
-                    # So away_team is 'home' for this calculation
-                    p_map[(aw, hw)] = 1.0 - self.calculate_game_win_prob(home, away, hw, aw, playoff_round)
-            
-            # Apply probabilities to batch
-            p_vector = np.array([p_map[(aw, hw)] if (aw < 4 and hw < 4) else 0.5 for aw, hw in zip(a_w, h_w)])
+            # Finished series are clipped onto a valid cell and then masked out below
+            p_vector = grid[np.minimum(a_w, 3), np.minimum(h_w, 3)]
             
             u = rng.random(n)
             away_win = u < p_vector
@@ -745,7 +782,60 @@ class PlayoffSeriesPredictor:
         prob_seven = float(np.mean(total_games + (away_wins + home_wins) == 7.0))
         return away_series_wins, total_games_completed, total_series_goals_sum, prob_seven
 
-    def simulate_series(self, away, home, away_wins=0, home_wins=0, simulations=10000, playoff_round: Optional[int] = None):
+    def _series_state_prob_tensor(
+        self,
+        away: str,
+        home: str,
+        playoff_round: Optional[int] = None,
+        away_wins: int = 0,
+        home_wins: int = 0,
+    ) -> np.ndarray:
+        """
+        P(away wins the next game) indexed by [away_wins, home_wins, venue], memoized per matchup.
+
+        venue 0 = game in the home team's arena, 1 = in the away team's arena. Only the
+        schedule states reachable from (away_wins, home_wins) are evaluated (lazily, once);
+        the rest stay NaN until a later call needs them.
+        """
+        key = (away, home, playoff_round)
+        tensor = self._series_state_prob_cache.get(key)
+        if tensor is None:
+            tensor = np.full((4, 4, 2), np.nan, dtype=np.float64)
+            self._series_state_prob_cache[key] = tensor
+        for aw in range(away_wins, 4):
+            for hw in range(home_wins, 4):
+                v = _SERIES_VENUE_IDX[aw + hw]
+                if not np.isnan(tensor[aw, hw, v]):
+                    continue
+                if v == 0:
+                    tensor[aw, hw, v] = self.calculate_game_win_prob(away, home, aw, hw, playoff_round)
+                else:
+                    # away team hosts: evaluate from its side and flip
+                    tensor[aw, hw, v] = 1.0 - self.calculate_game_win_prob(home, away, hw, aw, playoff_round)
+        return tensor
+
+    def _series_game_prob_grid(
+        self,
+        away: str,
+        home: str,
+        playoff_round: Optional[int] = None,
+        away_wins: int = 0,
+        home_wins: int = 0,
+    ) -> np.ndarray:
+        """4x4 view of the state tensor with the venue fixed by the H-H-A-A-H-A-H schedule."""
+        tensor = self._series_state_prob_tensor(away, home, playoff_round, away_wins, home_wins)
+        aw, hw = np.indices((4, 4))
+        return tensor[aw, hw, _SERIES_VENUE_IDX[aw + hw]]
+
+    def solve_series_exact(self, away, home, away_wins=0, home_wins=0, playoff_round: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Exact best-of-7 outcome (`solve_series_lattice`) with the same per-state
+        game probabilities as the Monte Carlo path.
+        """
+        grid = self._series_game_prob_grid(away, home, playoff_round, away_wins, home_wins)
+        return solve_series_lattice(grid, away_wins, home_wins)
+
+    def simulate_series(self, away, home, away_wins=0, home_wins=0, simulations=10000, playoff_round: Optional[int] = None, mode: str = "mc"):
         """
         Best-of-7 on the 2-2-1-1-1 schedule.
 
@@ -757,16 +847,16 @@ class PlayoffSeriesPredictor:
 
         Series length and total goals are **Monte Carlo** expectations over those draws.
         ``historical_*`` fields summarize the same JSON (reference marginals).
+
+        ``mode="exact"`` skips the draws and uses ``solve_series_exact`` instead: same game
+        probabilities, analytic series win %, length distribution and P(game 7), and
+        expected goals = expected games x the historical per-game Poisson mean.
+        ``simulations`` is ignored in that mode.
         """
         away_series_wins = 0
         total_games_completed = 0
         total_series_goals_sum = 0.0
 
-        # Pre-calculate win probs for both venues
-        p_away_at_home = self.calculate_game_win_prob(away, home, playoff_round=playoff_round)
-        p_home_at_away = self.calculate_game_win_prob(home, away, playoff_round=playoff_round)
-        p_away_at_away = 1 - p_home_at_away
-        
         # Format: H-H-A-A-H-A-H
         full_venues = ['home', 'home', 'away', 'away', 'home', 'away', 'home']
         
@@ -794,8 +884,17 @@ class PlayoffSeriesPredictor:
             }
 
         prob_seven = 0.0
+        length_dist = None
+        if mode == "exact":
+            exact = self.solve_series_exact(away, home, away_wins, home_wins, playoff_round=playoff_round)
+            simulations = 1  # exact expectations below; the shared averaging divides by this
+            away_series_wins = exact['away_series_win_prob']
+            total_games_completed = exact['avg_remaining_games']
+            total_series_goals_sum = exact['avg_remaining_games'] * self._historical_poisson_mean_combined_goals()
+            prob_seven = exact['prob_series_goes_seven']
+            length_dist = exact['series_length_distribution']
         # Vectorized path: dominates export runtime when simulations is large (hundreds of series × N).
-        if simulations >= 64:
+        elif simulations >= 64:
             away_series_wins, total_games_completed, total_series_goals_sum, prob_seven = (
                 self._simulate_series_numpy_batch(
                     away,
@@ -864,7 +963,7 @@ class PlayoffSeriesPredictor:
         gpg = (avg_total_goals / avg_games) if avg_games > 1e-9 else 0.0
         h_mg, h_p7, h_tg = self._historical_series_length_refs()
 
-        return {
+        result = {
             'away': away,
             'home': home,
             'away_series_win_prob': away_series_prob,
@@ -882,6 +981,9 @@ class PlayoffSeriesPredictor:
             'current_state': f"{away} {away_wins} - {home_wins} {home}",
             'winner_projection': away if away_series_prob > 0.5 else home
         }
+        if length_dist is not None:
+            result['series_length_distribution'] = {str(g): round(v, 6) for g, v in length_dist.items()}
+        return result
 
     def predict_cup_winner(self, filter_teams: Optional[List[str]] = None):
         """Analyze current teams and rank them by 'Championship DNA' alignment."""
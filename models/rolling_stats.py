@@ -0,0 +1,129 @@
+"""
+Array-backed rolling statistics for per-team game logs.
+
+`TeamHistory` (training in train_xgboost_model, inference in
+meta_ensemble_predictor) keeps one `RollingStats` per team and venue. Each
+game's stat dict becomes a row of a float matrix with one column per metric
+(NaN where the game did not record it), so a windowed EWMA/mean over every
+metric is a handful of array operations on the last `window` rows instead of
+a Python loop with one `np.average` call per key.
+
+Results match the original list-of-dicts implementation:
+  - the metrics reported are those of the oldest game in the window;
+  - a metric missing from some games is averaged over the games that have it,
+    with the EWMA weight alpha*(1-alpha)**i counted over those games only;
+  - a single value is returned as-is, and a metric absent from every game in
+    the window reports 0.0.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class RollingStats:
+    """Append-only game log with windowed mean/EWMA/std/rate queries."""
+
+    def __init__(self, capacity: int = 32) -> None:
+        self._values = np.full((max(1, int(capacity)), 0), np.nan)
+        self._n = 0
+        self._columns: Dict[str, int] = {}
+        # Distinct key orders seen so far -> (keys, column indices); each row
+        # points at one of them so the oldest row in a window picks the keys.
+        self._keysets: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], np.ndarray]] = {}
+        self._row_keys: List[Tuple[Tuple[str, ...], np.ndarray]] = []
+        self._ewm_weights: Dict[float, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _column(self, key: str) -> int:
+        col = self._columns.get(key)
+        if col is None:
+            col = len(self._columns)
+            self._columns[key] = col
+            pad = np.full((self._values.shape[0], 1), np.nan)
+            self._values = np.hstack([self._values, pad])
+        return col
+
+    def append(self, stats: Dict[str, Any]) -> None:
+        keys = tuple(stats.keys())
+        keyset = self._keysets.get(keys)
+        if keyset is None:
+            keyset = (keys, np.array([self._column(k) for k in keys], dtype=np.intp))
+            self._keysets[keys] = keyset
+
+        if self._n == self._values.shape[0]:
+            grown = np.full((self._n * 2, self._values.shape[1]), np.nan)
+            grown[: self._n] = self._values
+            self._values = grown
+
+        row = self._values[self._n]
+        for key, col in zip(keys, keyset[1]):
+            v = stats[key]
+            row[col] = np.nan if v is None else float(v)
+        self._row_keys.append(keyset)
+        self._n += 1
+
+    def _weights(self, alpha: float, n: int) -> np.ndarray:
+        """alpha*(1-alpha)**i for i < n, computed exactly as the scalar loop did."""
+        table = self._ewm_weights.get(alpha)
+        if table is None or len(table) < n:
+            table = np.array([alpha * (1 - alpha) ** i for i in range(max(n, 16))])
+            self._ewm_weights[alpha] = table
+        return table
+
+    def window_stats(self, window: int = 5, alpha: Optional[float] = None) -> Dict[str, float]:
+        """Mean (or EWMA with decay `alpha`, latest game weighted highest) of each metric over the last `window` games."""
+        if self._n == 0 or window <= 0:
+            return {}
+        start = max(0, self._n - int(window))
+        keys, cols = self._row_keys[start]
+        if not keys:
+            return {}
+
+        # One contiguous row per metric, oldest game first.
+        block = np.ascontiguousarray(self._values[start:self._n, cols].T)
+        present = ~np.isnan(block)
+        counts = present.sum(axis=1)
+        block[~present] = 0.0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = block.sum(axis=1) / counts
+            if alpha is not None and block.shape[1] > 1:
+                # Rank of each present value counted from the latest one.
+                rank = np.cumsum(present[:, ::-1], axis=1)[:, ::-1] - 1
+                w = np.where(present, self._weights(alpha, block.shape[1])[np.maximum(rank, 0)], 0.0)
+                ewm = (block * w).sum(axis=1) / w.sum(axis=1)
+                out = np.where(counts > 1, ewm, out)
+        out = np.where(counts > 0, out, 0.0)
+        return dict(zip(keys, out.tolist()))
+
+    def _window_column(self, key: str, window: int) -> Optional[np.ndarray]:
+        col = self._columns.get(key)
+        if col is None:
+            return None
+        return self._values[max(0, self._n - int(window)):self._n, col]
+
+    def window_std(self, window: int = 5, key: str = "goal_diff", default: float = 1.0) -> float:
+        """Population std of `key` over the last `window` games (`default` with fewer than 2 values)."""
+        vals = self._window_column(key, window)
+        if vals is None:
+            return default
+        vals = vals[~np.isnan(vals)]
+        return np.std(vals) if len(vals) > 1 else default
+
+    def window_rate(self, condition_key: str, target_key: str, window: int = 20, default: float = 0.5) -> float:
+        """Share of the last `window` games with condition_key == 1 that also had target_key == 1."""
+        cond = self._window_column(condition_key, window)
+        if cond is None:
+            return default
+        relevant = cond == 1
+        n_relevant = int(relevant.sum())
+        if n_relevant == 0:
+            return default
+        target = self._window_column(target_key, window)
+        if target is None:
+            return 0.0
+        return float(int((relevant & (target == 1)).sum())) / float(n_relevant)
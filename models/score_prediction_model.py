@@ -19,11 +19,18 @@ Key features:
 
 import json
 import hashlib
+import os
 import time
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
 from pathlib import Path
 
+try:
+    from nb_utils import nb_away_win_with_ot, nb_pmf_matrix, nb_win_probs, poisson_win_probs, scoreline_matrix
+except Exception:
+    from models.nb_utils import nb_away_win_with_ot, nb_pmf_matrix, nb_win_probs, poisson_win_probs, scoreline_matrix
+
 
 # NHL structure
 DIVISIONS = {
@@ -34,6 +41,29 @@ DIVISIONS = {
 }
 TEAM_TO_DIV = {t: d for d, teams in DIVISIONS.items() for t in teams}
 
+# Learned parameters (calibration grid, dispersion k, OT scale/blend, max goals,
+# scoring bias, league avg) are cached here, keyed by a fingerprint of every
+# input file, so construction only re-fits when the history actually changed.
+# Bump FITTED_PARAMS_VERSION whenever a fitting routine changes.
+FITTED_PARAMS_VERSION = 1
+FITTED_PARAMS_PATH = Path(os.environ.get("SCORE_MODEL_PARAMS_PATH", "data/cache/score_model_params.json"))
+FITTED_PARAM_ATTRS = (
+    "LEAGUE_AVG_GF",
+    "_scoring_bias",
+    "_team_scoring_env",
+    "_team_venue_splits",
+    "_win_calibration",
+    "_dispersion_k",
+    "_dispersion_k_by_total_edges",
+    "_dispersion_k_by_total_values",
+    "_ot_scale",
+    "_ot_blend",
+    "_ot_tie_gamma",
+    "_max_goals",
+)
+_ARRAY_PARAM_ATTRS = ("_dispersion_k_by_total_edges", "_dispersion_k_by_total_values")
+_DICT_PARAM_ATTRS = ("_team_scoring_env", "_team_venue_splits")
+
 # Phase 4: Time Zone Mapping (UTC Offsets)
 TEAM_TIMEZONES = {
     'ANA': -8, 'LAK': -8, 'SJS': -8, 'VAN': -8, 'SEA': -8, 'VGK': -8,
@@ -45,6 +75,31 @@ TEAM_TIMEZONES = {
 }
 
 
+# Common final scores get a small boost when sampling a scoreline - toned
+# down in Phase 46 to improve variety.
+COMMON_SCORE_WEIGHTS = {
+    (3, 2): 1.08, (2, 3): 1.08, (4, 2): 1.06, (2, 4): 1.06,
+    (2, 1): 1.05, (1, 2): 1.05, (4, 3): 1.04, (3, 4): 1.04,
+    (3, 1): 1.03, (1, 3): 1.03, (5, 2): 1.02, (2, 5): 1.02
+}
+
+
+@lru_cache(maxsize=32)
+def _scoreline_nudges(max_goals: int, desired: str) -> np.ndarray:
+    """[away, home] weights: common-score nudge times the 1.2 winner nudge."""
+    w = np.ones((max_goals + 1, max_goals + 1))
+    for (a, h), nudge in COMMON_SCORE_WEIGHTS.items():
+        if a <= max_goals and h <= max_goals:
+            w[a, h] = nudge
+    # Winner nudge (to align with Meta-Ensemble), stronger for sampling.
+    if desired == "away":
+        w[np.tril_indices(max_goals + 1, -1)] *= 1.2
+    elif desired == "home":
+        w[np.triu_indices(max_goals + 1, 1)] *= 1.2
+    w.flags.writeable = False
+    return w
+
+
 class ScorePredictionModel:
     """Optimized score prediction using correlation-validated features."""
     
@@ -61,27 +116,32 @@ class ScorePredictionModel:
     W_HDC = 0.15
     W_CONTEXT = 0.15
     
-    def __init__(self):
-        """Load all data sources."""
+    def __init__(self, refit: bool = False):
+        """
+        Load all data sources.
+
+        Fitted parameters come from FITTED_PARAMS_PATH when its fingerprint
+        matches the input files; pass refit=True (or SCORE_MODEL_REFIT=1) to
+        force re-tuning.
+        """
         self.team_stats = {}
         self.team_averages = {}
         self.prediction_history = []
         self.goalie_stats = {}
         self.h2h_cache = {}
+        self._inputs_hash = hashlib.sha1(f"v{FITTED_PARAMS_VERSION}".encode())
         
         # Load team stats
         from season_utils import get_team_stats_path
         p = get_team_stats_path()
         if p.exists():
-            with open(p) as f:
-                self.team_stats = json.load(f)
+            self.team_stats = self._read_input_json(p)
         
         # Load prediction history (has actual scores, B2B, opponents)
         for p in [Path('data/win_probability_predictions_v2.json'),
                   Path('win_probability_predictions_v2.json')]:
             if p.exists():
-                with open(p) as f:
-                    pred_data = json.load(f)
+                pred_data = self._read_input_json(p)
                 self.prediction_history = pred_data.get('predictions', [])
                 break
         
@@ -89,8 +149,7 @@ class ScorePredictionModel:
         self.advanced_team_metrics = {}
         for p in [Path('data/team_advanced_metrics.json'), Path('team_advanced_metrics.json')]:
             if p.exists():
-                with open(p) as f:
-                    metrics_data = json.load(f)
+                metrics_data = self._read_input_json(p)
                 self.goalie_stats = metrics_data.get('goalies', {})
                 self.advanced_team_metrics = metrics_data.get('teams', {})
                 # Create a name -> ID layout for easy lookup
@@ -102,8 +161,7 @@ class ScorePredictionModel:
         if not self.goalie_stats:
             for p in [Path('data/goalie_stats.json'), Path('goalie_stats.json')]:
                 if p.exists():
-                    with open(p) as f:
-                        g_data = json.load(f)
+                    g_data = self._read_input_json(p)
                     self.goalie_stats = g_data.get('goalies', {})
                     self.goalie_names = {v['name']: k for k, v in self.goalie_stats.items()}
                     break
@@ -116,37 +174,20 @@ class ScorePredictionModel:
             self._precompute_averages()
             self._build_h2h_records()
             n_h2h = sum(len(v) for v in self.h2h_cache.values())
-            
-            # Dynamic league average: compute from actual team data instead of hardcoded
-            self._learn_league_avg()
-            
-            # Scoring bias correction: learn from prediction errors
-            self._learn_scoring_bias()
-            
+
+            fingerprint = self._inputs_hash.hexdigest()
+            refit = refit or os.environ.get("SCORE_MODEL_REFIT", "0") == "1"
+            loaded = not refit and self._load_fitted_params(fingerprint)
+            if not loaded:
+                self._fit_params()
+                self._save_fitted_params(fingerprint)
+
             print(f"✅ Score model v3: {len(self.team_averages)} teams, "
                   f"{len(self.prediction_history)} predictions, "
-                  f"{n_h2h} H2H records")
+                  f"{n_h2h} H2H records"
+                  f"{' (cached fit)' if loaded else ''}")
             print(f"   📊 Dynamic league avg: {self.LEAGUE_AVG_GF:.2f} GF/game, "
                   f"scoring bias correction: {self._scoring_bias:.3f}")
-
-            # Learn a win-prob calibration curve from historical outcomes.
-            # This adjusts the winner decision boundary away from a pure
-            # Poisson assumption (helps reach higher winner accuracy).
-            self._win_calibration = self._build_win_calibration()
-
-            # OT-scale / blend tuning (time-split validation).
-            # We blend calibrated P(win) with a Poisson+OT tie allocation
-            # model. This lets OT-like variance influence winner decisions.
-            # Also estimate a dispersion parameter for Negative Binomial
-            # (more realistic scoring variance than Poisson).
-            self._dispersion_k = self._estimate_dispersion_k()
-
-            self._ot_scale = 0.75
-            self._ot_blend = 0.85
-            self._ot_tie_gamma = 1.0
-            self._max_goals = 10
-            self._tune_ot_scale_and_blend()
-            self._tune_max_goals()
         else:
             print("⚠️  No team stats found, using league averages")
             self._win_calibration = None
@@ -157,6 +198,83 @@ class ScorePredictionModel:
             self._max_goals = 10
             self._scoring_bias = 0.0
 
+    def _read_input_json(self, path: Path):
+        """Parse an input file, folding its bytes into the fitted-params fingerprint."""
+        raw = path.read_bytes()
+        self._inputs_hash.update(path.name.encode())
+        self._inputs_hash.update(raw)
+        return json.loads(raw)
+
+    def _fit_params(self) -> None:
+        """Learn every FITTED_PARAM_ATTRS value from the loaded history."""
+        # Dynamic league average: compute from actual team data instead of hardcoded
+        self._learn_league_avg()
+
+        # Scoring bias correction: learn from prediction errors
+        self._learn_scoring_bias()
+
+        # Learn a win-prob calibration curve from historical outcomes.
+        # This adjusts the winner decision boundary away from a pure
+        # Poisson assumption (helps reach higher winner accuracy).
+        self._win_calibration = self._build_win_calibration()
+
+        # OT-scale / blend tuning (time-split validation).
+        # We blend calibrated P(win) with a Poisson+OT tie allocation
+        # model. This lets OT-like variance influence winner decisions.
+        # Also estimate a dispersion parameter for Negative Binomial
+        # (more realistic scoring variance than Poisson).
+        self._dispersion_k = self._estimate_dispersion_k()
+
+        self._ot_scale = 0.75
+        self._ot_blend = 0.85
+        self._ot_tie_gamma = 1.0
+        self._max_goals = 10
+        self._tune_ot_scale_and_blend()
+        self._tune_max_goals()
+
+    def _load_fitted_params(self, fingerprint: str) -> bool:
+        """Restore fitted parameters if the artifact matches `fingerprint`."""
+        try:
+            with open(FITTED_PARAMS_PATH) as f:
+                artifact = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if artifact.get("version") != FITTED_PARAMS_VERSION or artifact.get("fingerprint") != fingerprint:
+            return False
+        params = artifact.get("params") or {}
+        if any(attr not in params for attr in FITTED_PARAM_ATTRS):
+            return False
+        for attr in FITTED_PARAM_ATTRS:
+            value = params[attr]
+            if attr in _ARRAY_PARAM_ATTRS and value is not None:
+                value = np.array(value, dtype=float)
+            elif attr in _DICT_PARAM_ATTRS and value is None:
+                value = {}
+            setattr(self, attr, value)
+        return True
+
+    def _save_fitted_params(self, fingerprint: str) -> None:
+        params = {}
+        for attr in FITTED_PARAM_ATTRS:
+            value = getattr(self, attr, None)
+            if isinstance(value, np.ndarray):
+                value = value.astype(float).tolist()
+            params[attr] = value
+        artifact = {
+            "version": FITTED_PARAMS_VERSION,
+            "fingerprint": fingerprint,
+            "fitted_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "params": params,
+        }
+        try:
+            FITTED_PARAMS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = FITTED_PARAMS_PATH.with_name(f"{FITTED_PARAMS_PATH.name}.{os.getpid()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(artifact, f, indent=2, default=float)
+            tmp.replace(FITTED_PARAMS_PATH)
+        except OSError as e:
+            print(f"⚠️  Could not save fitted score-model params: {e}")
+
     def _learn_league_avg(self):
         """Dynamically compute league average GF/game from actual team data.
         
@@ -185,6 +303,8 @@ class ScorePredictionModel:
         Uses recency weighting so recent errors matter more than old ones.
         """
         self._scoring_bias = 0.0
+        self._team_scoring_env = {}
+        self._team_venue_splits = {}
         
         # Only use predictions that have actual outcomes
         completed = [p for p in self.prediction_history 
@@ -320,38 +440,8 @@ class ScorePredictionModel:
 
     def _poisson_win_probs(self, away_lam: float, home_lam: float, max_goals: int = 15) -> Tuple[float, float, float]:
         """Return (p_away_reg_win, p_home_reg_win, p_tie_reg) from two Poissons."""
-        import math
-
-        away_lam = max(0.01, float(away_lam))
-        home_lam = max(0.01, float(home_lam))
-
-        pmf_away = [
-            math.exp(-away_lam) * (away_lam ** k) / math.factorial(k)
-            for k in range(max_goals + 1)
-        ]
-        pmf_home = [
-            math.exp(-home_lam) * (home_lam ** k) / math.factorial(k)
-            for k in range(max_goals + 1)
-        ]
-
-        p_away_win = 0.0
-        p_home_win = 0.0
-        p_tie = 0.0
-
-        for a in range(max_goals + 1):
-            pa = pmf_away[a]
-            if pa == 0.0:
-                continue
-            for h in range(max_goals + 1):
-                ph = pmf_home[h]
-                if a > h:
-                    p_away_win += pa * ph
-                elif h > a:
-                    p_home_win += pa * ph
-                else:
-                    p_tie += pa * ph
-
-        return p_away_win, p_home_win, p_tie
+        p_away, p_home, p_tie = poisson_win_probs(away_lam, home_lam, max_goals=max_goals)
+        return float(p_away[0]), float(p_home[0]), float(p_tie[0])
 
     def _poisson_away_win_with_ot(self, away_lam: float, home_lam: float, ot_scale: float) -> float:
         """Poisson win prob with OT-like tie reallocation using OT_SCALE."""
@@ -510,6 +600,20 @@ class ScorePredictionModel:
         except Exception:
             return float(getattr(self, "_dispersion_k", 20.0))
 
+    def _dispersion_k_batch(self, away_mu: np.ndarray, home_mu: np.ndarray) -> np.ndarray:
+        """Vectorized `_get_dispersion_k` over arrays of expected goals."""
+        total_mu = np.asarray(away_mu, dtype=float) + np.asarray(home_mu, dtype=float)
+        fallback = float(getattr(self, "_dispersion_k", 20.0))
+        total_edges = getattr(self, "_dispersion_k_by_total_edges", None)
+        values = getattr(self, "_dispersion_k_by_total_values", None)
+        if total_edges is None or values is None:
+            return np.full(total_mu.shape, fallback)
+        values = np.asarray(values, dtype=float)
+        idx = np.clip(np.searchsorted(total_edges, total_mu, side="right") - 1, 0, len(values) - 1)
+        k = values[idx]
+        ok = np.isfinite(total_mu) & np.isfinite(k) & (k > 0.0)
+        return np.where(ok, k, fallback)
+
     def _neg_bin_pmf(self, n: int, mu: float, k: float) -> float:
         """
         Negative binomial pmf for counts with mean mu and dispersion k.
@@ -527,33 +631,8 @@ class ScorePredictionModel:
 
     def _neg_bin_win_probs(self, away_mu: float, home_mu: float, k: float, max_goals: int = 12) -> Tuple[float, float, float]:
         """Return (p_away_reg_win, p_home_reg_win, p_tie_reg) from NB goals."""
-        import math
-
-        away_mu = float(away_mu)
-        home_mu = float(home_mu)
-        k = float(k)
-
-        pmf_away = [self._neg_bin_pmf(g, away_mu, k) for g in range(max_goals + 1)]
-        pmf_home = [self._neg_bin_pmf(g, home_mu, k) for g in range(max_goals + 1)]
-
-        p_away_win = 0.0
-        p_home_win = 0.0
-        p_tie = 0.0
-
-        for a in range(max_goals + 1):
-            pa = pmf_away[a]
-            if pa == 0.0:
-                continue
-            for h in range(max_goals + 1):
-                ph = pmf_home[h]
-                if a > h:
-                    p_away_win += pa * ph
-                elif h > a:
-                    p_home_win += pa * ph
-                else:
-                    p_tie += pa * ph
-
-        return float(p_away_win), float(p_home_win), float(p_tie)
+        p_away, p_home, p_tie = nb_win_probs(float(away_mu), float(home_mu), float(k), max_goals=max_goals)
+        return float(p_away[0]), float(p_home[0]), float(p_tie[0])
 
     def _neg_bin_away_win_with_ot(
         self,
@@ -569,49 +648,12 @@ class ScorePredictionModel:
         - Sudden-death approximation: after a regulation tie, we allocate the
           remaining tie mass to the side with higher OT mean, with special
           casing for zero-goal outcomes.
-        """
-        import math
 
-        # Regulation win/tie
-        p_away_win_reg, _p_home_win_reg, p_tie_reg = self._neg_bin_win_probs(
-            away_mu, home_mu, k, max_goals=12
-        )
-
-        # OT additional expected goals (scaled)
-        away_ot_mu = max(0.01, float(away_mu) * float(ot_scale))
-        home_ot_mu = max(0.01, float(home_mu) * float(ot_scale))
-
-        # P(OT goals == 0) under NB: (k/(k+mu))^k
-        def nb_p0(mu_ot: float) -> float:
-            kk = max(1e-9, float(k))
-            return float((kk / (kk + mu_ot)) ** kk)
-
-        away0 = nb_p0(away_ot_mu)
-        home0 = nb_p0(home_ot_mu)
-
-        away_scored = max(0.0, 1.0 - away0)
-        home_scored = max(0.0, 1.0 - home0)
-
-        total_ot_mu = away_ot_mu + home_ot_mu
-        away_share = float(away_ot_mu / total_ot_mu) if total_ot_mu > 0 else 0.5
-        away_share = max(0.01, min(0.99, away_share))
-        # Bias how strongly we allocate OT tie mass by expected OT scoring.
-        # tie_gamma=1.0 keeps the original proportional allocation.
-        # tie_gamma<1.0 moves toward a more neutral 50/50 split.
-        # tie_gamma>1.0 concentrates tie mass more heavily to the higher-OT side.
-        tie_gamma = float(tie_gamma)
-        if tie_gamma != 1.0:
-            away_share = 0.5 + (away_share - 0.5) * tie_gamma
-            away_share = max(0.01, min(0.99, float(away_share)))
-
-        # If exactly one side scores in OT, that side wins.
-        # If both score or both score 0, we approximate by sharing by away_share.
-        p_away_win_ot_cond = (home0 * away_scored) + away_share * (
-            (away0 * home0) + (away_scored * home_scored)
-        )
-        p_away_win_ot_cond = max(0.0, min(1.0, p_away_win_ot_cond))
-
-        return float(p_away_win_reg + p_tie_reg * p_away_win_ot_cond)
+        Scalar front-end to `nb_utils.nb_away_win_with_ot`; pass arrays to
+        that directly to score a whole history at once.
+        """
+        p = nb_away_win_with_ot(float(away_mu), float(home_mu), float(ot_scale), float(k), tie_gamma=float(tie_gamma))
+        return float(p[0])
 
     def _tune_ot_scale_and_blend(self) -> None:
         """Tune OT_SCALE and blend weight via time-split validation."""
@@ -686,46 +728,44 @@ class ScorePredictionModel:
                     return
                 val_splits = [val]
 
-        # Precompute expected-goal features on each validation split.
-        val_split_features = []
-        for val in val_splits:
-            away_expected_list = []
-            home_expected_list = []
-            p_cal_list = []
-            y_list = []
-            away_team_list = []
-            home_team_list = []
-            for _ts, away, home, a_i, h_i, away_b2b, home_b2b in val:
-                sp = self.predict_score(
-                    away,
-                    home,
-                    use_calibration=False,
-                    away_b2b=away_b2b,
-                    home_b2b=home_b2b,
-                )
-                away_expected = float(sp["away_expected"])
-                home_expected = float(sp["home_expected"])
-                diff = away_expected - home_expected
-                total = away_expected + home_expected
-                p_cal = self._calibrated_away_win_prob(diff, total)
-                y = 1.0 if a_i > h_i else 0.0
-                away_expected_list.append(away_expected)
-                home_expected_list.append(home_expected)
-                p_cal_list.append(float(p_cal))
-                y_list.append(float(y))
-                away_team_list.append(str(away))
-                home_team_list.append(str(home))
-
-            val_split_features.append(
-                {
-                    "away_expected": np.array(away_expected_list, dtype=float),
-                    "home_expected": np.array(home_expected_list, dtype=float),
-                    "p_cal": np.array(p_cal_list, dtype=float),
-                    "y": np.array(y_list, dtype=float),
-                    "away_team": away_team_list,
-                    "home_team": home_team_list,
-                }
+        # Precompute expected-goal features. Every split is a suffix of
+        # `completed`, so predict the longest one once and slice the others
+        # from its tail.
+        longest = max(val_splits, key=len)
+        away_expected_list = []
+        home_expected_list = []
+        p_cal_list = []
+        y_list = []
+        for _ts, away, home, a_i, h_i, away_b2b, home_b2b in longest:
+            sp = self.predict_score(
+                away,
+                home,
+                use_calibration=False,
+                away_b2b=away_b2b,
+                home_b2b=home_b2b,
             )
+            away_expected = float(sp["away_expected"])
+            home_expected = float(sp["home_expected"])
+            diff = away_expected - home_expected
+            total = away_expected + home_expected
+            p_cal = self._calibrated_away_win_prob(diff, total)
+            y = 1.0 if a_i > h_i else 0.0
+            away_expected_list.append(away_expected)
+            home_expected_list.append(home_expected)
+            p_cal_list.append(float(p_cal))
+            y_list.append(float(y))
+
+        away_mu_all = np.array(away_expected_list, dtype=float)
+        home_mu_all = np.array(home_expected_list, dtype=float)
+        k_all = self._dispersion_k_batch(away_mu_all, home_mu_all)
+        split_lens = [len(val) for val in val_splits]
+        val_split_features = [
+            {
+                "p_cal": np.array(p_cal_list, dtype=float)[-n:],
+                "y": np.array(y_list, dtype=float)[-n:],
+            }
+            for n in split_lens
+        ]
 
         # Keep tie allocation proportional (tie_gamma=1.0) for stability.
         ot_scales = [0.25, 0.5, 0.75, 1.0, 1.5, 2.0]
@@ -743,32 +783,9 @@ class ScorePredictionModel:
 
         for tie_gamma in tie_gammas:
             for ot in ot_scales:
-                # Precompute p_nb for each validation split (depends on ot + tie_gamma).
-                p_nb_splits = []
-                for feats in val_split_features:
-                    away_mu = feats["away_expected"]
-                    home_mu = feats["home_expected"]
-                    away_teams = feats["away_team"]
-                    home_teams = feats["home_team"]
-                    p_nb = np.array(
-                        [
-                            self._neg_bin_away_win_with_ot(
-                                float(away_mu[i]),
-                                float(home_mu[i]),
-                                ot,
-                                self._get_dispersion_k(
-                                    away_teams[i],
-                                    home_teams[i],
-                                    float(away_mu[i]),
-                                    float(home_mu[i]),
-                                ),
-                                tie_gamma=float(tie_gamma),
-                            )
-                            for i in range(len(away_mu))
-                        ],
-                        dtype=float,
-                    )
-                    p_nb_splits.append(p_nb)
+                # p_nb depends on ot + tie_gamma; score the whole history at once.
+                p_nb_all = nb_away_win_with_ot(away_mu_all, home_mu_all, ot, k_all, tie_gamma=float(tie_gamma))
+                p_nb_splits = [p_nb_all[-n:] for n in split_lens]
 
                 for blend in blends:
                     accs = []
@@ -896,29 +913,28 @@ class ScorePredictionModel:
         # Validate each cap using recomputed predictions.
         current_mg = int(getattr(self, "_max_goals", 10))
         try:
+            # Every split is a suffix of `completed`: predict the longest once
+            # per cap and score the other splits from the tail of that pass.
+            longest = max(val_splits, key=len)
             for mg in max_goals_candidates:
                 self._max_goals = int(mg)
-                split_accs = []
-                for val in val_splits:
-                    correct = 0
-                    n = 0
-                    for _ts, away, home, a_i, h_i, away_b2b, home_b2b in val:
-                        pred = self.predict_score(
-                            away,
-                            home,
-                            use_calibration=True,
-                            away_b2b=away_b2b,
-                            home_b2b=home_b2b,
-                        )
-                        pred_away_score = int(pred.get("away_score", 0))
-                        pred_home_score = int(pred.get("home_score", 0))
-                        pred_winner_is_away = pred_away_score > pred_home_score
-                        actual_winner_is_away = a_i > h_i
-                        if pred_winner_is_away == actual_winner_is_away:
-                            correct += 1
-                        n += 1
-
-                    split_accs.append(correct / n if n else 0.0)
+                correct_flags = []
+                for _ts, away, home, a_i, h_i, away_b2b, home_b2b in longest:
+                    pred = self.predict_score(
+                        away,
+                        home,
+                        use_calibration=True,
+                        away_b2b=away_b2b,
+                        home_b2b=home_b2b,
+                    )
+                    pred_away_score = int(pred.get("away_score", 0))
+                    pred_home_score = int(pred.get("home_score", 0))
+                    pred_winner_is_away = pred_away_score > pred_home_score
+                    actual_winner_is_away = a_i > h_i
+                    correct_flags.append(pred_winner_is_away == actual_winner_is_away)
+
+                correct_flags = np.array(correct_flags, dtype=float)
+                split_accs = [float(np.mean(correct_flags[-len(val):])) if len(val) else 0.0 for val in val_splits]
 
                 mean_acc = float(np.mean(split_accs)) if split_accs else -1.0
                 median_acc = float(np.median(split_accs)) if split_accs else -1.0
@@ -1965,37 +1981,9 @@ class ScorePredictionModel:
             home_win_prob_final = float(1.0 - away_win_prob_final)
         else:
             # Poisson-based win probability (with proportional tie allocation)
-            import math
-
-            max_prob_goals = 15
             away_lam = float(away_expected)
             home_lam = float(home_expected)
-
-            pmf_away = [
-                math.exp(-away_lam) * (away_lam ** k) / math.factorial(k)
-                for k in range(max_prob_goals + 1)
-            ]
-            pmf_home = [
-                math.exp(-home_lam) * (home_lam ** k) / math.factorial(k)
-                for k in range(max_prob_goals + 1)
-            ]
-
-            p_away_win = 0.0
-            p_home_win = 0.0
-            p_tie = 0.0
-
-            for a in range(max_prob_goals + 1):
-                pa = pmf_away[a]
-                if pa == 0.0:
-                    continue
-                for h in range(max_prob_goals + 1):
-                    ph = pmf_home[h]
-                    if a > h:
-                        p_away_win += pa * ph
-                    elif h > a:
-                        p_home_win += pa * ph
-                    else:
-                        p_tie += pa * ph
+            p_away_win, p_home_win, p_tie = self._poisson_win_probs(away_lam, home_lam, max_goals=15)
 
             tie_total = p_tie
             total_lam = away_lam + home_lam
@@ -2316,71 +2304,33 @@ class ScorePredictionModel:
         k = float(self._get_dispersion_k(away_u, home_u, away_mu, home_mu))
         k = float(max(0.25, k))
 
-        # Compute NB pmfs for 0..max_goals and pick joint argmax.
-        pmf_a = [self._neg_bin_pmf(g, away_mu, k) for g in range(int(max_goals) + 1)]
-        pmf_h = [self._neg_bin_pmf(g, home_mu, k) for g in range(int(max_goals) + 1)]
-
-        best_a = int(away_mu)
-        best_h = int(home_mu)
-        best_p = -1.0
-        
-        # Define common score weights - Toned down in Phase 46 to improve variety
-        common_weights = {
-            (3, 2): 1.08, (2, 3): 1.08, (4, 2): 1.06, (2, 4): 1.06,
-            (2, 1): 1.05, (1, 2): 1.05, (4, 3): 1.04, (3, 4): 1.04,
-            (3, 1): 1.03, (1, 3): 1.03, (5, 2): 1.02, (2, 5): 1.02
-        }
+        # Joint NB scoreline matrix for 0..max_goals, weighted by the score
+        # nudges below; rows with zero away mass are not candidates.
+        pmf = nb_pmf_matrix((away_mu, home_mu), k, int(max_goals))
+        pmf_a = pmf[0]
+        joint = scoreline_matrix(pmf[:1], pmf[1:])[0] * _scoreline_nudges(int(max_goals), desired)
 
         # Phase 39: Stochastic Series Projection (Stochastic Sampling)
         # We collect all candidate scores and their probabilities, then sample
-        candidates = []
-        probs = []
-        
+        rows = np.flatnonzero(pmf_a > 0.0)
+        probs = joint[rows].ravel()
+
         import hashlib
         import random
         # Seed the random number generator with the unique game_id
         seed_source = f"{away_u}{home_u}{game_id or 'none'}{away_mu:.2f}{home_mu:.2f}"
         rng_seed = int(hashlib.md5(seed_source.encode()).hexdigest(), 16) % (2**32)
         random.seed(rng_seed)
-        
-        for a in range(int(max_goals) + 1):
-            pa = pmf_a[a]
-            if pa <= 0.0:
-                continue
-            for h in range(int(max_goals) + 1):
-                ph = pmf_h[h]
-                p = pa * ph
-                
-                # Apply Common Score Nudge
-                nudge = common_weights.get((a, h), 1.0)
-                p *= nudge
-                
-                # Winner Nudge (to align with Meta-Ensemble)
-                if desired == "away" and a > h:
-                    p *= 1.2 # Stronger nudge for sampling
-                elif desired == "home" and h > a:
-                    p *= 1.2
-                
-                candidates.append((a, h))
-                probs.append(p)
-        
-        # Normalize probabilities
-        total_p = sum(probs)
+
+        best_a, best_h = int(away_mu), int(home_mu)
+        total_p = float(probs.sum())
         if total_p > 0:
-            probs = [p / total_p for p in probs]
-            
             # Phase 39: Sample from the distribution
-            # We use a simple cumulative distribution function for sampling
+            # First candidate whose cumulative probability reaches r.
             r = random.random()
-            cum_p = 0
-            best_a, best_h = int(away_mu), int(home_mu)
-            for i, p in enumerate(probs):
-                cum_p += p
-                if r <= cum_p:
-                    best_a, best_h = candidates[i]
-                    break
-        else:
-            best_a, best_h = int(away_mu), int(home_mu)
+            i = int(np.searchsorted(np.cumsum(probs / total_p), r, side="left"))
+            if i < probs.size:
+                best_a, best_h = int(rows[i // (int(max_goals) + 1)]), i % (int(max_goals) + 1)
 
         final_a = int(best_a)
         final_h = int(best_h)
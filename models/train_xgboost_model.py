@@ -29,6 +29,14 @@ try:
     from nb_utils import estimate_nb_size_from_mean_var, nb_nll
 except Exception:
     from models.nb_utils import estimate_nb_size_from_mean_var, nb_nll
+try:
+    from rolling_stats import RollingStats
+except Exception:
+    from models.rolling_stats import RollingStats
+try:
+    from parallel_eval import run_tasks, worker_threads
+except Exception:
+    from models.parallel_eval import run_tasks, worker_threads
 
 TEAM_COORDINATES = {
     'ANA': (33.80, -117.88), 'BOS': (42.36, -71.06), 'BUF': (42.89, -78.88),
@@ -192,14 +200,14 @@ class GoalieHistory:
 
 class TeamHistory:
     def __init__(self):
-        self.history = {}  # {team_abbr: {'dates': [], 'stats': [], 'home_stats': [], 'away_stats': [], 'opponents_elo': [], 'last_city': None}}
+        self.history = {}  # {team_abbr: {'dates': [], 'stats': RollingStats, 'home_stats': RollingStats, 'away_stats': RollingStats, 'opponents_elo': [], 'last_city': None}}
         self.elo = EloTracker()
         self.goalies = GoalieHistory()
         
     def update(self, team, date, game_stats, venue=None, opponent_elo=None, city=None):
         """Update team history with a new game"""
         if team not in self.history:
-            self.history[team] = {'dates': [], 'stats': [], 'home_stats': [], 'away_stats': [], 'opponents_elo': [], 'last_city': None}
+            self.history[team] = {'dates': [], 'stats': RollingStats(), 'home_stats': RollingStats(), 'away_stats': RollingStats(), 'opponents_elo': [], 'last_city': None}
             
         self.history[team]['dates'].append(date)
         self.history[team]['stats'].append(game_stats)
@@ -239,15 +247,9 @@ class TeamHistory:
 
     def get_rolling_rate(self, team, condition_key, target_key, window=20):
         """Calculate the success rate of a target condition (e.g., win_rate when leading_after_p2)"""
-        if team not in self.history or not self.history[team]['stats']:
+        if team not in self.history or not len(self.history[team]['stats']):
             return 0.5
-        
-        relevant_games = [g for g in self.history[team]['stats'][-window:] if g.get(condition_key) == 1]
-        if not relevant_games:
-            return 0.5
-            
-        successes = [g for g in relevant_games if g.get(target_key) == 1]
-        return len(successes) / len(relevant_games)
+        return self.history[team]['stats'].window_rate(condition_key, target_key, window)
         
     def get_rolling_stats(self, team, window=5, venue=None, alpha=None):
         """Calculate averages with optional venue filter and exponential decay (alpha)"""
@@ -255,38 +257,18 @@ class TeamHistory:
             return {}
             
         if venue == 'home':
-            stats_list = self.history[team]['home_stats'][-window:]
+            stats = self.history[team]['home_stats']
         elif venue == 'away':
-            stats_list = self.history[team]['away_stats'][-window:]
+            stats = self.history[team]['away_stats']
         else:
-            stats_list = self.history[team]['stats'][-window:]
-            
-        aggregated = {}
-        if not stats_list:
-            return {}
-            
-        keys = stats_list[0].keys()
-        for k in keys:
-            vals = [g[k] for g in stats_list if g.get(k) is not None]
-            if vals:
-                if alpha is not None and len(vals) > 1:
-                    # Exponential Weighted Mean (most recent has higher weight)
-                    weights = [alpha * (1 - alpha) ** i for i in range(len(vals))]
-                    weights = weights[::-1]  # Latest value gets alpha
-                    aggregated[k] = np.average(vals, weights=weights)
-                else:
-                    aggregated[k] = np.mean(vals)
-            else:
-                aggregated[k] = 0.0
-        return aggregated
+            stats = self.history[team]['stats']
+        return stats.window_stats(window, alpha)
 
     def get_rolling_std(self, team, window=5, key='goal_diff'):
         """Calculate rolling standard deviation for a metric"""
         if team not in self.history or len(self.history[team]['stats']) < 2:
             return 1.0
-        stats_list = self.history[team]['stats'][-window:]
-        vals = [g[key] for g in stats_list if g.get(key) is not None]
-        return np.std(vals) if len(vals) > 1 else 1.0
+        return self.history[team]['stats'].window_std(window, key)
 
     def get_sos(self, team, window=5):
         """Calculate Strength of Schedule (Avg Opponent Elo)"""
@@ -302,6 +284,12 @@ def load_data():
         load_latest_by_game_id = None
         PREDICTION_EVENTS_PATH = None
         OUTCOME_EVENTS_PATH = None
+    try:
+        # Fold in only the events appended since the last retrain.
+        from utils.event_cursor import load_latest_incremental
+        load_latest_by_game_id = lambda path: load_latest_incremental(path, "retrain")
+    except Exception:
+        pass
 
     if load_latest_by_game_id is not None and PREDICTION_EVENTS_PATH is not None:
         preds_by_gid = load_latest_by_game_id(PREDICTION_EVENTS_PATH)
@@ -347,13 +335,16 @@ def calculate_target_encoding(df, col, target='target', min_samples_leaf=5, smoo
     smooth = (counts * means + smoothing * prior) / (counts + smoothing)
     return smooth.to_dict(), prior
 
+def _played_games(predictions):
+    """Games with a recorded outcome, in date order."""
+    sorted_preds = sorted(predictions, key=lambda x: x.get('date', ''))
+    return [p for p in sorted_preds if p.get('actual_winner')]
+
 def extract_features_chronologically(predictions):
     # Sort by date
     print("Sorting games chronologically...")
-    sorted_preds = sorted(predictions, key=lambda x: x.get('date', ''))
-    
     # Filter for games with actual outcomes
-    played_games = [p for p in sorted_preds if p.get('actual_winner')]
+    played_games = _played_games(predictions)
     print(f"📊 Total played games in history: {len(played_games)}")
     
     # Train on all completed games for maximum stability.
@@ -366,9 +357,19 @@ def extract_features_chronologically(predictions):
     standings = StandingsTracker()
     profiles = load_profiles() # Load finishing profiles
     edge_data = load_edge_data() # Load NHL Edge speed profiles
+    training_data = _replay_games(train_subset, tracker, standings, profiles, edge_data)
+    
+    train_df = pd.DataFrame(training_data)
+    
+    # NEW: Add Team Mean Win Rate (Target Encoding) for Train/Test split
+    # We do this later in the main loop to avoid leakage, but here's the mapping
+    return train_df
+
+def _replay_games(games, tracker, standings, profiles, edge_data):
+    """Emit a feature row per game from the history before it, then fold the game into `tracker`."""
     training_data = []
     
-    for p in train_subset:
+    for p in games:
         game_id = p.get('game_id')
         date_str = p.get('date')
         if not date_str:
@@ -613,11 +614,92 @@ def extract_features_chronologically(predictions):
         tracker.update(home, game_date, h_stats, venue='home', opponent_elo=curr_a_elo, city=home)
         tracker.update(away, game_date, a_stats, venue='away', opponent_elo=curr_h_elo, city=home)
         
-    train_df = pd.DataFrame(training_data)
-    
-    # NEW: Add Team Mean Win Rate (Target Encoding) for Train/Test split
-    # We do this later in the main loop to avoid leakage, but here's the mapping
-    return train_df
+    return training_data
+
+# Persisted feature table: the rows extracted so far plus the TeamHistory they
+# left behind, keyed by a fingerprint of every played game, so a retrain only
+# replays games added since the last run. Bump FEATURE_TABLE_VERSION whenever a
+# feature or the history update in _replay_games changes.
+FEATURE_TABLE_VERSION = 1
+FEATURE_TABLE_PATH = Path(os.environ.get("FEATURE_TABLE_PATH", "data/cache/feature_table.pkl"))
+
+def _game_fingerprint(p):
+    return hashlib.sha1(json.dumps(p, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def _feature_schema_hash(profiles, edge_data):
+    """Feature code version plus the static inputs applied to every row."""
+    h = hashlib.sha1(f"feature_table_v{FEATURE_TABLE_VERSION}".encode('utf-8'))
+    h.update(json.dumps(profiles, sort_keys=True, default=str).encode('utf-8'))
+    h.update(json.dumps(edge_data, sort_keys=True, default=str).encode('utf-8'))
+    return h.hexdigest()
+
+class _FeatureTableUnpickler(pickle.Unpickler):
+    """Resolve the pickled tracker classes to this module, whatever name it was imported under."""
+    def find_class(self, module, name):
+        local = {'TeamHistory': TeamHistory, 'EloTracker': EloTracker, 'GoalieHistory': GoalieHistory, 'RollingStats': RollingStats}
+        if name in local:
+            return local[name]
+        return super().find_class(module, name)
+
+def _load_feature_table(path, schema):
+    try:
+        with open(path, 'rb') as f:
+            state = _FeatureTableUnpickler(f).load()
+    except Exception:
+        return None
+    if not isinstance(state, dict) or state.get('schema') != schema:
+        return None
+    if not all(k in state for k in ('keys', 'tracker', 'table')):
+        return None
+    return state
+
+def _save_feature_table(path, state):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+    except OSError as e:
+        print(f"⚠️ Could not save feature table: {e}")
+
+def build_feature_table(predictions, rebuild=False, path=None):
+    """
+    Same DataFrame as extract_features_chronologically, backed by the table at
+    FEATURE_TABLE_PATH.
+
+    If the cached games are a prefix of today's played games (same ids, same
+    records), only the new games are replayed on the saved tracker and their
+    rows appended. Anything else (schema change, a corrected or back-dated
+    game, rebuild=True or FEATURE_TABLE_REBUILD=1) replays the full history.
+    """
+    path = Path(path) if path is not None else FEATURE_TABLE_PATH
+    played_games = _played_games(predictions)
+    keys = [(str(p.get('game_id')), _game_fingerprint(p)) for p in played_games]
+    profiles = load_profiles()
+    edge_data = load_edge_data()
+    schema = _feature_schema_hash(profiles, edge_data)
+
+    rebuild = rebuild or os.environ.get("FEATURE_TABLE_REBUILD", "0") == "1"
+    state = None if rebuild else _load_feature_table(path, schema)
+    done = len(state['keys']) if state else 0
+    if state is not None and state['keys'] != keys[:done]:
+        print("♻️ Game history changed before the last cached game; rebuilding feature table")
+        state = None
+    if state is None:
+        state = {'schema': schema, 'keys': [], 'tracker': TeamHistory(), 'table': pd.DataFrame()}
+        done = 0
+
+    new_games = played_games[done:]
+    print(f"📦 Feature table: {done} cached games, {len(new_games)} to extract")
+    if new_games:
+        rows = _replay_games(new_games, state['tracker'], StandingsTracker(), profiles, edge_data)
+        if rows:
+            new_df = pd.DataFrame(rows)
+            state['table'] = new_df if state['table'].empty else pd.concat([state['table'], new_df], ignore_index=True)
+        state['keys'] = keys
+        _save_feature_table(path, state)
+    return state['table'].copy()
 
 
 def split_train_cal_test(df: pd.DataFrame, train_frac: float = 0.80, cal_frac: float = 0.10):
@@ -807,7 +889,7 @@ def train_calibrate_evaluate_variant(
                 "subsample": [0.8, 0.9],
                 "colsample_bytree": [0.8, 0.9],
             }
-            base = xgb.XGBClassifier(objective="binary:logistic", eval_metric="logloss", random_state=42)
+            base = xgb.XGBClassifier(objective="binary:logistic", eval_metric="logloss", random_state=42, n_jobs=worker_threads())
         elif algo == "lgbm":
             import lightgbm as lgb
             param_grid = {
@@ -817,7 +899,7 @@ def train_calibrate_evaluate_variant(
                 "subsample": [0.8, 0.9],
                 "num_leaves": [15, 31, 63],
             }
-            base = lgb.LGBMClassifier(random_state=42, verbose=-1)
+            base = lgb.LGBMClassifier(random_state=42, verbose=-1, n_jobs=worker_threads())
         elif algo == "rf":
             from sklearn.ensemble import RandomForestClassifier
             param_grid = {
@@ -826,14 +908,14 @@ def train_calibrate_evaluate_variant(
                 "min_samples_split": [2, 5],
                 "max_features": ["sqrt", "log2"],
             }
-            base = RandomForestClassifier(random_state=42)
+            base = RandomForestClassifier(random_state=42, n_jobs=worker_threads())
         
         grid = GridSearchCV(
             estimator=base,
             param_grid=param_grid,
             cv=tscv,
             scoring="neg_log_loss",
-            n_jobs=-1,
+            n_jobs=worker_threads() or -1,
         )
         grid.fit(X_train, y_train, sample_weight=w)
         best_model = grid.best_estimator_
@@ -851,13 +933,13 @@ def train_calibrate_evaluate_variant(
         
         best_params = dict(params)
         if algo == "xgb":
-            best_model = xgb.XGBClassifier(objective="binary:logistic", eval_metric="logloss", random_state=42, **best_params)
+            best_model = xgb.XGBClassifier(objective="binary:logistic", eval_metric="logloss", random_state=42, n_jobs=worker_threads(), **best_params)
         elif algo == "lgbm":
             import lightgbm as lgb
-            best_model = lgb.LGBMClassifier(random_state=42, verbose=-1, **best_params)
+            best_model = lgb.LGBMClassifier(random_state=42, verbose=-1, n_jobs=worker_threads(), **best_params)
         elif algo == "rf":
             from sklearn.ensemble import RandomForestClassifier
-            best_model = RandomForestClassifier(random_state=42, **best_params)
+            best_model = RandomForestClassifier(random_state=42, n_jobs=worker_threads(), **best_params)
             
         best_model.fit(X_train, y_train, sample_weight=w)
 
@@ -916,7 +998,7 @@ def train_optimized_model():
     print("=" * 60)
     
     raw_preds = load_data()
-    df = extract_features_chronologically(raw_preds)
+    df = build_feature_table(raw_preds)
     
     if len(df) < 100:
         print("⚠️ Not enough samples for training.")
@@ -936,13 +1018,11 @@ def train_optimized_model():
     train_df_recent = train_df_full.tail(recent_n).copy() if len(train_df_full) > recent_n else train_df_full.copy()
     print(f"🏷️ Variants: full_train={len(train_df_full)} recent_train={len(train_df_recent)} cal={len(cal_df)} test={len(test_df)}")
 
-    # Evaluate multiple algorithms
-    results = []
+    # Evaluate multiple algorithms. The full variants are independent and run
+    # in parallel; each recent variant reuses its full variant's best params.
     algos = ["xgb", "lgbm", "rf"]
-    
-    for algo in algos:
-        # Full variant
-        res_full = train_calibrate_evaluate_variant(
+    full_results = run_tasks(train_calibrate_evaluate_variant, [
+        dict(
             name=f"{algo}_full",
             algo=algo,
             train_df=train_df_full,
@@ -950,10 +1030,10 @@ def train_optimized_model():
             test_df=test_df,
             do_grid_search=True,
         )
-        results.append(res_full)
-        
-        # Recent variant
-        res_recent = train_calibrate_evaluate_variant(
+        for algo in algos
+    ])
+    recent_results = run_tasks(train_calibrate_evaluate_variant, [
+        dict(
             name=f"{algo}_recent",
             algo=algo,
             train_df=train_df_recent,
@@ -962,7 +1042,9 @@ def train_optimized_model():
             do_grid_search=False,
             fixed_params=res_full.get("best_params"),
         )
-        results.append(res_recent)
+        for algo, res_full in zip(algos, full_results)
+    ])
+    results = [r for pair in zip(full_results, recent_results) for r in pair]
 
     # Pick overall champion by test log loss
     results.sort(key=lambda x: x["test_logloss"])
@@ -1634,129 +1716,34 @@ def rolling_time_split_eval(
 
     Trains on earlier games and evaluates on later games for each split.
     Also reports an Elo-only baseline built from results up to that point.
+    Splits are independent and run in parallel (see parallel_eval).
     """
-    from sklearn.metrics import brier_score_loss
-
     df = df.sort_values("date").reset_index(drop=True)
     features_all = [c for c in df.columns if c not in ["game_id", "date", "target", "margin", "p1_target"]]
+    model_params = {k: getattr(base_model, k) for k in ["max_depth", "learning_rate", "n_estimators", "subsample", "colsample_bytree", "gamma"] if hasattr(base_model, k)}
 
     # Build encodings using only training folds inside each split to avoid leakage.
     tscv = TimeSeriesSplit(n_splits=max(2, int(n_splits)))
 
-    accs = []
-    lls = []
-    briers = []
-    elo_accs = []
-    elo_lls = []
-
-    # Elo tracker for baseline (updated only with training fold results)
-    elo = EloTracker()
-
-    splits_used = 0
+    tasks = []
     for train_idx, test_idx in tscv.split(df):
-        train_df = df.iloc[train_idx].copy()
-        test_df = df.iloc[test_idx].copy()
-        if len(test_df) < 30 or len(train_df) < 200:
+        if len(test_idx) < 30 or len(train_idx) < 200:
             continue
-
-        # Target encodings learned on train only
-        home_map, home_prior = calculate_target_encoding(train_df, "home_team")
-        away_map, away_prior = calculate_target_encoding(train_df, "away_team", target="target")
-
-        def build_X(dframe: pd.DataFrame) -> pd.DataFrame:
-            X = dframe[features_all].copy()
-            X["home_win_rate"] = dframe["home_team"].map(home_map).fillna(home_prior)
-            X["away_win_rate"] = dframe["away_team"].map(away_map).fillna(away_prior)
-            X = X.drop(columns=["home_team", "away_team"])
-            # Minimal interactions used in training
-            if "away_sos" in dframe.columns:
-                X["home_win_rate_away_sos"] = X["home_win_rate"] * dframe["away_sos"]
-            if "away_b2b" in dframe.columns and "finish_diff" in dframe.columns:
-                X["away_b2b_home_strength"] = dframe["away_b2b"] * dframe["finish_diff"]
-            # Symbolic features if available
-            if all(k in dframe.columns for k in ["home_xg", "away_xg", "home_elo", "away_elo", "home_sos", "away_sos", "elo_diff", "l10_xg_diff"]):
-                X["pressure_index"] = (dframe["home_xg"] / (dframe["away_xg"] + 0.1)) * (dframe["home_elo"] / (dframe["away_elo"] + 0.1))
-                X["xg_efficiency"] = (dframe["home_xg"] * (dframe["home_sos"] / 1500.0)) - (dframe["away_xg"] * (dframe["away_sos"] / 1500.0))
-                X["power_momentum"] = dframe["elo_diff"] * dframe["l10_xg_diff"]
-            # Keep prune list consistent
-            prune = [
-                "home_venue_goal_diff", "away_venue_goal_diff", "l5_pizza_diff",
-                "l5_nzt_diff", "l5_rush_diff", "l5_pk_diff", "l5_pp_diff",
-                "l5_ozs_diff", "l5_hdc_diff",
-            ]
-            for col in prune:
-                if col in X.columns:
-                    X.drop(columns=[col], inplace=True)
-            return X
-
-        X_train = build_X(train_df)
-        y_train = train_df["target"].astype(int).values
-        X_test = build_X(test_df)
-        y_test = test_df["target"].astype(int).values
-
-        # Recency weights inside train fold
-        n_train = len(train_df)
-        ages = (n_train - 1) - np.arange(n_train, dtype=float)
-        w = 0.5 ** (ages / 60.0)
-        late_mask = train_df["season_month"].isin([3, 4]).values if "season_month" in train_df.columns else np.zeros(n_train, dtype=bool)
-        w[late_mask] *= 1.25
-
-        # Fit model (clone-ish by re-instantiating when possible)
-        model = xgb.XGBClassifier(
-            objective="binary:logistic",
-            eval_metric="logloss",
-            random_state=42,
-            **{k: getattr(base_model, k) for k in ["max_depth", "learning_rate", "n_estimators", "subsample", "colsample_bytree", "gamma"] if hasattr(base_model, k)},
-        )
-        model.fit(X_train, y_train, sample_weight=w)
-
-        if calibrated:
-            # Calibrate on the last 20% of the training fold (future within fold),
-            # then evaluate on the test fold.
-            fold_n = len(X_train)
-            fold_cal_start = int(fold_n * 0.80)
-            X_tr = X_train.iloc[:fold_cal_start]
-            y_tr = y_train[:fold_cal_start]
-            X_ca = X_train.iloc[fold_cal_start:]
-            y_ca = y_train[fold_cal_start:]
-            w_tr = w[:fold_cal_start]
-
-            model.fit(X_tr, y_tr, sample_weight=w_tr)
-            cal = CalibratedClassifierCV(estimator=model, method="isotonic", cv="prefit")
-            cal.fit(X_ca, y_ca)
-            p = cal.predict_proba(X_test)[:, 1]
-        else:
-            p = model.predict_proba(X_test)[:, 1]
-
-        preds = (p >= 0.5).astype(int)
-        accs.append(float(accuracy_score(y_test, preds)))
-        lls.append(float(log_loss(y_test, np.clip(p, 1e-6, 1 - 1e-6))))
-        briers.append(float(brier_score_loss(y_test, p)))
-
-        # Elo baseline: update Elo with training fold results, then predict test fold.
-        elo = EloTracker()
-        for _, row in train_df.iterrows():
-            # target==1 => home win
-            home = row["home_team"]
-            away = row["away_team"]
-            # Update with a synthetic 1-goal margin just to record outcome
-            if int(row["target"]) == 1:
-                elo.update(home, away, 2, 1)
-            else:
-                elo.update(home, away, 1, 2)
-
-        elo_p = []
-        for _, row in test_df.iterrows():
-            home = row["home_team"]
-            away = row["away_team"]
-            elo_home = float(elo.get_win_prob(home, away))
-            elo_p.append(elo_home)
-        elo_p = np.array(elo_p, dtype=float)
-        elo_preds = (elo_p >= 0.5).astype(int)
-        elo_accs.append(float(np.mean(elo_preds == y_test)))
-        elo_lls.append(float(log_loss(y_test, np.clip(elo_p, 1e-6, 1 - 1e-6))))
-
-        splits_used += 1
+        tasks.append(dict(
+            train_df=df.iloc[train_idx].copy(),
+            test_df=df.iloc[test_idx].copy(),
+            features_all=features_all,
+            model_params=model_params,
+            calibrated=calibrated,
+        ))
+    folds = run_tasks(_time_split_fold, tasks)
+
+    accs = [f["acc"] for f in folds]
+    lls = [f["logloss"] for f in folds]
+    briers = [f["brier"] for f in folds]
+    elo_accs = [f["elo_acc"] for f in folds]
+    elo_lls = [f["elo_logloss"] for f in folds]
+    splits_used = len(folds)
 
     return {
         "mean_acc": float(np.mean(accs)) if accs else float("nan"),
@@ -1768,51 +1755,37 @@ def rolling_time_split_eval(
     }
 
 
-def rolling_recent_eval(df: pd.DataFrame, recent_n: int = 200, n_splits: int = 4) -> Dict[str, float]:
-    """Evaluate XGB vs Elo on the same forward windows for the most recent games."""
-    df = df.sort_values("date").reset_index(drop=True)
-    if len(df) < (recent_n + 200):
-        # Need enough history to make training folds meaningful
-        recent_n = min(recent_n, max(0, len(df) - 200))
-    recent_df = df.iloc[-recent_n:].copy()
-    if len(recent_df) < 60:
-        raise ValueError("Not enough rows for recent evaluation")
-
-    tscv = TimeSeriesSplit(n_splits=max(2, int(n_splits)))
-
-    xgb_probs = []
-    xgb_y = []
-    elo_probs = []
-    elo_y = []
+def _time_split_fold(
+    train_df: pd.DataFrame,
+    test_df: pd.DataFrame,
+    features_all,
+    model_params: Dict,
+    calibrated: bool,
+) -> Dict[str, float]:
+    """Fit and score one rolling_time_split_eval split (XGB and the Elo baseline)."""
+    from sklearn.metrics import brier_score_loss
 
-    # Use a moderate, non-extreme XGB config to avoid producing saturated
-    # probabilities that can dominate log loss. The goal is apples-to-apples
-    # comparison on identical windows, not micro-optimizing this evaluator.
+    # Target encodings learned on train only
+    home_map, home_prior = calculate_target_encoding(train_df, "home_team")
+    away_map, away_prior = calculate_target_encoding(train_df, "away_team", target="target")
 
-    def build_X_with_train_encodings(tr_df: pd.DataFrame, dframe: pd.DataFrame) -> pd.DataFrame:
-        """Build feature matrix using the same transforms as training (leakage-safe)."""
-        base_feats = [c for c in tr_df.columns if c not in ["game_id", "date", "target", "margin", "p1_target"]]
-        home_map, home_prior = calculate_target_encoding(tr_df, "home_team")
-        away_map, away_prior = calculate_target_encoding(tr_df, "away_team", target="target")
-        X = dframe[base_feats].copy()
+    def build_X(dframe: pd.DataFrame) -> pd.DataFrame:
+        X = dframe[features_all].copy()
         X["home_win_rate"] = dframe["home_team"].map(home_map).fillna(home_prior)
         X["away_win_rate"] = dframe["away_team"].map(away_map).fillna(away_prior)
-        X.drop(columns=["home_team", "away_team"], inplace=True)
-
+        X = X.drop(columns=["home_team", "away_team"])
+        # Minimal interactions used in training
         if "away_sos" in dframe.columns:
             X["home_win_rate_away_sos"] = X["home_win_rate"] * dframe["away_sos"]
         if "away_b2b" in dframe.columns and "finish_diff" in dframe.columns:
             X["away_b2b_home_strength"] = dframe["away_b2b"] * dframe["finish_diff"]
-
-        if all(k in dframe.columns for k in ["home_xg", "away_xg", "home_elo", "away_elo"]):
+        # Symbolic features if available
+        if all(k in dframe.columns for k in ["home_xg", "away_xg", "home_elo", "away_elo", "home_sos", "away_sos", "elo_diff", "l10_xg_diff"]):
             X["pressure_index"] = (dframe["home_xg"] / (dframe["away_xg"] + 0.1)) * (dframe["home_elo"] / (dframe["away_elo"] + 0.1))
-        if all(k in dframe.columns for k in ["home_xg", "away_xg", "home_sos", "away_sos"]):
             X["xg_efficiency"] = (dframe["home_xg"] * (dframe["home_sos"] / 1500.0)) - (dframe["away_xg"] * (dframe["away_sos"] / 1500.0))
-        if all(k in dframe.columns for k in ["elo_diff", "l10_xg_diff"]):
             X["power_momentum"] = dframe["elo_diff"] * dframe["l10_xg_diff"]
-
+        # Keep prune list consistent
         prune = [
-            "home_win_rate",
             "home_venue_goal_diff", "away_venue_goal_diff", "l5_pizza_diff",
             "l5_nzt_diff", "l5_rush_diff", "l5_pk_diff", "l5_pp_diff",
             "l5_ozs_diff", "l5_hdc_diff",
@@ -1822,71 +1795,101 @@ def rolling_recent_eval(df: pd.DataFrame, recent_n: int = 200, n_splits: int = 4
                 X.drop(columns=[col], inplace=True)
         return X
 
-    for tr_idx, te_idx in tscv.split(recent_df):
-        tr = recent_df.iloc[tr_idx].copy()
-        te = recent_df.iloc[te_idx].copy()
-        if len(te) < 10 or len(tr) < 80:
-            continue
+    X_train = build_X(train_df)
+    y_train = train_df["target"].astype(int).values
+    X_test = build_X(test_df)
+    y_test = test_df["target"].astype(int).values
+
+    # Recency weights inside train fold
+    n_train = len(train_df)
+    ages = (n_train - 1) - np.arange(n_train, dtype=float)
+    w = 0.5 ** (ages / 60.0)
+    late_mask = train_df["season_month"].isin([3, 4]).values if "season_month" in train_df.columns else np.zeros(n_train, dtype=bool)
+    w[late_mask] *= 1.25
+
+    # Fit model (clone-ish by re-instantiating when possible)
+    model = xgb.XGBClassifier(
+        objective="binary:logistic",
+        eval_metric="logloss",
+        random_state=42,
+        n_jobs=worker_threads(),
+        **model_params,
+    )
+    model.fit(X_train, y_train, sample_weight=w)
+
+    if calibrated:
+        # Calibrate on the last 20% of the training fold (future within fold),
+        # then evaluate on the test fold.
+        fold_n = len(X_train)
+        fold_cal_start = int(fold_n * 0.80)
+        X_tr = X_train.iloc[:fold_cal_start]
+        y_tr = y_train[:fold_cal_start]
+        X_ca = X_train.iloc[fold_cal_start:]
+        y_ca = y_train[fold_cal_start:]
+        w_tr = w[:fold_cal_start]
 
-        X_tr_full = build_X_with_train_encodings(tr, tr)
-        y_tr_full = tr["target"].astype(int).values
-        X_te = build_X_with_train_encodings(tr, te)
-        y_te = te["target"].astype(int).values
-
-        # Recency weights within the train split
-        ntr = len(tr)
-        ages = (ntr - 1) - np.arange(ntr, dtype=float)
-        w = 0.5 ** (ages / 60.0)
-
-        # Inner-split future calibration
-        cal_start = int(ntr * 0.80)
-        X_tr = X_tr_full.iloc[:cal_start]
-        y_tr = y_tr_full[:cal_start]
-        X_ca = X_tr_full.iloc[cal_start:]
-        y_ca = y_tr_full[cal_start:]
-        w_tr = w[:cal_start]
-
-        model = xgb.XGBClassifier(
-            objective="binary:logistic",
-            eval_metric="logloss",
-            random_state=42,
-            max_depth=3,
-            learning_rate=0.03,
-            n_estimators=80,
-            subsample=0.85,
-            colsample_bytree=0.85,
-            gamma=0.0,
-            reg_lambda=1.0,
-        )
         model.fit(X_tr, y_tr, sample_weight=w_tr)
-        # Calibrate only if we have a non-degenerate calibration slice.
-        # Isotonic on small/imbalanced slices can produce saturated 0/1 probs,
-        # which makes log loss meaningless for comparison.
-        if len(np.unique(y_ca)) < 2 or len(y_ca) < 30:
-            p = model.predict_proba(X_te)[:, 1]
+        cal = CalibratedClassifierCV(estimator=model, method="isotonic", cv="prefit")
+        cal.fit(X_ca, y_ca)
+        p = cal.predict_proba(X_test)[:, 1]
+    else:
+        p = model.predict_proba(X_test)[:, 1]
+
+    preds = (p >= 0.5).astype(int)
+
+    # Elo baseline: update Elo with training fold results, then predict test fold.
+    elo = EloTracker()
+    for _, row in train_df.iterrows():
+        # target==1 => home win
+        home = row["home_team"]
+        away = row["away_team"]
+        # Update with a synthetic 1-goal margin just to record outcome
+        if int(row["target"]) == 1:
+            elo.update(home, away, 2, 1)
         else:
-            cal = CalibratedClassifierCV(estimator=model, method="sigmoid", cv="prefit")
-            cal.fit(X_ca, y_ca)
-            p = cal.predict_proba(X_te)[:, 1]
-
-        xgb_probs.extend(p.tolist())
-        xgb_y.extend(y_te.tolist())
-
-        # Elo baseline on the same windows: train Elo on tr outcomes, predict te.
-        elo = EloTracker()
-        for _, row in tr.iterrows():
-            home = row["home_team"]
-            away = row["away_team"]
-            if int(row["target"]) == 1:
-                elo.update(home, away, 2, 1)
-            else:
-                elo.update(home, away, 1, 2)
+            elo.update(home, away, 1, 2)
 
-        elo_p = []
-        for _, row in te.iterrows():
-            elo_p.append(float(elo.get_win_prob(row["home_team"], row["away_team"])))
-        elo_probs.extend(elo_p)
-        elo_y.extend(y_te.tolist())
+    elo_p = []
+    for _, row in test_df.iterrows():
+        home = row["home_team"]
+        away = row["away_team"]
+        elo_home = float(elo.get_win_prob(home, away))
+        elo_p.append(elo_home)
+    elo_p = np.array(elo_p, dtype=float)
+    elo_preds = (elo_p >= 0.5).astype(int)
+
+    return {
+        "acc": float(accuracy_score(y_test, preds)),
+        "logloss": float(log_loss(y_test, np.clip(p, 1e-6, 1 - 1e-6))),
+        "brier": float(brier_score_loss(y_test, p)),
+        "elo_acc": float(np.mean(elo_preds == y_test)),
+        "elo_logloss": float(log_loss(y_test, np.clip(elo_p, 1e-6, 1 - 1e-6))),
+    }
+
+
+def rolling_recent_eval(df: pd.DataFrame, recent_n: int = 200, n_splits: int = 4) -> Dict[str, float]:
+    """Evaluate XGB vs Elo on the same forward windows for the most recent games."""
+    df = df.sort_values("date").reset_index(drop=True)
+    if len(df) < (recent_n + 200):
+        # Need enough history to make training folds meaningful
+        recent_n = min(recent_n, max(0, len(df) - 200))
+    recent_df = df.iloc[-recent_n:].copy()
+    if len(recent_df) < 60:
+        raise ValueError("Not enough rows for recent evaluation")
+
+    tscv = TimeSeriesSplit(n_splits=max(2, int(n_splits)))
+
+    tasks = []
+    for tr_idx, te_idx in tscv.split(recent_df):
+        if len(te_idx) < 10 or len(tr_idx) < 80:
+            continue
+        tasks.append(dict(tr=recent_df.iloc[tr_idx].copy(), te=recent_df.iloc[te_idx].copy()))
+    folds = run_tasks(_recent_eval_fold, tasks)
+
+    xgb_probs = [v for f in folds for v in f["xgb_probs"]]
+    xgb_y = [v for f in folds for v in f["y"]]
+    elo_probs = [v for f in folds for v in f["elo_probs"]]
+    elo_y = [v for f in folds for v in f["y"]]
 
     if not xgb_probs or not elo_probs:
         raise ValueError("Recent evaluation produced no predictions")
@@ -1973,6 +1976,104 @@ def rolling_recent_eval(df: pd.DataFrame, recent_n: int = 200, n_splits: int = 4
     return out
 
 
+def _recent_eval_matrix(tr_df: pd.DataFrame, dframe: pd.DataFrame) -> pd.DataFrame:
+    """Build feature matrix using the same transforms as training (leakage-safe)."""
+    base_feats = [c for c in tr_df.columns if c not in ["game_id", "date", "target", "margin", "p1_target"]]
+    home_map, home_prior = calculate_target_encoding(tr_df, "home_team")
+    away_map, away_prior = calculate_target_encoding(tr_df, "away_team", target="target")
+    X = dframe[base_feats].copy()
+    X["home_win_rate"] = dframe["home_team"].map(home_map).fillna(home_prior)
+    X["away_win_rate"] = dframe["away_team"].map(away_map).fillna(away_prior)
+    X.drop(columns=["home_team", "away_team"], inplace=True)
+
+    if "away_sos" in dframe.columns:
+        X["home_win_rate_away_sos"] = X["home_win_rate"] * dframe["away_sos"]
+    if "away_b2b" in dframe.columns and "finish_diff" in dframe.columns:
+        X["away_b2b_home_strength"] = dframe["away_b2b"] * dframe["finish_diff"]
+
+    if all(k in dframe.columns for k in ["home_xg", "away_xg", "home_elo", "away_elo"]):
+        X["pressure_index"] = (dframe["home_xg"] / (dframe["away_xg"] + 0.1)) * (dframe["home_elo"] / (dframe["away_elo"] + 0.1))
+    if all(k in dframe.columns for k in ["home_xg", "away_xg", "home_sos", "away_sos"]):
+        X["xg_efficiency"] = (dframe["home_xg"] * (dframe["home_sos"] / 1500.0)) - (dframe["away_xg"] * (dframe["away_sos"] / 1500.0))
+    if all(k in dframe.columns for k in ["elo_diff", "l10_xg_diff"]):
+        X["power_momentum"] = dframe["elo_diff"] * dframe["l10_xg_diff"]
+
+    prune = [
+        "home_win_rate",
+        "home_venue_goal_diff", "away_venue_goal_diff", "l5_pizza_diff",
+        "l5_nzt_diff", "l5_rush_diff", "l5_pk_diff", "l5_pp_diff",
+        "l5_ozs_diff", "l5_hdc_diff",
+    ]
+    for col in prune:
+        if col in X.columns:
+            X.drop(columns=[col], inplace=True)
+    return X
+
+
+def _recent_eval_fold(tr: pd.DataFrame, te: pd.DataFrame) -> Dict[str, list]:
+    """Fit and score one rolling_recent_eval split (XGB and the Elo baseline)."""
+    X_tr_full = _recent_eval_matrix(tr, tr)
+    y_tr_full = tr["target"].astype(int).values
+    X_te = _recent_eval_matrix(tr, te)
+    y_te = te["target"].astype(int).values
+
+    # Recency weights within the train split
+    ntr = len(tr)
+    ages = (ntr - 1) - np.arange(ntr, dtype=float)
+    w = 0.5 ** (ages / 60.0)
+
+    # Inner-split future calibration
+    cal_start = int(ntr * 0.80)
+    X_tr = X_tr_full.iloc[:cal_start]
+    y_tr = y_tr_full[:cal_start]
+    X_ca = X_tr_full.iloc[cal_start:]
+    y_ca = y_tr_full[cal_start:]
+    w_tr = w[:cal_start]
+
+    # Use a moderate, non-extreme XGB config to avoid producing saturated
+    # probabilities that can dominate log loss. The goal is apples-to-apples
+    # comparison on identical windows, not micro-optimizing this evaluator.
+    model = xgb.XGBClassifier(
+        objective="binary:logistic",
+        eval_metric="logloss",
+        random_state=42,
+        n_jobs=worker_threads(),
+        max_depth=3,
+        learning_rate=0.03,
+        n_estimators=80,
+        subsample=0.85,
+        colsample_bytree=0.85,
+        gamma=0.0,
+        reg_lambda=1.0,
+    )
+    model.fit(X_tr, y_tr, sample_weight=w_tr)
+    # Calibrate only if we have a non-degenerate calibration slice.
+    # Isotonic on small/imbalanced slices can produce saturated 0/1 probs,
+    # which makes log loss meaningless for comparison.
+    if len(np.unique(y_ca)) < 2 or len(y_ca) < 30:
+        p = model.predict_proba(X_te)[:, 1]
+    else:
+        cal = CalibratedClassifierCV(estimator=model, method="sigmoid", cv="prefit")
+        cal.fit(X_ca, y_ca)
+        p = cal.predict_proba(X_te)[:, 1]
+
+    # Elo baseline on the same windows: train Elo on tr outcomes, predict te.
+    elo = EloTracker()
+    for _, row in tr.iterrows():
+        home = row["home_team"]
+        away = row["away_team"]
+        if int(row["target"]) == 1:
+            elo.update(home, away, 2, 1)
+        else:
+            elo.update(home, away, 1, 2)
+
+    elo_p = []
+    for _, row in te.iterrows():
+        elo_p.append(float(elo.get_win_prob(row["home_team"], row["away_team"])))
+
+    return {"xgb_probs": p.tolist(), "y": y_te.tolist(), "elo_probs": elo_p}
+
+
 def elo_logloss_on_test(train_df: pd.DataFrame, test_df: pd.DataFrame) -> float:
     """Compute Elo log loss on `test_df`, with Elo fit on `train_df` only."""
     elo = EloTracker()
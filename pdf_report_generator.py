@@ -23,6 +23,9 @@ from reportlab.lib.fonts import addMapping
 from reportlab.pdfgen import canvas
 from advanced_metrics_analyzer import AdvancedMetricsAnalyzer
 from improved_xg_model import ImprovedXGModel
+from play_by_play_frame import PlayByPlayFrame, SHOT_ATTEMPT_TYPES, zone_name
+from game_analysis_context import GameAnalysisContext, game_metric
+from player_directory import get_player_directory
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.charts.legends import Legend
@@ -82,22 +85,19 @@ class BackgroundPageTemplate(PageTemplate):
                     background.paste(pil_img, mask=pil_img.split()[-1])
                     pil_img = background
                 
-                # Save as temporary JPEG
-                temp_path = "/tmp/background_template.jpg"
-                pil_img.save(temp_path, "JPEG", quality=95)
+                # Encode as JPEG in memory (no shared temp file: reports may render side by side)
+                jpeg = BytesIO()
+                pil_img.save(jpeg, "JPEG", quality=95)
+                jpeg.seek(0)
                 
                 # Draw a white page background to avoid transparency artifacts
                 canvas.saveState()
                 canvas.setFillColorRGB(1, 1, 1)
                 canvas.rect(0, 0, page_width, page_height, fill=1, stroke=0)
                 # Draw the background image FIRST (at the bottom layer)
-                canvas.drawImage(temp_path, 0, 0, width=page_width, height=page_height)
+                canvas.drawImage(ImageReader(jpeg), 0, 0, width=page_width, height=page_height)
                 canvas.restoreState()
-                print(f"DEBUG: Background drawn successfully on page (JPEG temp)")
-                
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                print(f"DEBUG: Background drawn successfully on page (in-memory JPEG)")
                     
             except Exception as e:
                 # Fallback: try drawing the PNG directly without PIL
@@ -206,12 +206,8 @@ class PostGameReportGenerator:
 
         # 1) Advanced metrics section (comprehensive report)
         try:
-            from advanced_metrics_analyzer import AdvancedMetricsAnalyzer
-
-            pbp = (game_data or {}).get("play_by_play") or {}
-            analyzer = AdvancedMetricsAnalyzer(pbp)
             if out.get("away_team_id") and out.get("home_team_id"):
-                adv = analyzer.generate_comprehensive_report(int(out["away_team_id"]), int(out["home_team_id"]))
+                adv = GameAnalysisContext.of(game_data).advanced_report(int(out["away_team_id"]), int(out["home_team_id"]))
                 out["postgame"]["advanced_metrics"] = adv
         except Exception as e:
             out["postgame"]["advanced_metrics_error"] = str(e)
@@ -650,7 +646,8 @@ class PostGameReportGenerator:
                 )
                 
                 # Save the modified header
-                modified_header_path = "temp_header_with_teams.png"
+                # Per process: reports for several games may render side by side
+                modified_header_path = f"temp_header_with_teams_{os.getpid()}.png"
                 header_img.save(modified_header_path)
                 
                 # Create ReportLab Image object - extend beyond margins to eliminate white edges
@@ -897,55 +894,13 @@ class PostGameReportGenerator:
         return goals
 
     def _create_player_roster_map(self, play_by_play, game_data=None):
-        """Create a complete mapping of player IDs to player info dynamically from PBP, Boxscore, and Landing data."""
-        roster_map = {}
-        # 1. From play_by_play.rosterSpots
-        pbp_dict = play_by_play if isinstance(play_by_play, dict) else {}
-        if 'rosterSpots' in pbp_dict:
-            for player in pbp_dict['rosterSpots']:
-                player_id = player.get('playerId')
-                if player_id:
-                    fn = (player.get('firstName') or {}).get('default', '') if isinstance(player.get('firstName'), dict) else str(player.get('firstName', ''))
-                    ln = (player.get('lastName') or {}).get('default', '') if isinstance(player.get('lastName'), dict) else str(player.get('lastName', ''))
-                    name = f"{fn} {ln}".strip() or (player.get('name') or {}).get('default', f"Player #{player_id}")
-                    roster_map[player_id] = {
-                        'name': name,
-                        'firstName': fn,
-                        'lastName': ln,
-                        'sweaterNumber': player.get('sweaterNumber', ''),
-                        'positionCode': player.get('positionCode', ''),
-                        'teamId': player.get('teamId')
-                    }
-
-        # 2. From boxscore.playerByGameStats
+        """Map player IDs to player info for one game (rosterSpots, then boxscore players), via the shared player directory."""
         boxscore = None
         if isinstance(game_data, dict):
             boxscore = game_data.get('boxscore')
         elif isinstance(play_by_play, dict) and 'playerByGameStats' in play_by_play:
             boxscore = play_by_play
-
-        if isinstance(boxscore, dict) and 'playerByGameStats' in boxscore:
-            pbg = boxscore['playerByGameStats']
-            for side in ('awayTeam', 'homeTeam'):
-                side_data = pbg.get(side) or {}
-                t_id = (boxscore.get(side) or {}).get('id')
-                for cat in ('forwards', 'defense', 'goalies'):
-                    for player in side_data.get(cat, []):
-                        pid = player.get('playerId')
-                        if pid and pid not in roster_map:
-                            raw_name = player.get('name') or {}
-                            p_name = raw_name.get('default') if isinstance(raw_name, dict) else str(raw_name)
-                            fn = p_name.split()[0] if p_name else ''
-                            ln = p_name.split()[-1] if p_name else ''
-                            roster_map[pid] = {
-                                'name': p_name or f"Player #{pid}",
-                                'firstName': fn,
-                                'lastName': ln,
-                                'sweaterNumber': player.get('sweaterNumber', ''),
-                                'positionCode': player.get('position', cat[0].upper()),
-                                'teamId': t_id
-                            }
-        return roster_map
+        return get_player_directory().game_roster(play_by_play, boxscore)
 
     def _calculate_team_stats_from_play_by_play(self, game_data, team_side):
         """Calculate team statistics from play-by-play data"""
@@ -1805,7 +1760,7 @@ class PostGameReportGenerator:
                 
                 # Retrieve Name and Team
                 player_info = roster_map.get(gid, {})
-                name = f"{player_info.get('firstName', {}).get('default', '')} {player_info.get('lastName', {}).get('default', '')}"
+                name = player_info.get('name') or get_player_directory().name(gid, '')
                 if len(name.strip()) < 2:
                      name = f"Goalie {gid}"
                 
@@ -1866,6 +1821,7 @@ class PostGameReportGenerator:
         return elements
 
     
+    @game_metric
     def calculate_win_probability(self, game_data):
         """Calculate win probability using POSTGAME correlation-based weights.
         Uses actual game stats with weights derived from correlation analysis of completed games.
@@ -2031,6 +1987,60 @@ class PostGameReportGenerator:
                     'home_team': 'HME'
                 }
     
+    def _play_frame(self, game_data):
+        """Columnar play-by-play shared by every calculator that reads this game"""
+        return PlayByPlayFrame.of(game_data.get('play_by_play'))
+
+    def _frame_shot_xg(self, frame, play_index):
+        """xG of the shot at play_index (previous 10 plays as context), computed once per game"""
+        key = ('shot_xg', self.xg_model)
+        xg_values = frame.memo.get(key)
+        if xg_values is None:
+            xg_values = frame.memo[key] = self._frame_xg_batch(frame)
+        return xg_values[play_index]
+
+    def _frame_xg_batch(self, frame):
+        """xG for every shot attempt in the game in one ImprovedXGModel batch (0.0 for other plays)"""
+        xg_values = [0.0] * len(frame)
+        shots = np.flatnonzero(frame.is_type(*SHOT_ATTEMPT_TYPES)).tolist()
+        # Rebound/rush context comes from the feed's one-pass shot annotations
+        annotations = frame.shot_annotations()
+        
+        batch, x_coords, y_coords, shot_types, event_types, strengths = [], [], [], [], [], []
+        strength_by_code = {}
+        for i in shots:
+            play = frame.plays[i]
+            details = play.get('details', {})
+            x_coord = details.get('xCoord', 0)
+            y_coord = details.get('yCoord', 0)
+            shot_type = details.get('shotType', 'wrist')
+            if not (isinstance(x_coord, (int, float)) and isinstance(y_coord, (int, float)) and isinstance(shot_type, str)):
+                # Malformed shot: score it alone so it gets the scalar path's error handling
+                xg_values[i] = self._calculate_shot_xg(details, play.get('typeDescKey', ''), play, [],
+                                                       is_rebound=bool(annotations.rebound[i]),
+                                                       is_rush=bool(annotations.xg_rush[i]))
+                continue
+            situation_code = play.get('situationCode', '1551')
+            strength = strength_by_code.get(situation_code)
+            if strength is None:
+                strength = strength_by_code[situation_code] = self._parse_strength_state(situation_code)
+            batch.append(i)
+            x_coords.append(x_coord)
+            y_coords.append(y_coord)
+            shot_types.append(shot_type.lower())
+            event_types.append(play.get('typeDescKey', ''))
+            strengths.append(strength)
+        
+        if batch:
+            # Score differential is not tracked here (treated as tied), as in _calculate_shot_xg
+            xg = self.xg_model.calculate_xg_batch(
+                x_coords, y_coords, shot_types, event_types, strengths, 0,
+                is_rebound=annotations.rebound[batch], is_rush=annotations.xg_rush[batch])
+            for i, value in zip(batch, xg.tolist()):
+                xg_values[i] = value
+        return xg_values
+
+    @game_metric
     def _calculate_xg_from_plays(self, game_data):
         """Calculate expected goals from play-by-play data using the working ImprovedXGModel"""
         try:
@@ -2041,20 +2051,16 @@ class PostGameReportGenerator:
             home_xg = 0.0
             
             if 'play_by_play' in game_data and 'plays' in game_data['play_by_play']:
-                plays = game_data['play_by_play']['plays']
-                for play_index, play in enumerate(plays):
-                    if play.get('typeDescKey') in ['shot-on-goal', 'goal', 'missed-shot', 'blocked-shot']:
-                        team_id = play.get('details', {}).get('eventOwnerTeamId')
-                        if team_id == away_team_id or team_id == home_team_id:
-                            # Get previous events for context (last 10 events)
-                            previous_events = plays[max(0, play_index-10):play_index]
-                            
-                            # Calculate xG using the working ImprovedXGModel
-                            xg = self._calculate_shot_xg(play.get('details', {}), play.get('typeDescKey', ''), play, previous_events)
-                            if team_id == away_team_id:
-                                away_xg += xg
-                            else:
-                                home_xg += xg
+                frame = self._play_frame(game_data)
+                teams = frame.column('team')
+                shots = frame.is_type(*SHOT_ATTEMPT_TYPES) & np.isin(frame.team, [away_team_id, home_team_id])
+                for play_index in np.flatnonzero(shots).tolist():
+                    # xG with the last 10 events as context, shared with the period metrics
+                    xg = self._frame_shot_xg(frame, play_index)
+                    if teams[play_index] == away_team_id:
+                        away_xg += xg
+                    else:
+                        home_xg += xg
             
             return away_xg, home_xg
             
@@ -2134,6 +2140,7 @@ class PostGameReportGenerator:
             print(f"Error in improved xG calculation: {e}")
             return 0.05
     
+    @game_metric
     def _calculate_game_scores(self, game_data):
         """Calculate total Game Score for both teams"""
         try:
@@ -2183,6 +2190,7 @@ class PostGameReportGenerator:
             print(f"Error calculating play Game Score: {e}")
             return 0.0
     
+    @game_metric
     def _calculate_ot_so_stats(self, game_data, team_id, team_side, period_type=None):
         """Calculate comprehensive stats for OT/SO periods"""
         try:
@@ -2383,6 +2391,7 @@ class PostGameReportGenerator:
             print(f"Error checking for OT period: {e}")
             return False
     
+    @game_metric
     def _calculate_hdc_from_plays(self, game_data):
         """Calculate high danger chances from play-by-play data"""
         try:
@@ -2391,30 +2400,21 @@ class PostGameReportGenerator:
             
             away_hdc = 0
             home_hdc = 0
-            
+
             if 'play_by_play' in game_data and 'plays' in game_data['play_by_play']:
-                for play in game_data['play_by_play']['plays']:
-                    if play.get('typeDescKey') in ['shot-on-goal', 'goal']:
-                        team_id = play.get('details', {}).get('eventOwnerTeamId')
-                        if team_id == away_team_id or team_id == home_team_id:
-                            # Check if it's a high danger chance (close to net)
-                            details = play.get('details', {})
-                            x_coord = details.get('xCoord', 0)
-                            y_coord = details.get('yCoord', 0)
-                            
-                            # High danger area: close to net and in front
-                            if x_coord > 50 and abs(y_coord) < 20:  # In front of net, close
-                                if team_id == away_team_id:
-                                    away_hdc += 1
-                                else:
-                                    home_hdc += 1
-            
+                frame = self._play_frame(game_data)
+                # High danger area: shot on goal close to net and in front
+                hdc = frame.is_type('shot-on-goal', 'goal') & (frame.x > 50) & (np.abs(frame.y) < 20)
+                away_hdc = int(np.count_nonzero(hdc & (frame.team == away_team_id)))
+                home_hdc = int(np.count_nonzero(hdc & (frame.team == home_team_id)))
+
             return away_hdc, home_hdc
             
         except Exception as e:
             print(f"Error calculating HDC from plays: {e}")
             return 0, 0
     
+    @game_metric
     def _calculate_faceoff_percentages(self, game_data):
         """Calculate faceoff win percentages from play-by-play data"""
         try:
@@ -2426,14 +2426,11 @@ class PostGameReportGenerator:
             total_faceoffs = 0
             
             if 'play_by_play' in game_data and 'plays' in game_data['play_by_play']:
-                for play in game_data['play_by_play']['plays']:
-                    if play.get('typeDescKey') == 'faceoff':
-                        total_faceoffs += 1
-                        team_id = play.get('details', {}).get('eventOwnerTeamId')
-                        if team_id == away_team_id:
-                            away_fo_wins += 1
-                        elif team_id == home_team_id:
-                            home_fo_wins += 1
+                frame = self._play_frame(game_data)
+                faceoffs = frame.is_type('faceoff')
+                total_faceoffs = int(np.count_nonzero(faceoffs))
+                away_fo_wins = int(np.count_nonzero(faceoffs & (frame.team == away_team_id)))
+                home_fo_wins = int(np.count_nonzero(faceoffs & (frame.team == home_team_id)))
             
             if total_faceoffs > 0:
                 away_fo_pct = (away_fo_wins / total_faceoffs) * 100
@@ -2448,6 +2445,7 @@ class PostGameReportGenerator:
             print(f"Error calculating faceoff percentages: {e}")
             return 50.0, 50.0
     
+    @game_metric
     def _calculate_goals_by_period(self, game_data, team_id):
         """Calculate goals scored by a team in each period from play-by-play data (including OT/SO)"""
         try:
@@ -2459,25 +2457,25 @@ class PostGameReportGenerator:
             ot_goals = 0
             so_goals = 0
             
-            for play in play_by_play['plays']:
-                if play.get('typeDescKey') == 'goal':
-                    period = play.get('periodDescriptor', {}).get('number', 1)
-                    period_type = play.get('periodDescriptor', {}).get('periodType', 'REG')
-                    event_team_id = play.get('details', {}).get('eventOwnerTeamId')
-                    
-                    if event_team_id == team_id:
-                        if period <= 3:  # Regulation periods
-                            goals_by_period[period - 1] += 1
-                        elif period_type == 'SO':  # Shootout (check SO first since it's more specific)
-                            so_goals += 1
-                        elif period > 3 or period_type == 'OT':  # Overtime (period > 3 or explicitly marked as OT)
-                            ot_goals += 1
+            frame = self._play_frame(game_data)
+            periods = frame.column('period')
+            period_types = frame.column('period_type')
+            for i in np.flatnonzero(frame.is_type('goal') & (frame.team == team_id)).tolist():
+                period = periods[i]
+                period_type = period_types[i]
+                if period <= 3:  # Regulation periods
+                    goals_by_period[period - 1] += 1
+                elif period_type == 'SO':  # Shootout (check SO first since it's more specific)
+                    so_goals += 1
+                elif period > 3 or period_type == 'OT':  # Overtime (period > 3 or explicitly marked as OT)
+                    ot_goals += 1
             
             return goals_by_period, ot_goals, so_goals
         except Exception as e:
             print(f"Error calculating goals by period: {e}")
             return [0, 0, 0], 0, 0
     
+    @game_metric
     def _calculate_period_metrics(self, game_data, team_id, team_side):
         """Calculate Game Score and xG by period for a team"""
         try:
@@ -2500,28 +2498,15 @@ class PostGameReportGenerator:
             for player in team_players:
                 player_map[player['id']] = player['name']
             
-            # Get all plays for previous_events context
-            all_plays = play_by_play['plays']
+            frame = self._play_frame(game_data)
+            periods = frame.column('period')
+            event_types = frame.column('event_type')
+            own = (frame.team == team_id) & (frame.period <= 3)
             
-            # Process each play
-            for play_index, play in enumerate(all_plays):
-                details = play.get('details', {})
-                event_team = details.get('eventOwnerTeamId')
-                period = play.get('periodDescriptor', {}).get('number', 1)
-                
-                # Only process plays for this team
-                if event_team != team_id:
-                    continue
-                
-                # Skip if period is beyond 3 (overtime, etc.)
-                if period > 3:
-                    continue
-                
-                period_index = period - 1
-                event_type = play.get('typeDescKey', '')
-                
-                # Get previous events for context (last 10 events)
-                previous_events = all_plays[max(0, play_index-10):play_index]
+            # Process this team's plays (overtime and later periods are skipped)
+            for play_index in np.flatnonzero(own).tolist():
+                period_index = periods[play_index] - 1
+                event_type = event_types[play_index]
                 
                 # Calculate Game Score components for this play
                 if event_type == 'goal':
@@ -2529,7 +2514,7 @@ class PostGameReportGenerator:
                     game_scores[period_index] += 0.75
                     
                     # Calculate xG for this goal using ImprovedXGModel
-                    xg = self._calculate_shot_xg(details, 'goal', play, previous_events)
+                    xg = self._frame_shot_xg(frame, play_index)
                     xg_values[period_index] += xg
                     
                 elif event_type == 'shot-on-goal':
@@ -2537,19 +2522,19 @@ class PostGameReportGenerator:
                     game_scores[period_index] += 0.075
                     
                     # Calculate xG for this shot using ImprovedXGModel
-                    xg = self._calculate_shot_xg(details, 'shot-on-goal', play, previous_events)
+                    xg = self._frame_shot_xg(frame, play_index)
                     xg_values[period_index] += xg
                     
                 elif event_type == 'missed-shot':
                     # Missed shots don't count for Game Score but count for xG
-                    xg = self._calculate_shot_xg(details, 'missed-shot', play, previous_events)
+                    xg = self._frame_shot_xg(frame, play_index)
                     xg_values[period_index] += xg
                     
                 elif event_type == 'blocked-shot':
                     # Blocked shots: 0.05 points
                     game_scores[period_index] += 0.05
                     # Blocked shots also count for xG
-                    xg = self._calculate_shot_xg(details, 'blocked-shot', play, previous_events)
+                    xg = self._frame_shot_xg(frame, play_index)
                     xg_values[period_index] += xg
                     
                 elif event_type == 'penalty':
@@ -2581,7 +2566,7 @@ class PostGameReportGenerator:
             traceback.print_exc()
             return [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
     
-    def _calculate_shot_xg(self, shot_details, event_type, play_data, previous_events):
+    def _calculate_shot_xg(self, shot_details, event_type, play_data, previous_events, is_rebound=None, is_rush=None):
         """Calculate expected goals for a single shot using our ImprovedXGModel"""
         try:
             x_coord = shot_details.get('xCoord', 0)
@@ -2612,6 +2597,10 @@ class PostGameReportGenerator:
                 'score_differential': score_differential,
                 'team_id': team_id
             }
+            if is_rebound is not None:
+                shot_data['is_rebound'] = is_rebound
+            if is_rush is not None:
+                shot_data['is_rush'] = is_rush
             
             # Use ImprovedXGModel to calculate xG
             xg = self.xg_model.calculate_xg(shot_data, previous_events)
@@ -2818,6 +2807,7 @@ class PostGameReportGenerator:
         
         return team_colors.get(team_abbrev.upper(), '#666666')  # Default gray if team not found
     
+    @game_metric
     def _calculate_pass_metrics(self, game_data, team_id, team_side):
         """Calculate pass metrics by period for a team"""
         try:
@@ -2825,49 +2815,16 @@ class PostGameReportGenerator:
             if not play_by_play or 'plays' not in play_by_play:
                 return [0, 0, 0], [0, 0, 0], [0, 0, 0]  # east_west, north_south, behind_net
             
-            # Initialize period arrays (3 periods)
-            east_west_passes = [0, 0, 0]  # East to West and West to East
-            north_south_passes = [0, 0, 0]  # North to South and South to North
-            behind_net_passes = [0, 0, 0]  # Passes behind the net
+            frame = self._play_frame(game_data)
+            x_coord, y_coord = frame.x, frame.y
             
-            # Process each play
-            for play in play_by_play['plays']:
-                details = play.get('details', {})
-                event_team = details.get('eventOwnerTeamId')
-                period = play.get('periodDescriptor', {}).get('number', 1)
-                
-                # Only process plays for this team
-                if event_team != team_id:
-                    continue
-                
-                # Skip if period is beyond 3 (overtime, etc.)
-                if period > 3:
-                    continue
-                
-                period_index = period - 1
-                event_type = play.get('typeDescKey', '')
-                
-                # Get coordinates (robust to alternate schema)
-                x_coord = details.get('xCoord')
-                y_coord = details.get('yCoord')
-                if x_coord is None or y_coord is None:
-                    coords = details.get('coordinates', {})
-                    x_coord = coords.get('x', x_coord if x_coord is not None else 0)
-                    y_coord = coords.get('y', y_coord if y_coord is not None else 0)
-                
-                # Process all events that have coordinates (most puck events)
-                if x_coord != 0 or y_coord != 0:  # Only process events with coordinates
-                    # Check if this is a behind-net event
-                    if self._is_behind_net_pass(x_coord, y_coord):
-                        behind_net_passes[period_index] += 1
-                    
-                    # Check for East-West movement
-                    if self._is_east_west_pass(x_coord, y_coord):
-                        east_west_passes[period_index] += 1
-                    
-                    # Check for North-South movement
-                    if self._is_north_south_pass(x_coord, y_coord):
-                        north_south_passes[period_index] += 1
+            # This team's regulation events that have coordinates (most puck events)
+            located = (frame.team == team_id) & frame.regulation() & ((x_coord != 0) | (y_coord != 0))
+            
+            # Behind the net (X > 89 or X < -89), East-West (|X| > 10), North-South (|Y| > 8)
+            behind_net_passes = frame.per_period(located & (np.abs(x_coord) > 89))
+            east_west_passes = frame.per_period(located & (np.abs(x_coord) > 10))
+            north_south_passes = frame.per_period(located & (np.abs(y_coord) > 8))
             
             return east_west_passes, north_south_passes, behind_net_passes
             
@@ -2891,6 +2848,7 @@ class PostGameReportGenerator:
         # Any significant Y movement counts as North-South
         return abs(y_coord) > 8
     
+    @game_metric
     def _calculate_zone_metrics(self, game_data, team_id, team_side):
         """Calculate zone-specific metrics by period for a team"""
         try:
@@ -2922,24 +2880,25 @@ class PostGameReportGenerator:
             # so we can attribute a subsequent shot attempt against within a real time window.
             nzt_events = []  # each: {'period': int, 't': int, 'used': bool}
             
-            # Process each play
-            for play in play_by_play['plays']:
-                details = play.get('details', {})
-                event_team = details.get('eventOwnerTeamId')
-                period = play.get('periodDescriptor', {}).get('number', 1)
-                
-                # Skip if period is beyond 3 (overtime, etc.)
-                if period > 3:
-                    continue
-                
-                period_index = period - 1
-                event_type = play.get('typeDescKey', '')
-                x_coord = details.get('xCoord', 0)
-                y_coord = details.get('yCoord', 0)
-                t = self._parse_time_to_seconds(play.get('timeInPeriod', '00:00'))
+            frame = self._play_frame(game_data)
+            teams, periods, event_types = frame.column('team'), frame.column('period'), frame.column('event_type')
+            xs, ys, zones, times = frame.column('x'), frame.column('y'), frame.column('zone'), frame.column('seconds')
+            
+            # Shot origin and rush tags for every play, from one pass over the feed
+            annotations = frame.shot_annotations()
+            origin_zones, rush = annotations.origin_zone, annotations.rush
+            
+            # Process each regulation play (overtime and later periods are skipped)
+            for i in np.flatnonzero(frame.regulation()).tolist():
+                event_team = teams[i]
+                period_index = periods[i] - 1
+                event_type = event_types[i]
+                x_coord = xs[i]
+                y_coord = ys[i]
+                t = times[i]
                 
                 # Determine zone
-                zone_code = details.get('zoneCode')
+                zone_code = zones[i]
                 zone = self._determine_zone(x_coord, y_coord, zone_code)
                 
                 # Process team events
@@ -2953,7 +2912,7 @@ class PostGameReportGenerator:
                     
                     # Track shots by originating zone using possession logic
                     elif event_type in ['shot-on-goal', 'missed-shot', 'blocked-shot', 'goal']:
-                        origin_zone = self._get_shot_origin_zone(play, play_by_play['plays'], team_id)
+                        origin_zone = origin_zones[i]
                         
                         if origin_zone == 'offensive':
                             metrics['oz_originating_shots'][period_index] += 1
@@ -2963,7 +2922,7 @@ class PostGameReportGenerator:
                             metrics['dz_originating_shots'][period_index] += 1
                         
                         # Determine shot type using proper hockey logic
-                        if self._is_rush_shot(play, play_by_play['plays'], team_id):
+                        if rush[i]:
                             metrics['rush_sog'][period_index] += 1
                         else:
                             # All non-rush shots are considered forecheck/cycle shots
@@ -3004,6 +2963,7 @@ class PostGameReportGenerator:
                 'rush_sog': [0, 0, 0]
             }
     
+    @game_metric
     def _calculate_real_period_stats(self, game_data, team_id, team_side):
         """Calculate real period-by-period stats from NHL API data"""
         try:
@@ -3056,23 +3016,20 @@ class PostGameReportGenerator:
             
             prev_pp_advantage = 0
             
-            # Process each play
-            for play in play_by_play['plays']:
-                period_descriptor = play.get('periodDescriptor', {})
-                period = period_descriptor.get('number', 1)
-                
-                # Skip if period is beyond 3 (overtime, etc.)
-                if period > 3:
-                    continue
-                
-                period_index = period - 1
-                event_type = play.get('typeDescKey', '')
-                details = play.get('details', {})
-                event_team = details.get('eventOwnerTeamId')
-                event_id = play.get('eventId')
+            frame = self._play_frame(game_data)
+            teams, periods, event_types = frame.column('team'), frame.column('period'), frame.column('event_type')
+            situations, event_ids = frame.column('situation'), frame.column('event_id')
+            period_starts, penalty_minutes_col = frame.column('period_start'), frame.column('penalty_minutes')
+            
+            # Process each regulation play (overtime and later periods are skipped)
+            for i in np.flatnonzero(frame.regulation()).tolist():
+                period_index = periods[i] - 1
+                event_type = event_types[i]
+                event_team = teams[i]
+                event_id = event_ids[i]
                 
                 # Reset advantage tracking at start of new period
-                if play.get('timeInPeriod') == '00:00':
+                if period_starts[i]:
                     prev_pp_advantage = 0
                 
                 # Count shots on goal
@@ -3087,7 +3044,7 @@ class PostGameReportGenerator:
                         corsi_against[period_index] += 1
                 
                 # Check situation code for PP goals and tracking PP state
-                sit_code = play.get('situationCode', '')
+                sit_code = situations[i]
                 
                 current_pp_advantage = 0
                 if len(sit_code) == 4:
@@ -3125,8 +3082,7 @@ class PostGameReportGenerator:
 
                 # Count penalty minutes
                 if event_type == 'penalty' and event_team == team_id:
-                    penalty_minutes = details.get('penaltyMinutes', 2)
-                    pim[period_index] += penalty_minutes
+                    pim[period_index] += penalty_minutes_col[i]
                 
                 # Count hits
                 if event_type == 'hit' and event_team == team_id:
@@ -3212,88 +3168,21 @@ class PostGameReportGenerator:
     
     def _determine_zone(self, x_coord, y_coord, zone_code=None):
         """Determine which zone the coordinates are in, preferring zoneCode if available"""
-        if zone_code == 'O' or zone_code == 'offensive':
-            return 'offensive'
-        elif zone_code == 'D' or zone_code == 'defensive':
-            return 'defensive'
-        elif zone_code == 'N' or zone_code == 'neutral':
-            return 'neutral'
-            
-        # Fallback to coordinates (use absolute value of X to handle team side)
-        abs_x = abs(x_coord)
-        if abs_x > 25:
-            # We assume if it's in an end zone, it's offensive for the purposes of these metrics
-            # unless we have the side context to distinguish O from D.
-            return 'offensive'
-        else:
-            return 'neutral'
+        return zone_name(zone_code, x_coord)
     
     def _is_rush_shot(self, current_play, all_plays, team_id):
         """Determine if a shot attempt is from a rush.
 
         Hockey-logic proxy using only available PBP fields:
-        a same-team transition trigger in N/D within ~6-8 seconds before an OZ shot attempt.
+        a same-team transition trigger in N/D within ~8 seconds before an OZ shot attempt.
+        Read from the feed's one-pass shot annotations (see ShotAnnotations).
         """
         try:
-            current_team = current_play.get('details', {}).get('eventOwnerTeamId')
-            current_period = current_play.get('periodDescriptor', {}).get('number', 1)
-            current_time_str = current_play.get('timeInPeriod', '00:00')
-            
-            # Convert current time to seconds
-            current_time_seconds = self._parse_time_to_seconds(current_time_str)
-            
-            # Find current play index for more efficient searching
-            try:
-                play_index = all_plays.index(current_play)
-            except ValueError:
+            frame = PlayByPlayFrame.of({'plays': all_plays})
+            play_index = frame.index_of(current_play)
+            if play_index is None:
                 return False
-            
-            # Look back by time (not fixed event count) up to 8 seconds.
-            # Use zoneCode when present; fall back to transition-like event types.
-            for i in range(play_index - 1, max(-1, play_index - 60), -1):
-                prev_play = all_plays[i]
-                prev_team = prev_play.get('details', {}).get('eventOwnerTeamId')
-                prev_period = prev_play.get('periodDescriptor', {}).get('number', 1)
-                
-                # Only consider plays from the same team and period
-                if prev_team != current_team or prev_period != current_period:
-                    continue
-                
-                prev_time_str = prev_play.get('timeInPeriod', '00:00')
-                prev_time_seconds = self._parse_time_to_seconds(prev_time_str)
-                
-                # Check if within 8 seconds
-                time_diff = current_time_seconds - prev_time_seconds
-                if time_diff < 0:
-                    continue
-                if time_diff > 8:
-                    break
-                
-                # Check if previous event was in neutral or defensive zone
-                prev_zone = prev_play.get('details', {}).get('zoneCode', '')
-                
-                # Use zone code if available, otherwise use coordinates
-                is_nd_zone = False
-                if prev_zone:
-                    is_nd_zone = prev_zone in ['N', 'D']
-                else:
-                    # Note: We can't rely just on X <= 0 because it depends on team side.
-                    # But checking for explicit N/D zone code is safer if available.
-                    # If no zone code, fallback to type logic
-                    pass
-                
-                # If we have explicit N/D zone, great.
-                if is_nd_zone:
-                    return True
-                    
-                # Fallback: check event types that typically happen in N/D zone or transition
-                # If we don't have zone code, we rely on event type + time
-                prev_type = prev_play.get('typeDescKey', '')
-                if prev_type in ['takeaway', 'giveaway', 'block-shot', 'blocked-shot', 'hit', 'faceoff'] and time_diff <= 8:
-                     # This is a heuristic: defensive plays shortly before a shot likely mean transition
-                     return True
-            
-            return False
+            return bool(frame.shot_annotations().rush[play_index])
             
         except Exception as e:
             print(f"Error in rush shot detection: {e}")
@@ -3302,65 +3191,16 @@ class PostGameReportGenerator:
     def _get_shot_origin_zone(self, current_play, all_plays, team_id):
         """
         Determine the zone where the attack sequence leading to the shot originated.
-        Searches back for the possession-triggering event.
+        Read from the feed's one-pass shot annotations (see ShotAnnotations).
         """
         try:
-            current_team = current_play.get('details', {}).get('eventOwnerTeamId')
-            current_period = current_play.get('periodDescriptor', {}).get('number', 1)
-            current_time_seconds = self._parse_time_to_seconds(current_play.get('timeInPeriod', '00:00'))
-            
-            # Default to shot location
-            details = current_play.get('details', {})
-            x_coord = details.get('xCoord', 0)
-            y_coord = details.get('yCoord', 0)
-            zone_code = details.get('zoneCode')
-            shot_zone = self._determine_zone(x_coord, y_coord, zone_code)
-            
-            # Find current play index
-            try:
-                play_index = all_plays.index(current_play)
-            except ValueError:
-                return shot_zone
-
-            # Search back up to 10 events or 20 seconds
-            for idx in range(max(0, play_index - 1), max(-1, play_index - 11), -1):
-                prev_play = all_plays[idx]
-                
-                prev_details = prev_play.get('details', {})
-                prev_team = prev_details.get('eventOwnerTeamId')
-                prev_period = prev_play.get('periodDescriptor', {}).get('number', 1)
-                
-                # Only consider same team/period
-                if prev_team != current_team or prev_period != current_period:
-                    continue
-                    
-                prev_time_seconds = self._parse_time_to_seconds(prev_play.get('timeInPeriod', '00:00'))
-                time_diff = current_time_seconds - prev_time_seconds
-                if time_diff > 20: # Long possession likely changed context
-                    break
-                
-                prev_type = prev_play.get('typeDescKey', '')
-                prev_zone_code = prev_details.get('zoneCode', '')
-                prev_x = prev_details.get('xCoord', 0)
-                prev_y = prev_details.get('yCoord', 0)
-                
-                # Zone of the previous event
-                prev_zone = self._determine_zone(prev_x, prev_y, prev_zone_code)
-                
-                # Logic: If we found a takeaway, hit, or faceoff win in D or N zone, that's the origin
-                if prev_type in ['takeaway', 'hit', 'faceoff']:
-                     if prev_zone in ['defensive', 'neutral']:
-                         return prev_zone
-                
-                # If we see the play transition from D or N to O within the sequence
-                if prev_zone in ['defensive', 'neutral']:
-                    return prev_zone
-                    
-                # If we find a previous shot/goal, it indicates sustained OZ pressure
-                if prev_type in ['shot-on-goal', 'goal', 'missed-shot']:
-                    return 'offensive'
-
-            return shot_zone
+            frame = PlayByPlayFrame.of({'plays': all_plays})
+            play_index = frame.index_of(current_play)
+            if play_index is None:
+                # Default to shot location
+                details = current_play.get('details', {})
+                return self._determine_zone(details.get('xCoord', 0), details.get('yCoord', 0), details.get('zoneCode'))
+            return frame.shot_annotations().origin_zone[play_index]
             
         except Exception as e:
             print(f"Error determining shot origin zone: {e}")
@@ -4126,9 +3966,7 @@ class PostGameReportGenerator:
             home_team_color = team_colors.get(home_team_abbrev, colors.white)
             
             # Get advanced metrics using the analyzer
-            from advanced_metrics_analyzer import AdvancedMetricsAnalyzer
-            analyzer = AdvancedMetricsAnalyzer(game_data.get('play_by_play', {}))
-            metrics = analyzer.generate_comprehensive_report(away_team_id, home_team_id)
+            metrics = GameAnalysisContext.of(game_data).advanced_report(away_team_id, home_team_id)
             
             # Advanced Metrics Table with real data (title removed as requested)
             
@@ -4496,7 +4334,11 @@ class PostGameReportGenerator:
             from sprite_table_generator import create_sprite_analysis_tables
             
             analyzer = SpriteGoalAnalyzer()
-            sprite_data = analyzer.analyze_game_goals_by_team(game_id)
+            sprite_data = analyzer.analyze_game_goals_by_team(
+                game_id,
+                play_by_play=game_data.get('play_by_play'),
+                landing=game_data.get('landing'),
+            )
             
             if sprite_data:
                 # Add sprite tables at bottom with spacing.
@@ -0,0 +1,84 @@
+"""
+Micro-benchmark: ImprovedXGModel.calculate_xg (one shot dict at a time) vs
+calculate_xg_batch (NumPy arrays) on a full regular season of shot attempts.
+
+Shots are synthetic but shaped like NHL play-by-play: 1312 games at ~115
+attempts per game, rink coordinates, the usual shot/event type mix and
+occasional special-teams, rebound and rush context.
+
+    python scripts/benchmark_xg_batch.py [--shots 150000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models"))
+
+from improved_xg_model import ImprovedXGModel
+
+
+SEASON_GAMES = 1312
+ATTEMPTS_PER_GAME = 115
+
+
+def synthetic_shots(n: int, seed: int = 42) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "x_coords": rng.integers(-99, 100, n),
+        "y_coords": rng.integers(-42, 43, n),
+        "shot_types": rng.choice(["wrist", "snap", "slap", "backhand", "tip-in", "deflected", "wrap-around"],
+                                 n, p=[0.45, 0.17, 0.12, 0.1, 0.1, 0.03, 0.03]),
+        "event_types": rng.choice(["shot-on-goal", "missed-shot", "blocked-shot", "goal"], n, p=[0.5, 0.22, 0.23, 0.05]),
+        "strength_states": rng.choice(["5v5", "5v4", "4v5", "4v4", "3v3"], n, p=[0.8, 0.1, 0.06, 0.02, 0.02]),
+        "score_differentials": rng.integers(-3, 4, n),
+        "is_rebound": rng.random(n) < 0.06,
+        "is_rush": rng.random(n) < 0.1,
+    }
+
+
+def shot_dicts(shots: Dict[str, np.ndarray]) -> List[dict]:
+    keys = ("x_coord", "y_coord", "shot_type", "event_type", "strength_state", "score_differential", "is_rebound", "is_rush")
+    columns = [shots[k].tolist() for k in shots]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shots", type=int, default=SEASON_GAMES * ATTEMPTS_PER_GAME)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    model = ImprovedXGModel()
+    shots = synthetic_shots(args.shots)
+    dicts = shot_dicts(shots)
+
+    scalar = np.array([model.calculate_xg(d) for d in dicts])
+    batch = model.calculate_xg_batch(**shots)
+    max_diff = float(np.max(np.abs(scalar - batch))) if len(batch) else 0.0
+
+    t_scalar = best_of(args.repeat, lambda: [model.calculate_xg(d) for d in dicts])
+    t_batch = best_of(args.repeat, lambda: model.calculate_xg_batch(**shots))
+
+    print(f"Shots: {args.shots:,} (total xG {batch.sum():,.1f}, max |scalar - batch| = {max_diff:.2e})")
+    print(f"  calculate_xg       {t_scalar:8.3f}s  {args.shots / t_scalar:12,.0f} shots/s")
+    print(f"  calculate_xg_batch {t_batch:8.3f}s  {args.shots / t_batch:12,.0f} shots/s  ({t_scalar / t_batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,12 @@ _PROJECT_DIR = _SCRIPT_DIR.parent
 sys.path.insert(0, str(_PROJECT_DIR))
 sys.path.insert(0, str(_PROJECT_DIR / "models"))
 
-from playoff_predictor import PlayoffSeriesPredictor
+from playoff_predictor import PlayoffSeriesPredictor, solve_series_lattice, venue_game_prob_grid
 
 BASE_URL = 'https://api-web.nhle.com/v1'
 
 # Bump when export shape / meta fields change (check meta.export_version in JSON).
-PLAYOFF_EXPORT_VERSION = 16
+PLAYOFF_EXPORT_VERSION = 17
 
 
 def _series_projection_fields(r: dict) -> dict:
@@ -47,7 +47,8 @@ def _inner_series_simulations(iterations: int, fast: bool = False) -> int:
 
     The conditional R2–SCF grid calls this hundreds of times — large values dominate
     runtime. Defaults favor speed; use --accurate or higher --iterations for tighter
-    estimates, or set --inner-series-sims explicitly.
+    estimates, set --inner-series-sims explicitly, or use --series-mode exact to
+    replace the draws with the analytic lattice solver.
     """
     it = max(1, int(iterations))
     if fast:
@@ -401,6 +402,7 @@ def _build_projected_bracket_path(
     predictor,
     get_series_current_wins,
     cond_sims: int,
+    series_mode: str = "mc",
 ) -> dict:
     """
     One full projected schedule on the real bracket: R1 favorites, then R2–SCF for the
@@ -414,6 +416,7 @@ def _build_projected_bracket_path(
             away_wins=a_w,
             home_wins=h_w,
             simulations=cond_sims,
+            mode=series_mode,
             playoff_round=rnd,
         )
 
@@ -519,70 +522,24 @@ def _build_projected_bracket_path(
     }
 
 
-def run_tournament_monte_carlo(
-    iterations=50_000,
-    season: str = "20252026",
-    bracket_out: Path | None = None,
-    predictions_out: Path | None = None,
-    series_csv_out: Path | None = None,
-    series_winners_out: Path | None = None,
-    fast: bool = False,
-    accurate: bool = False,
-    inner_series_sims: int | None = None,
-):
-    predictor = PlayoffSeriesPredictor()
-    standings = fetch_standings("now")
-    if not standings:
-        print('Error fetching standings.')
-        return
-        
-    bracket = build_round1_bracket_from_standings(standings)
+_ENGINE_CHUNK = 250_000
 
-    if bracket_out:
-        bracket_out.parent.mkdir(parents=True, exist_ok=True)
-        with bracket_out.open("w") as f:
-            json.dump(bracket, f, indent=2)
-    
-    # Trackers for advancement
-    advancement = defaultdict(lambda: Counter()) # team -> {round_number: wins}
-
-    # Track opponent paths by round: opponent_counts[round][team][opp] += 1
-    opponent_counts = {
-        1: defaultdict(lambda: Counter()),
-        2: defaultdict(lambda: Counter()),
-        3: defaultdict(lambda: Counter()),
-        4: defaultdict(lambda: Counter()),
-    }
-    round_appearances = {
-        1: Counter(),
-        2: Counter(),
-        3: Counter(),
-        4: Counter(),
-    }
+
+def _empty_trackers():
+    advancement = defaultdict(lambda: Counter())  # team -> {round_number: wins}
+    # opponent_counts[round][team][opp] += 1
+    opponent_counts = {rnd: defaultdict(lambda: Counter()) for rnd in (1, 2, 3, 4)}
+    round_appearances = {rnd: Counter() for rnd in (1, 2, 3, 4)}
     # Empirical P(this East champ vs this West champ) before the Stanley Cup Final is played
     finals_pair_counts: Counter = Counter()
+    return advancement, opponent_counts, round_appearances, finals_pair_counts
 
-    # Pre-cache game win probs to speed up sims
-    prob_cache = {}
-
-    series_state = fetch_playoff_series_state(season) if season else {}
-        
-    def get_series_constants(away, home, round_no: int):
-        key = (int(round_no), tuple(sorted([away, home])))
-        if key not in prob_cache:
-            # Get consistent win probs for this matchup (round-aware priors)
-            p_away_at_home = predictor.calculate_game_win_prob(away, home, playoff_round=round_no)
-            p_home_at_away = predictor.calculate_game_win_prob(home, away, playoff_round=round_no)
-            p_away_at_away = 1 - p_home_at_away
-            prob_cache[key] = (away, home, p_away_at_home, p_away_at_away)
-        return prob_cache[key]
 
-    def get_series_current_wins(away, home):
-        key = frozenset({away, home})
-        s = series_state.get(key)
-        if not s:
-            return 0, 0
-        return int(s.get(away, 0)), int(s.get(home, 0))
+def _simulate_brackets_python(bracket, get_series_constants, get_series_current_wins, iterations, seed=None):
+    """Reference engine: one bracket at a time, one game at a time."""
+    if seed is not None:
+        random.seed(seed)
+    advancement, opponent_counts, round_appearances, finals_pair_counts = _empty_trackers()
 
     def record_matchup(round_no: int, team_a: str, team_b: str):
         opponent_counts[round_no][team_a][team_b] += 1
@@ -608,9 +565,6 @@ def run_tournament_monte_carlo(
                 winner = a_team if a_wins == 4 else h_team
                 return winner
 
-    print(f"🏒 STARTING {iterations:,} TOURNAMENT SIMULATIONS (High-Fidelity xG Mode)...")
-    start_time = time.time()
-    
     for _ in range(iterations):
         # Round 1 (Division Semis)
         e_r1_winners = [get_series_winner(1, m["away"], m["home"]) for m in bracket["East"]]
@@ -642,6 +596,135 @@ def run_tournament_monte_carlo(
         # Round 4 (Stanley Cup Finals)
         cup_winner = get_series_winner(4, e_r3_winner, w_r3_winner)
         advancement[cup_winner][4] += 1
+
+    return advancement, opponent_counts, round_appearances, finals_pair_counts
+
+
+def _simulate_brackets_numpy(bracket, get_series_constants, get_series_current_wins, iterations, seed=None):
+    """
+    Batch engine: all brackets advance together, one round at a time.
+
+    Each possible (round, away, home) pairing gets an exact series win probability
+    up front (solve_series_lattice over the per-venue game probabilities from the
+    current series wins), so a
+    series is a single uniform draw per bracket. Slot order is East R1 (away, home)
+    x4 then West x4; the left half of every subtree is "away", which is exactly the
+    orientation get_series_winner() sees in the Python engine (East away in the SCF).
+    """
+    import numpy as np
+
+    slots = [t for conf in ("East", "West") for m in bracket[conf] for t in (m["away"], m["home"])]
+    teams = sorted(set(slots))
+    index = {t: i for i, t in enumerate(teams)}
+    n_teams = len(teams)
+    slot_idx = np.array([index[t] for t in slots], dtype=np.int16)
+
+    # series_p[rnd][away, home] = P(away wins that series)
+    series_p = {rnd: np.zeros((n_teams, n_teams)) for rnd in (1, 2, 3, 4)}
+    for rnd in (1, 2, 3, 4):
+        width = 2 ** rnd
+        for start in range(0, len(slots), width):
+            half = width // 2
+            for away in slots[start:start + half]:
+                for home in slots[start + half:start + width]:
+                    a_team, h_team, p_ath, p_ata = get_series_constants(away, home, rnd)
+                    a_w, h_w = get_series_current_wins(a_team, h_team)
+                    p = solve_series_lattice(venue_game_prob_grid(p_ath, p_ata), a_w, h_w)["away_series_win_prob"]
+                    series_p[rnd][index[a_team], index[h_team]] = p
+
+    rng = np.random.default_rng(seed)
+    adv = np.zeros((5, n_teams), dtype=np.int64)
+    pairs = np.zeros((5, n_teams * n_teams), dtype=np.int64)
+    finals = np.zeros(n_teams * n_teams, dtype=np.int64)
+
+    remaining = int(iterations)
+    while remaining > 0:
+        n = min(_ENGINE_CHUNK, remaining)
+        remaining -= n
+        alive = np.broadcast_to(slot_idx, (n, slot_idx.size))
+        for rnd in (1, 2, 3, 4):
+            away = alive[:, 0::2].astype(np.intp)
+            home = alive[:, 1::2].astype(np.intp)
+            winners = np.where(rng.random(away.shape) < series_p[rnd][away, home], away, home)
+            pairs[rnd] += np.bincount((away * n_teams + home).ravel(), minlength=n_teams * n_teams)
+            adv[rnd] += np.bincount(winners.ravel(), minlength=n_teams)
+            if rnd == 3:
+                finals += np.bincount(winners[:, 0] * n_teams + winners[:, 1], minlength=n_teams * n_teams)
+            alive = winners
+
+    advancement, opponent_counts, round_appearances, finals_pair_counts = _empty_trackers()
+    for rnd in (1, 2, 3, 4):
+        for t in np.flatnonzero(adv[rnd]):
+            advancement[teams[t]][rnd] += int(adv[rnd][t])
+        for code in np.flatnonzero(pairs[rnd]):
+            a_team, h_team = teams[code // n_teams], teams[code % n_teams]
+            c = int(pairs[rnd][code])
+            opponent_counts[rnd][a_team][h_team] += c
+            opponent_counts[rnd][h_team][a_team] += c
+            round_appearances[rnd][a_team] += c
+            round_appearances[rnd][h_team] += c
+    for code in np.flatnonzero(finals):
+        finals_pair_counts[(teams[code // n_teams], teams[code % n_teams])] += int(finals[code])
+
+    return advancement, opponent_counts, round_appearances, finals_pair_counts
+
+
+def run_tournament_monte_carlo(
+    iterations=50_000,
+    season: str = "20252026",
+    bracket_out: Path | None = None,
+    predictions_out: Path | None = None,
+    series_csv_out: Path | None = None,
+    series_winners_out: Path | None = None,
+    fast: bool = False,
+    accurate: bool = False,
+    inner_series_sims: int | None = None,
+    engine: str = "numpy",
+    seed: int | None = None,
+    series_mode: str = "mc",
+):
+    predictor = PlayoffSeriesPredictor()
+    standings = fetch_standings("now")
+    if not standings:
+        print('Error fetching standings.')
+        return
+        
+    bracket = build_round1_bracket_from_standings(standings)
+
+    if bracket_out:
+        bracket_out.parent.mkdir(parents=True, exist_ok=True)
+        with bracket_out.open("w") as f:
+            json.dump(bracket, f, indent=2)
+    
+    # Pre-cache game win probs to speed up sims
+    prob_cache = {}
+
+    series_state = fetch_playoff_series_state(season) if season else {}
+        
+    def get_series_constants(away, home, round_no: int):
+        key = (int(round_no), tuple(sorted([away, home])))
+        if key not in prob_cache:
+            # Get consistent win probs for this matchup (round-aware priors)
+            p_away_at_home = predictor.calculate_game_win_prob(away, home, playoff_round=round_no)
+            p_home_at_away = predictor.calculate_game_win_prob(home, away, playoff_round=round_no)
+            p_away_at_away = 1 - p_home_at_away
+            prob_cache[key] = (away, home, p_away_at_home, p_away_at_away)
+        return prob_cache[key]
+
+    def get_series_current_wins(away, home):
+        key = frozenset({away, home})
+        s = series_state.get(key)
+        if not s:
+            return 0, 0
+        return int(s.get(away, 0)), int(s.get(home, 0))
+
+    print(f"🏒 STARTING {iterations:,} TOURNAMENT SIMULATIONS (High-Fidelity xG Mode, {engine} engine)...")
+    start_time = time.time()
+
+    simulate = _simulate_brackets_python if engine == "python" else _simulate_brackets_numpy
+    advancement, opponent_counts, round_appearances, finals_pair_counts = simulate(
+        bracket, get_series_constants, get_series_current_wins, iterations, seed=seed
+    )
         
     duration = time.time() - start_time
     print(f"✅ Simulation Complete in {duration:.1f}s\n")
@@ -688,6 +771,7 @@ def run_tournament_monte_carlo(
                     away_wins=a_w,
                     home_wins=h_w,
                     simulations=cond_sims,
+                    mode=series_mode,
                     playoff_round=1,
                 )
                 series_odds[conf].append({
@@ -729,7 +813,7 @@ def run_tournament_monte_carlo(
         # Ordering (away/home) matches get_series_winner() in the Monte Carlo loop.
 
         projected_bracket_path = _build_projected_bracket_path(
-            bracket, series_odds, predictor, get_series_current_wins, cond_sims
+            bracket, series_odds, predictor, get_series_current_wins, cond_sims, series_mode=series_mode
         )
 
         def _append_conditional_series(
@@ -748,6 +832,7 @@ def run_tournament_monte_carlo(
                 away_wins=a_w,
                 home_wins=h_w,
                 simulations=cond_sims,
+                mode=series_mode,
                 playoff_round=playoff_round,
             )
             out_list.append(
@@ -885,6 +970,7 @@ def run_tournament_monte_carlo(
                     away_wins=a_w,
                     home_wins=h_w,
                     simulations=cond_sims,
+                    mode=series_mode,
                     playoff_round=rnd,
                 )
                 series_prob_cache[key] = (
@@ -930,6 +1016,7 @@ def run_tournament_monte_carlo(
                 "export_version": PLAYOFF_EXPORT_VERSION,
                 "iterations": int(iterations),
                 "series_monte_carlo_draws": int(cond_sims),
+                "series_mode": series_mode,
                 "season": season,
                 "source": "simulate_2026_playoffs_master.py",
             },
@@ -965,6 +1052,7 @@ def run_tournament_monte_carlo(
                 "export_version": PLAYOFF_EXPORT_VERSION,
                 "iterations": int(iterations),
                 "series_monte_carlo_draws": int(cond_sims),
+                "series_mode": series_mode,
                 "season": season,
                 "source": "simulate_2026_playoffs_master.py",
                 "all_series_note": (
@@ -1057,6 +1145,19 @@ if __name__ == '__main__':
         metavar="N",
         help="Override inner simulate_series draw count (default: scales with --iterations and --fast).",
     )
+    parser.add_argument(
+        "--engine",
+        choices=["numpy", "python"],
+        default="numpy",
+        help="Bracket engine: vectorized NumPy batch (default) or the per-game Python reference loop.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed the bracket RNG for reproducible runs.")
+    parser.add_argument(
+        "--series-mode",
+        choices=["mc", "exact"],
+        default="mc",
+        help="Per-series projections: Monte Carlo draws (default) or the exact lattice solver (ignores inner sims).",
+    )
     parser.add_argument("--season", type=str, default="20252026", help="Season string for playoff-series endpoint (e.g. 20252026)")
     parser.add_argument("--bracket-out", type=str, default="data/official_2026_bracket_current.json")
     parser.add_argument("--predictions-out", type=str, default="data/playoff_predictions_2026.json")
@@ -1089,4 +1190,7 @@ if __name__ == '__main__':
         fast=bool(args.fast),
         accurate=bool(args.accurate),
         inner_series_sims=args.inner_series_sims,
+        engine=args.engine,
+        seed=args.seed,
+        series_mode=args.series_mode,
     )
@@ -319,7 +319,7 @@ class TeamReportGenerator(PostGameReportGenerator):
                 continue
             
             try:
-                game_data = self.api.get_comprehensive_game_data(str(game_id))
+                game_data = self.api.get_game_bundle(str(game_id), include_landing=False)
                 if not game_data or 'boxscore' not in game_data:
                     continue
                 
@@ -0,0 +1,59 @@
+import json
+
+from utils.event_cursor import EventLogCursor, LatestByGameIndex, iter_new_events
+from utils.event_store import load_latest_by_game_id
+
+
+def _write(path, rows, mode="a"):
+    with open(path, mode) as f:
+        for r in rows:
+            f.write(json.dumps(r) + "\n")
+
+
+def test_cursor_yields_only_new_records(tmp_path):
+    log = tmp_path / "prediction_events.jsonl"
+    _write(log, [{"game_id": "1"}, {"game_id": "2"}])
+    assert [r["game_id"] for r in iter_new_events(log, "t", state_dir=tmp_path)] == ["1", "2"]
+    assert list(iter_new_events(log, "t", state_dir=tmp_path)) == []
+
+    _write(log, [{"game_id": "3"}])
+    # A partially written line is left for the next read.
+    with open(log, "a") as f:
+        f.write('{"game_id": "4"')
+    cursor = EventLogCursor(log, "t", state_dir=tmp_path)
+    assert [r["game_id"] for r in cursor.read_new()] == ["3"]
+    # Not committed: a new cursor re-reads the same batch.
+    assert [r["game_id"] for r in EventLogCursor(log, "t", state_dir=tmp_path).read_new()] == ["3"]
+    cursor.commit()
+
+    with open(log, "a") as f:
+        f.write("}\n")
+    assert [r["game_id"] for r in iter_new_events(log, "t", state_dir=tmp_path)] == ["4"]
+
+
+def test_cursor_rewinds_after_compaction(tmp_path):
+    log = tmp_path / "outcome_events.jsonl"
+    _write(log, [{"game_id": "1", "w": "A"}, {"game_id": "1", "w": "B"}, {"game_id": "2", "w": "C"}])
+    list(iter_new_events(log, "t", state_dir=tmp_path))
+
+    _write(log, [{"game_id": "1", "w": "B"}, {"game_id": "2", "w": "C"}], mode="w")
+    cursor = EventLogCursor(log, "t", state_dir=tmp_path)
+    assert len(cursor.read_new()) == 2
+    assert cursor.rewound
+
+
+def test_latest_index_matches_full_scan(tmp_path):
+    log = tmp_path / "prediction_events.jsonl"
+    _write(log, [{"game_id": "1", "p": 0.1}, {"game_id": "2", "p": 0.2}])
+    LatestByGameIndex(log, "view", state_dir=tmp_path).refresh()
+
+    _write(log, [{"game_id": "1", "p": 0.3}, {"game_id": "3", "p": 0.4}])
+    idx = LatestByGameIndex(log, "view", state_dir=tmp_path)
+    latest = idx.refresh()
+    assert idx.changed == ["1", "3"]
+    assert latest == load_latest_by_game_id(log)
+    assert list(latest) == list(load_latest_by_game_id(log))
+
+    again = LatestByGameIndex(log, "view", state_dir=tmp_path)
+    again.refresh()
+    assert again.changed == []
@@ -0,0 +1,67 @@
+import json
+
+from utils.event_store import load_latest_by_game_id
+from utils.event_store_sqlite import SQLiteEventStore
+
+
+def _write(path, rows, mode="a"):
+    with open(path, mode) as f:
+        for r in rows:
+            f.write(json.dumps(r) + "\n")
+
+
+def test_sync_matches_jsonl_and_is_incremental(tmp_path):
+    log = tmp_path / "prediction_events.jsonl"
+    _write(log, [
+        {"game_id": "1", "date": "2026-01-01", "home_win_prob": 0.5},
+        {"game_id": "2", "date": "2026-01-03", "home_win_prob": 0.6},
+        {"game_id": "1", "date": "2026-01-01", "home_win_prob": 0.7},
+    ])
+    store = SQLiteEventStore(tmp_path / "events.sqlite3")
+    assert store.sync_jsonl("prediction", log) == 3
+    assert store.latest_by_game_id("prediction") == load_latest_by_game_id(log)
+    assert store.sync_jsonl("prediction", log) == 0
+
+    _write(log, [{"game_id": "3", "date": "2026-02-01", "home_win_prob": 0.4}])
+    assert store.sync_jsonl("prediction", log) == 1
+    assert [r["game_id"] for r in store.latest_between("prediction", "2026-01-01", "2026-01-31")] == ["1", "2"]
+    assert store.latest_for_game("prediction", "1")["home_win_prob"] == 0.7
+    assert len(store.events_for_game("prediction", "1")) == 2
+
+
+def test_rewritten_log_triggers_rebuild(tmp_path):
+    log = tmp_path / "outcome_events.jsonl"
+    _write(log, [{"game_id": "1", "actual_winner": "BOS"}, {"game_id": "1", "actual_winner": "TOR"}])
+    store = SQLiteEventStore(tmp_path / "events.sqlite3")
+    store.sync_jsonl("outcome", log)
+
+    # Compaction rewrites the file with only the latest record per game.
+    _write(log, [{"game_id": "1", "actual_winner": "TOR"}], mode="w")
+    assert store.sync_jsonl("outcome", log) == 1
+    assert store.count("outcome") == 1
+
+
+def test_append_api_writes_indexed_rows(tmp_path):
+    store = SQLiteEventStore(tmp_path / "events.sqlite3", paths={"outcome": tmp_path / "outcome_events.jsonl"})
+    store.append_outcome_event(
+        game_id="2025020001", date="2025-10-07", away_team="CHI", home_team="FLA",
+        actual_away_score=2, actual_home_score=3, actual_winner="FLA", lead_after_p1=1,
+    )
+    row = store.latest_for_game("outcome", "2025020001")
+    assert row["event_type"] == "outcome" and row["lead_after_p1"] == 1
+
+
+def test_appends_write_through_to_the_jsonl_log(tmp_path):
+    log = tmp_path / "prediction_events.jsonl"
+    store = SQLiteEventStore(tmp_path / "events.sqlite3", paths={"prediction": log})
+    store.append_prediction_event({"game_id": "1", "date": "2026-01-01", "home_win_prob": 0.5})
+    _write(log, [{"game_id": "2", "date": "2026-01-02", "home_win_prob": 0.6}])
+    store.append_prediction_event({"game_id": "1", "date": "2026-01-01", "home_win_prob": 0.7})
+
+    # The log holds every append; a sync neither drops nor re-imports them.
+    assert store.sync_jsonl("prediction") == 0
+    assert store.count("prediction") == 3
+    assert store.latest_by_game_id("prediction") == load_latest_by_game_id(log)
+
+    rebuilt = SQLiteEventStore(tmp_path / "rebuilt.sqlite3", paths={"prediction": log})
+    assert rebuilt.sync_jsonl("prediction") == 3
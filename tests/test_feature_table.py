@@ -0,0 +1,54 @@
+import contextlib
+import io
+from datetime import date, timedelta
+
+import pandas as pd
+
+import models.train_xgboost_model as txm
+
+
+def _season(n_days=24):
+    teams = ["BOS", "TOR", "EDM", "COL", "NYR", "NJD"]
+    start = date(2025, 10, 8)
+    preds = []
+    for d in range(n_days):
+        for i in range(0, len(teams), 2):
+            away, home = teams[(i + d) % len(teams)], teams[(i + d + 1) % len(teams)]
+            h, a = (d + i) % 5, (d * 3 + i) % 4
+            preds.append({
+                "game_id": f"2025{d:03d}{i}",
+                "date": (start + timedelta(days=d)).isoformat(),
+                "away_team": away,
+                "home_team": home,
+                "actual_winner": home if h >= a else away,
+                "actual_home_score": h + (1 if h == a else 0),
+                "actual_away_score": a,
+                "metrics_used": {"home_xg": 2.0 + i / 3, "away_xg": 2.5 - d % 3 / 4, "lead_after_p1": 1 if d % 3 == 0 else 0},
+            })
+    return preds
+
+
+def test_feature_table_appends_new_games_and_matches_full_replay(tmp_path, monkeypatch):
+    monkeypatch.setattr(txm.StandingsTracker, "get_current_standings", lambda self, date=None: {})
+    path = tmp_path / "feature_table.pkl"
+    preds = _season()
+    replays = []
+    original_replay = txm._replay_games
+    monkeypatch.setattr(txm, "_replay_games", lambda games, *a: (replays.append(len(games)), original_replay(games, *a))[1])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        txm.build_feature_table(preds[:-6], path=path)
+        incremental = txm.build_feature_table(preds, path=path)
+        cached = txm.build_feature_table(preds, path=path)
+        full = txm.extract_features_chronologically(preds)
+    assert replays == [len(preds) - 6, 6, len(preds)]
+    pd.testing.assert_frame_equal(incremental, full)
+    pd.testing.assert_frame_equal(cached, full)
+
+    # Correcting an already-cached game replays everything.
+    preds[3] = dict(preds[3], actual_home_score=9)
+    with contextlib.redirect_stdout(io.StringIO()):
+        rebuilt = txm.build_feature_table(preds, path=path)
+        full = txm.extract_features_chronologically(preds)
+    assert replays[-2] == len(preds)
+    pd.testing.assert_frame_equal(rebuilt, full)
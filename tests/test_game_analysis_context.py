@@ -0,0 +1,63 @@
+import pickle
+from collections import defaultdict
+
+from analyzers.game_analysis_context import GameAnalysisContext, game_metric
+
+
+def _game(game_id=2025020001, plays=3):
+    return {
+        'game_id': str(game_id),
+        'boxscore': {'id': game_id, 'awayTeam': {'score': 2}, 'homeTeam': {'score': 1}, 'gameState': 'OFF'},
+        'play_by_play': {'plays': [{'eventId': i, 'sortOrder': i, 'typeDescKey': 'hit'} for i in range(plays)]},
+    }
+
+
+class _Calculator:
+    calls = 0
+
+    @game_metric
+    def totals(self, game_data, team_side):
+        _Calculator.calls += 1
+        return {'side': team_side, 'shots': [1, 2, 3]}
+
+
+def test_metrics_are_computed_once_per_game_state_and_copied_out():
+    _Calculator.calls = 0
+    game = _game()
+    first = _Calculator().totals(game, 'away')
+    first['shots'].append(99)
+
+    # A second calculator and an equal refetched payload share the result.
+    assert _Calculator().totals(_game(), 'away') == {'side': 'away', 'shots': [1, 2, 3]}
+    assert _Calculator.calls == 1
+
+    _Calculator().totals(game, 'home')
+    _Calculator().totals(_game(plays=4), 'away')
+    _Calculator().totals(_game(game_id=2025020002), 'away')
+    assert _Calculator.calls == 4
+
+
+def test_payloads_without_game_id_only_share_with_themselves():
+    game = _game()
+    del game['game_id'], game['boxscore']['id']
+    other = pickle.loads(pickle.dumps(game))
+
+    context = GameAnalysisContext.of(game)
+    assert GameAnalysisContext.of(game) is context
+    assert GameAnalysisContext.of(other) is not context
+    assert context.game_id is None
+
+
+def test_export_and_merge_carry_picklable_results():
+    context = GameAnalysisContext.of(_game(game_id=2025020003))
+    context.get('xg', lambda: (1.5, 2.25))
+    context.get('report', lambda: defaultdict(lambda: 0))
+
+    exported = context.export()
+    assert exported == {'xg': (1.5, 2.25)}
+
+    parent = GameAnalysisContext(_game(game_id=2025020003), ('parent',))
+    parent.get('hdc', lambda: (4, 5))
+    parent.merge(dict(exported, hdc=(0, 0)))
+    assert parent.get('xg', lambda: None) == (1.5, 2.25)
+    assert parent.get('hdc', lambda: None) == (4, 5)
@@ -0,0 +1,89 @@
+import random
+
+from analyzers.live_game_session import LiveGameSession
+
+AWAY, HOME = 6, 10
+ROSTER = [{'playerId': 100 + i, 'teamId': AWAY if i < 20 else HOME} for i in range(40)]
+
+
+def _plays(n, seed=7):
+    rng = random.Random(seed)
+    plays = []
+    for i in range(n):
+        event_type = rng.choice(['faceoff', 'shot-on-goal', 'missed-shot', 'blocked-shot', 'goal',
+                                 'hit', 'giveaway', 'takeaway', 'penalty', 'stoppage'])
+        details = {'eventOwnerTeamId': rng.choice([AWAY, HOME]),
+                   'xCoord': rng.randint(-99, 99), 'yCoord': rng.randint(-42, 42)}
+        if event_type == 'faceoff':
+            details['winningPlayerId'] = 100 + rng.randrange(40)
+        if event_type == 'penalty':
+            details['penaltyMinutes'] = details['duration'] = rng.choice([2, 4, 5])
+        plays.append({'sortOrder': i * 10, 'eventId': i + 1, 'typeDescKey': event_type,
+                      'situationCode': rng.choice(['1551', '1451', '1541']), 'details': details})
+    return plays
+
+
+def _state(session):
+    return session.counts, session.faceoffs, session.goals, session.likelihood
+
+
+def _session():
+    return LiveGameSession('2025020001', xg=lambda x, y, shot_type: abs(x) / 1000)
+
+
+def test_polls_apply_only_new_plays_and_match_a_full_read():
+    plays = _plays(300)
+    live = _session()
+    seen = 0
+    for n in (0, 25, 26, 26, 180, 300):
+        new_plays = live.advance(plays[:n], AWAY, HOME, ROSTER)
+        assert new_plays == plays[seen:n]
+        seen = n
+
+    full = _session()
+    full.advance(plays, AWAY, HOME, ROSTER)
+    assert _state(live) == _state(full)
+    assert live.counts['away']['faceoff_wins'] + live.counts['home']['faceoff_wins'] == live.faceoffs
+
+
+def test_withdrawn_or_edited_play_rebuilds_from_first_play():
+    plays = _plays(120)
+    live = _session()
+    live.advance(plays, AWAY, HOME, ROSTER)
+    live.shots_data.append({'x': 1})
+
+    # The last play is withdrawn.
+    assert live.advance(plays[:119], AWAY, HOME, ROSTER) == plays[:119]
+    assert live.shots_data == []
+
+    # The last play read is replaced by a different event.
+    edited = plays[:118] + [dict(plays[118], eventId=999)]
+    assert live.advance(edited + plays[119:], AWAY, HOME, ROSTER) == edited + plays[119:]
+
+    expected = _session()
+    expected.advance(edited + plays[119:], AWAY, HOME, ROSTER)
+    assert _state(live) == _state(expected)
+
+
+def test_goal_edited_after_it_was_read_rebuilds():
+    plays = _plays(120)
+    goal_index = next(i for i, p in enumerate(plays) if p['typeDescKey'] == 'goal')
+    live = _session()
+    live.advance(plays, AWAY, HOME, ROSTER)
+    live.shots_data.append({'x': 1})
+
+    # The scorer changes and an assist is filled in after the goal was posted.
+    edited = [dict(p) for p in plays]
+    edited[goal_index] = dict(plays[goal_index], details=dict(plays[goal_index]['details'],
+                                                              scoringPlayerId=7, assist1PlayerId=8))
+    assert live.advance(edited, AWAY, HOME, ROSTER) == edited
+    assert live.shots_data == []
+    assert live.goals[0]['details']['scoringPlayerId'] == 7
+    assert live.goals[0]['details']['assist1PlayerId'] == 8
+
+    expected = _session()
+    expected.advance(edited, AWAY, HOME, ROSTER)
+    assert _state(live) == _state(expected)
+
+    # An unchanged feed is not rebuilt.
+    assert live.advance(edited, AWAY, HOME, ROSTER) == []
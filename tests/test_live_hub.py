@@ -0,0 +1,68 @@
+import threading
+import time
+
+from utils.live_hub import LiveGameHub
+
+FAST = {'critical': 0.05, 'late': 0.05, 'live': 0.05, 'intermission': 0.05}
+
+
+def _hub(states, idle_timeout=60, sweep_interval=60, on_sweep=None):
+    calls = []
+
+    def compute(game_id):
+        calls.append(game_id)
+        state = states[min(len(calls), len(states)) - 1]
+        if state == 'error':
+            return {'error': 'boom'}, 500
+        return {'game_state': state, 'tick': len(calls)}, 200
+
+    hub = LiveGameHub(compute, lambda game_id, payload: {'game_state': payload['game_state']}, on_sweep=on_sweep,
+                      idle_timeout=idle_timeout, sweep_interval=sweep_interval,
+                      intervals=FAST, backoff_base=0.01, requests_per_minute=6000)
+    return hub, calls
+
+
+def test_subscribers_share_one_computation_per_tick():
+    hub, calls = _hub(['LIVE'] * 4 + ['FINAL'])
+    received = [[] for _ in range(20)]
+
+    def watch(events):
+        for snapshot in hub.subscribe('2025020001', heartbeat=1):
+            if snapshot is not None:
+                events.append((snapshot['payload']['tick'], snapshot['final']))
+
+    threads = [threading.Thread(target=watch, args=(events,)) for events in received]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    hub.stop()
+
+    assert len(calls) == 5
+    for events in received:
+        assert events[-1] == (5, True)
+        assert [tick for tick, _ in events] == sorted(tick for tick, _ in events)
+    # Polling readers get the cached snapshot without another computation.
+    assert hub.snapshot('2025020001')['payload']['tick'] == 5
+    assert len(calls) == 5
+
+
+def test_error_is_served_only_until_a_good_snapshot_and_idle_games_are_forgotten():
+    sweeps = []
+    hub, calls = _hub(['error', 'LIVE', 'error', 'LIVE'], idle_timeout=0.2, sweep_interval=0.1, on_sweep=sweeps.append)
+    first = hub.snapshot('7', timeout=5)
+    assert first['status'] == 500
+
+    deadline = time.time() + 5
+    while len(calls) < 4 and time.time() < deadline:
+        time.sleep(0.01)
+        assert hub.snapshot('7')['status'] in (500, 200)
+    assert hub.snapshot('7')['status'] == 200
+
+    deadline = time.time() + 5
+    while hub.poller.tracked and time.time() < deadline:
+        time.sleep(0.05)
+    hub.stop()
+    assert not hub.poller.tracked and '7' not in hub._snapshots
+    # The caller hears which games are still watched, so it can free the rest.
+    assert {'7'} in sweeps and sweeps[-1] == set()
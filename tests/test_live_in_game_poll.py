@@ -0,0 +1,63 @@
+import random
+
+import live_in_game_predictions as lp
+from utils.player_directory import PlayerDirectory
+
+AWAY, HOME = 6, 10
+ROSTER = [{'playerId': 100 + i, 'teamId': AWAY if i < 20 else HOME} for i in range(40)]
+
+
+def _plays(n, seed=5):
+    rng = random.Random(seed)
+    plays = []
+    for i in range(n):
+        event_type = rng.choice(['faceoff', 'shot-on-goal', 'missed-shot', 'blocked-shot', 'goal', 'hit', 'stoppage'])
+        plays.append({'sortOrder': i * 10, 'eventId': i + 1, 'typeDescKey': event_type, 'situationCode': '1551',
+                      'periodDescriptor': {'number': 1 + i * 3 // n}, 'timeInPeriod': f"{i % 20:02d}:00",
+                      'details': {'eventOwnerTeamId': rng.choice([AWAY, HOME]), 'shootingPlayerId': 100 + rng.randrange(40),
+                                  'xCoord': rng.randint(-99, 99), 'yCoord': rng.randint(-42, 42)}})
+    return plays
+
+
+class _Api:
+    def __init__(self):
+        self.plays, self.sog = [], 0
+
+    def get_game_bundle(self, game_id, include_landing=False):
+        team = lambda team_id, abbrev: {'id': team_id, 'abbrev': abbrev, 'sog': self.sog, 'score': 0}
+        return {
+            'boxscore': {'gameState': 'LIVE', 'awayTeam': team(AWAY, 'BOS'), 'homeTeam': team(HOME, 'TOR'),
+                         'periodDescriptor': {'number': 1}},
+            'play_by_play': {'plays': self.plays, 'rosterSpots': ROSTER},
+        }
+
+
+class _Reports:
+    def _calculate_improved_xg_live(self, x, y, shot_type):
+        return 0.1
+
+
+def _predictor(tmp_path, monkeypatch):
+    monkeypatch.setattr(lp, 'get_player_directory', lambda: PlayerDirectory(tmp_path / 'players.json'))
+    predictor = lp.LiveInGamePredictor.__new__(lp.LiveInGamePredictor)
+    predictor.api, predictor.report_generator = _Api(), _Reports()
+    predictor._sessions, predictor._sessions_lock = {}, lp.threading.Lock()
+    return predictor
+
+
+def test_failed_poll_does_not_lose_the_plays_it_read(tmp_path, monkeypatch):
+    plays = _plays(160)
+    live, fresh = _predictor(tmp_path, monkeypatch), _predictor(tmp_path, monkeypatch)
+    live.api.plays = plays[:60]
+    assert live.get_live_game_data('2025020001') is not None
+
+    # The next poll reads new plays, then fails on a boxscore without shots on goal.
+    live.api.plays, live.api.sog = plays, None
+    assert live.get_live_game_data('2025020001') is None
+
+    live.api.sog = fresh.api.sog = 0
+    fresh.api.plays = plays
+    shots = live.get_live_game_data('2025020001')['shots_data']
+    expected = fresh.get_live_game_data('2025020001')['shots_data']
+    assert len(shots) == len(expected) > 0
+    assert shots == expected
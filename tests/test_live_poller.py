@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from utils.live_poller import LivePoller, RequestBudget, backoff_delay, poll_interval
+
+
+def test_interval_follows_game_state():
+    assert poll_interval({'game_state': 'LIVE', 'period': 1, 'seconds_remaining': 900}) == 20.0
+    assert poll_interval({'game_state': 'LIVE', 'period': 2, 'in_intermission': True}) == 60.0
+    assert poll_interval({'game_state': 'LIVE', 'period': 3, 'seconds_remaining': 250}) == 10.0
+    assert poll_interval({'game_state': 'CRIT', 'period': 3, 'seconds_remaining': 90}) == 5.0
+    assert poll_interval({'game_state': 'LIVE', 'period': 2, 'situation_code': '0651'}) == 5.0
+    assert poll_interval({'game_state': 'LIVE', 'period': 4}) == 5.0
+    assert poll_interval({'game_state': 'OFF'}) is None
+    assert poll_interval({'period': 1}, {'live': 30}) == 30
+
+
+def test_backoff_is_jittered_exponential_and_capped():
+    assert backoff_delay(1, base=5, rng=lambda: 0.5) == 5
+    assert backoff_delay(3, base=5, rng=lambda: 0.0) == 10
+    assert backoff_delay(3, base=5, rng=lambda: 1.0) == 30
+    assert backoff_delay(20, base=5, cap=300, rng=lambda: 1.0) == 300
+
+
+def test_budget_waits_for_tokens():
+    now = [0.0]
+    budget = RequestBudget(per_minute=60, burst=2, clock=lambda: now[0],
+                           sleep=lambda s: now.__setitem__(0, now[0] + s))
+    assert budget.acquire() == 0 and budget.acquire() == 0
+    assert budget.acquire() == pytest.approx(1.0)
+    assert budget.acquire(2) == pytest.approx(2.0)
+
+
+def test_games_are_polled_concurrently_until_final():
+    fast = {'critical': 0.01, 'late': 0.01, 'live': 0.01, 'intermission': 0.01}
+    states = {'a': ['error', 'LIVE', 'OFF'], 'b': ['LIVE', 'LIVE', 'FINAL']}
+    calls = {'a': 0, 'b': 0}
+    running, peak = set(), [0]
+    lock = threading.Lock()
+    finals = []
+
+    def poll(game_id):
+        with lock:
+            state = states[game_id][calls[game_id]]
+            calls[game_id] += 1
+            running.add(game_id)
+            peak[0] = max(peak[0], len(running))
+        time.sleep(0.05)
+        with lock:
+            running.discard(game_id)
+        if state == 'error':
+            raise RuntimeError('upstream 503')
+        return {'gameState': state}
+
+    poller = LivePoller(poll, lambda game_id, box: {'game_state': box['gameState']},
+                        on_final=lambda game_id, box: finals.append(game_id),
+                        discover=lambda: ['a', 'b'], discover_interval=0.02, intervals=fast,
+                        max_workers=4, requests_per_minute=6000, backoff_base=0.01, rng=lambda: 0.5)
+    deadline = time.monotonic() + 5
+    poller.run(until=lambda: len(finals) == 2 or time.monotonic() > deadline)
+
+    assert sorted(finals) == ['a', 'b']
+    assert calls == {'a': 3, 'b': 3}
+    assert peak[0] == 2
+    assert poller.tracked == set()
@@ -0,0 +1,41 @@
+import contextlib
+import io
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.meta_ensemble_predictor import MetaEnsemblePredictor
+
+# (home_prob, predicted_margin) per game, from the per-game predictor before batching.
+EXPECTED = [
+    (47.75427003800561, -0.2856380045413971),
+    (58.28024642927892, 0.7702486515045166),
+    (47.75427003800561, 0.5894953012466431),
+    (58.28024642927892, -0.03349001705646515),
+]
+
+
+def test_batch_xgboost_matches_single_game_predictions():
+    with contextlib.redirect_stdout(io.StringIO()):
+        meta = MetaEnsemblePredictor()
+    meta.standings.calculate_desperation_index = lambda team, *a, **k: 0.2 if team < "M" else 0.6
+
+    teams = ["BOS", "TOR", "EDM", "COL", "NYR", "NJD", "FLA", "TBL"]
+    start = datetime(2026, 2, 1)
+    for d in range(20):
+        for i, team in enumerate(teams):
+            stats = {"goal_diff": (d * 7 + i) % 5 - 2, "xg_avg": 2.0 + (d + i) % 3, "pp_pct": 15 + i, "won_game": (d + i) % 2}
+            meta.history_tracker.update(team, start + timedelta(days=d), stats, venue="home" if (d + i) % 2 else "away")
+
+    games = [
+        {"away_team": teams[i], "home_team": teams[i + 1], "game_date": "2026-03-01", "is_playoff": i == 4}
+        for i in range(0, len(teams), 2)
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        batch = meta._predict_xgboost_batch(games)
+
+    assert all(b is not None for b in batch)
+    for result, (home_prob, margin) in zip(batch, EXPECTED):
+        assert result["home_prob"] == pytest.approx(home_prob, abs=1e-6)
+        assert result["away_prob"] == pytest.approx(100 - home_prob, abs=1e-6)
+        assert result["predicted_margin"] == pytest.approx(margin, abs=1e-6)
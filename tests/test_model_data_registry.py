@@ -0,0 +1,47 @@
+import logging
+
+from models.improved_self_learning_model_v2 import ImprovedSelfLearningModelV2, clear_shared_model_data
+from models.specialized_models import HighScoringGameModel
+
+
+def test_models_share_parsed_data_but_not_weights():
+    logging.disable(logging.CRITICAL)
+    try:
+        clear_shared_model_data()
+        base = ImprovedSelfLearningModelV2()
+        special = HighScoringGameModel()
+        private = ImprovedSelfLearningModelV2(shared=False)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert special.team_stats is base.team_stats
+    assert special.model_data["predictions"] is base.model_data["predictions"]
+    assert private.team_stats is not base.team_stats
+
+    base.model_data["model_weights"]["xg_weight"] = 0.99
+    assert special.model_data["model_weights"]["xg_weight"] != 0.99
+    assert private.model_data["model_weights"]["xg_weight"] != 0.99
+
+
+def test_writes_are_copied_on_write(monkeypatch):
+    logging.disable(logging.CRITICAL)
+    try:
+        clear_shared_model_data()
+        writer = ImprovedSelfLearningModelV2()
+        reader = HighScoringGameModel()
+    finally:
+        logging.disable(logging.NOTSET)
+    monkeypatch.setattr(writer, "save_model_data", lambda: None)
+    before = list(reader.model_data["predictions"])
+    team_stats_before = repr(reader.team_stats)
+
+    writer.add_prediction("2025020999", "2025-11-01", "XAA", "XBB", 0.55, 0.45,
+                          {"away_goalie": "A. Goalie", "home_goalie": "B. Goalie", "away_xg": 3.1, "home_xg": 2.4},
+                          actual_winner="XAA", actual_away_score=4, actual_home_score=2)
+    writer.update_team_stats(writer.model_data["predictions"][-1])
+
+    assert writer.model_data["predictions"][-1]["game_id"] == "2025020999"
+    assert reader.model_data["predictions"] == before
+    assert all(p.get("game_id") != "2025020999" for p in reader.prediction_index().recent_completed(50))
+    assert repr(reader.team_stats) == team_stats_before
+    assert "XAA" in writer.team_stats and "XAA" not in reader.team_stats
@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+
+from models.nb_utils import nb_away_win_with_ot, nb_pmf_matrix, nb_win_probs, poisson_win_probs, scoreline_matrix
+
+
+def _nb_pmf(n, mu, k):
+    p = k / (k + mu)
+    return math.exp(math.lgamma(n + k) - math.lgamma(k) - math.lgamma(n + 1) + k * math.log(p) + n * math.log(1.0 - p))
+
+
+def _loop_outcomes(pmf_a, pmf_h):
+    away = home = tie = 0.0
+    for a, pa in enumerate(pmf_a):
+        for h, ph in enumerate(pmf_h):
+            if a > h:
+                away += pa * ph
+            elif h > a:
+                home += pa * ph
+            else:
+                tie += pa * ph
+    return away, home, tie
+
+
+def test_batched_outcomes_match_scalar_loops():
+    away_mu = np.array([1.5, 2.8, 3.4, 4.8])
+    home_mu = np.array([4.1, 2.8, 2.2, 1.5])
+    k = np.array([0.5, 8.0, 20.0, 150.0])
+
+    nb = np.column_stack(nb_win_probs(away_mu, home_mu, k, max_goals=12))
+    pois = np.column_stack(poisson_win_probs(away_mu, home_mu, max_goals=15))
+    for i in range(len(away_mu)):
+        pa = [_nb_pmf(g, away_mu[i], k[i]) for g in range(13)]
+        ph = [_nb_pmf(g, home_mu[i], k[i]) for g in range(13)]
+        assert np.allclose(nb[i], _loop_outcomes(pa, ph), rtol=1e-12, atol=1e-15)
+        pa = [math.exp(-away_mu[i]) * away_mu[i] ** g / math.factorial(g) for g in range(16)]
+        ph = [math.exp(-home_mu[i]) * home_mu[i] ** g / math.factorial(g) for g in range(16)]
+        assert np.allclose(pois[i], _loop_outcomes(pa, ph), rtol=1e-12, atol=1e-15)
+
+    joint = scoreline_matrix(nb_pmf_matrix(away_mu, k), nb_pmf_matrix(home_mu, k))
+    assert joint.shape == (4, 13, 13)
+    assert np.allclose(joint.sum(axis=(1, 2)), nb.sum(axis=1))
+
+    # Rows are independent: scoring one game alone matches the batch.
+    p = nb_away_win_with_ot(away_mu, home_mu, 0.75, k)
+    assert np.allclose(p[2], nb_away_win_with_ot(away_mu[2], home_mu[2], 0.75, k[2])[0])
+    assert np.all((p > nb[:, 0]) & (p < nb[:, 0] + nb[:, 2]))
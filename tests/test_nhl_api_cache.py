@@ -0,0 +1,94 @@
+from utils.nhl_api_cache import ResponseCache, ttl_for
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.status_code = 200
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _CountingSession:
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.calls = []
+
+    def get(self, url):
+        self.calls.append(url)
+        return _FakeResponse(self.payloads[url.rsplit("/v1/", 1)[-1]])
+
+
+def test_ttl_policy_by_game_state():
+    assert ttl_for("gamecenter", {"gameState": "OFF"}) is None
+    assert ttl_for("gamecenter", {"gameState": "FINAL"}) is None
+    assert 0 < ttl_for("gamecenter", {"gameState": "LIVE"}) < 60
+    assert ttl_for("gamecenter", {"gameState": "FUT"}) >= 60
+
+    past_week = {"gameWeek": [{"date": "2020-01-01", "games": [{"gameState": "OFF"}]}]}
+    assert ttl_for("schedule", past_week) is None
+    live_week = {"gameWeek": [{"date": "2999-01-01", "games": [{"gameState": "LIVE"}]}]}
+    assert ttl_for("schedule", live_week) is not None
+
+
+def test_final_game_served_from_disk_after_restart(tmp_path):
+    from utils.nhl_api_client import NHLAPIClient
+
+    box = {"gameState": "OFF", "awayTeam": {"abbrev": "BOS"}}
+    pbp = {"gameState": "OFF", "plays": [{"eventId": 1}]}
+    payloads = {"gamecenter/1/boxscore": box, "gamecenter/1/play-by-play": pbp}
+
+    client = NHLAPIClient(cache=ResponseCache(tmp_path))
+    client.session = _CountingSession(payloads)
+    assert client.get_game_center(1) == {"boxscore": box, "play_by_play": pbp}
+    assert client.get_game_boxscore(1) == box
+    assert len(client.session.calls) == 2
+
+    # Fresh cache object (new process) reads the compressed disk tier.
+    client2 = NHLAPIClient(cache=ResponseCache(tmp_path))
+    client2.session = _CountingSession(payloads)
+    got = client2.get_play_by_play(1)
+    assert got == pbp
+    assert client2.session.calls == []
+
+    # Callers may mutate what they get back without poisoning the cache.
+    got["plays"].clear()
+    assert client2.get_play_by_play(1) == pbp
+
+
+def test_live_game_not_persisted_and_lru_bounded(tmp_path):
+    cache = ResponseCache(tmp_path, max_memory_entries=2)
+    cache.put("gamecenter/2/play-by-play", {"gameState": "LIVE"}, ttl_for("gamecenter", {"gameState": "LIVE"}))
+    assert not list(tmp_path.rglob("*.gz"))
+    assert cache.get("gamecenter/2/play-by-play") == {"gameState": "LIVE"}
+
+    cache.put("a", {"x": 1}, 300)
+    cache.put("b", {"x": 2}, 300)
+    assert len(cache._mem) == 2
+
+
+def test_game_bundle_fetches_each_resource_once():
+    import pickle
+
+    import pytest
+
+    from utils.nhl_api_client import GameBundle, NHLAPIClient
+
+    box = {"gameState": "OFF", "awayTeam": {"abbrev": "BOS", "score": 3}, "homeTeam": {"abbrev": "TOR", "score": 2}}
+    pbp = {"gameState": "OFF", "plays": []}
+    landing = {"gameState": "OFF", "summary": {}}
+    payloads = {"gamecenter/3/boxscore": box, "gamecenter/3/play-by-play": pbp, "gamecenter/3/landing": landing}
+
+    client = NHLAPIClient(cache=False)
+    client.session = _CountingSession(payloads)
+    bundle = client.get_comprehensive_game_data(3)
+
+    assert sorted(u.rsplit("/", 1)[-1] for u in client.session.calls) == ["boxscore", "landing", "play-by-play"]
+    assert isinstance(bundle, dict)
+    assert bundle["game_center"] == {"boxscore": box, "play_by_play": pbp}
+    assert bundle["landing"] == landing and bundle["gameState"] == "OFF"
+    with pytest.raises(TypeError):
+        bundle["boxscore"] = {}
+    assert isinstance(bundle.copy(), dict) and not isinstance(bundle.copy(), GameBundle)
+    assert pickle.loads(pickle.dumps(bundle)) == bundle
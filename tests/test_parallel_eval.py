@@ -0,0 +1,16 @@
+import numpy as np
+
+from models.parallel_eval import run_tasks
+
+
+def _draw(scale, offset=0.0):
+    return float(np.random.rand() * scale + offset)
+
+
+def test_pool_results_match_serial_run_in_task_order():
+    tasks = [dict(scale=s, offset=o) for s, o in [(1.0, 0.0), (2.0, 1.0), (3.0, 0.5), (4.0, 2.0)]]
+    serial = run_tasks(_draw, tasks, max_workers=1)
+    pooled = run_tasks(_draw, tasks, max_workers=2)
+    assert pooled == serial
+    assert len(set(serial)) == len(tasks)
+    assert run_tasks(_draw, []) == []
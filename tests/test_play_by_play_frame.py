@@ -0,0 +1,90 @@
+import random
+
+from analyzers.advanced_metrics_analyzer import AdvancedMetricsAnalyzer
+from analyzers.play_by_play_frame import NO_TEAM, PlayByPlayFrame
+from models.improved_xg_model import ImprovedXGModel
+
+
+def _play(event_type, team, clock, zone=None, period=1, **details):
+    if team is not None:
+        details['eventOwnerTeamId'] = team
+    if zone is not None:
+        details['zoneCode'] = zone
+    return {'typeDescKey': event_type, 'timeInPeriod': clock,
+            'periodDescriptor': {'number': period, 'periodType': 'REG'}, 'details': details}
+
+
+def _pbp():
+    return {'plays': [
+        {'typeDescKey': 'period-start', 'timeInPeriod': '00:00', 'details': {}},
+        _play('takeaway', 1, '00:10', 'N', xCoord=-5, yCoord=3),
+        _play('shot-on-goal', 1, '00:13', 'O', xCoord=70, yCoord=-4),
+        _play('shot-on-goal', 1, '00:15', 'O', xCoord=80, yCoord=2),
+        _play('stoppage', None, '00:15'),
+        _play('giveaway', 2, '05:00', 'N'),
+        _play('goal', 1, '05:04', 'O', xCoord=85, yCoord=0),
+        _play('missed-shot', 2, 'bad', 'O', period=2),
+    ]}
+
+
+def test_frame_columns_and_defaults():
+    frame = PlayByPlayFrame(_pbp()['plays'])
+
+    assert frame.column('event_type')[:3] == ['period-start', 'takeaway', 'shot-on-goal']
+    assert frame.column('team') == [NO_TEAM, 1, 1, 1, NO_TEAM, 2, 1, 2]
+    assert frame.column('period') == [1, 1, 1, 1, 1, 1, 1, 2]
+    assert frame.column('seconds') == [0, 10, 13, 15, 15, 300, 304, 0]
+    assert frame.column('zone')[4:6] == ['', 'N']
+    assert frame.column('has_x')[4:7] == [False, False, True]
+    assert frame.column('x')[4:7] == [0, 0, 85]
+    assert frame.column('period_start')[:2] == [True, False]
+    assert frame.per_period(frame.is_type('shot-on-goal', 'goal', 'missed-shot')) == [3, 1, 0]
+
+
+def test_frame_is_shared_per_feed_and_rebuilt_when_plays_grow():
+    pbp = _pbp()
+    frame = PlayByPlayFrame.of(pbp)
+    assert PlayByPlayFrame.of(pbp) is frame
+    assert PlayByPlayFrame.of(_pbp()) is not frame
+
+    pbp['plays'].append(_play('hit', 2, '06:00'))
+    grown = PlayByPlayFrame.of(pbp)
+    assert grown is not frame and len(grown) == len(pbp['plays'])
+
+
+def test_analyzer_metrics_read_from_frame():
+    analyzer = AdvancedMetricsAnalyzer(_pbp())
+
+    assert analyzer.calculate_rush_metrics(1) == {'rush_shots': 1, 'rush_goals': 0}
+    assert analyzer.calculate_rebounds_by_period(1) == {1: 1, 2: 0, 3: 0, 4: 0}
+    assert analyzer.calculate_nzt_metrics(1) == {'nzt': 0, 'nztsa': 0}
+    assert analyzer.calculate_nzt_metrics(2) == {'nzt': 2, 'nztsa': 2}
+    assert analyzer.calculate_transition_metrics(1)['counter_attack_shots'] == 2
+
+
+def test_shot_annotations_tag_rush_and_origin_in_one_pass():
+    annotations = PlayByPlayFrame(_pbp()['plays']).shot_annotations()
+
+    assert annotations.rush[[2, 3, 6]].tolist() == [True, True, False]
+    assert annotations.since_trigger[[2, 3]].tolist() == [3.0, 5.0]
+    assert annotations.origin_zone[[2, 3, 6]].tolist() == ['neutral', 'offensive', 'offensive']
+
+
+def test_xg_context_flags_match_model_lookback():
+    rng = random.Random(5)
+    plays, t = [], 0
+    for i in range(400):
+        t += rng.choice([0, 1, 2, 3, 5, 8])
+        play = _play(rng.choice(['shot-on-goal', 'missed-shot', 'goal', 'hit', 'takeaway', 'faceoff', 'stoppage']),
+                     rng.choice([1, 2]), f'{t // 60:02d}:{t % 60:02d}', rng.choice(['O', 'N', 'D', None]))
+        if i % 3 == 0:
+            play['period'] = 1
+        plays.append(play)
+    annotations = PlayByPlayFrame(plays).shot_annotations()
+    model = ImprovedXGModel()
+
+    for i, play in enumerate(plays):
+        shot = {'time_in_period': play['timeInPeriod'], 'period': 1, 'team_id': play['details']['eventOwnerTeamId']}
+        previous = plays[max(0, i - 10):i]
+        assert annotations.rebound[i] == (model._get_rebound_adjustment(shot, previous) != 1.0)
+        assert annotations.xg_rush[i] == (model._get_rush_adjustment(shot, previous) != 1.0)
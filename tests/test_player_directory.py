@@ -0,0 +1,55 @@
+from utils.player_directory import PlayerDirectory, boxscore_names
+
+PBP = {'rosterSpots': [
+    {'playerId': 8478402, 'teamId': 22, 'firstName': {'default': 'Connor'}, 'lastName': {'default': 'McDavid'},
+     'sweaterNumber': 97, 'positionCode': 'C'},
+]}
+BOX = {
+    'awayTeam': {'id': 22, 'abbrev': 'EDM'},
+    'homeTeam': {'id': 6, 'abbrev': 'BOS'},
+    'playerByGameStats': {
+        'awayTeam': {'forwards': [{'playerId': 8478402, 'name': {'default': 'C. McDavid'}, 'position': 'C'}]},
+        'homeTeam': {'goalies': [{'playerId': 8480280, 'name': {'default': 'J. Swayman'}, 'sweaterNumber': 1}]},
+    },
+}
+ROSTER = {'forwards': [{'id': 8478402, 'firstName': {'default': 'Connor'}, 'lastName': {'default': 'McDavid'},
+                        'positionCode': 'C', 'shootsCatches': 'L'}]}
+
+
+class _Client:
+    def __init__(self):
+        self.calls = []
+
+    def get_team_roster(self, team):
+        self.calls.append(team)
+        return ROSTER if team == 'EDM' else None
+
+
+def test_game_roster_and_lookups(tmp_path):
+    directory = PlayerDirectory(tmp_path / 'players.json')
+    roster = directory.game_roster(PBP, BOX)
+    assert roster[8478402]['name'] == 'Connor McDavid' and roster[8478402]['teamId'] == 22
+    assert roster[8480280] == {'name': 'J. Swayman', 'firstName': 'J.', 'lastName': 'Swayman', 'sweaterNumber': 1,
+                               'positionCode': 'G', 'teamId': 6, 'shootsCatches': None}
+    assert directory.game_roster(PBP, BOX) is roster
+
+    # Boxscore short names never replace full names; ids may be strings.
+    assert directory.name('8478402') == 'Connor McDavid'
+    assert directory.name(8480280) == 'J. Swayman'
+    assert directory.name(1, 'Player #1') == 'Player #1'
+    assert boxscore_names(BOX) == {8478402: 'C. McDavid', 8480280: 'J. Swayman'}
+
+
+def test_batch_refresh_skips_fresh_teams_and_persists(tmp_path):
+    path = tmp_path / 'players.json'
+    directory = PlayerDirectory(path)
+    client = _Client()
+    assert directory.refresh_teams(client, ['EDM', 'BOS', None]) == 1
+    assert directory.get(8478402)['shootsCatches'] == 'L'
+
+    directory.refresh_teams(client, ['EDM', 'BOS'])
+    assert sorted(client.calls) == ['BOS', 'BOS', 'EDM']
+
+    reloaded = PlayerDirectory(path)
+    assert reloaded.get(8478402)['name'] == 'Connor McDavid'
+    assert reloaded.stale_teams(['EDM', 'BOS']) == ['BOS']
@@ -0,0 +1,65 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from models.playoff_predictor import solve_series_lattice, venue_game_prob_grid
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "simulate_2026_playoffs_master.py"
+_spec = importlib.util.spec_from_file_location("simulate_2026_playoffs_master", _SCRIPT)
+sim = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sim)
+
+TEAMS = [f"T{i:02d}" for i in range(16)]
+BRACKET = {
+    "East": [{"away": TEAMS[i], "home": TEAMS[i + 1]} for i in range(0, 8, 2)],
+    "West": [{"away": TEAMS[i], "home": TEAMS[i + 1]} for i in range(8, 16, 2)],
+}
+STRENGTH = {t: (i * 7 % 16) / 15.0 for i, t in enumerate(TEAMS)}
+
+
+def series_constants(away, home, round_no):
+    p = 0.42 + 0.2 * (STRENGTH[away] - STRENGTH[home]) - 0.01 * round_no
+    return away, home, p, p + 0.08
+
+
+def current_wins(away, home):
+    # One first-round series is already under way.
+    return (2, 1) if {away, home} == {"T02", "T03"} else (0, 0)
+
+
+def _frequencies(result, n):
+    advancement, opponent_counts, _, finals_pair_counts = result
+    adv = {(t, rnd): c / n for t, rounds in advancement.items() for rnd, c in rounds.items()}
+    paths = {(rnd, t, o): c / n for rnd, by_team in opponent_counts.items() for t, opps in by_team.items() for o, c in opps.items()}
+    finals = {pair: c / n for pair, c in finals_pair_counts.items()}
+    return adv, paths, finals
+
+
+def _assert_close(a, b, tol):
+    for key in set(a) | set(b):
+        assert a.get(key, 0.0) == pytest.approx(b.get(key, 0.0), abs=tol), key
+
+
+def test_shared_solver_matches_closed_forms():
+    fair = solve_series_lattice(venue_game_prob_grid(0.5, 0.5))
+    assert fair["away_series_win_prob"] == pytest.approx(0.5)
+    assert fair["prob_series_goes_seven"] == pytest.approx(0.3125)
+    # Up 3-0, the away side only loses the series by dropping games 4-7 (away, home, away, home arenas).
+    r = solve_series_lattice(venue_game_prob_grid(0.4, 0.6), 3, 0)
+    assert r["away_series_win_prob"] == pytest.approx(1 - 0.4 * 0.6 * 0.4 * 0.6)
+    assert solve_series_lattice(venue_game_prob_grid(0.4, 0.6), 4, 2)["away_series_win_prob"] == 1.0
+
+
+def test_numpy_engine_matches_python_engine():
+    n = 20_000
+    py = _frequencies(sim._simulate_brackets_python(BRACKET, series_constants, current_wins, n, seed=3), n)
+    vec = _frequencies(sim._simulate_brackets_numpy(BRACKET, series_constants, current_wins, n, seed=3), n)
+    for a, b in zip(py, vec):
+        _assert_close(a, b, tol=0.02)
+
+
+def test_numpy_engine_is_reproducible_for_a_seed():
+    run = lambda seed: _frequencies(sim._simulate_brackets_numpy(BRACKET, series_constants, current_wins, 5_000, seed=seed), 5_000)
+    assert run(11) == run(11)
+    assert run(11) != run(12)
@@ -0,0 +1,42 @@
+from models.playoff_predictor import PlayoffSeriesPredictor
+
+
+def _stub_predictor():
+    # Skip the heavy data loading; only the series machinery is under test.
+    p = PlayoffSeriesPredictor.__new__(PlayoffSeriesPredictor)
+    p._series_state_prob_cache = {}
+    p._playoff_series_historical_5yr = {}
+    p.calls = 0
+
+    def game_prob(away, home, away_wins=0, home_wins=0, playoff_round=None):
+        p.calls += 1
+        return 0.55 + 0.02 * (away_wins - home_wins) + (0.03 if away == "AAA" else -0.03)
+
+    p.calculate_game_win_prob = game_prob
+    return p
+
+
+def test_exact_series_matches_closed_form_for_coin_flips():
+    p = _stub_predictor()
+    p.calculate_game_win_prob = lambda *a, **k: 0.5
+    r = p.solve_series_exact("AAA", "BBB")
+    assert abs(r["away_series_win_prob"] - 0.5) < 1e-12
+    # P(7 games) for a fair best-of-7 is C(6,3)/2^6 = 0.3125
+    assert abs(r["prob_series_goes_seven"] - 0.3125) < 1e-12
+    assert abs(sum(r["series_length_distribution"].values()) - 1.0) < 1e-12
+
+
+def test_exact_mode_agrees_with_monte_carlo_and_is_memoized():
+    p = _stub_predictor()
+    exact = p.simulate_series("AAA", "BBB", away_wins=1, home_wins=2, playoff_round=2, mode="exact")
+    mc = p.simulate_series("AAA", "BBB", away_wins=1, home_wins=2, simulations=100_000, playoff_round=2)
+    assert abs(exact["away_series_win_prob"] - mc["away_series_win_prob"]) < 0.01
+    assert abs(exact["prob_series_goes_seven"] - mc["prob_series_goes_seven"]) < 0.01
+
+    # Only the 6 states reachable from 1-2 were evaluated.
+    assert p.calls == 6
+    p.solve_series_exact("AAA", "BBB", 0, 0, playoff_round=2)
+    calls = p.calls
+    p.solve_series_exact("AAA", "BBB", 0, 0, playoff_round=2)
+    p.simulate_series("AAA", "BBB", simulations=1_000, playoff_round=2)
+    assert p.calls == calls == 16
@@ -0,0 +1,31 @@
+from models.improved_self_learning_model_v2 import PredictionHistoryIndex
+
+
+def _pred(date, away, home, winner=None):
+    return {"date": date, "away_team": away, "home_team": home, "actual_winner": winner}
+
+
+def test_index_orders_by_date_and_tracks_appends():
+    preds = [
+        _pred("2025-10-05", "BOS", "TOR", "BOS"),
+        _pred("2025-10-01", "MTL", "TOR", "TOR"),
+        _pred("2025-10-03", "TOR", "BOS"),  # pending
+    ]
+    idx = PredictionHistoryIndex().sync(preds)
+    assert [p["date"] for p in idx.team_games("tor", "home")] == ["2025-10-01", "2025-10-05"]
+    assert idx.team_games("TOR", "away") == []
+
+    # Outcome written in place, plus a newly appended game.
+    preds[2]["actual_winner"] = "TOR"
+    preds.append(_pred("2025-10-02", "OTT", "TOR", "OTT"))
+    idx.sync(preds)
+    assert [p["date"] for p in idx.team_games("TOR", "home", window=2)] == ["2025-10-02", "2025-10-05"]
+    assert idx.team_games("TOR", "away") == [preds[2]]
+    assert idx.recent_completed(2) == [preds[2], preds[3]]
+
+
+def test_index_rebuilds_when_list_replaced():
+    idx = PredictionHistoryIndex().sync([_pred("2025-10-01", "BOS", "TOR", "BOS")])
+    idx.sync([_pred("2025-10-02", "NYR", "NJD", "NJD")])
+    assert idx.team_games("TOR", "home") == []
+    assert len(idx.team_games("NJD", "home")) == 1
@@ -0,0 +1,73 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import utils.report_pipeline as report_pipeline
+from utils.report_pipeline import prepare_reports
+
+GAMES = [{'id': g, 'away': 'A', 'home': 'H'} for g in ('1', '2', '3')]
+
+
+def _fetch(game_id):
+    return {'id': game_id}
+
+
+def _render(game_data, game_id, away_team, home_team):
+    # Module level, so the spawn pool's workers can unpickle it.
+    return {'image_path': f'/tmp/{away_team}_{home_team}_{game_data["id"]}.png', 'pid': os.getpid()}
+
+
+class _BrokenPool:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool('worker died')
+
+    def shutdown(self, *args, **kwargs):
+        pass
+
+
+def test_serial_pipeline_yields_games_in_order_with_errors_attached(monkeypatch):
+    calls = []
+
+    def fetch(game_id):
+        calls.append(('fetch', game_id))
+        if game_id == '2':
+            raise ConnectionError('boom')
+        return None if game_id == '3' else {'id': game_id}
+
+    def render(game_data, game_id, away_team, home_team):
+        calls.append(('render', game_id))
+        return {'image_path': f'/tmp/{away_team}_{home_team}_{game_id}.png'}
+
+    monkeypatch.setattr(report_pipeline, 'render_report', render)
+    games = [{'id': g, 'away': 'A', 'home': 'H'} for g in ('1', '2', '3', '4')]
+    prepared = dict((g['id'], p) for g, p in prepare_reports(games, fetch, max_workers=1))
+
+    assert list(prepared) == ['1', '2', '3', '4']
+    assert prepared['1']['report'] == {'image_path': '/tmp/A_H_1.png'}
+    assert isinstance(prepared['2']['error'], ConnectionError) and prepared['2']['game_data'] is None
+    assert prepared['3'] == {'game_data': None, 'report': None, 'error': None}
+    assert calls == [('fetch', '1'), ('render', '1'), ('fetch', '2'), ('fetch', '3'), ('fetch', '4'), ('render', '4')]
+
+
+def test_pool_renders_every_game_in_worker_processes(monkeypatch):
+    monkeypatch.setattr(report_pipeline, 'render_report', _render)
+    prepared = [(g['id'], p) for g, p in prepare_reports(GAMES, _fetch, max_workers=2)]
+
+    assert [game_id for game_id, _ in prepared] == ['1', '2', '3']
+    for game_id, p in prepared:
+        assert p['error'] is None and p['game_data'] == {'id': game_id}
+        assert p['report']['image_path'] == f'/tmp/A_H_{game_id}.png'
+        assert p['report']['pid'] != os.getpid()
+
+
+def test_broken_pool_falls_back_to_rendering_in_process(monkeypatch):
+    monkeypatch.setattr(report_pipeline, 'render_report', _render)
+    monkeypatch.setattr(report_pipeline, 'ProcessPoolExecutor', _BrokenPool)
+    prepared = [(g['id'], p) for g, p in prepare_reports(GAMES, _fetch, max_workers=2)]
+
+    assert [game_id for game_id, _ in prepared] == ['1', '2', '3']
+    for game_id, p in prepared:
+        assert p['error'] is None
+        assert p['report'] == {'image_path': f'/tmp/A_H_{game_id}.png', 'pid': os.getpid()}
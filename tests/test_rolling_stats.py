@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+import pytest
+
+from models.rolling_stats import RollingStats
+
+
+def _list_rolling_stats(stats_list, window, alpha):
+    """The list-of-dicts implementation RollingStats replaced."""
+    stats_list = stats_list[-window:]
+    if not stats_list:
+        return {}
+    aggregated = {}
+    for k in stats_list[0].keys():
+        vals = [g[k] for g in stats_list if g.get(k) is not None]
+        if vals:
+            if alpha is not None and len(vals) > 1:
+                weights = [alpha * (1 - alpha) ** i for i in range(len(vals))][::-1]
+                aggregated[k] = np.average(vals, weights=weights)
+            else:
+                aggregated[k] = np.mean(vals)
+        else:
+            aggregated[k] = 0.0
+    return aggregated
+
+
+def _random_games(n, seed=7):
+    rng = random.Random(seed)
+    games = []
+    for _ in range(n):
+        g = {'goals': rng.randint(0, 7), 'xg': rng.uniform(0.5, 5.0), 'win': rng.randint(0, 1), 'lead_p2': rng.randint(0, 1)}
+        if rng.random() < 0.5:
+            g['pk_pct'] = rng.uniform(0.6, 1.0)
+        if rng.random() < 0.2:
+            g['xg'] = None
+        if rng.random() < 0.3:
+            g = dict(reversed(list(g.items())))
+        games.append(g)
+    return games
+
+
+@pytest.mark.parametrize("window,alpha", [(5, None), (10, None), (10, 0.3), (20, 0.15), (1, 0.3)])
+def test_window_stats_match_list_implementation(window, alpha):
+    games = _random_games(60)
+    rs = RollingStats(capacity=4)
+    for i, g in enumerate(games):
+        rs.append(g)
+        expected = _list_rolling_stats(games[:i + 1], window, alpha)
+        got = rs.window_stats(window, alpha)
+        assert list(got) == list(expected)
+        for k, v in expected.items():
+            assert got[k] == pytest.approx(v, rel=1e-12, abs=1e-12)
+
+
+def test_std_and_rate():
+    games = _random_games(40, seed=3)
+    rs = RollingStats()
+    for g in games:
+        rs.append(g)
+
+    vals = [g['xg'] for g in games[-8:] if g.get('xg') is not None]
+    assert rs.window_std(8, 'xg') == pytest.approx(np.std(vals))
+    assert rs.window_std(8, 'missing') == 1.0
+
+    relevant = [g for g in games[-20:] if g['lead_p2'] == 1]
+    assert rs.window_rate('lead_p2', 'win', 20) == sum(g['win'] == 1 for g in relevant) / len(relevant)
+    assert rs.window_rate('missing', 'win', 20) == 0.5
+    assert RollingStats().window_stats(5, 0.3) == {}
@@ -0,0 +1,80 @@
+import json
+import random
+
+import pytest
+
+import models.score_prediction_model as spm
+
+TEAMS = [team for teams in spm.DIVISIONS.values() for team in teams]
+METRICS = ('goals', 'opp_goals', 'xg', 'opp_xg', 'gs', 'shots', 'hdc', 'hdca', 'hits', 'blocked_shots',
+           'takeaways', 'giveaways', 'faceoff_pct', 'corsi_pct', 'power_play_pct', 'penalty_kill_pct')
+
+
+def _write_fixture_history(root, n_predictions, seed=11):
+    """Team stats and prediction history files under root/data (never the repo's live data)."""
+    rng = random.Random(seed)
+    data = root / "data"
+    data.mkdir()
+    teams = {
+        team: {venue: {key: [round(rng.uniform(1, 5), 2) for _ in range(20)] for key in METRICS}
+               for venue in ('home', 'away')}
+        for team in TEAMS
+    }
+    (data / "season_2025_2026_team_stats.json").write_text(json.dumps({"teams": teams}))
+    predictions = []
+    for i in range(n_predictions):
+        away, home = rng.sample(TEAMS, 2)
+        predictions.append({
+            "game_id": f"2025020{i:03d}",
+            "date": f"2025-11-{1 + i % 28:02d}",
+            "away_team": away,
+            "home_team": home,
+            "predicted_away_win_prob": rng.uniform(0.3, 0.7),
+            "actual_away_score": rng.randint(0, 6),
+            "actual_home_score": rng.randint(0, 6),
+            "metrics_used": {"away_xg": rng.uniform(2, 4), "home_xg": rng.uniform(2, 4)},
+        })
+    (data / "win_probability_predictions_v2.json").write_text(json.dumps({"predictions": predictions}))
+
+
+@pytest.fixture
+def fixture_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(spm, "FITTED_PARAMS_PATH", tmp_path / "score_model_params.json")
+    monkeypatch.delenv("SCORE_MODEL_REFIT", raising=False)
+    return tmp_path
+
+
+def test_fitted_params_are_reused_until_inputs_change(fixture_history, monkeypatch):
+    _write_fixture_history(fixture_history, 120)
+    artifact = spm.FITTED_PARAMS_PATH
+    fits = []
+    original_fit = spm.ScorePredictionModel._fit_params
+    monkeypatch.setattr(spm.ScorePredictionModel, "_fit_params", lambda self: (fits.append(1), original_fit(self)))
+
+    first = spm.ScorePredictionModel()
+    second = spm.ScorePredictionModel()
+    assert len(fits) == 1
+    for attr in spm.FITTED_PARAM_ATTRS:
+        a, b = getattr(first, attr), getattr(second, attr)
+        assert json.dumps(a, default=lambda x: x.tolist()) == json.dumps(b, default=lambda x: x.tolist())
+
+    # A different fingerprint (changed inputs) forces a re-fit.
+    data = json.loads(artifact.read_text())
+    data["fingerprint"] = "stale"
+    artifact.write_text(json.dumps(data))
+    spm.ScorePredictionModel()
+    assert len(fits) == 2
+
+    spm.ScorePredictionModel(refit=True)
+    assert len(fits) == 3
+
+
+def test_cached_fit_with_short_history_still_predicts(fixture_history):
+    # Fewer than 30 completed games: the per-team environment and venue splits stay empty.
+    _write_fixture_history(fixture_history, 10)
+    fitted = spm.ScorePredictionModel()
+    cached = spm.ScorePredictionModel()
+    assert cached._team_scoring_env == {} and cached._team_venue_splits == {}
+    assert fitted.predict_score('BOS', 'TOR') is not None
+    assert cached.predict_score('BOS', 'TOR') is not None
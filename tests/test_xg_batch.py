@@ -0,0 +1,36 @@
+import random
+
+import numpy as np
+import pytest
+
+from models.improved_xg_model import ImprovedXGModel
+
+
+def test_batch_matches_scalar_model():
+    rng = random.Random(11)
+    model = ImprovedXGModel()
+    n = 3000
+    shots = {
+        'x_coords': [89, -89, 95, 0, 60] + [rng.randint(-100, 100) for _ in range(n - 5)],
+        'y_coords': [3, -3, 0, 0, 35] + [rng.randint(-42, 42) for _ in range(n - 5)],
+        'shot_types': [rng.choice(['wrist', 'Slap', 'tip-in', 'wrap', 'bat', 'unknown']) for _ in range(n)],
+        'event_types': [rng.choice(['shot-on-goal', 'goal', 'missed-shot', 'blocked-shot']) for _ in range(n)],
+        'strength_states': [rng.choice(['5v5', '5v4', '4v5', '3v3', '6v5']) for _ in range(n)],
+        'score_differentials': [rng.randint(-5, 5) for _ in range(n)],
+        'is_rebound': [rng.random() < 0.2 for _ in range(n)],
+        'is_rush': [rng.random() < 0.2 for _ in range(n)],
+    }
+    keys = ('x_coord', 'y_coord', 'shot_type', 'event_type', 'strength_state', 'score_differential', 'is_rebound', 'is_rush')
+    expected = [model.calculate_xg(dict(zip(keys, row))) for row in zip(*shots.values())]
+
+    got = model.calculate_xg_batch(**shots)
+    assert got == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_batch_broadcasts_shared_values():
+    model = ImprovedXGModel()
+    got = model.calculate_xg_batch(np.array([80, -70]), np.array([2, -10]), 'snap', 'missed-shot', '5v4', 1)
+    expected = [model.calculate_xg({'x_coord': x, 'y_coord': y, 'shot_type': 'snap', 'event_type': 'missed-shot',
+                                    'strength_state': '5v4', 'score_differential': 1}) for x, y in ((80, 2), (-70, -10))]
+    assert got.tolist() == pytest.approx(expected)
+    assert len(model.calculate_xg_batch([], [])) == 0
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
+    from utils.event_cursor import CURSOR_DIR, LatestByGameIndex
     from utils.event_store import (
         OUTCOME_EVENTS_PATH,
         PREDICTION_EVENTS_PATH,
@@ -14,16 +15,43 @@ try:
     )
 except Exception:
     # Allows running as `python3 utils/build_predictions_history_view.py`
+    from event_cursor import CURSOR_DIR, LatestByGameIndex
     from event_store import (
         OUTCOME_EVENTS_PATH,
         PREDICTION_EVENTS_PATH,
         load_latest_by_game_id,
     )
 
+VIEW_CONSUMER = "history_view"
+VIEW_STAMP_PATH = CURSOR_DIR / f"{VIEW_CONSUMER}.stamp.json"
 
-def build_view() -> Dict[str, Any]:
-    preds = load_latest_by_game_id(PREDICTION_EVENTS_PATH)
-    outs = load_latest_by_game_id(OUTCOME_EVENTS_PATH)
+
+def _load_events(incremental: bool) -> Tuple[Dict[str, Any], Dict[str, Any], bool]:
+    """Return (preds, outs, changed) where changed=False means no new events since the last build."""
+    if not incremental:
+        return load_latest_by_game_id(PREDICTION_EVENTS_PATH), load_latest_by_game_id(OUTCOME_EVENTS_PATH), True
+    pred_idx = LatestByGameIndex(PREDICTION_EVENTS_PATH, VIEW_CONSUMER)
+    out_idx = LatestByGameIndex(OUTCOME_EVENTS_PATH, VIEW_CONSUMER)
+    preds = pred_idx.refresh()
+    outs = out_idx.refresh()
+    changed = pred_idx.changed != [] or out_idx.changed != []
+    return preds, outs, changed
+
+
+def _view_stamp(out_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        st = out_path.stat()
+    except FileNotFoundError:
+        return None
+    return {"path": str(out_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def build_view(*, incremental: bool = False) -> Dict[str, Any]:
+    preds, outs, _ = _load_events(incremental)
+    return _build_view(preds, outs)
+
+
+def _build_view(preds: Dict[str, Any], outs: Dict[str, Any]) -> Dict[str, Any]:
 
     rows: List[Dict[str, Any]] = []
     for gid, p in preds.items():
@@ -65,8 +93,7 @@ def build_view() -> Dict[str, Any]:
         # Carry P1 lead into metrics_used if present
         if o.get("lead_after_p1") is not None:
             mu = row.get("metrics_used") or {}
-            if not isinstance(mu, dict):
-                mu = {}
+            mu = dict(mu) if isinstance(mu, dict) else {}
             mu["lead_after_p1"] = o.get("lead_after_p1")
             row["metrics_used"] = mu
         rows.append(row)
@@ -76,10 +103,29 @@ def build_view() -> Dict[str, Any]:
     return {"predictions": rows}
 
 
-def write_view(out_path: Path = Path("data/win_probability_predictions_v2.json")) -> Path:
+def write_view(out_path: Path = Path("data/win_probability_predictions_v2.json"), *, incremental: bool = True) -> Path:
+    """
+    Write the derived JSON view.
+
+    With incremental=True the event logs are folded in through persisted
+    cursors (utils/event_cursor), and the rewrite is skipped entirely when no
+    new events arrived and nobody else has touched the view file since.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    view = build_view()
+    preds, outs, changed = _load_events(incremental)
+    if incremental and not changed:
+        try:
+            stamp = json.loads(VIEW_STAMP_PATH.read_text())
+        except Exception:
+            stamp = None
+        if stamp is not None and stamp == _view_stamp(out_path):
+            return out_path
+
+    view = _build_view(preds, outs)
     out_path.write_text(json.dumps(view, indent=2))
+    if incremental:
+        VIEW_STAMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+        VIEW_STAMP_PATH.write_text(json.dumps(_view_stamp(out_path)))
     return out_path
 
 
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Incremental readers for the append-only JSONL event logs.
+
+`EventLogCursor` keeps a persisted byte offset per (consumer, log) so a
+consumer only parses records appended since it last committed. The cursor
+also stores a fingerprint of the file head and of the bytes just before the
+offset; if the log was truncated or rewritten (e.g. by
+`compact_event_logs.compact`), the cursor rewinds to 0 and sets `rewound` so
+the consumer can rebuild whatever it derived from the old contents.
+
+`LatestByGameIndex` builds on the cursor: it persists the latest record per
+game_id next to the offset and folds in new lines on `refresh()`, which is
+what the history view, the outcome updater and retraining need.
+
+State lives under EVENT_CURSOR_DIR (default data/cursors/).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+CURSOR_DIR = Path(os.environ.get("EVENT_CURSOR_DIR", "data/cursors"))
+
+# Bytes hashed at the head of the file and just before the offset.
+_FINGERPRINT_BYTES = 4096
+
+
+def file_fingerprint(path: Path, offset: int) -> str:
+    """Hash of the first and last few KB of `path[:offset]`."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        h.update(f.read(min(offset, _FINGERPRINT_BYTES)))
+        tail_start = max(0, offset - _FINGERPRINT_BYTES)
+        f.seek(tail_start)
+        h.update(f.read(offset - tail_start))
+    return h.hexdigest()
+
+
+def resume_offset(path: Path, offset: int, fingerprint: Optional[str]) -> int:
+    """
+    Return `offset` if `path` still starts with the bytes it was taken from,
+    otherwise 0 (the file was truncated or rewritten).
+    """
+    if not fingerprint or offset <= 0 or not path.exists():
+        return 0
+    if offset > path.stat().st_size:
+        return 0
+    return offset if file_fingerprint(path, offset) == fingerprint else 0
+
+
+def read_complete_lines(path: Path, start: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parse JSON objects from complete lines starting at byte `start`.
+
+    Returns (records, end_offset). A trailing line without a newline is left
+    for the next read, since a writer may still be appending it.
+    """
+    records: List[Dict[str, Any]] = []
+    end = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            end += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(obj, dict):
+                records.append(obj)
+    return records, end
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+class EventLogCursor:
+    """
+    Persisted read position of one consumer over one JSONL log.
+
+        cursor = EventLogCursor(OUTCOME_EVENTS_PATH, "outcome_updater")
+        for event in cursor.read_new():
+            ...
+        cursor.commit()
+
+    Nothing is persisted until `commit()`, so a consumer that crashes
+    mid-batch re-reads the same records next time.
+    """
+
+    def __init__(self, path: Path, consumer: str, *, state_dir: Path = CURSOR_DIR) -> None:
+        self.path = Path(path)
+        self.consumer = consumer
+        self.state_path = Path(state_dir) / f"{consumer}.{self.path.stem}.cursor.json"
+        self.offset = 0
+        self.fingerprint: Optional[str] = None
+        self.rewound = False
+        self._pending: Optional[Tuple[int, str]] = None
+        self._load_state()
+
+    def _load_state(self) -> None:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except Exception:
+            return
+        if state.get("path") == str(self.path):
+            self.offset = int(state.get("offset") or 0)
+            self.fingerprint = state.get("fingerprint")
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        """Records appended since the last commit (all records after a rewind)."""
+        start = resume_offset(self.path, self.offset, self.fingerprint)
+        self.rewound = start == 0 and self.offset > 0
+        if not self.path.exists():
+            self._pending = (0, "")
+            return []
+        records, end = read_complete_lines(self.path, start)
+        self._pending = (end, file_fingerprint(self.path, end))
+        return records
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.read_new())
+
+    def commit(self) -> None:
+        """Persist the position reached by the last `read_new()`."""
+        if self._pending is None:
+            return
+        self.offset, self.fingerprint = self._pending
+        self._pending = None
+        _write_atomic(self.state_path, json.dumps({
+            "path": str(self.path),
+            "consumer": self.consumer,
+            "offset": self.offset,
+            "fingerprint": self.fingerprint,
+        }, indent=2).encode("utf-8"))
+
+    def reset(self) -> None:
+        """Forget the saved position; the next read starts from the beginning."""
+        self.offset, self.fingerprint, self._pending = 0, None, None
+        try:
+            self.state_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def iter_new_events(path: Path, consumer: str, *, state_dir: Path = CURSOR_DIR) -> Iterator[Dict[str, Any]]:
+    """Yield records appended since `consumer` last ran; commits once exhausted."""
+    cursor = EventLogCursor(path, consumer, state_dir=state_dir)
+    yield from cursor.read_new()
+    cursor.commit()
+
+
+class LatestByGameIndex:
+    """
+    Latest record per game_id for one log, maintained incrementally.
+
+    The snapshot and its offset are pickled together in one file, so they
+    can never disagree (unpickling the snapshot is cheaper than re-parsing
+    the JSON lines it came from). `refresh()` returns the same mapping as
+    `event_store.load_latest_by_game_id(path)`; `changed` lists the game_ids
+    touched by the last refresh (None after a full rebuild).
+    """
+
+    def __init__(self, path: Path, consumer: str, *, state_dir: Path = CURSOR_DIR) -> None:
+        self.path = Path(path)
+        self.consumer = consumer
+        self.state_path = Path(state_dir) / f"{consumer}.{self.path.stem}.latest.pkl"
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        self.changed: Optional[List[str]] = None
+        self._offset = 0
+        self._fingerprint: Optional[str] = None
+        self._load_state()
+
+    def _load_state(self) -> None:
+        try:
+            with open(self.state_path, "rb") as f:
+                state = pickle.load(f)
+        except Exception:
+            return
+        if not isinstance(state, dict) or state.get("path") != str(self.path):
+            return
+        self.latest = state.get("latest") or {}
+        self._offset = int(state.get("offset") or 0)
+        self._fingerprint = state.get("fingerprint")
+
+    def refresh(self, *, save: bool = True) -> Dict[str, Dict[str, Any]]:
+        start = resume_offset(self.path, self._offset, self._fingerprint)
+        if start == 0:
+            self.latest = {}
+            self.changed = None
+        else:
+            self.changed = []
+        if not self.path.exists():
+            return self.latest
+
+        records, end = read_complete_lines(self.path, start)
+        for obj in records:
+            gid = obj.get("game_id")
+            if gid is None:
+                continue
+            gid = str(gid)
+            self.latest[gid] = obj
+            if self.changed is not None:
+                self.changed.append(gid)
+
+        if end != self._offset or start == 0:
+            self._offset = end
+            self._fingerprint = file_fingerprint(self.path, end)
+            if save:
+                self.save()
+        return self.latest
+
+    def save(self) -> None:
+        _write_atomic(self.state_path, pickle.dumps({
+            "path": str(self.path),
+            "consumer": self.consumer,
+            "offset": self._offset,
+            "fingerprint": self._fingerprint,
+            "latest": self.latest,
+        }, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_latest_incremental(path: Path, consumer: str, *, state_dir: Path = CURSOR_DIR) -> Dict[str, Dict[str, Any]]:
+    """Drop-in for `load_latest_by_game_id` that only parses newly appended lines."""
+    return LatestByGameIndex(path, consumer, state_dir=state_dir).refresh()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -10,6 +11,10 @@ PREDICTION_EVENTS_PATH = Path("data/prediction_events.jsonl")
 OUTCOME_EVENTS_PATH = Path("data/outcome_events.jsonl")
 POSTGAME_METRICS_EVENTS_PATH = Path("data/postgame_metrics_events.jsonl")
 
+# "jsonl" (default) parses the log on every read; "sqlite" reads through the
+# indexed store in utils/event_store_sqlite, syncing appended lines first.
+EVENT_STORE_BACKEND = os.environ.get("EVENT_STORE_BACKEND", "jsonl").strip().lower()
+
 
 def _ensure_parent(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -132,6 +137,11 @@ def load_latest_by_game_id(path: Path) -> Dict[str, Dict[str, Any]]:
     """
     Load JSONL and return latest record per game_id.
     """
+    if EVENT_STORE_BACKEND == "sqlite":
+        indexed = _load_latest_from_sqlite(path)
+        if indexed is not None:
+            return indexed
+
     latest: Dict[str, Dict[str, Any]] = {}
     if not path.exists():
         return latest
@@ -150,3 +160,20 @@ def load_latest_by_game_id(path: Path) -> Dict[str, Dict[str, Any]]:
             latest[str(gid)] = obj
     return latest
 
+
+
+def _load_latest_from_sqlite(path: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Indexed read for the canonical logs; None falls back to parsing the file."""
+    try:
+        try:
+            from utils.event_store_sqlite import get_default_store, stream_for_path
+        except Exception:
+            from event_store_sqlite import get_default_store, stream_for_path
+        stream = stream_for_path(path)
+        if stream is None:
+            return None
+        store = get_default_store()
+        store.sync_jsonl(stream, path)
+        return store.latest_by_game_id(stream)
+    except Exception:
+        return None
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+SQLite backend for the append-only event logs in utils/event_store.
+
+The JSONL files stay the canonical, git-committed record. This store is an
+indexed copy of them: every event is a row keyed by (stream, game_id, date),
+and a `latest` table tracks the newest row per game so "latest per game" and
+date-range reads are index lookups instead of full-file parses.
+
+The store keeps the byte offset it has imported from each JSONL file, so
+`sync_jsonl()` only parses lines appended since the previous sync. If a file
+was truncated or rewritten (e.g. by `compact_event_logs`), the stream is
+rebuilt from scratch (see utils/event_cursor for the detection).
+
+The append API writes through: each event is appended to the stream's JSONL
+file first and then imported by the same incremental sync, so the log stays
+the only source of truth and a later rebuild reproduces every row.
+
+Usage:
+    python3 utils/event_store_sqlite.py            # migrate/sync all logs
+    python3 utils/event_store_sqlite.py --rebuild  # drop and re-import
+
+Set EVENT_STORE_BACKEND=sqlite to make `event_store.load_latest_by_game_id`
+read through this store (EVENT_STORE_DB moves the database file).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from utils.event_store import (
+        OUTCOME_EVENTS_PATH,
+        POSTGAME_METRICS_EVENTS_PATH,
+        PREDICTION_EVENTS_PATH,
+        _json_safe,
+    )
+    from utils.event_cursor import file_fingerprint, read_complete_lines, resume_offset
+except Exception:
+    from event_store import (
+        OUTCOME_EVENTS_PATH,
+        POSTGAME_METRICS_EVENTS_PATH,
+        PREDICTION_EVENTS_PATH,
+        _json_safe,
+    )
+    from event_cursor import file_fingerprint, read_complete_lines, resume_offset
+
+
+EVENT_STORE_DB_PATH = Path(os.environ.get("EVENT_STORE_DB", "data/event_store.sqlite3"))
+
+STREAM_PATHS: Dict[str, Path] = {
+    "prediction": PREDICTION_EVENTS_PATH,
+    "outcome": OUTCOME_EVENTS_PATH,
+    "postgame_metrics": POSTGAME_METRICS_EVENTS_PATH,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stream TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    date TEXT,
+    away_team TEXT,
+    home_team TEXT,
+    recorded_at_utc TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_stream_game ON events(stream, game_id);
+CREATE INDEX IF NOT EXISTS idx_events_stream_date ON events(stream, date);
+
+CREATE TABLE IF NOT EXISTS latest (
+    stream TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    event_id INTEGER NOT NULL,
+    date TEXT,
+    PRIMARY KEY (stream, game_id)
+);
+CREATE INDEX IF NOT EXISTS idx_latest_stream_date ON latest(stream, date);
+
+CREATE TABLE IF NOT EXISTS jsonl_sources (
+    stream TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+
+def _utc_now() -> str:
+    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class SQLiteEventStore:
+    """
+    Indexed event store with the same append API as utils/event_store.
+
+    `paths` maps each stream to its JSONL log (default STREAM_PATHS). One
+    connection per store, guarded by a lock so a store can be shared by
+    worker threads.
+    """
+
+    def __init__(self, db_path: Path = EVENT_STORE_DB_PATH, paths: Optional[Dict[str, Path]] = None) -> None:
+        self.db_path = Path(db_path)
+        self.paths: Dict[str, Path] = {s: Path(p) for s, p in {**STREAM_PATHS, **(paths or {})}.items()}
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "SQLiteEventStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _row_for(stream: str, payload: Dict[str, Any]) -> Optional[Tuple]:
+        gid = payload.get("game_id")
+        if gid is None:
+            return None
+        date = payload.get("date")
+        return (
+            stream,
+            str(gid),
+            str(date) if date is not None else None,
+            payload.get("away_team"),
+            payload.get("home_team"),
+            payload.get("recorded_at_utc"),
+            json.dumps(payload, ensure_ascii=False),
+        )
+
+    def _insert_many(self, rows: Iterable[Tuple]) -> int:
+        """Insert event rows and advance `latest`; caller holds the lock and commits."""
+        n = 0
+        for row in rows:
+            cur = self._conn.execute(
+                "INSERT INTO events (stream, game_id, date, away_team, home_team, recorded_at_utc, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO latest (stream, game_id, event_id, date) VALUES (?, ?, ?, ?)",
+                (row[0], row[1], cur.lastrowid, row[2]),
+            )
+            n += 1
+        return n
+
+    def append(self, stream: str, payload: Dict[str, Any]) -> None:
+        """Append one event to the stream's JSONL log and import it (with anything else new)."""
+        path = self.paths[stream]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            with open(path, "a") as f:
+                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            self._sync_locked(stream, path, rebuild=False)
+
+    def append_prediction_event(self, event: Dict[str, Any]) -> None:
+        payload = _json_safe(dict(event))
+        payload.setdefault("event_type", "prediction")
+        payload.setdefault("recorded_at_utc", _utc_now())
+        self.append("prediction", payload)
+
+    def append_outcome_event(
+        self,
+        *,
+        game_id: str,
+        date: Optional[str],
+        away_team: Optional[str],
+        home_team: Optional[str],
+        actual_away_score: Optional[int],
+        actual_home_score: Optional[int],
+        actual_winner: Optional[str],
+        lead_after_p1: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        payload: Dict[str, Any] = _json_safe({
+            "event_type": "outcome",
+            "recorded_at_utc": _utc_now(),
+            "game_id": game_id,
+            "date": date,
+            "away_team": away_team,
+            "home_team": home_team,
+            "actual_away_score": actual_away_score,
+            "actual_home_score": actual_home_score,
+            "actual_winner": actual_winner,
+        })
+        if lead_after_p1 is not None:
+            payload["lead_after_p1"] = int(lead_after_p1)
+        for k, v in kwargs.items():
+            if v is not None:
+                payload[k] = _json_safe(v)
+        self.append("outcome", payload)
+
+    def append_postgame_metrics_event(self, event: Dict[str, Any]) -> None:
+        payload = _json_safe(dict(event))
+        payload.setdefault("event_type", "postgame_metrics")
+        payload.setdefault("recorded_at_utc", _utc_now())
+        self.append("postgame_metrics", payload)
+
+    # ------------------------------------------------------------------
+    # JSONL migration / incremental sync
+    # ------------------------------------------------------------------
+
+    def _drop_stream(self, stream: str) -> None:
+        self._conn.execute("DELETE FROM events WHERE stream = ?", (stream,))
+        self._conn.execute("DELETE FROM latest WHERE stream = ?", (stream,))
+        self._conn.execute("DELETE FROM jsonl_sources WHERE stream = ?", (stream,))
+
+    def sync_jsonl(self, stream: str, path: Optional[Path] = None, *, rebuild: bool = False) -> int:
+        """
+        Import lines appended to a JSONL log since the last sync.
+
+        Returns the number of events imported. A missing file is a no-op; a
+        file that was truncated or rewritten triggers a full re-import.
+        """
+        path = Path(path) if path is not None else self.paths[stream]
+        if not path.exists():
+            return 0
+        with self._lock:
+            return self._sync_locked(stream, path, rebuild=rebuild)
+
+    def _sync_locked(self, stream: str, path: Path, *, rebuild: bool) -> int:
+        # Called with self._lock held.
+        size = path.stat().st_size
+        src = self._conn.execute(
+            "SELECT path, offset, fingerprint FROM jsonl_sources WHERE stream = ?", (stream,)
+        ).fetchone()
+        start = 0
+        if src is not None and not rebuild and src[0] == str(path):
+            start = resume_offset(path, int(src[1]), src[2])
+        if start == 0 and src is not None:
+            self._drop_stream(stream)
+        if start == size:
+            return 0
+
+        records, end = read_complete_lines(path, start)
+        rows = [r for r in (self._row_for(stream, obj) for obj in records) if r is not None]
+        n = self._insert_many(rows)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO jsonl_sources (stream, path, offset, fingerprint) VALUES (?, ?, ?, ?)",
+            (stream, str(path), end, file_fingerprint(path, end)),
+        )
+        self._conn.commit()
+        return n
+
+    def migrate_from_jsonl(self, *, rebuild: bool = False) -> Dict[str, int]:
+        """Sync every known JSONL log into the store."""
+        return {stream: self.sync_jsonl(stream, path, rebuild=rebuild) for stream, path in self.paths.items()}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _select(self, sql: str, params: Tuple) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def latest_by_game_id(self, stream: str) -> Dict[str, Dict[str, Any]]:
+        """Latest record per game_id, in the same shape as `load_latest_by_game_id`."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT l.game_id, e.payload FROM latest l JOIN events e ON e.id = l.event_id "
+                "WHERE l.stream = ? ORDER BY l.event_id",
+                (stream,),
+            ).fetchall()
+        return {gid: json.loads(payload) for gid, payload in rows}
+
+    def latest_for_game(self, stream: str, game_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._select(
+            "SELECT e.payload FROM latest l JOIN events e ON e.id = l.event_id "
+            "WHERE l.stream = ? AND l.game_id = ?",
+            (stream, str(game_id)),
+        )
+        return rows[0] if rows else None
+
+    def events_for_game(self, stream: str, game_id: str) -> List[Dict[str, Any]]:
+        """Every event recorded for a game, oldest first."""
+        return self._select(
+            "SELECT payload FROM events WHERE stream = ? AND game_id = ? ORDER BY id",
+            (stream, str(game_id)),
+        )
+
+    def latest_between(self, stream: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Latest record per game for games dated in [start_date, end_date] (YYYY-MM-DD)."""
+        return self._select(
+            "SELECT e.payload FROM latest l JOIN events e ON e.id = l.event_id "
+            "WHERE l.stream = ? AND l.date >= ? AND l.date <= ? ORDER BY l.date, l.game_id",
+            (stream, start_date, end_date),
+        )
+
+    def count(self, stream: str, *, latest: bool = False) -> int:
+        table = "latest" if latest else "events"
+        with self._lock:
+            return int(self._conn.execute(f"SELECT COUNT(*) FROM {table} WHERE stream = ?", (stream,)).fetchone()[0])
+
+
+_default_store: Optional[SQLiteEventStore] = None
+_default_lock = threading.Lock()
+
+
+def get_default_store() -> SQLiteEventStore:
+    """Process-wide store at EVENT_STORE_DB_PATH."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = SQLiteEventStore()
+        return _default_store
+
+
+def stream_for_path(path: Path) -> Optional[str]:
+    """Map a canonical JSONL path back to its stream name."""
+    p = Path(path)
+    for stream, sp in STREAM_PATHS.items():
+        if p == sp:
+            return stream
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate JSONL event logs into the SQLite event store")
+    parser.add_argument("--db", type=Path, default=EVENT_STORE_DB_PATH)
+    parser.add_argument("--rebuild", action="store_true", help="Drop and re-import every stream")
+    args = parser.parse_args()
+
+    with SQLiteEventStore(args.db) as store:
+        imported = store.migrate_from_jsonl(rebuild=args.rebuild)
+        for stream, n in imported.items():
+            print(f"IMPORTED_{stream.upper()}={n} GAMES={store.count(stream, latest=True)}")
+
+
+if __name__ == "__main__":
+    main()
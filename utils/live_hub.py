@@ -0,0 +1,214 @@
+"""
+Server-side fan-out of live game updates.
+
+`LiveGameHub` computes each watched game once per tick, on the LivePoller
+schedule (see live_poller.py), and keeps the latest result as a snapshot
+(the payload plus its JSON text, serialized once). Every reader shares it:
+
+  snapshot(game_id)     the cached snapshot - the JSON polling endpoint
+  subscribe(game_id)    yields each new snapshot - the server-sent events stream
+
+so upstream NHL traffic depends on how many games are being watched, not
+on how many clients watch them. The first reader of a game waits for its
+first computation; concurrent readers wait on that same computation.
+
+A game is watched while it has a subscriber or was read in the last
+LIVE_HUB_IDLE_SECONDS (default 120). Each sweep (every `sweep_interval`
+seconds) drops the others and forgets their snapshots, then passes the
+watched set to `on_sweep` so the caller can free its own per-game state. A
+final game is computed one last time and then served from its snapshot until
+it goes idle.
+
+A failed computation keeps the last good snapshot; it is only published
+when the game has no snapshot yet, so the first reader gets the error.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+try:
+    from utils.live_poller import LivePoller
+except Exception:
+    from live_poller import LivePoller
+
+
+SWEEP_INTERVAL = 30.0
+FIRST_RESULT_TIMEOUT = 60.0
+HEARTBEAT_INTERVAL = 15.0
+
+
+def default_idle_timeout() -> float:
+    try:
+        seconds = float(os.environ.get("LIVE_HUB_IDLE_SECONDS", "0"))
+    except ValueError:
+        seconds = 0.0
+    return seconds if seconds > 0 else 120.0
+
+
+class LiveGameHub:
+    """
+    compute(game_id) -> (payload, http_status)   one full computation of a game
+    status_of(game_id, payload)                  the poll_interval() status of a payload
+    on_sweep(watched_game_ids)                   called after each sweep (e.g. to retire sessions)
+
+    Snapshots are dicts: {'game_id', 'version', 'status', 'payload', 'data'
+    (JSON text), 'updated_at' (epoch seconds), 'final'}. Treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[str], Tuple[Dict[str, Any], int]],
+        status_of: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+        on_sweep: Optional[Callable[[Set[str]], None]] = None,
+        idle_timeout: Optional[float] = None,
+        sweep_interval: float = SWEEP_INTERVAL,
+        dumps: Callable[[Any], str] = lambda payload: json.dumps(payload, default=str),
+        clock: Callable[[], float] = time.monotonic,
+        **poller_options,
+    ):
+        self.compute = compute
+        self.status_of = status_of
+        self.on_sweep = on_sweep
+        self.idle_timeout = idle_timeout or default_idle_timeout()
+        self.dumps = dumps
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._changed: Dict[str, threading.Condition] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Dict[str, int] = {}
+        self._last_read: Dict[str, float] = {}
+        self._thread: Optional[threading.Thread] = None
+
+        self.poller = LivePoller(
+            self._poll,
+            lambda game_id, payload: self.status_of(game_id, payload),
+            on_final=self._on_final,
+            discover=self._sweep,
+            discover_interval=sweep_interval,
+            clock=clock,
+            **poller_options,
+        )
+
+    def start(self) -> None:
+        """Run the poller in a daemon thread (once)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self.poller.run, name="live-hub", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.poller.stop()
+
+    def _condition(self, game_id: str) -> threading.Condition:
+        # Called with self._lock held.
+        changed = self._changed.get(game_id)
+        if changed is None:
+            changed = self._changed[game_id] = threading.Condition(self._lock)
+        return changed
+
+    # Computation (pool threads)
+
+    def _poll(self, game_id: str):
+        payload, status = self.compute(game_id)
+        ok = status == 200
+        with self._lock:
+            previous = self._snapshots.get(game_id)
+            if ok or previous is None:
+                self._publish(game_id, payload, status)
+        # A failed computation is retried with backoff.
+        return payload if ok else None
+
+    def _publish(self, game_id: str, payload: Dict[str, Any], status: int, final: bool = False) -> None:
+        # Called with self._lock held. An unchanged payload is not a new version.
+        previous = self._snapshots.get(game_id)
+        data = self.dumps(payload)
+        if previous is not None and previous['data'] == data and previous['status'] == status and previous['final'] == final:
+            return
+        self._snapshots[game_id] = {
+            'game_id': game_id,
+            'version': (previous['version'] if previous else 0) + 1,
+            'status': status,
+            'payload': payload,
+            'data': data,
+            'updated_at': time.time(),
+            'final': final,
+        }
+        self._condition(game_id).notify_all()
+
+    def _on_final(self, game_id: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._publish(game_id, payload, 200, final=True)
+
+    def _sweep(self):
+        """The watched games (LivePoller discovery); forgets the rest."""
+        now = self._clock()
+        with self._lock:
+            watched = {g for g, n in self._subscribers.items() if n > 0}
+            watched |= {g for g, t in self._last_read.items() if now - t < self.idle_timeout}
+            idle = (set(self._snapshots) | set(self._last_read)) - watched
+            for game_id in idle:
+                self._snapshots.pop(game_id, None)
+                self._last_read.pop(game_id, None)
+                self._subscribers.pop(game_id, None)
+                self._changed.pop(game_id, None)
+        for game_id in idle:
+            self.poller.forget(game_id)
+        if self.on_sweep:
+            try:
+                self.on_sweep(set(watched))
+            except Exception as e:
+                print(f"⚠️ Live hub: on_sweep failed: {e}")
+        return watched
+
+    # Readers (request threads)
+
+    def watch(self, game_id) -> str:
+        """Mark game_id as read now and make sure it is being computed."""
+        game_id = str(game_id)
+        with self._lock:
+            self._last_read[game_id] = self._clock()
+        self.start()
+        self.poller.track(game_id)
+        return game_id
+
+    def snapshot(self, game_id, timeout: float = FIRST_RESULT_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """The game's latest snapshot, waiting up to `timeout` seconds for the first one."""
+        game_id = self.watch(game_id)
+        with self._lock:
+            self._condition(game_id).wait_for(lambda: game_id in self._snapshots, timeout)
+            return self._snapshots.get(game_id)
+
+    def subscribe(self, game_id, heartbeat: float = HEARTBEAT_INTERVAL) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Yield each new snapshot of game_id, starting with the current one, and
+        None after `heartbeat` seconds without one. Ends after the final snapshot.
+        """
+        game_id = str(game_id)
+        with self._lock:
+            self._subscribers[game_id] = self._subscribers.get(game_id, 0) + 1
+        try:
+            self.watch(game_id)
+            version = 0
+            while True:
+                with self._lock:
+                    newer = lambda: (self._snapshots.get(game_id) or {}).get('version', 0) > version
+                    self._condition(game_id).wait_for(newer, heartbeat)
+                    snapshot = self._snapshots.get(game_id)
+                if snapshot is None or snapshot['version'] <= version:
+                    yield None
+                    continue
+                version = snapshot['version']
+                yield snapshot
+                if snapshot['final']:
+                    return
+        finally:
+            with self._lock:
+                self._subscribers[game_id] = max(0, self._subscribers.get(game_id, 1) - 1)
+                self._last_read[game_id] = self._clock()
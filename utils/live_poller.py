@@ -0,0 +1,315 @@
+"""
+Concurrent polling of live games, each on its own schedule.
+
+`LivePoller` keeps one due time per tracked game and hands due games to a
+thread pool, so a slow or failing game never delays the others. After every
+poll the game's next interval comes from its state (`poll_interval`):
+
+  critical      5s   overtime, the last 2 minutes of the 3rd, an empty net
+  late         10s   the rest of the last 5 minutes of the 3rd
+  live         20s   any other live play
+  intermission 60s   between periods
+  final        -     the game is dropped (and `on_final` is called)
+
+A poll that raises or returns None is retried with jittered exponential
+backoff (`backoff_delay`), capped at MAX_BACKOFF. Every poll, and every
+call to `discover`, first takes tokens from a shared `RequestBudget`, so
+the whole poller never exceeds LIVE_POLL_REQUESTS_PER_MINUTE upstream
+requests however many games are live.
+
+`discover()` returns the ids that should be tracked (e.g. today's live
+games). It is called every `discover_interval` seconds. Games it returns
+are added, and games it stops returning are dropped.
+
+LIVE_POLL_WORKERS caps the thread pool.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+INTERVALS: Dict[str, float] = {
+    'critical': 5.0,
+    'late': 10.0,
+    'live': 20.0,
+    'intermission': 60.0,
+}
+BACKOFF_BASE = 5.0
+MAX_BACKOFF = 300.0
+FINAL_GAME_STATES = frozenset({'FINAL', 'OFF'})
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        n = int(os.environ.get(name, "0"))
+    except ValueError:
+        n = 0
+    return n if n > 0 else default
+
+
+def default_workers() -> int:
+    return _env_int("LIVE_POLL_WORKERS", 16)
+
+
+def default_requests_per_minute() -> int:
+    return _env_int("LIVE_POLL_REQUESTS_PER_MINUTE", 240)
+
+
+def clock_seconds(time_remaining) -> Optional[int]:
+    """'MM:SS' -> seconds, None when it cannot be read."""
+    try:
+        minutes, seconds = str(time_remaining).split(':')
+        return int(minutes) * 60 + int(seconds)
+    except (TypeError, ValueError):
+        return None
+
+
+def net_is_empty(situation_code) -> bool:
+    """True when either goalie is pulled (situationCode digits: away goalie, away skaters, home skaters, home goalie)."""
+    code = str(situation_code or '')
+    return len(code) == 4 and code.isdigit() and (code[0] == '0' or code[3] == '0')
+
+
+def poll_interval(status: Dict[str, Any], intervals: Optional[Dict[str, float]] = None) -> Optional[float]:
+    """
+    Seconds until a game should be polled again, None once it is final.
+
+    `status` keys (all optional): game_state, period, seconds_remaining,
+    in_intermission, situation_code.
+    """
+    intervals = {**INTERVALS, **(intervals or {})}
+    if str(status.get('game_state') or '').upper() in FINAL_GAME_STATES:
+        return None
+    if status.get('in_intermission'):
+        return intervals['intermission']
+
+    period = status.get('period') or 0
+    remaining = status.get('seconds_remaining')
+    if period > 3 or net_is_empty(status.get('situation_code')):
+        return intervals['critical']
+    if period == 3 and remaining is not None:
+        if remaining <= 120:
+            return intervals['critical']
+        if remaining <= 300:
+            return intervals['late']
+    return intervals['live']
+
+
+def backoff_delay(failures: int, base: float = BACKOFF_BASE, cap: float = MAX_BACKOFF,
+                  rng: Callable[[], float] = random.random) -> float:
+    """Jittered exponential backoff after `failures` consecutive failed polls (50-150% of base * 2^(n-1))."""
+    delay = min(cap, base * (2 ** max(0, failures - 1)))
+    return min(cap, delay * (0.5 + rng()))
+
+
+class RequestBudget:
+    """Token bucket shared by every request the poller makes."""
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.rate = per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1.0, per_minute / 6.0))
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take `tokens`, sleeping until they are available. Returns the time waited."""
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class LivePoller:
+    """
+    Poll every tracked game concurrently, each at the interval its state calls for.
+
+    poll(game_id)                     fetch and process one game; raise or return None on failure
+    status_of(game_id, result)        the poll_interval() status of a successful result
+    on_result(game_id, result, status) called after every successful poll (from a pool thread)
+    on_final(game_id, result)         called once when a game reaches a final state
+    discover()                        ids to track, refreshed every `discover_interval` seconds
+    """
+
+    def __init__(
+        self,
+        poll: Callable[[Any], Any],
+        status_of: Callable[[Any, Any], Dict[str, Any]],
+        on_result: Optional[Callable[[Any, Any, Dict[str, Any]], None]] = None,
+        on_final: Optional[Callable[[Any, Any], None]] = None,
+        discover: Optional[Callable[[], Iterable[Any]]] = None,
+        discover_interval: float = 60.0,
+        intervals: Optional[Dict[str, float]] = None,
+        max_workers: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        requests_per_poll: float = 1.0,
+        backoff_base: float = BACKOFF_BASE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.poll = poll
+        self.status_of = status_of
+        self.on_result = on_result
+        self.on_final = on_final
+        self.discover = discover
+        self.discover_interval = discover_interval
+        self.intervals = {**INTERVALS, **(intervals or {})}
+        self.max_workers = max_workers or default_workers()
+        self.budget = RequestBudget(requests_per_minute or default_requests_per_minute(), clock=clock, sleep=sleep)
+        self.requests_per_poll = requests_per_poll
+        self.backoff_base = backoff_base
+        self._clock = clock
+        self._rng = rng
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._due = []            # heap of (due time, sequence, game_id)
+        self._seq = 0
+        self._tracked = {}        # game_id -> due time, or None while its poll is running
+        self._failures: Dict[Any, int] = {}
+        self._finished = set()    # reached a final state; never tracked again
+        self._next_discovery = None
+
+    def track(self, game_id, delay: float = 0.0) -> None:
+        """Start polling game_id (after `delay` seconds); a no-op if it is already tracked."""
+        with self._lock:
+            if game_id in self._tracked or game_id in self._finished:
+                return
+            self._schedule(game_id, self._clock() + delay)
+        self._wake.set()
+
+    def untrack(self, game_id) -> None:
+        with self._lock:
+            self._tracked.pop(game_id, None)
+            self._failures.pop(game_id, None)
+
+    def forget(self, game_id) -> None:
+        """Untrack game_id; a later track() polls it again even if it had reached a final state."""
+        self.untrack(game_id)
+        with self._lock:
+            self._finished.discard(game_id)
+
+    @property
+    def tracked(self):
+        with self._lock:
+            return set(self._tracked)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _schedule(self, game_id, due: float) -> None:
+        # Called with self._lock held. Stale heap entries are skipped when popped.
+        self._tracked[game_id] = due
+        self._seq += 1
+        heapq.heappush(self._due, (due, self._seq, game_id))
+
+    def _pop_due(self, now: float):
+        due = []
+        with self._lock:
+            while self._due and self._due[0][0] <= now:
+                when, _, game_id = heapq.heappop(self._due)
+                if self._tracked.get(game_id) == when:
+                    self._tracked[game_id] = None
+                    due.append(game_id)
+            next_due = self._due[0][0] if self._due else None
+        return due, next_due
+
+    def _refresh(self) -> None:
+        self.budget.acquire()
+        try:
+            wanted = set(self.discover())
+        except Exception as e:
+            print(f"⚠️ Live poller: discovery failed ({e}); keeping {len(self.tracked)} games")
+            return
+        for game_id in self.tracked - wanted:
+            self.untrack(game_id)
+        for game_id in wanted:
+            self.track(game_id)
+
+    def _poll_one(self, game_id) -> None:
+        try:
+            result = self.poll(game_id)
+            error = None if result is not None else "no data"
+        except Exception as e:
+            result, error = None, e
+
+        if error is not None:
+            with self._lock:
+                failures = self._failures[game_id] = self._failures.get(game_id, 0) + 1
+            delay = backoff_delay(failures, base=self.backoff_base, rng=self._rng)
+            print(f"⚠️ Live poller: {game_id} failed ({error}); retry #{failures} in {delay:.0f}s")
+            self._reschedule(game_id, delay)
+            return
+
+        with self._lock:
+            self._failures.pop(game_id, None)
+        try:
+            status = self.status_of(game_id, result) or {}
+            interval = poll_interval(status, self.intervals)
+            if self.on_result:
+                self.on_result(game_id, result, status)
+        except Exception as e:
+            print(f"⚠️ Live poller: handling {game_id} failed: {e}")
+            interval = self.intervals['live']
+
+        if interval is None:
+            with self._lock:
+                self._finished.add(game_id)
+            self.untrack(game_id)
+            if self.on_final:
+                self.on_final(game_id, result)
+            return
+        self._reschedule(game_id, interval)
+
+    def _reschedule(self, game_id, delay: float) -> None:
+        with self._lock:
+            # Dropped (untracked) while the poll ran: leave it dropped.
+            if game_id in self._tracked and self._tracked[game_id] is None:
+                self._schedule(game_id, self._clock() + delay)
+        self._wake.set()
+
+    def run(self, until: Optional[Callable[[], bool]] = None) -> None:
+        """Poll until stop() is called (or `until()` returns True)."""
+        self._stop.clear()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="live-poll") as pool:
+            while not self._stop.is_set() and not (until and until()):
+                # Cleared before reading the schedule, so a track() or reschedule
+                # that lands after this point still ends the wait below.
+                self._wake.clear()
+                now = self._clock()
+                if self.discover and (self._next_discovery is None or now >= self._next_discovery):
+                    self._refresh()
+                    self._next_discovery = self._clock() + self.discover_interval
+
+                due, next_due = self._pop_due(self._clock())
+                for game_id in due:
+                    self.budget.acquire(self.requests_per_poll)
+                    pool.submit(self._poll_one, game_id)
+                if due:
+                    continue
+
+                wait_until = [t for t in (next_due, self._next_discovery) if t is not None]
+                timeout = max(0.0, min(wait_until) - self._clock()) if wait_until else self.discover_interval
+                self._wake.wait(timeout)
@@ -0,0 +1,251 @@
+"""
+Response cache for NHLAPIClient.
+
+Finished games never change, so gamecenter payloads (boxscore, play-by-play,
+landing) for FINAL/OFF games are kept permanently on disk. Live games get a
+short TTL, pre-game payloads a medium one, and schedule weeks are refreshed
+until every game in the week is final. A small LRU dict sits in front of the
+gzip-compressed disk store so repeated reads inside one process are free.
+
+Set NHL_API_CACHE=0 to bypass the cache entirely, NHL_API_CACHE_DIR to move it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+CACHE_DIR = Path(os.environ.get("NHL_API_CACHE_DIR", "data/cache/nhl_api"))
+
+FINAL_GAME_STATES = frozenset({"FINAL", "OFF"})
+LIVE_GAME_STATES = frozenset({"LIVE", "CRIT"})
+
+# Seconds until an entry expires; None means "never expires".
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "gamecenter_final": None,
+    "gamecenter_live": 5.0,  # the fastest live poll interval (utils/live_poller.py)
+    "gamecenter_pregame": 300.0,
+    "schedule_final": None,
+    "schedule_live": 60.0,
+    "schedule": 600.0,
+    "roster": 6 * 3600.0,
+    "player": 6 * 3600.0,
+    "team": 24 * 3600.0,
+    "standings": 300.0,
+    "default": 300.0,
+}
+
+# Entries expiring sooner than this stay in memory only (live polling would
+# otherwise rewrite a megabyte of play-by-play to disk every cycle).
+DISK_MIN_TTL = 120.0
+
+
+def game_state_of(payload: Any) -> Optional[str]:
+    """Return the gameState of a gamecenter payload (boxscore, pbp, landing)."""
+    if not isinstance(payload, dict):
+        return None
+    state = payload.get("gameState")
+    return str(state).upper() if state else None
+
+
+def _schedule_is_final(payload: Any) -> bool:
+    """True when every game in a past schedule week is final."""
+    if not isinstance(payload, dict):
+        return False
+    days = payload.get("gameWeek") or []
+    games = [g for d in days for g in (d.get("games") or [])]
+    if not games:
+        return False
+    last_date = str(days[-1].get("date") or "")
+    if not last_date or last_date >= datetime.now().strftime("%Y-%m-%d"):
+        return False
+    return all(str(g.get("gameState") or "").upper() in FINAL_GAME_STATES for g in games)
+
+
+def _schedule_has_live(payload: Any) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    days = payload.get("gameWeek") or []
+    return any(
+        str(g.get("gameState") or "").upper() in LIVE_GAME_STATES
+        for d in days for g in (d.get("games") or [])
+    )
+
+
+def ttl_for(kind: str, payload: Any, ttls: Optional[Dict[str, Optional[float]]] = None) -> Optional[float]:
+    """
+    Resolve the TTL for a payload of a given endpoint kind.
+
+    `kind` is one of "gamecenter", "schedule", "roster", "player", "team",
+    "standings" (anything else falls back to "default").
+    """
+    t = ttls or DEFAULT_TTLS
+    if kind == "gamecenter":
+        state = game_state_of(payload)
+        if state in FINAL_GAME_STATES:
+            return t["gamecenter_final"]
+        if state in LIVE_GAME_STATES:
+            return t["gamecenter_live"]
+        return t["gamecenter_pregame"]
+    if kind == "schedule":
+        if _schedule_is_final(payload):
+            return t["schedule_final"]
+        if _schedule_has_live(payload):
+            return t["schedule_live"]
+        return t["schedule"]
+    return t.get(kind, t["default"])
+
+
+class ResponseCache:
+    """
+    Two-tier (LRU memory + gzip JSON on disk) cache keyed by API path.
+
+    Thread-safe; one instance is shared by every NHLAPIClient in the process
+    via `get_default_cache()`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR,
+        *,
+        max_memory_entries: int = 64,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        persist: bool = True,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_memory_entries = int(max_memory_entries)
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.persist = bool(persist)
+        self._mem: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json.gz"
+
+    @staticmethod
+    def _alive(expires_at: Optional[float]) -> bool:
+        return expires_at is None or expires_at > time.time()
+
+    def _remember(self, key: str, expires_at: Optional[float], text: str) -> None:
+        with self._lock:
+            self._mem[key] = (expires_at, text)
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.max_memory_entries:
+                self._mem.popitem(last=False)
+
+    def _get_text(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                if self._alive(entry[0]):
+                    self._mem.move_to_end(key)
+                    return entry[1]
+                del self._mem[key]
+
+        if not self.persist:
+            return None
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                text = f.read()
+        except Exception:
+            return None
+        if header.get("key") != key or not self._alive(header.get("expires_at")):
+            return None
+        self._remember(key, header.get("expires_at"), text)
+        return text
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return a cached, unexpired payload or None.
+
+        Entries are held as JSON text so every caller gets its own freshly
+        parsed object and can mutate it without poisoning the cache.
+        """
+        text = self._get_text(key)
+        if text is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(text)
+
+    def put(self, key: str, payload: Any, ttl: Optional[float]) -> None:
+        """Store a payload; ttl=None keeps it forever, ttl<=0 skips caching."""
+        if payload is None or (ttl is not None and ttl <= 0):
+            return
+        expires_at = None if ttl is None else time.time() + float(ttl)
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        self._remember(key, expires_at, text)
+
+        if not self.persist or (ttl is not None and ttl < DISK_MIN_TTL):
+            return
+        path = self._path_for(key)
+        header = {"key": key, "stored_at": time.time(), "expires_at": expires_at}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                f.write(json.dumps(header) + "\n")
+                f.write(text)
+            tmp.replace(path)
+        except Exception:
+            # Disk cache is best-effort; the memory tier still holds the entry.
+            pass
+
+    def get_or_fetch(self, key: str, kind: str, fetch: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """Return the cached payload for `key`, calling `fetch()` on a miss."""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        payload = fetch()
+        if payload is not None:
+            self.put(key, payload, ttl_for(kind, payload, self.ttls))
+        return payload
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._mem.pop(key, None)
+        try:
+            self._path_for(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._mem.clear()
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("NHL_API_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_default_cache() -> Optional[ResponseCache]:
+    """Process-wide shared cache, or None when disabled via NHL_API_CACHE=0."""
+    global _default_cache
+    if not cache_enabled():
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
@@ -2,10 +2,44 @@ import requests
 import json
 from datetime import datetime, timedelta
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from utils.nhl_api_cache import get_default_cache
+except ImportError:
+    from nhl_api_cache import get_default_cache
+
+class GameBundle(dict):
+    """
+    Read-only result of NHLAPIClient.get_game_bundle.
+
+    Keys: game_id, gameState, game_center, boxscore, play_by_play, landing.
+    It is a dict so existing `game_data['boxscore']` / `.get(...)` /
+    `isinstance(game_data, dict)` call sites keep working, but the top level
+    cannot be reassigned; use `.copy()` for a mutable plain-dict view.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("GameBundle is read-only; use .copy() for a mutable dict")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    update = setdefault = pop = popitem = clear = _readonly
+
+    def copy(self):
+        return dict(self)
+
+    def __reduce__(self):
+        return (GameBundle, (dict(self),))
+
 
 class NHLAPIClient:
-    def __init__(self):
+    def __init__(self, cache=None):
+        """
+        cache: a ResponseCache to read through, None for the process-wide
+        shared cache, or False to always hit the network.
+        """
         self.base_url = "https://api-web.nhle.com/v1"
+        self.cache = get_default_cache() if cache is None else (cache or None)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -14,48 +48,41 @@ class NHLAPIClient:
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive'
         })
-    
-    def get_team_info(self, team_id):
-        """Get team information by team ID"""
-        url = f"{self.base_url}/teams/{team_id}"
+
+    def _fetch_json(self, path):
+        url = f"{self.base_url}/{path}"
         response = self.session.get(url)
         if response.status_code == 200:
             return response.json()
         return None
+
+    def _get_json(self, path, kind="default"):
+        """GET base_url/path, reading through the response cache when enabled"""
+        if self.cache is None:
+            return self._fetch_json(path)
+        return self.cache.get_or_fetch(path, kind, lambda: self._fetch_json(path))
+    
+    def get_team_info(self, team_id):
+        """Get team information by team ID"""
+        return self._get_json(f"teams/{team_id}", "team")
     
     def get_team_roster(self, team_abbr):
         """Get team roster by team abbreviation"""
-        url = f"{self.base_url}/roster/{team_abbr}/current"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"roster/{team_abbr}/current", "roster")
     
     def get_game_schedule(self, date=None):
         """Get game schedule for a specific date"""
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
         
-        url = f"{self.base_url}/schedule/{date}"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"schedule/{date}", "schedule")
     
     def get_game_center(self, game_id):
         """Get detailed game information by combining boxscore and play-by-play"""
-        # Get boxscore data
-        boxscore_url = f"{self.base_url}/gamecenter/{game_id}/boxscore"
-        boxscore_response = self.session.get(boxscore_url)
+        boxscore_data = self.get_game_boxscore(game_id)
+        pbp_data = self.get_play_by_play(game_id)
         
-        # Get play-by-play data
-        pbp_url = f"{self.base_url}/gamecenter/{game_id}/play-by-play"
-        pbp_response = self.session.get(pbp_url)
-        
-        if boxscore_response.status_code == 200 and pbp_response.status_code == 200:
-            boxscore_data = boxscore_response.json()
-            pbp_data = pbp_response.json()
-            
+        if boxscore_data is not None and pbp_data is not None:
             # Combine the data
             combined_data = {
                 'boxscore': boxscore_data,
@@ -66,27 +93,15 @@ class NHLAPIClient:
     
     def get_game_landing(self, game_id):
         """Get game landing summary"""
-        url = f"{self.base_url}/gamecenter/{game_id}/landing"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"gamecenter/{game_id}/landing", "gamecenter")
 
     def get_game_boxscore(self, game_id):
         """Get game boxscore"""
-        url = f"{self.base_url}/gamecenter/{game_id}/boxscore"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"gamecenter/{game_id}/boxscore", "gamecenter")
     
     def get_player_stats(self, player_id):
         """Get player statistics"""
-        url = f"{self.base_url}/players/{player_id}/stats"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"players/{player_id}/stats", "player")
     
     def find_recent_game(self, team1_abbrev, team2_abbrev, days_back=30):
         """Find the most recent game between two teams"""
@@ -131,29 +146,50 @@ class NHLAPIClient:
     
     def get_play_by_play(self, game_id):
         """Get play-by-play data for a game"""
-        url = f"{self.base_url}/gamecenter/{game_id}/play-by-play"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json(f"gamecenter/{game_id}/play-by-play", "gamecenter")
 
-    def get_comprehensive_game_data(self, game_id):
-        """Get comprehensive game data including boxscore and play-by-play"""
-        game_center = self.get_game_center(game_id)
-        boxscore = self.get_game_boxscore(game_id)
-        play_by_play = self.get_play_by_play(game_id)
-        
-        print(f"Debug - Game Center data: {game_center is not None}")
-        print(f"Debug - Boxscore data: {boxscore is not None}")
-        print(f"Debug - Play-by-play data: {play_by_play is not None}")
-        
-        # If we have boxscore but no game_center, create a minimal game_center from boxscore
-        if boxscore is not None and game_center is None:
+    def get_game_bundle(self, game_id, include_landing=True):
+        """
+        Fetch boxscore, play-by-play and (optionally) landing exactly once each,
+        concurrently, and return them as a read-only GameBundle.
+
+        Returns None when the boxscore is unavailable.
+        """
+        fetchers = {
+            'boxscore': self.get_game_boxscore,
+            'play_by_play': self.get_play_by_play,
+        }
+        if include_landing:
+            fetchers['landing'] = self.get_game_landing
+
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+            futures = {name: pool.submit(fn, game_id) for name, fn in fetchers.items()}
+            boxscore = futures['boxscore'].result()
+            play_by_play = futures['play_by_play'].result()
+            landing = None
+            if 'landing' in futures:
+                try:
+                    landing = futures['landing'].result()
+                except Exception as e:
+                    # Landing only enriches the report; never fail the bundle on it
+                    print(f"Warning: landing fetch failed for {game_id}: {e}")
+
+        if boxscore is None:
+            print("Warning: Missing game data, returning None")
+            return None
+
+        if play_by_play is not None:
+            game_center = {
+                'boxscore': boxscore,
+                'play_by_play': play_by_play
+            }
+        else:
+            # Same minimal game_center shape callers have always received
             print("Creating minimal game_center from boxscore data...")
             game_center = {
                 'id': game_id,  # Ensure ID is present
                 'game': {
-                    'gameDate': '2024-03-04',  # Default date
+                    'gameDate': boxscore.get('gameDate', '2024-03-04'),
                     'awayTeamScore': boxscore['awayTeam']['score'],
                     'homeTeamScore': boxscore['homeTeam']['score'],
                     'awayTeamScoreByPeriod': [0, 0, 0, 0],  # Default periods
@@ -171,16 +207,19 @@ class NHLAPIClient:
                     'default': 'Unknown Arena'
                 }
             }
-        
-        if game_center is None or boxscore is None:
-            print("Warning: Missing game data, returning None")
-            return None
-        
-        return {
-            'game_center': game_center,
-            'boxscore': boxscore,
-            'play_by_play': play_by_play
-        }
+
+        return GameBundle(
+            game_id=str(game_id),
+            gameState=boxscore.get('gameState') or (play_by_play or {}).get('gameState'),
+            game_center=game_center,
+            boxscore=boxscore,
+            play_by_play=play_by_play,
+            landing=landing,
+        )
+
+    def get_comprehensive_game_data(self, game_id):
+        """Get comprehensive game data including boxscore and play-by-play"""
+        return self.get_game_bundle(game_id)
 
     def get_team_recent_games(self, team_abbr, limit=5):
         """Get recent game IDs for a team"""
@@ -306,8 +345,4 @@ class NHLAPIClient:
 
     def get_standings(self):
         """Get current league standings"""
-        url = f"{self.base_url}/standings/now"
-        response = self.session.get(url)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        return self._get_json("standings/now", "standings")
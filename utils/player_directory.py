@@ -0,0 +1,340 @@
+"""
+Persistent player directory: player id -> name, position, handedness.
+
+Player names used to be resolved by whoever needed them: the report
+generators rebuilt a roster map from rosterSpots / the boxscore for every
+game, and the live predictor scanned the boxscore (and called roster
+endpoints) for every shot. The directory keeps one record per player id
+
+  name, firstName, lastName, sweaterNumber, positionCode, shootsCatches,
+  teamId, teamAbbrev
+
+merged from every payload that passes through it:
+
+  add_roster_spots(spots)   play-by-play rosterSpots (no network)
+  add_boxscore(boxscore)    boxscore playerByGameStats (no network)
+  add_team_roster(roster)   a roster/{team}/current response
+  refresh_teams(client, teams)
+                            fetch several team rosters at once, skipping
+                            teams refreshed within ROSTER_MAX_AGE
+
+`get()` and `name()` are dictionary reads, so they are safe inside per-event
+loops; nothing here touches the network except `refresh_teams`.
+
+`game_roster(play_by_play, boxscore)` is the per-game {player id: info} map
+the report generators read (the players dressed for that game, with the
+team they played for), memoized per payload.
+
+The process-wide directory (`get_player_directory()`) is loaded from
+PLAYER_DIRECTORY_PATH (default data/player_directory.json) on first use and
+written back at exit and after every refresh when it has changed.
+PLAYER_DIRECTORY_PATH=off keeps it in memory only.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "data" / "player_directory.json"
+ROSTER_MAX_AGE = 6 * 3600.0  # matches the "roster" response cache TTL
+MAX_REFRESH_THREADS = 8
+FIELDS = ('name', 'firstName', 'lastName', 'sweaterNumber', 'positionCode', 'shootsCatches', 'teamId', 'teamAbbrev')
+
+# game_roster() maps kept, most recently used last.
+_GAME_ROSTER_CACHE_SIZE = 16
+
+
+def _text(value) -> str:
+    """A localized {'default': ...} field, or a plain string, as a string."""
+    if isinstance(value, dict):
+        return value.get('default', '') or ''
+    return str(value) if value else ''
+
+
+def player_id_of(value) -> Optional[int]:
+    """Player ids arrive as ints or digit strings; None when it is not an id."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def boxscore_name(player: Dict[str, Any]) -> str:
+    """A playerByGameStats row's display name ('C. McDavid'), as the top performers endpoint reads it."""
+    name = _text(player.get('name'))
+    if not name:
+        name = f"{_text(player.get('firstName'))} {_text(player.get('lastName'))}".strip()
+    return name
+
+
+def _boxscore_players(boxscore: Optional[Dict[str, Any]]):
+    """(side, position group, row) for every playerByGameStats row."""
+    pbg = (boxscore or {}).get('playerByGameStats') or {}
+    for side in ('awayTeam', 'homeTeam'):
+        side_data = pbg.get(side) or {}
+        for group in ('forwards', 'defense', 'goalies'):
+            for player in side_data.get(group) or []:
+                yield side, group, player
+
+
+def boxscore_names(boxscore: Optional[Dict[str, Any]]) -> Dict[int, str]:
+    """{player id: boxscore display name} for one game."""
+    names = {}
+    for _, _, player in _boxscore_players(boxscore):
+        pid = player_id_of(player.get('playerId') or player.get('id') or player.get('playerID'))
+        name = boxscore_name(player)
+        if pid is not None and name and pid not in names:
+            names[pid] = name
+    return names
+
+
+class PlayerDirectory:
+    """Thread-safe player id -> record map, optionally backed by a JSON file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._players: Dict[int, Dict[str, Any]] = {}
+        self._refreshed: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._game_rosters: "OrderedDict[tuple, tuple]" = OrderedDict()
+        if self.path is not None:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __contains__(self, player_id) -> bool:
+        return player_id_of(player_id) in self._players
+
+    # Lookups
+
+    def get(self, player_id) -> Optional[Dict[str, Any]]:
+        """A copy of the player's record, None when unknown."""
+        record = self._players.get(player_id_of(player_id))
+        return dict(record) if record is not None else None
+
+    def name(self, player_id, default: Optional[str] = None) -> Optional[str]:
+        record = self._players.get(player_id_of(player_id))
+        return (record or {}).get('name') or default
+
+    # Seeding
+
+    def _merge(self, player_id, fields: Dict[str, Any], keep_name: bool = False) -> None:
+        # Called with self._lock held. Empty values never overwrite known ones.
+        pid = player_id_of(player_id)
+        if pid is None:
+            return
+        record = self._players.setdefault(pid, {})
+        for key, value in fields.items():
+            if value in (None, ''):
+                continue
+            if keep_name and key in ('name', 'firstName', 'lastName') and record.get(key):
+                continue
+            if record.get(key) != value:
+                record[key] = value
+                self._dirty = True
+
+    def add_roster_spots(self, roster_spots: Optional[Iterable[Dict[str, Any]]]) -> None:
+        """Seed from play-by-play rosterSpots."""
+        with self._lock:
+            for spot in roster_spots or []:
+                first, last = _text(spot.get('firstName')), _text(spot.get('lastName'))
+                self._merge(spot.get('playerId'), {
+                    'name': f"{first} {last}".strip() or _text(spot.get('name')),
+                    'firstName': first,
+                    'lastName': last,
+                    'sweaterNumber': spot.get('sweaterNumber'),
+                    'positionCode': spot.get('positionCode'),
+                    'teamId': spot.get('teamId'),
+                })
+
+    def add_boxscore(self, boxscore: Optional[Dict[str, Any]]) -> None:
+        """Seed from playerByGameStats; its abbreviated names only fill players with no name yet."""
+        if not boxscore:
+            return
+        with self._lock:
+            for side, group, player in _boxscore_players(boxscore):
+                team = boxscore.get(side) or {}
+                name = boxscore_name(player)
+                self._merge(player.get('playerId'), {
+                    'name': name,
+                    'sweaterNumber': player.get('sweaterNumber'),
+                    'positionCode': player.get('position') or group[0].upper(),
+                    'teamId': team.get('id'),
+                    'teamAbbrev': _text(team.get('abbrev')),
+                }, keep_name=True)
+
+    def add_team_roster(self, roster: Optional[Dict[str, Any]], team_abbrev: Optional[str] = None) -> None:
+        """Seed from a roster/{team}/current response ({'forwards', 'defensemen', 'goalies'})."""
+        if not roster:
+            return
+        with self._lock:
+            for group in ('forwards', 'defensemen', 'goalies'):
+                for player in roster.get(group) or []:
+                    first, last = _text(player.get('firstName')), _text(player.get('lastName'))
+                    self._merge(player.get('id'), {
+                        'name': f"{first} {last}".strip(),
+                        'firstName': first,
+                        'lastName': last,
+                        'sweaterNumber': player.get('sweaterNumber'),
+                        'positionCode': player.get('positionCode'),
+                        'shootsCatches': player.get('shootsCatches'),
+                        'teamAbbrev': team_abbrev,
+                    })
+            if team_abbrev:
+                self._refreshed[team_abbrev] = time.time()
+                self._dirty = True
+
+    def stale_teams(self, team_abbrevs: Iterable[str], max_age: float = ROSTER_MAX_AGE):
+        now = time.time()
+        with self._lock:
+            return sorted({t for t in team_abbrevs if t and now - self._refreshed.get(t, 0.0) >= max_age})
+
+    def refresh_teams(self, client, team_abbrevs: Iterable[str], max_age: float = ROSTER_MAX_AGE) -> int:
+        """
+        Fetch the current rosters of the teams not refreshed within `max_age`,
+        concurrently, with `client.get_team_roster`. Returns the number of
+        rosters loaded. Call it outside per-event loops.
+        """
+        teams = self.stale_teams(team_abbrevs, max_age)
+        if not teams:
+            return 0
+
+        def fetch(team):
+            try:
+                return team, client.get_team_roster(team)
+            except Exception as e:
+                print(f"⚠️ Player directory: roster fetch failed for {team}: {e}")
+                return team, None
+
+        with ThreadPoolExecutor(max_workers=min(len(teams), MAX_REFRESH_THREADS),
+                                thread_name_prefix="roster-refresh") as pool:
+            results = list(pool.map(fetch, teams))
+        loaded = 0
+        for team, roster in results:
+            if roster:
+                self.add_team_roster(roster, team)
+                loaded += 1
+        if loaded:
+            self.save()
+        return loaded
+
+    # Per-game maps
+
+    def game_roster(self, play_by_play: Optional[Dict[str, Any]], boxscore: Optional[Dict[str, Any]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        {player id: {'name', 'firstName', 'lastName', 'sweaterNumber',
+        'positionCode', 'teamId', 'shootsCatches'}} for the players in one game:
+        rosterSpots first, then boxscore players not in rosterSpots. Seeds the
+        directory on first sight of the payload. Shared between callers -
+        treat it as read-only.
+        """
+        play_by_play = play_by_play if isinstance(play_by_play, dict) else {}
+        boxscore = boxscore if isinstance(boxscore, dict) else None
+        spots = play_by_play.get('rosterSpots') or []
+        key = (id(play_by_play), id(boxscore), len(spots))
+        with self._lock:
+            cached = self._game_rosters.get(key)
+            if cached is not None and cached[0] is play_by_play and cached[1] is boxscore:
+                self._game_rosters.move_to_end(key)
+                return cached[2]
+
+            self.add_roster_spots(spots)
+            self.add_boxscore(boxscore)
+            roster = {}
+            for spot in spots:
+                pid = spot.get('playerId')
+                if not pid:
+                    continue
+                first, last = _text(spot.get('firstName')), _text(spot.get('lastName'))
+                roster[pid] = {
+                    'name': f"{first} {last}".strip() or _text(spot.get('name')) or f"Player #{pid}",
+                    'firstName': first,
+                    'lastName': last,
+                    'sweaterNumber': spot.get('sweaterNumber', ''),
+                    'positionCode': spot.get('positionCode', ''),
+                    'teamId': spot.get('teamId'),
+                }
+            for side, group, player in _boxscore_players(boxscore):
+                pid = player.get('playerId')
+                if not pid or pid in roster:
+                    continue
+                name = _text(player.get('name'))
+                roster[pid] = {
+                    'name': name or f"Player #{pid}",
+                    'firstName': name.split()[0] if name else '',
+                    'lastName': name.split()[-1] if name else '',
+                    'sweaterNumber': player.get('sweaterNumber', ''),
+                    'positionCode': player.get('position', group[0].upper()),
+                    'teamId': (boxscore.get(side) or {}).get('id'),
+                }
+            for pid, info in roster.items():
+                info['shootsCatches'] = (self._players.get(player_id_of(pid)) or {}).get('shootsCatches')
+
+            self._game_rosters[key] = (play_by_play, boxscore, roster)
+            while len(self._game_rosters) > _GAME_ROSTER_CACHE_SIZE:
+                self._game_rosters.popitem(last=False)
+            return roster
+
+    # Persistence
+
+    def load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Player directory: could not read {self.path}: {e}")
+            return
+        with self._lock:
+            for pid, record in (data.get('players') or {}).items():
+                if player_id_of(pid) is not None and isinstance(record, dict):
+                    self._players[player_id_of(pid)] = {k: v for k, v in record.items() if k in FIELDS}
+            self._refreshed.update(data.get('refreshed') or {})
+
+    def save(self) -> None:
+        """Write the directory if it changed since the last save (atomically, via a temp file)."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'players': {str(pid): record for pid, record in sorted(self._players.items())},
+                'refreshed': dict(self._refreshed),
+            }
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"⚠️ Player directory: could not write {self.path}: {e}")
+
+
+_default: Optional[PlayerDirectory] = None
+_default_lock = threading.Lock()
+
+
+def get_player_directory() -> PlayerDirectory:
+    """The directory shared by everything in this process."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            setting = os.environ.get("PLAYER_DIRECTORY_PATH", "")
+            path = None if setting.lower() in ("off", "0", "none") else (Path(setting) if setting else DEFAULT_PATH)
+            _default = PlayerDirectory(path)
+            atexit.register(_default.save)
+        return _default
@@ -85,7 +85,7 @@ class PredictionInterface:
                                 continue
                             
                             try:
-                                game_data = self.api.get_comprehensive_game_data(game_id)
+                                game_data = self.api.get_game_bundle(game_id, include_landing=False)
                                 if not game_data or 'boxscore' not in game_data:
                                     continue
                                 away_goals = int(game_data['boxscore']['awayTeam'].get('score', 0))
@@ -110,7 +110,7 @@ class PredictionInterface:
                         if game_state in ['FINAL', 'OFF']:
                             try:
                                 # Get comprehensive game data
-                                game_data = self.api.get_comprehensive_game_data(game_id)
+                                game_data = self.api.get_game_bundle(game_id, include_landing=False)
                                 if not game_data:
                                     continue
                                 
@@ -617,7 +617,7 @@ class PredictionInterface:
                 continue
             
             try:
-                game_data = self.api.get_comprehensive_game_data(game_id)
+                game_data = self.api.get_game_bundle(game_id, include_landing=False)
             except Exception as exc:
                 print(f"  ⚠️  Unable to fetch stale game {game_id}: {exc}")
                 continue
@@ -0,0 +1,223 @@
+"""
+Pipelined post-game report preparation for a slate of finished games.
+
+Each game goes through two stages before the caller publishes it:
+
+  fetch   the game bundle, in a thread pool (network-bound)
+  render  the PDF report, its postgame metrics payload and the stitched PNG
+          (`render_report`), in a spawn process pool - ReportLab and
+          matplotlib are CPU-bound and not thread-safe
+
+`prepare_reports()` yields the prepared games in schedule order, so the
+caller can post, learn and update processed_games.json one game at a time
+while later games are still being fetched and rendered.
+
+REPORT_WORKERS caps the render pool; REPORT_WORKERS=1 (or a single core)
+fetches, renders and yields one game at a time in-process, exactly as the
+serial runner did. If the pool cannot start or dies, the remaining games are
+rendered in the main process.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+try:
+    from utils.event_store import _json_safe
+except Exception:
+    from event_store import _json_safe
+try:
+    from game_analysis_context import GameAnalysisContext
+except Exception:
+    from analyzers.game_analysis_context import GameAnalysisContext
+
+
+IMAGE_DIR = Path("/tmp/nhl_images")
+# Reports are text-dense and get downscaled in the X timeline, so pages are
+# rendered at high DPI to keep small table text (especially sprite bars) legible.
+IMAGE_DPI = 400
+MAX_FETCH_THREADS = 16
+
+
+def default_workers() -> int:
+    try:
+        n = int(os.environ.get("REPORT_WORKERS", "0"))
+    except ValueError:
+        n = 0
+    return n if n > 0 else (os.cpu_count() or 1)
+
+
+def _stitch_pages(pages):
+    """Stack PDF pages into one tall image and trim the empty space below the content."""
+    if len(pages) == 1:
+        return pages[0]
+
+    from PIL import Image as PILImage
+    total_width = max(p.width for p in pages)
+    total_height = sum(p.height for p in pages)
+    final_image = PILImage.new('RGB', (total_width, total_height), 'white')
+    y_offset = 0
+    for page in pages:
+        final_image.paste(page, (0, y_offset))
+        y_offset += page.height
+    print(f"📐 Stitched {len(pages)} pages into single image ({total_width}x{total_height})")
+
+    # Auto-crop the stitched image to remove empty space at the bottom (useful for OT spill-over)
+    try:
+        gray = final_image.convert('L')
+        # Threshold: Paper.png pixels are very bright (> 220ish). Text/lines are darker.
+        # Convert content pixels (< 230) to 255 (white) and background to 0 (black).
+        content_mask = gray.point(lambda p: 255 if p < 230 else 0)
+        bbox = content_mask.getbbox()
+
+        if bbox:
+            # getbbox returns (left, upper, right, lower)
+            # Add a padding of 150 pixels below the actual content
+            crop_bottom = min(bbox[3] + 150, final_image.height)
+
+            # Only crop if there's a significant amount of empty space (e.g. > 200px)
+            if final_image.height - crop_bottom > 200:
+                final_image = final_image.crop((0, 0, final_image.width, crop_bottom))
+                print(f"✂️ Cropped image height from {total_height} to {crop_bottom} to remove empty space")
+    except Exception as e:
+        print(f"⚠️ Could not auto-crop image: {e}")
+    return final_image
+
+
+def render_report(game_data: Dict[str, Any], game_id, away_team: str, home_team: str) -> Dict[str, Any]:
+    """
+    Build the post-game PDF for one game and convert it to a single PNG.
+
+    Returns {'pdf_path', 'is_high_fidelity', 'postgame_metrics', 'image_path',
+    'analysis'}, where `analysis` is the game's GameAnalysisContext export.
+    `postgame_metrics` is None when the payload could not be collected;
+    `image_path` is None for low-fidelity reports (not converted) and when
+    conversion produced no pages. The PDF is deleted once converted.
+    """
+    from pdf_report_generator import PostGameReportGenerator
+
+    output_filename = f"/tmp/nhl_postgame_report_{away_team}_vs_{home_team}_{game_id}.pdf"
+    generator = PostGameReportGenerator()
+    pdf_path = generator.generate_report(game_data, output_filename, game_id)
+
+    try:
+        # Reduced to the JSON the event store writes, so it can leave the worker.
+        postgame_metrics = _json_safe(generator.collect_postgame_metrics(game_data, game_id=game_id))
+    except Exception as e:
+        print(f"⚠️  Could not collect postgame metrics: {e}")
+        postgame_metrics = None
+
+    result = {
+        'pdf_path': pdf_path,
+        'is_high_fidelity': generator.is_high_fidelity,
+        'postgame_metrics': postgame_metrics,
+        'image_path': None,
+        # Metrics computed for the report, so the caller does not redo them.
+        'analysis': GameAnalysisContext.of(game_data).export(),
+    }
+    if not generator.is_high_fidelity or not pdf_path or not Path(pdf_path).exists():
+        return result
+
+    from pdf2image import convert_from_path
+
+    pages = convert_from_path(pdf_path, dpi=IMAGE_DPI)
+    if not pages:
+        print(f"❌ PDF conversion failed - no pages")
+        return result
+
+    IMAGE_DIR.mkdir(exist_ok=True)
+    image_path = IMAGE_DIR / f"nhl_postgame_report_{away_team}_vs_{home_team}_{game_id}.png"
+    _stitch_pages(pages).save(image_path, 'PNG')
+    if image_path.exists():
+        result['image_path'] = str(image_path)
+        try:
+            Path(pdf_path).unlink()
+            print(f"🗑️  Cleaned up PDF: {pdf_path}")
+        except Exception as e:
+            print(f"⚠️  Could not delete PDF: {e}")
+    return result
+
+
+def _prepared(game_data=None, report=None, error=None) -> Dict[str, Any]:
+    return {'game_data': game_data, 'report': report, 'error': error}
+
+
+def _prepare_serial(game: Dict[str, Any], fetch: Callable[[str], Any]) -> Dict[str, Any]:
+    try:
+        game_data = fetch(game['id'])
+    except Exception as e:
+        return _prepared(error=e)
+    if not game_data:
+        return _prepared()
+    try:
+        return _prepared(game_data, render_report(game_data, game['id'], game['away'], game['home']))
+    except Exception as e:
+        return _prepared(game_data, error=e)
+
+
+def _prepare_pooled(game: Dict[str, Any], fetch: Callable[[str], Any], pool: ProcessPoolExecutor):
+    """Fetch in this thread, render in the pool. Returns (prepared, rendered_in_pool)."""
+    try:
+        game_data = fetch(game['id'])
+    except Exception as e:
+        return _prepared(error=e), True
+    if not game_data:
+        return _prepared(), True
+    try:
+        future = pool.submit(render_report, game_data, game['id'], game['away'], game['home'])
+        return _prepared(game_data, future.result()), True
+    except (BrokenProcessPool, OSError) as e:
+        print(f"⚠️ Render pool unavailable ({e}); rendering {game['id']} in-process")
+        return _prepared(game_data), False
+    except Exception as e:
+        return _prepared(game_data, error=e), True
+
+
+def prepare_reports(
+    games: Sequence[Dict[str, Any]],
+    fetch: Callable[[str], Any],
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Yield (game, prepared) for each {'id', 'away', 'home'} game, in order.
+
+    `prepared` is {'game_data', 'report', 'error'}: `game_data` is None when
+    the fetch returned nothing, `report` is render_report()'s result, and
+    `error` holds the exception if fetching or rendering raised. `fetch` is
+    called from worker threads and must be thread-safe.
+    """
+    games = list(games)
+    workers = min(len(games), max_workers or default_workers())
+    if workers <= 1:
+        for game in games:
+            yield game, _prepare_serial(game, fetch)
+        return
+
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"))
+    except OSError as e:
+        print(f"⚠️ Render pool unavailable ({e}); preparing {len(games)} games serially")
+        for game in games:
+            yield game, _prepare_serial(game, fetch)
+        return
+
+    threads = min(len(games), MAX_FETCH_THREADS)
+    try:
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="report-fetch") as stage:
+            futures = [stage.submit(_prepare_pooled, game, fetch, pool) for game in games]
+            for game, future in zip(games, futures):
+                prepared, rendered = future.result()
+                if not rendered:
+                    game_data = prepared['game_data']
+                    try:
+                        prepared['report'] = render_report(game_data, game['id'], game['away'], game['home'])
+                    except Exception as e:
+                        prepared['error'] = e
+                yield game, prepared
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -43,6 +43,12 @@ def update_game_outcomes():
             load_latest_by_game_id = None
             PREDICTION_EVENTS_PATH = None
             OUTCOME_EVENTS_PATH = None
+        try:
+            # Only parse events appended since the last run.
+            from utils.event_cursor import load_latest_incremental
+            load_latest_by_game_id = lambda path: load_latest_incremental(path, "outcome_updater")
+        except Exception:
+            pass
 
         predictions: list = []
         if load_latest_by_game_id is not None and PREDICTION_EVENTS_PATH is not None: